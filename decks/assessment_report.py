@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Chart deck from exported Pacer assessment data.
+
+Reads one or more exports of the storage.js `orf_data` object
+({version, students[], assessments[]}), flattens the fields the report needs
+into numpy columns, and computes every aggregate with array operations:
+Hasbrouck–Tindal percentile bands (norms parsed from js/benchmarks.js),
+per-grade medians, the WCPM histogram and the errorBreakdown totals. The
+result is a slidekit deck spec with native PPTX charts.
+
+A report covers one season of one school year (August to July), so a
+multi-year export never mixes winters. Only each student's latest assessment
+in that season counts towards the WCPM charts (--every-assessment uses all
+of them); errors are summed over every assessment in the season. Season and
+school year default to the newest assessment's (seasons use benchmarks.js's
+getSeason() months); --season alone picks the newest school year with
+assessments in that season.
+
+Exports only hold each student's current grade, taken to apply to the
+newest school year in the export; an earlier year's report ranks students
+one grade lower per year back.
+
+Flattened columns are cached in decks/.cache/reports/ per export file (path,
+size and mtime), so re-running a report on the same export skips parsing.
+
+Usage:
+  python decks/assessment_report.py orf_data.json
+  python decks/assessment_report.py class-*.json --season winter --school-year 2024-25 \\
+      --title "Lincoln MS — Winter screening" --output reports/lincoln-winter.pptx
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+import build
+import slidekit
+
+try:
+    import orjson
+except ImportError:  # stdlib json is fine, just slower on large exports
+    orjson = None
+
+NORMS_JS = os.path.join(build.REPO_ROOT, "js", "benchmarks.js")
+COLUMN_CACHE_DIR = os.path.join(build.DECKS_DIR, ".cache", "reports")
+
+SEASONS = ("fall", "winter", "spring")
+PERCENTILES = (10, 25, 50, 75, 90)
+MAX_GRADE = 12
+# getSeason(): Aug–Nov fall, Dec–Feb winter, Mar–Jul spring (month 0 = January)
+SEASON_OF_MONTH = np.array([1, 1, 2, 2, 2, 2, 2, 0, 0, 0, 0, 1])
+SCHOOL_YEAR_START_MONTH = 7  # August; a school year is named by the calendar year it starts in
+
+BANDS = ("Below 10th", "10th–25th", "25th–50th", "50th–75th", "75th–90th", "90th and up")
+BAND_COLORS = ("RED", "ORANGE", "AMBER", "TEAL", "GREEN", "ACCENT2")
+ERROR_TYPES = (("wordErrors", "Word errors"), ("omissions", "Omissions"),
+               ("longPauseErrors", "Long pauses"), ("insertionErrors", "Insertions"))
+ERROR_COLORS = ("RED", "ORANGE", "PURPLE", "TEAL")
+HISTOGRAM_BIN = 10
+HISTOGRAM_MAX = 250
+
+COLORS = {
+    "DARK_BG": "0F172A", "CARD": "1E293B", "WHITE": "F1F5F9", "MUTED": "94A3B8", "DIM": "64748B",
+    "GRID": "334155", "ACCENT2": "0EA5E9", "RED": "EF4444", "ORANGE": "F97116", "AMBER": "F59E0B",
+    "GREEN": "22C55E", "TEAL": "14B8A6", "PURPLE": "A855F7",
+}
+
+
+# ──────────────────────────────────────────────────────────
+# Norms
+# ──────────────────────────────────────────────────────────
+_GRADE_LINE = re.compile(r"^\s*(\d+):\s*\{")
+_SEASON_LINE = re.compile(r"(fall|winter|spring):\s*\{([^}]*)\}")
+_PERCENTILE = re.compile(r"p(\d+):\s*(\d+)")
+
+
+def load_norms(path=NORMS_JS):
+    """
+    HT_NORMS from benchmarks.js.
+
+    Returns:
+        float array [grade 0..MAX_GRADE, season, percentile] of WCPM at each of
+        PERCENTILES, NaN where the table has no norms
+    """
+    norms = np.full((MAX_GRADE + 1, len(SEASONS), len(PERCENTILES)), np.nan)
+    grade = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            match = _GRADE_LINE.match(line)
+            if match:
+                grade = int(match.group(1))
+            for season, body in _SEASON_LINE.findall(line):
+                values = {int(p): int(v) for p, v in _PERCENTILE.findall(body)}
+                norms[grade, SEASONS.index(season)] = [values[p] for p in PERCENTILES]
+    return norms
+
+
+# ──────────────────────────────────────────────────────────
+# Ingest
+# ──────────────────────────────────────────────────────────
+def _load_json(path):
+    with open(path, "rb") as f:
+        return orjson.loads(f.read()) if orjson else json.load(f)
+
+
+def _number(value):
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan
+
+
+def flatten(data):
+    """
+    The report's columns from one orf_data object (or a list of them).
+
+    Returns:
+        dict of equal-length arrays, one row per assessment: id, student,
+        grade (0 unknown), date (datetime64[ms]), wcpm, accuracy, totalWords
+        (NaN when missing), and one count column per ERROR_TYPES entry
+        (NaN when the assessment has no errorBreakdown)
+    """
+    exports = data if isinstance(data, list) else [data]
+    grades = {}
+    for export in exports:
+        for student in export.get("students") or []:
+            grade = student.get("grade")
+            grades[student.get("id")] = grade if isinstance(grade, int) and 1 <= grade <= MAX_GRADE else 0
+
+    rows = [a for export in exports for a in export.get("assessments") or []]
+    cols = {
+        "id": np.array([str(a.get("id")) for a in rows], dtype=object),
+        "student": np.array([str(a.get("studentId")) for a in rows], dtype=object),
+        "grade": np.array([grades.get(a.get("studentId"), 0) for a in rows], dtype=np.int64),
+        "date": np.array([(a.get("date") or "NaT").rstrip("Z") for a in rows], dtype="datetime64[ms]"),
+        "wcpm": np.array([_number(a.get("wcpm")) for a in rows]),
+        "accuracy": np.array([_number(a.get("accuracy")) for a in rows]),
+        "totalWords": np.array([_number(a.get("totalWords")) for a in rows]),
+    }
+    for key, _ in ERROR_TYPES:
+        cols[key] = np.array([_number((a.get("errorBreakdown") or {}).get(key, np.nan)) for a in rows])
+    return cols
+
+
+def _column_cache_path(path):
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}"
+    return os.path.join(COLUMN_CACHE_DIR, hashlib.sha256(key.encode()).hexdigest()[:24] + ".npz")
+
+
+def load_exports(paths, use_cache=True):
+    """Flattened columns of every export, concatenated, with duplicate assessment ids dropped."""
+    parts = []
+    for path in paths:
+        cached = _column_cache_path(path)
+        if use_cache and os.path.exists(cached):
+            with np.load(cached, allow_pickle=True) as z:
+                parts.append({k: z[k] for k in z.files})
+            continue
+        cols = flatten(_load_json(path))
+        if use_cache:
+            os.makedirs(COLUMN_CACHE_DIR, exist_ok=True)
+            np.savez(cached, **cols)
+        parts.append(cols)
+    cols = {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+    _, first = np.unique(cols["id"].astype(str), return_index=True)
+    if len(first) < len(cols["id"]):
+        keep = np.sort(first)
+        cols = {k: v[keep] for k, v in cols.items()}
+    return cols
+
+
+# ──────────────────────────────────────────────────────────
+# Aggregates
+# ──────────────────────────────────────────────────────────
+def seasons_of(dates):
+    months = dates.astype("datetime64[M]").astype(np.int64) % 12
+    return SEASON_OF_MONTH[months]
+
+
+def school_years_of(dates):
+    """Calendar year each date's school year (August–July) starts in."""
+    months = dates.astype("datetime64[M]").astype(np.int64)
+    return 1970 + (months - SCHOOL_YEAR_START_MONTH) // 12
+
+
+def school_year_label(year):
+    return f"{year}–{(year + 1) % 100:02d}"
+
+
+def parse_school_year(text):
+    """'2024', '2024-25' or '2024–25' -> 2024."""
+    match = re.match(r"^\s*(\d{4})(?:\s*[-–/]\s*(\d{2}|\d{4}))?\s*$", text)
+    if not match or (match.group(2) and int(match.group(2)) % 100 != (int(match.group(1)) + 1) % 100):
+        raise ValueError(f"bad school year {text!r} (expected e.g. 2024-25)")
+    return int(match.group(1))
+
+
+def latest_per_student(students, dates):
+    """Indexes of each student's newest row."""
+    order = np.lexsort((dates, students.astype(str)))
+    s = students[order]
+    last = np.ones(len(order), dtype=bool)
+    last[:-1] = s[1:] != s[:-1]
+    return order[last]
+
+
+def percentile_bands(wcpm, grade, season, norms):
+    """
+    0..5 = how many of the grade/season's PERCENTILES each WCPM reaches
+    (BANDS order), -1 where there are no norms or no WCPM.
+    """
+    table = norms[grade, season]
+    bands = (wcpm[:, None] >= table).sum(axis=1)
+    valid = ~np.isnan(table).any(axis=1) & ~np.isnan(wcpm)
+    return np.where(valid, bands, -1)
+
+
+def grouped_median(values, groups, n_groups):
+    """NaN-ignoring median of `values` per integer group, via one sort."""
+    ok = ~np.isnan(values)
+    v, g = values[ok], groups[ok]
+    order = np.lexsort((v, g))
+    v, g = v[order], g[order]
+    starts = np.searchsorted(g, np.arange(n_groups), side="left")
+    ends = np.searchsorted(g, np.arange(n_groups), side="right")
+    counts = ends - starts
+    lo = v[np.minimum(starts + (counts - 1) // 2, len(v) - 1)] if len(v) else np.zeros(n_groups)
+    hi = v[np.minimum(starts + counts // 2, len(v) - 1)] if len(v) else np.zeros(n_groups)
+    return np.where(counts > 0, (lo + hi) / 2, np.nan), counts
+
+
+def summarize(cols, norms, season=None, school_year=None, every_assessment=False):
+    """
+    Every number the report shows, for one season of one school year.
+
+    Returns:
+        dict of plain Python values/lists (JSON-serializable)
+    """
+    has_date = ~np.isnat(cols["date"])
+    if not has_date.any():
+        raise ValueError("No dated assessments in the export(s)")
+    dated = np.flatnonzero(has_date)
+    seasons = np.full(len(cols["date"]), -1)
+    seasons[dated] = seasons_of(cols["date"][dated])
+    years = np.full(len(cols["date"]), -1)
+    years[dated] = school_years_of(cols["date"][dated])
+    newest_year = int(years[dated].max())
+
+    if season is None and school_year is None:
+        newest = dated[np.argmax(cols["date"][dated])]
+        season, school_year = SEASONS[seasons[newest]], int(years[newest])
+    elif season is None:
+        in_year = dated[years[dated] == school_year]
+        if not len(in_year):
+            raise ValueError(f"No assessments in school year {school_year_label(school_year)}")
+        season = SEASONS[seasons[in_year[np.argmax(cols["date"][in_year])]]]
+    elif school_year is None:
+        with_season = years[seasons == SEASONS.index(season)]
+        school_year = int(with_season.max()) if len(with_season) else newest_year
+    in_season = (seasons == SEASONS.index(season)) & (years == school_year)
+    # Current grades apply to the newest school year; step back one per earlier year
+    grades = cols["grade"] - (newest_year - school_year)
+    grades = np.where((cols["grade"] > 0) & (grades >= 1), grades, 0)
+
+    rows = np.flatnonzero(in_season)
+    if not every_assessment:
+        rows = rows[latest_per_student(cols["student"][rows], cols["date"][rows])]
+
+    wcpm, grade = cols["wcpm"][rows], grades[rows]
+    bands = percentile_bands(wcpm, grade, np.full(len(rows), SEASONS.index(season)), norms)
+    n_bands = len(BANDS)
+    band_counts = np.bincount(grade[bands >= 0] * n_bands + bands[bands >= 0],
+                              minlength=(MAX_GRADE + 1) * n_bands).reshape(MAX_GRADE + 1, n_bands)
+    medians, counts = grouped_median(wcpm, grade, MAX_GRADE + 1)
+    graded = [g for g in range(1, MAX_GRADE + 1) if counts[g]]
+
+    clipped = np.clip(wcpm[~np.isnan(wcpm)], 0, HISTOGRAM_MAX)
+    edges = np.arange(0, HISTOGRAM_MAX + HISTOGRAM_BIN, HISTOGRAM_BIN)
+    histogram = np.bincount((clipped // HISTOGRAM_BIN).astype(np.int64), minlength=len(edges))[:len(edges)]
+
+    # Errors: every assessment in the season that has a breakdown
+    err_rows = np.flatnonzero(in_season & ~np.isnan(cols["wordErrors"]))
+    error_totals, errors_per_100 = [0.0] * len(ERROR_TYPES), {}
+    if len(err_rows):
+        errors = np.stack([np.nan_to_num(cols[key][err_rows]) for key, _ in ERROR_TYPES])
+        words = np.nan_to_num(cols["totalWords"][err_rows])
+        err_grade = grades[err_rows]
+        per_grade_errors = np.stack([np.bincount(err_grade, weights=e, minlength=MAX_GRADE + 1)
+                                     for e in errors]).astype(float)
+        per_grade_words = np.bincount(err_grade, weights=words, minlength=MAX_GRADE + 1)
+        per_100 = np.divide(per_grade_errors * 100, per_grade_words,
+                            out=np.zeros_like(per_grade_errors), where=per_grade_words > 0)
+        error_totals = errors.sum(axis=1).tolist()
+        errors_per_100 = {g: per_100[:, g].tolist() for g in graded if per_grade_words[g] > 0}
+
+    ranked = bands >= 0
+    dates = cols["date"][rows]
+    return {
+        "season": season,
+        "schoolYear": school_year_label(school_year),
+        "everyAssessment": every_assessment,
+        "students": int(len(np.unique(cols["student"][rows].astype(str)))),
+        "assessments": int(in_season.sum()),
+        "dateRange": [str(dates.min())[:10], str(dates.max())[:10]] if len(dates) else None,
+        "medianWcpm": float(np.nanmedian(wcpm)) if np.any(~np.isnan(wcpm)) else None,
+        "ranked": int(ranked.sum()),
+        "atOrAbove50th": float(np.mean(bands[ranked] >= 3)) if ranked.any() else None,
+        "below25th": float(np.mean(bands[ranked] < 2)) if ranked.any() else None,
+        "grades": graded,
+        "bandCounts": {g: band_counts[g].tolist() for g in graded},
+        "gradeMedians": {g: float(medians[g]) for g in graded},
+        "gradeCounts": {g: int(counts[g]) for g in graded},
+        "norms": {g: [None if np.isnan(v) else float(v) for v in norms[g, SEASONS.index(season)]] for g in graded},
+        "histogram": {"edges": edges.tolist(), "counts": histogram.tolist()},
+        "errorTotals": error_totals,
+        "errorAssessments": int(len(err_rows)),
+        "errorsPer100": errors_per_100,
+    }
+
+
+# ──────────────────────────────────────────────────────────
+# Slides
+# ──────────────────────────────────────────────────────────
+CHART_STYLE = {"size": 12, "color": "MUTED", "face": "Calibri", "gridlines": "GRID"}
+
+
+def _title(text, subtitle=None):
+    shapes = [{"box": [0.6, 0.35, 12.1, 0.8],
+               "text": [{"align": "left", "size": 32, "bold": True, "color": "WHITE", "face": "Calibri",
+                         "text": text}]}]
+    if subtitle:
+        shapes.append({"box": [0.6, 1.05, 12.1, 0.45],
+                       "text": [{"align": "left", "size": 14, "color": "MUTED", "face": "Calibri",
+                                 "text": subtitle}]})
+    return shapes
+
+
+def _stat_card(x, value, label, color):
+    return [
+        {"geom": "roundRect", "box": [x, 2.0, 2.8, 2.0], "adj": [0.06], "fill": "CARD", "line": None,
+         "shadow": False},
+        {"box": [x + 0.2, 2.2, 2.4, 1.0],
+         "text": [{"align": "center", "size": 44, "bold": True, "color": color, "face": "Calibri", "text": value}]},
+        {"box": [x + 0.2, 3.2, 2.4, 0.6],
+         "text": [{"align": "center", "size": 14, "color": "MUTED", "face": "Calibri", "text": label}]},
+    ]
+
+
+def _pct(x):
+    return f"{x:.0%}" if x is not None else "–"
+
+
+def report_spec(summary, title="Reading fluency report", output="assessment-report.pptx"):
+    season = summary["season"].capitalize()
+    grade_labels = [f"Grade {g} (n={summary['gradeCounts'][g]})" for g in summary["grades"]]
+    normed = [g for g in summary["grades"] if summary["norms"][g][0] is not None]
+    date_range = " to ".join(summary["dateRange"]) if summary["dateRange"] else "no dates"
+    slides = []
+
+    median = summary["medianWcpm"]
+    slides.append({"background": "DARK_BG", "shapes": [
+        *_title(title, f"{season} {summary['schoolYear']} · {summary['students']} students · {summary['assessments']} assessments · "
+                       f"{date_range}"),
+        *_stat_card(0.6, str(summary["students"]), "students assessed", "WHITE"),
+        *_stat_card(3.7, f"{median:.0f}" if median is not None else "–", "median WCPM", "ACCENT2"),
+        *_stat_card(6.8, _pct(summary["atOrAbove50th"]), "at or above the 50th percentile", "GREEN"),
+        *_stat_card(9.9, _pct(summary["below25th"]), "below the 25th percentile", "RED"),
+        {"box": [0.6, 4.4, 12.1, 0.8], "text": [{"align": "left", "size": 13, "color": "DIM", "face": "Calibri",
+         "text": f"Percentiles against Hasbrouck–Tindal {summary['season']} ORF norms; "
+                 f"{summary['ranked']} of {summary['students']} students have a grade with norms. "
+                 + ("Every assessment in the season is charted." if summary["everyAssessment"]
+                    else "Each student's latest assessment in the season is used.")}]},
+    ]})
+
+    if normed:
+        slides.append({"background": "DARK_BG", "shapes": [
+            *_title("WCPM against grade norms", f"Share of students in each Hasbrouck–Tindal percentile band, "
+                                                f"{summary['season']}"),
+            {"chart": "stacked_bar_100", "box": [0.6, 1.7, 12.1, 5.4], **CHART_STYLE, "legend": "bottom",
+             "categories": [f"Grade {g} (n={sum(summary['bandCounts'][g])})" for g in normed],
+             "number_format": "0", "axis_format": "0%", "gap_width": 60, "overlap": 100,
+             "series": [{"name": band, "color": color, "values": [summary["bandCounts"][g][i] for g in normed]}
+                        for i, (band, color) in enumerate(zip(BANDS, BAND_COLORS))]},
+        ]})
+
+    if summary["grades"]:
+        norm_series = [{"name": f"Norm {p}th", "color": color,
+                        "values": [summary["norms"][g][PERCENTILES.index(p)] for g in summary["grades"]]}
+                       for p, color in ((25, "DIM"), (50, "MUTED"), (75, "WHITE"))]
+        slides.append({"background": "DARK_BG", "shapes": [
+            *_title("Median WCPM by grade", f"Students' median against the 25th/50th/75th percentile norms, "
+                                            f"{summary['season']}"),
+            {"chart": "column", "box": [0.6, 1.7, 12.1, 5.4], **CHART_STYLE, "legend": "bottom",
+             "categories": grade_labels, "number_format": "0", "labels": True, "label_font": {"size": 10},
+             "gap_width": 80,
+             "series": [{"name": "Students (median)", "color": "ACCENT2",
+                         "values": [round(summary["gradeMedians"][g], 1) for g in summary["grades"]]},
+                        *norm_series]},
+        ]})
+
+    edges = summary["histogram"]["edges"]
+    bins = [f"{lo}–{lo + HISTOGRAM_BIN - 1}" for lo in edges[:-1]] + [f"{edges[-1]}+"]
+    slides.append({"background": "DARK_BG", "shapes": [
+        *_title("WCPM distribution", f"All grades, {HISTOGRAM_BIN}-word bins"),
+        {"chart": "column", "box": [0.6, 1.7, 12.1, 5.4], **CHART_STYLE, "legend": None, "gap_width": 20,
+         "categories": bins, "number_format": "0",
+         "series": [{"name": "Students", "color": "ACCENT2", "values": summary["histogram"]["counts"]}]},
+    ]})
+
+    if summary["errorAssessments"]:
+        per_100_grades = list(summary["errorsPer100"])
+        slides.append({"background": "DARK_BG", "shapes": [
+            *_title("Error breakdown", f"{summary['errorAssessments']} assessments with an error breakdown, "
+                                       f"{summary['season']}"),
+            {"chart": "doughnut", "box": [0.6, 1.7, 5.2, 5.4], **CHART_STYLE, "legend": "bottom",
+             "labels": True, "number_format": "0",
+             "categories": [label for _, label in ERROR_TYPES],
+             "series": [{"name": "Errors", "values": summary["errorTotals"], "colors": list(ERROR_COLORS)}]},
+            {"chart": "stacked_column", "box": [6.2, 1.7, 6.5, 5.4], **CHART_STYLE, "legend": "bottom",
+             "categories": [f"Grade {g}" for g in per_100_grades], "number_format": "0.0", "gap_width": 60,
+             "overlap": 100,
+             "series": [{"name": f"{label} / 100 words", "color": color,
+                         "values": [round(summary["errorsPer100"][g][i], 2) for g in per_100_grades]}
+                        for i, ((_, label), color) in enumerate(zip(ERROR_TYPES, ERROR_COLORS))]},
+        ]})
+
+    return {"output": output, "size": [13.333, 7.5], "colors": COLORS, "slides": slides}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("exports", nargs="+", help="orf_data JSON export(s)")
+    parser.add_argument("--season", choices=SEASONS, help="Report season (default: the newest assessment's)")
+    parser.add_argument("--school-year", type=parse_school_year, metavar="YYYY-YY",
+                        help="School year, August to July, e.g. 2024-25 (default: the newest with the season)")
+    parser.add_argument("--every-assessment", action="store_true",
+                        help="Chart every assessment instead of each student's latest")
+    parser.add_argument("--title", default="Reading fluency report")
+    parser.add_argument("--output", default="assessment-report.pptx", help="Deck path (relative to the repo root)")
+    parser.add_argument("--spec-out", help="Also write the generated deck spec here")
+    parser.add_argument("--summary-out", help="Also write the computed aggregates here as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse exports instead of using cached columns")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cols = load_exports(args.exports, use_cache=not args.no_cache)
+    loaded = time.perf_counter()
+    summary = summarize(cols, load_norms(), season=args.season, school_year=args.school_year,
+                        every_assessment=args.every_assessment)
+    spec = report_spec(summary, title=args.title, output=args.output)
+    out = build.output_path(spec, "assessment-report")
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    slidekit.build_deck(spec, out)
+    done = time.perf_counter()
+
+    if args.spec_out:
+        with open(args.spec_out, "w", encoding="utf-8") as f:
+            slidekit.dump_spec(spec, f)
+    if args.summary_out:
+        with open(args.summary_out, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+            f.write("\n")
+    print(f"{len(cols['id'])} assessments loaded in {loaded - start:.2f}s; {summary['season']} {summary['schoolYear']}: "
+          f"{summary['students']} students, median WCPM "
+          f"{summary['medianWcpm'] if summary['medianWcpm'] is None else round(summary['medianWcpm'])}")
+    print(f"{len(spec['slides'])} slides -> {os.path.relpath(out, build.REPO_ROOT)} "
+          f"({done - start:.2f}s total)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
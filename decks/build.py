@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Build the pitch decks from their specs in decks/specs/.
+
+Each slide is rendered to its XML part on its own (slidekit.slide_part())
+and cached in decks/.cache/slides/ under a hash of the slide's spec, the
+deck palette and the renderer source. Only slides whose hash is not cached
+are rendered, in a process pool across all selected decks; each deck is
+then assembled from its cached parts. Outputs go to each spec's "output"
+path, relative to the repo root.
+
+Usage:
+  python decks/build.py                      # all decks
+  python decks/build.py pitch-deck pitch-deck-hero
+  python decks/build.py --force --jobs 4
+  python decks/build.py --list
+"""
+
+import argparse
+import functools
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pptx
+
+import slidekit
+
+DECKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SPECS_DIR = os.path.join(DECKS_DIR, "specs")
+CACHE_DIR = os.path.join(DECKS_DIR, ".cache", "slides")
+REPO_ROOT = os.path.dirname(DECKS_DIR)
+
+
+def spec_paths():
+    """deck name -> spec path, JSON and YAML alike."""
+    paths = {}
+    for path in sorted(glob.glob(os.path.join(SPECS_DIR, "*"))):
+        name, ext = os.path.splitext(os.path.basename(path))
+        if ext in (".json", ".yaml", ".yml"):
+            paths[name] = path
+    return paths
+
+
+def select_decks(names):
+    available = spec_paths()
+    if not names:
+        return available
+    unknown = [n for n in names if n not in available]
+    if unknown:
+        raise SystemExit(f"Unknown deck(s): {', '.join(unknown)} (have: {', '.join(available)})")
+    return {n: available[n] for n in names}
+
+
+def output_path(spec, name):
+    return os.path.join(REPO_ROOT, spec.get("output", f"{name}.pptx"))
+
+
+# ──────────────────────────────────────────────────────────
+# Slide cache
+# ──────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=1)
+def renderer_hash():
+    """Changes whenever the slide renderer or python-pptx does."""
+    with open(slidekit.__file__, "rb") as f:
+        source = f.read()
+    return hashlib.sha256(source + pptx.__version__.encode()).hexdigest()[:16]
+
+
+def slide_hash(slide, colors):
+    payload = json.dumps({"slide": slide, "colors": colors or {}, "renderer": renderer_hash()},
+                         sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cache_path(digest):
+    return os.path.join(CACHE_DIR, f"{digest}.xml")
+
+
+def read_part(digest):
+    try:
+        with open(cache_path(digest), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def write_part(digest, part):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f"{cache_path(digest)}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(part)
+    os.replace(tmp, cache_path(digest))
+
+
+def render_part(slide, colors):
+    """Worker entry point: one slide spec -> its XML part bytes."""
+    return slidekit.slide_part(slide, slidekit.Palette(colors))
+
+
+def prune_cache(keep):
+    """Delete cached parts no selected deck refers to. Returns the count removed."""
+    removed = 0
+    for path in glob.glob(os.path.join(CACHE_DIR, "*.xml")):
+        if os.path.splitext(os.path.basename(path))[0] not in keep:
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+# ──────────────────────────────────────────────────────────
+# Build
+# ──────────────────────────────────────────────────────────
+def build(decks, jobs=None, force=False):
+    """
+    Render every uncached slide of the given decks, then assemble each deck.
+
+    Args:
+        decks: deck name -> spec path
+        jobs: Worker processes (None: CPU count, 1: render in this process)
+        force: Re-render every slide even if cached
+
+    Returns:
+        (results, render seconds, slide hashes in use), where results maps
+        deck name -> {"output", "slides", "rendered", "seconds"}
+    """
+    specs = {name: slidekit.load_spec(path) for name, path in decks.items()}
+    # Native charts bring their own package parts, so those decks skip the slide cache
+    direct = {name for name, spec in specs.items() if any(map(slidekit.has_charts, spec["slides"]))}
+    specs_cached = {name: spec for name, spec in specs.items() if name not in direct}
+    hashes = {name: [slide_hash(slide, spec.get("colors")) for slide in spec["slides"]]
+              for name, spec in specs_cached.items()}
+
+    # digest -> (deck, slide index) of the first slide needing it
+    todo = {}
+    parts = {}
+    for name, spec in specs_cached.items():
+        for i, digest in enumerate(hashes[name]):
+            if digest in todo or digest in parts:
+                continue
+            part = None if force else read_part(digest)
+            if part is None:
+                todo[digest] = (name, i)
+            else:
+                parts[digest] = part
+
+    rendered = {name: 0 for name in specs}
+    render_start = time.perf_counter()
+
+    def record(digest, part):
+        write_part(digest, part)
+        parts[digest] = part
+        rendered[todo[digest][0]] += 1
+
+    if len(todo) <= 1 or jobs == 1:
+        # A pool costs more to start than a slide costs to render
+        for digest, (name, i) in todo.items():
+            spec = specs[name]
+            record(digest, render_part(spec["slides"][i], spec.get("colors")))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(render_part, specs[name]["slides"][i], specs[name].get("colors")): digest
+                       for digest, (name, i) in todo.items()}
+            for future in as_completed(futures):
+                record(futures[future], future.result())
+    render_seconds = time.perf_counter() - render_start
+
+    results = {}
+    for name, spec in specs.items():
+        start = time.perf_counter()
+        out = output_path(spec, name)
+        if name in direct:
+            slidekit.build_deck(spec, out)
+            rendered[name] = len(spec["slides"])
+        else:
+            slidekit.assemble_deck(spec, [parts[d] for d in hashes[name]], out)
+        results[name] = {"output": out, "slides": len(spec["slides"]), "rendered": rendered[name],
+                         "seconds": time.perf_counter() - start}
+    return results, render_seconds, {d for h in hashes.values() for d in h}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("decks", nargs="*", help="Deck names (spec file names without extension)")
+    parser.add_argument("--list", action="store_true", help="List the available decks and exit")
+    parser.add_argument("--force", action="store_true", help="Re-render every slide, ignoring the cache")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    decks = select_decks(args.decks)
+    if args.list:
+        for name, path in decks.items():
+            print(f"  {name:28s} {os.path.relpath(path, REPO_ROOT)}")
+        return
+
+    start = time.perf_counter()
+    results, render_seconds, used = build(decks, jobs=args.jobs, force=args.force)
+    for name, r in results.items():
+        print(f"  {name:28s} {r['slides']:3d} slides, {r['rendered']:3d} rendered  "
+              f"assembled in {r['seconds'] * 1000:4.0f}ms  -> {os.path.relpath(r['output'], REPO_ROOT)}")
+    n_rendered = sum(r["rendered"] for r in results.values())
+    print(f"{len(results)} deck(s) built in {time.perf_counter() - start:.2f}s "
+          f"({n_rendered} slide(s) rendered in {render_seconds:.2f}s)")
+    if not args.decks:
+        removed = prune_cache(used)
+        if removed:
+            print(f"Removed {removed} stale cached slide(s)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
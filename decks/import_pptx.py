@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Convert an existing .pptx into a slidekit deck spec.
+
+Handles the subset of DrawingML the deck generators produce (preset-geometry
+shapes and text boxes with solid fills, lines and run formatting) and refuses
+anything else rather than silently dropping it. Colours are written as palette
+names when --colors-from points at a script defining NAME = RGBColor(...).
+The spec is rendered back and compared slide by slide before it is written.
+
+Usage:
+  python decks/import_pptx.py pitch-deck.pptx --colors-from generate-pptx.py \\
+      --output pitch-deck.pptx > decks/specs/pitch-deck.json
+"""
+
+import argparse
+import io
+import re
+import sys
+import zipfile
+
+from lxml import etree
+
+import slidekit
+
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+
+_RGB_CONSTANT = re.compile(r'^(\w+)\s*=\s*RGBColor\(0x(\w\w),\s*0x(\w\w),\s*0x(\w\w)\)', re.M)
+
+
+class Unsupported(ValueError):
+    pass
+
+
+def colors_from_script(path):
+    """NAME -> RRGGBB for every `NAME = RGBColor(0x.., 0x.., 0x..)` line (first name wins per value)."""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    return {name: (r + g + b).upper() for name, r, g, b in _RGB_CONSTANT.findall(source)}
+
+
+def _inches(value):
+    return round(int(value) / slidekit.EMU_PER_INCH, 6)
+
+
+def _pt(value, scale):
+    v = int(value) / scale
+    return int(v) if v == int(v) else round(v, 6)
+
+
+class Importer:
+    def __init__(self, colors):
+        self.colors = colors
+        self.names = {}
+        for name, hexval in colors.items():
+            self.names.setdefault(hexval, name)
+
+    def color(self, fill):
+        clr = fill.find(f"{A}srgbClr")
+        if clr is None or len(fill) != 1 or len(clr):
+            raise Unsupported(etree.tostring(fill).decode())
+        return self.names.get(clr.get("val").upper(), clr.get("val").upper())
+
+    def props(self, rpr):
+        out = {}
+        if rpr.get("sz") is not None:
+            out["size"] = _pt(rpr.get("sz"), 100)
+        if rpr.get("b") is not None:
+            out["bold"] = rpr.get("b") in ("1", "true")
+        if rpr.get("i") is not None:
+            out["italic"] = rpr.get("i") in ("1", "true")
+        if set(rpr.attrib) - {"sz", "b", "i"}:
+            raise Unsupported(f"run attributes {sorted(rpr.attrib)}")
+        for child in rpr:
+            if child.tag == f"{A}solidFill":
+                out["color"] = self.color(child)
+            elif child.tag == f"{A}latin" and set(child.attrib) == {"typeface"}:
+                out["face"] = child.get("typeface")
+            else:
+                raise Unsupported(etree.tostring(child).decode())
+        return out
+
+    def paragraph(self, p):
+        out = {}
+        runs = []
+        for child in p:
+            if child.tag == f"{A}pPr":
+                out.update(self.paragraph_props(child))
+            elif child.tag == f"{A}r":
+                rpr = child.find(f"{A}rPr")
+                text = child.find(f"{A}t").text or ""
+                if len(child) != (2 if rpr is not None else 1):
+                    raise Unsupported(etree.tostring(child).decode())
+                if rpr is None:
+                    runs.append(text)
+                else:
+                    props = self.props(rpr)
+                    if not props:
+                        raise Unsupported("empty run properties")
+                    runs.append({"text": text, **props})
+            elif child.tag == f"{A}br" and len(child) == 0:
+                runs.append("\n")
+            else:
+                raise Unsupported(etree.tostring(child).decode())
+        joined = "".join(runs) if all(isinstance(r, str) for r in runs) else None
+        if joined is not None and runs and slidekit.runs_of({"text": joined}) == runs:
+            out["text"] = joined
+        elif runs:
+            out["runs"] = runs
+        return out
+
+    def paragraph_props(self, ppr):
+        out = {}
+        attrs = dict(ppr.attrib)
+        if "marL" in attrs or "indent" in attrs:
+            out["margin"] = [_inches(attrs.pop("marL", 0)), _inches(attrs.pop("indent", 0))]
+        if "algn" in attrs:
+            out["align"] = slidekit.ALIGN_NAMES[attrs.pop("algn")]
+        if attrs:
+            raise Unsupported(f"paragraph attributes {sorted(attrs)}")
+        for child in ppr:
+            tag = etree.QName(child).localname
+            if tag in ("lnSpc", "spcBef", "spcAft"):
+                pts = child.find(f"{A}spcPts")
+                if pts is None or len(child) != 1:
+                    raise Unsupported(etree.tostring(child).decode())
+                key = {"lnSpc": "line_spacing", "spcBef": "space_before", "spcAft": "space_after"}[tag]
+                out[key] = _pt(pts.get("val"), 100)
+            elif tag == "defRPr":
+                out.update(self.props(child))
+            else:
+                raise Unsupported(etree.tostring(child).decode())
+        if not out:
+            out["pPr"] = True
+        return out
+
+    def body(self, tx_body, defaults, default_text):
+        body_pr = tx_body.find(f"{A}bodyPr")
+        attrs = dict(body_pr.attrib)
+        for child in body_pr:
+            if child.tag != f"{A}spAutoFit":
+                raise Unsupported(etree.tostring(child).decode())
+            attrs["autofit"] = True
+        base = dict(defaults)
+        body = {k: v for k, v in attrs.items() if base.get(k) != v}
+        body.update({k: None for k in base if k not in attrs})
+        paragraphs = [self.paragraph(p) for p in tx_body.findall(f"{A}p")]
+        out = {}
+        if body:
+            out["body"] = body
+        if paragraphs != default_text:
+            out["text"] = paragraphs
+        return out
+
+    def shape(self, sp):
+        if sp.tag != f"{P}sp":
+            raise Unsupported(f"<{etree.QName(sp).localname}> shapes")
+        sp_pr = sp.find(f"{P}spPr")
+        is_textbox = sp.find(f"{P}nvSpPr/{P}cNvSpPr").get("txBox") == "1"
+        off, ext = sp_pr.find(f"{A}xfrm/{A}off"), sp_pr.find(f"{A}xfrm/{A}ext")
+        box = [_inches(off.get("x")), _inches(off.get("y")), _inches(ext.get("cx")), _inches(ext.get("cy"))]
+        geom = sp_pr.find(f"{A}prstGeom")
+        tx_body = sp.find(f"{P}txBody")
+
+        if is_textbox:
+            if [etree.QName(c).localname for c in sp_pr] != ["xfrm", "prstGeom", "noFill"]:
+                raise Unsupported("text box formatting")
+            return {"box": box, **self.body(tx_body, slidekit.TEXTBOX_BODY, [])}
+
+        out = {"geom": geom.get("prst"), "box": box}
+        adj = [int(gd.get("fmla").split()[1]) / 100000 for gd in geom.findall(f"{A}avLst/{A}gd")]
+        if adj:
+            out["adj"] = adj
+        for child in sp_pr[2:]:
+            tag = etree.QName(child).localname
+            if tag == "solidFill":
+                out["fill"] = self.color(child)
+            elif tag == "noFill":
+                out["fill"] = None
+            elif tag == "ln":
+                out["line"] = self.line(child)
+            elif tag == "effectLst" and len(child) == 0:
+                out["shadow"] = False
+            else:
+                raise Unsupported(etree.tostring(child).decode())
+        out.update(self.body(tx_body, slidekit.AUTOSHAPE_BODY, slidekit.AUTOSHAPE_TEXT))
+        return out
+
+    def line(self, ln):
+        out = {}
+        if ln.get("w") is not None:
+            out["width"] = _pt(ln.get("w"), slidekit.EMU_PER_PT)
+        for child in ln:
+            tag = etree.QName(child).localname
+            if tag == "solidFill":
+                out["color"] = self.color(child)
+            elif tag == "noFill":
+                out["hidden"] = True
+            elif tag == "prstDash":
+                out["dash"] = child.get("val")
+            else:
+                raise Unsupported(etree.tostring(child).decode())
+        return None if out == {"hidden": True} else out
+
+    def slide(self, root):
+        c_sld = root.find(f"{P}cSld")
+        out = {}
+        bg = c_sld.find(f"{P}bg")
+        if bg is not None:
+            fill = bg.find(f"{P}bgPr/{A}solidFill")
+            if fill is None:
+                raise Unsupported("non-solid background")
+            out["background"] = self.color(fill)
+        tree = c_sld.find(f"{P}spTree")
+        out["shapes"] = [self.shape(sp) for sp in tree[2:]]
+        return out
+
+
+def canonical(xml):
+    return etree.tostring(etree.fromstring(xml), method="c14n")
+
+
+def import_deck(path, colors=None, output=None):
+    """
+    Returns:
+        (spec, mismatched): the spec, and indexes of slides whose re-rendered
+        XML differs from the source
+    """
+    importer = Importer(colors or {})
+    parts = slidekit.slide_parts(path)
+    with zipfile.ZipFile(path) as z:
+        pres = etree.fromstring(z.read("ppt/presentation.xml"))
+    size = pres.find(f"{P}sldSz")
+    spec = {"output": output or path, "size": [_inches(size.get("cx")), _inches(size.get("cy"))]}
+    if colors:
+        spec["colors"] = colors
+    spec["slides"] = [importer.slide(etree.fromstring(part)) for part in parts]
+
+    buf = io.BytesIO()
+    slidekit.build_deck(spec, buf)
+    rendered = slidekit.slide_parts(buf.getvalue())
+    mismatched = [i for i, (a, b) in enumerate(zip(parts, rendered)) if canonical(a) != canonical(b)]
+    return spec, mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pptx")
+    parser.add_argument("--colors-from", help="Python script whose RGBColor constants name the palette")
+    parser.add_argument("--output", help='Value for the spec\'s "output" (default: the input path)')
+    args = parser.parse_args()
+
+    colors = colors_from_script(args.colors_from) if args.colors_from else None
+    spec, mismatched = import_deck(args.pptx, colors, args.output)
+    if mismatched:
+        sys.exit(f"Round trip differs on slide(s) {[i + 1 for i in mismatched]}")
+    slidekit.dump_spec(spec, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
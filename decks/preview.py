@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+Headless PNG previews of the pitch decks, without PowerPoint.
+
+Draws slide XML directly with Pillow, covering what the deck specs produce:
+solid backgrounds, rect/roundRect/ellipse/chevron/triangle/rightArrow
+autoshapes, freeform rect/ellipse paths, groups, and text boxes with wrapped,
+aligned runs. Native charts are drawn as labelled placeholder frames. Fonts
+are approximated with DejaVu (serif for Georgia, mono for Consolas), so
+spacing is close but not exact; characters DejaVu has no glyph for (most
+emoji) are left out rather than drawn as boxes.
+
+Slides come from the build's slide cache (rendering any missing part), and
+PNGs are cached in decks/.cache/previews/ under the slide hash plus width,
+so only edited slides are redrawn. Misses are drawn in a process pool.
+Output goes to decks/previews/<deck>/slide-NN.png.
+
+Usage:
+  python decks/preview.py                    # every deck
+  python decks/preview.py pitch-deck --width 640
+  python decks/preview.py --pptx pitch-deck-5min.pptx
+"""
+
+import argparse
+import functools
+import hashlib
+import io
+import os
+import shutil
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from lxml import etree
+from PIL import Image, ImageDraw, ImageFont
+
+import build
+import slidekit
+
+PREVIEW_DIR = os.path.join(build.DECKS_DIR, "previews")
+PREVIEW_CACHE_DIR = os.path.join(build.DECKS_DIR, ".cache", "previews")
+
+DEFAULT_WIDTH = 960
+SUPERSAMPLE = 2
+
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+
+# Default theme colours (python-pptx's template)
+THEME = {"accent1": "4F81BD", "lt1": "FFFFFF", "dk1": "000000", "tx1": "000000", "bg1": "FFFFFF"}
+STYLE_LINE = "385D8A"  # lnRef idx 1 on accent1 (shade 50%)
+CHART_PLACEHOLDER = "94A3B8"
+DEFAULT_SIZE_PT = 18
+LINE_HEIGHT = 1.2
+
+# bodyPr insets in EMU
+INSETS = {"lIns": 91440, "tIns": 45720, "rIns": 91440, "bIns": 45720}
+
+FONT_FILES = {
+    ("sans", False): "DejaVuSans.ttf", ("sans", True): "DejaVuSans-Bold.ttf",
+    ("serif", False): "DejaVuSerif.ttf", ("serif", True): "DejaVuSerif-Bold.ttf",
+    ("mono", False): "DejaVuSansMono.ttf", ("mono", True): "DejaVuSansMono-Bold.ttf",
+}
+# DejaVu Sans sets ~12% wider than Calibri and the other sans faces the
+# decks use, so sans text is drawn that much smaller to wrap like the deck
+SANS_SCALE = 0.88
+SERIF_FACES = {"Georgia", "Times New Roman", "Cambria", "Garamond"}
+MONO_FACES = {"Consolas", "Courier New", "Menlo", "Monaco", "JetBrains Mono"}
+
+
+# ──────────────────────────────────────────────────────────
+# Drawing primitives
+# ──────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=256)
+def font(face, bold, px):
+    family = "serif" if face in SERIF_FACES else "mono" if face in MONO_FACES else "sans"
+    if family == "sans":
+        px = max(1, round(px * SANS_SCALE))
+    try:
+        return ImageFont.truetype(FONT_FILES[(family, bool(bold))], px)
+    except OSError:
+        return ImageFont.load_default(px)
+
+
+def rgb(hexval):
+    return tuple(int(hexval[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def fill_color(parent, default=None):
+    """Colour of a solidFill/noFill child of `parent`: RRGGBB, None for none, else `default`."""
+    if parent is None:
+        return default
+    if parent.find(f"{A}noFill") is not None:
+        return None
+    solid = parent.find(f"{A}solidFill")
+    if solid is None:
+        return default
+    clr = solid.find(f"{A}srgbClr")
+    if clr is not None:
+        return clr.get("val")
+    scheme = solid.find(f"{A}schemeClr")
+    return THEME.get(scheme.get("val"), default) if scheme is not None else default
+
+
+class Canvas:
+    """A slide image plus the EMU -> pixel mapping (including group transforms)."""
+
+    def __init__(self, slide_cx, slide_cy, width):
+        self.scale = width * SUPERSAMPLE / slide_cx
+        self.size = (width * SUPERSAMPLE, max(1, round(slide_cy * self.scale)))
+        self.image = Image.new("RGB", self.size, "white")
+        self.draw = ImageDraw.Draw(self.image)
+        self.transform = (0, 0, 1.0, 1.0)  # child EMU -> slide EMU: off, scale
+
+    def box(self, x, y, cx, cy):
+        ox, oy, sx, sy = self.transform
+        return ((ox + x * sx) * self.scale, (oy + y * sy) * self.scale,
+                (ox + (x + cx) * sx) * self.scale, (oy + (y + cy) * sy) * self.scale)
+
+    def px(self, emu_len):
+        return emu_len * self.scale * self.transform[2]
+
+    def thumbnail(self):
+        return self.image.reduce(SUPERSAMPLE)
+
+
+# ──────────────────────────────────────────────────────────
+# Geometry
+# ──────────────────────────────────────────────────────────
+def _adj(geom, default):
+    gd = geom.find(f"{A}avLst/{A}gd")
+    return int(gd.get("fmla").split()[1]) / 100000 if gd is not None else default
+
+
+def preset_outline(prst, geom, x0, y0, x1, y1):
+    """Polygon for the non-rectangular presets we draw as polygons, else None."""
+    w, h = x1 - x0, y1 - y0
+    if prst == "chevron":
+        d = min(w, h) * _adj(geom, 0.5)
+        return [(x0, y0), (x1 - d, y0), (x1, y0 + h / 2), (x1 - d, y1), (x0, y1), (x0 + d, y0 + h / 2)]
+    if prst == "triangle":
+        return [(x0 + w * _adj(geom, 0.5), y0), (x1, y1), (x0, y1)]
+    if prst == "rightArrow":
+        head = min(w, h) * 0.5
+        shaft = h * _adj(geom, 0.5) / 2
+        mid = y0 + h / 2
+        return [(x0, mid - shaft), (x1 - head, mid - shaft), (x1 - head, y0), (x1, mid),
+                (x1 - head, y1), (x1 - head, mid + shaft), (x0, mid + shaft)]
+    return None
+
+
+def custom_paths(geom, x0, y0, x1, y1):
+    """(kind, points) for each subpath of a custGeom: kind is "polygon" or "ellipse"."""
+    out = []
+    for path in geom.iterfind(f"{A}pathLst/{A}path"):
+        pw, ph = int(path.get("w", 1)) or 1, int(path.get("h", 1)) or 1
+        sx, sy = (x1 - x0) / pw, (y1 - y0) / ph
+        points, current = [], None
+        for cmd in path:
+            tag = etree.QName(cmd).localname
+            if tag in ("moveTo", "lnTo"):
+                pt = cmd.find(f"{A}pt")
+                current = (x0 + int(pt.get("x")) * sx, y0 + int(pt.get("y")) * sy)
+                if tag == "moveTo" and len(points) > 1:
+                    out.append(("polygon", points))
+                points = [current] if tag == "moveTo" else points + [current]
+            elif tag == "arcTo" and current is not None and cmd.get("swAng") == "21600000":
+                # Full ellipse starting at angle 0 (its rightmost point)
+                rx, ry = int(cmd.get("wR")) * sx, int(cmd.get("hR")) * sy
+                cx, cy = current[0] - rx, current[1]
+                out.append(("ellipse", [(cx - rx, cy - ry), (cx + rx, cy + ry)]))
+                points = []
+            elif tag == "close":
+                if len(points) > 2:
+                    out.append(("polygon", points))
+                points = []
+        if len(points) > 2:
+            out.append(("polygon", points))
+    return out
+
+
+def draw_outline(canvas, kind, pts, fill, line, width, radius=0):
+    draw = canvas.draw
+    fill_rgb = rgb(fill) if fill else None
+    line_rgb = rgb(line) if line else None
+    width = max(1, round(width)) if line else 0
+    if kind == "polygon":
+        draw.polygon(pts, fill=fill_rgb, outline=line_rgb, width=width)
+        return
+    (x0, y0), (x1, y1) = pts
+    if x1 < x0 or y1 < y0:
+        return
+    if kind == "ellipse":
+        draw.ellipse([x0, y0, x1, y1], fill=fill_rgb, outline=line_rgb, width=width)
+    elif radius > 0:
+        draw.rounded_rectangle([x0, y0, x1, y1], radius=radius, fill=fill_rgb, outline=line_rgb, width=width)
+    else:
+        draw.rectangle([x0, y0, x1, y1], fill=fill_rgb, outline=line_rgb, width=width)
+
+
+# ──────────────────────────────────────────────────────────
+# Text
+# ──────────────────────────────────────────────────────────
+def run_style(rpr, base):
+    """Merge an rPr/defRPr over `base` ({size, bold, face, color})."""
+    style = dict(base)
+    if rpr is None:
+        return style
+    if rpr.get("sz"):
+        style["size"] = int(rpr.get("sz")) / 100
+    if rpr.get("b") is not None:
+        style["bold"] = rpr.get("b") in ("1", "true")
+    color = fill_color(rpr)
+    if color:
+        style["color"] = color
+    latin = rpr.find(f"{A}latin")
+    if latin is not None:
+        style["face"] = latin.get("typeface")
+    return style
+
+
+def layout_paragraph(p, base, max_width, canvas):
+    """
+    Greedy word wrap of one paragraph.
+
+    Returns:
+        (lines, pPr, pixels per point), each line a list of
+        (text, font, colour, font size in px) segments
+    """
+    ppr = p.find(f"{A}pPr")
+    base = run_style(ppr.find(f"{A}defRPr") if ppr is not None else None, base)
+    pt_px = canvas.scale * canvas.transform[2] * slidekit.EMU_PER_PT
+
+    lines = [[]]
+    width = 0.0
+
+    def new_line():
+        nonlocal width
+        lines.append([])
+        width = 0.0
+
+    for child in p:
+        tag = etree.QName(child).localname
+        if tag == "br":
+            new_line()
+            continue
+        if tag != "r":
+            continue
+        style = run_style(child.find(f"{A}rPr"), base)
+        f = font(style["face"], style["bold"], max(1, round(style["size"] * pt_px)))
+        for word in _words(child.findtext(f"{A}t") or "", f):
+            w = f.getlength(word)
+            if max_width is not None and lines[-1] and width + w > max_width and word.strip():
+                new_line()
+                word = word.lstrip()
+                w = f.getlength(word)
+            lines[-1].append((word, f, style["color"], style["size"] * pt_px))
+            width += w
+    if not any(lines):
+        # An empty paragraph still takes a line at its default size
+        lines = [[("", font(base["face"], base["bold"], max(1, round(base["size"] * pt_px))),
+                   base["color"], base["size"] * pt_px)]]
+    return lines, ppr, pt_px
+
+
+# Emoji presentation selectors and the zero-width joiner: only meaningful
+# to a colour-emoji font, which the preview doesn't have
+EMOJI_JOINERS = {"\ufe0e", "\ufe0f", "\u200d"}
+
+
+@functools.lru_cache(maxsize=4096)
+def _has_glyph(f, ch):
+    """False if `f` would draw `ch` as its .notdef box (tofu), e.g. the ⏱ ❌ emoji in DejaVu."""
+    return _glyph_mask(f, ch) != _glyph_mask(f, "\U0010fffd")
+
+
+def _glyph_mask(f, ch):
+    mask = f.getmask(ch)
+    return mask.size, bytes(mask)
+
+
+def _words(text, f):
+    out, current = [], ""
+    for ch in text:
+        if ch in EMOJI_JOINERS or not _has_glyph(f, ch):
+            continue
+        current += ch
+        if ch == " ":
+            out.append(current)
+            current = ""
+    if current:
+        out.append(current)
+    return out
+
+
+def draw_text(canvas, tx_body, box, default_color, default_anchor):
+    body_pr = tx_body.find(f"{A}bodyPr")
+    x0, y0, x1, y1 = box
+    ins = {k: canvas.px(int(body_pr.get(k, v))) for k, v in INSETS.items()}
+    left, right = x0 + ins["lIns"], x1 - ins["rIns"]
+    top, bottom = y0 + ins["tIns"], y1 - ins["bIns"]
+    max_width = None if body_pr.get("wrap") == "none" else max(1.0, right - left)
+    base = {"size": DEFAULT_SIZE_PT, "bold": False, "face": "Calibri", "color": default_color}
+
+    blocks = []  # (y offset, line, height, align)
+    y = 0.0
+    for p in tx_body.findall(f"{A}p"):
+        lines, ppr, pt_px = layout_paragraph(p, base, max_width, canvas)
+        align = ppr.get("algn", "l") if ppr is not None else "l"
+        spacing = {}
+        if ppr is not None:
+            for tag in ("lnSpc", "spcBef", "spcAft"):
+                pts = ppr.find(f"{A}{tag}/{A}spcPts")
+                if pts is not None:
+                    spacing[tag] = int(pts.get("val")) / 100 * pt_px
+        y += spacing.get("spcBef", 0)
+        for line in lines:
+            height = spacing.get("lnSpc") or max(seg[3] for seg in line) * LINE_HEIGHT
+            blocks.append((y, line, height, align))
+            y += height
+        y += spacing.get("spcAft", 0)
+
+    anchor = body_pr.get("anchor", default_anchor)
+    offset = top
+    if anchor == "ctr":
+        offset = top + (bottom - top - y) / 2
+    elif anchor == "b":
+        offset = bottom - y
+
+    for line_y, line, height, align in blocks:
+        width = sum(seg[1].getlength(seg[0]) for seg in line)
+        if align == "ctr":
+            x = left + (right - left - width) / 2
+        elif align == "r":
+            x = right - width
+        else:
+            x = left
+        for text, f, color, _ in line:
+            if text:
+                canvas.draw.text((x, offset + line_y + height / 2), text, font=f, fill=rgb(color), anchor="lm")
+            x += f.getlength(text)
+
+
+# ──────────────────────────────────────────────────────────
+# Shapes and slides
+# ──────────────────────────────────────────────────────────
+def draw_shape(canvas, sp):
+    sp_pr = sp.find(f"{P}spPr")
+    off, ext = sp_pr.find(f"{A}xfrm/{A}off"), sp_pr.find(f"{A}xfrm/{A}ext")
+    if off is None or ext is None:
+        return
+    box = canvas.box(int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")))
+    is_textbox = sp.find(f"{P}nvSpPr/{P}cNvSpPr").get("txBox") == "1"
+    styled = sp.find(f"{P}style") is not None
+
+    fill = fill_color(sp_pr, THEME["accent1"] if styled else None)
+    ln = sp_pr.find(f"{A}ln")
+    line = fill_color(ln, STYLE_LINE if styled else None) if ln is not None else (STYLE_LINE if styled else None)
+    line_w = canvas.px(int(ln.get("w", 9525)) if ln is not None else 9525)
+
+    x0, y0, x1, y1 = box
+    prst = sp_pr.find(f"{A}prstGeom")
+    cust = sp_pr.find(f"{A}custGeom")
+    if (fill or line) and not is_textbox:
+        if cust is not None:
+            for kind, pts in custom_paths(cust, *box):
+                draw_outline(canvas, kind, pts, fill, line, line_w)
+        else:
+            kind = prst.get("prst") if prst is not None else "rect"
+            outline = preset_outline(kind, prst, *box)
+            if outline:
+                draw_outline(canvas, "polygon", outline, fill, line, line_w)
+            elif kind == "ellipse":
+                draw_outline(canvas, "ellipse", [(x0, y0), (x1, y1)], fill, line, line_w)
+            else:
+                radius = min(x1 - x0, y1 - y0) * _adj(prst, 0.16667) if kind == "roundRect" else 0
+                draw_outline(canvas, "rect", [(x0, y0), (x1, y1)], fill, line, line_w, radius)
+    elif is_textbox and fill:
+        draw_outline(canvas, "rect", [(x0, y0), (x1, y1)], fill, line, line_w)
+
+    tx_body = sp.find(f"{P}txBody")
+    if tx_body is not None:
+        draw_text(canvas, tx_body, box,
+                  THEME["lt1"] if styled else THEME["tx1"], "t" if is_textbox else "ctr")
+
+
+def draw_chart_frame(canvas, frame):
+    """Charts live in their own part; mark where one sits and what kind it is."""
+    off, ext = frame.find(f"{P}xfrm/{A}off"), frame.find(f"{P}xfrm/{A}ext")
+    if off is None or ext is None:
+        return
+    x0, y0, x1, y1 = canvas.box(int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")))
+    color = rgb(CHART_PLACEHOLDER)
+    width = max(1, round(canvas.px(19050)))
+    canvas.draw.rectangle([x0, y0, x1, y1], outline=color, width=width)
+    name = frame.find(f"{P}nvGraphicFramePr/{P}cNvPr").get("name", "Chart")
+    label_font = font("Calibri", False, max(1, round(canvas.px(14 * slidekit.EMU_PER_PT))))
+    canvas.draw.text(((x0 + x1) / 2, (y0 + y1) / 2), name, fill=color, font=label_font, anchor="mm")
+
+
+def draw_tree(canvas, tree):
+    for child in tree:
+        tag = etree.QName(child).localname
+        if tag == "sp":
+            draw_shape(canvas, child)
+        elif tag == "graphicFrame":
+            draw_chart_frame(canvas, child)
+        elif tag == "grpSp":
+            xfrm = child.find(f"{P}grpSpPr/{A}xfrm")
+            saved = canvas.transform
+            if xfrm is not None:
+                off, ext = xfrm.find(f"{A}off"), xfrm.find(f"{A}ext")
+                ch_off, ch_ext = xfrm.find(f"{A}chOff"), xfrm.find(f"{A}chExt")
+                sx = int(ext.get("cx")) / max(1, int(ch_ext.get("cx")))
+                sy = int(ext.get("cy")) / max(1, int(ch_ext.get("cy")))
+                gx = int(off.get("x")) - int(ch_off.get("x")) * sx
+                gy = int(off.get("y")) - int(ch_off.get("y")) * sy
+                ox, oy, psx, psy = saved
+                canvas.transform = (ox + gx * psx, oy + gy * psy, psx * sx, psy * sy)
+            draw_tree(canvas, child)
+            canvas.transform = saved
+
+
+def render_png(part, slide_size, width=DEFAULT_WIDTH):
+    """
+    Draw one slide XML part.
+
+    Args:
+        part: Slide XML bytes
+        slide_size: (cx, cy) in EMU
+        width: Output width in pixels
+
+    Returns:
+        PNG bytes
+    """
+    canvas = Canvas(*slide_size, width)
+    root = etree.fromstring(part)
+    c_sld = root.find(f"{P}cSld")
+    bg = fill_color(c_sld.find(f"{P}bg/{P}bgPr"))
+    if bg:
+        canvas.draw.rectangle([0, 0, *canvas.size], fill=rgb(bg))
+    draw_tree(canvas, c_sld.find(f"{P}spTree"))
+    buf = io.BytesIO()
+    canvas.thumbnail().save(buf, "PNG", optimize=False)
+    return buf.getvalue()
+
+
+# ──────────────────────────────────────────────────────────
+# Cache and CLI
+# ──────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=1)
+def preview_renderer_hash():
+    with open(os.path.abspath(__file__), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def preview_key(slide_digest, slide_size, width):
+    payload = f"{slide_digest}:{slide_size[0]}x{slide_size[1]}:{width}:{preview_renderer_hash()}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def preview_cache_path(key):
+    return os.path.join(PREVIEW_CACHE_DIR, f"{key}.png")
+
+
+def _one_slide_deck(spec, slide):
+    buf = io.BytesIO()
+    slidekit.build_deck({**spec, "slides": [slide]}, buf)
+    return buf.getvalue()
+
+
+def deck_slides(name, path):
+    """
+    Slide parts of a spec deck, through the build's slide cache (chart
+    slides, which the build doesn't cache, are rendered in a one-slide deck).
+
+    Returns:
+        (slide size in EMU, [(slide hash, part bytes)])
+    """
+    spec = slidekit.load_spec(path)
+    width, height = spec.get("size", [13.333, 7.5])
+    slides = []
+    for slide in spec["slides"]:
+        digest = build.slide_hash(slide, spec.get("colors"))
+        part = build.read_part(digest)
+        if part is None and slidekit.has_charts(slide):
+            part = slidekit.slide_parts(_one_slide_deck(spec, slide))[0]
+        elif part is None:
+            part = build.render_part(slide, spec.get("colors"))
+            build.write_part(digest, part)
+        slides.append((digest, part))
+    return (slidekit.emu(width), slidekit.emu(height)), slides
+
+
+def pptx_slides(path):
+    """Slide parts of any .pptx, keyed by a hash of their bytes."""
+    with zipfile.ZipFile(path) as z:
+        pres = etree.fromstring(z.read("ppt/presentation.xml"))
+    size = pres.find(f"{P}sldSz")
+    parts = slidekit.slide_parts(path)
+    return ((int(size.get("cx")), int(size.get("cy"))),
+            [(hashlib.sha256(part).hexdigest(), part) for part in parts])
+
+
+def preview(decks, width=DEFAULT_WIDTH, jobs=None):
+    """
+    Write PNG previews for each deck, drawing only uncached slides.
+
+    Args:
+        decks: deck name -> (slide size, [(slide hash, part)])
+        width: Thumbnail width in pixels
+        jobs: Worker processes (None: CPU count, 1: draw in this process)
+
+    Returns:
+        (deck name -> [png paths], number of slides drawn)
+    """
+    todo = {}
+    for size, slides in decks.values():
+        for digest, part in slides:
+            key = preview_key(digest, size, width)
+            if key not in todo and not os.path.exists(preview_cache_path(key)):
+                todo[key] = (part, size)
+
+    def record(key, png):
+        os.makedirs(PREVIEW_CACHE_DIR, exist_ok=True)
+        tmp = f"{preview_cache_path(key)}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(png)
+        os.replace(tmp, preview_cache_path(key))
+
+    if len(todo) <= 1 or jobs == 1:
+        for key, (part, size) in todo.items():
+            record(key, render_png(part, size, width))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(render_png, part, size, width): key for key, (part, size) in todo.items()}
+            for future in as_completed(futures):
+                record(futures[future], future.result())
+
+    written = {}
+    for name, (size, slides) in decks.items():
+        out_dir = os.path.join(PREVIEW_DIR, name)
+        if os.path.isdir(out_dir):
+            shutil.rmtree(out_dir)
+        os.makedirs(out_dir)
+        written[name] = []
+        for i, (digest, _) in enumerate(slides):
+            out = os.path.join(out_dir, f"slide-{i + 1:02d}.png")
+            shutil.copyfile(preview_cache_path(preview_key(digest, size, width)), out)
+            written[name].append(out)
+    return written, len(todo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("decks", nargs="*", help="Deck names (spec file names without extension)")
+    parser.add_argument("--pptx", action="append", default=[], metavar="FILE",
+                        help="Preview an existing .pptx instead of a spec (repeatable)")
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH, help="Thumbnail width in pixels")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    decks = {}
+    for path in args.pptx:
+        decks[os.path.splitext(os.path.basename(path))[0]] = pptx_slides(path)
+    if args.decks or not args.pptx:
+        for name, path in build.select_decks(args.decks).items():
+            decks[name] = deck_slides(name, path)
+
+    written, drawn = preview(decks, width=args.width, jobs=args.jobs)
+    for name, paths in written.items():
+        print(f"  {name:28s} {len(paths):3d} slides  -> {os.path.relpath(os.path.join(PREVIEW_DIR, name), build.REPO_ROOT)}")
+    print(f"{len(written)} deck(s) previewed in {time.perf_counter() - start:.2f}s ({drawn} slide(s) drawn)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
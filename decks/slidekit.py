@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+"""
+Shared slide rendering for the Pacer pitch decks.
+
+Decks are declarative specs (decks/specs/*.json, or .yaml when PyYAML is
+installed) rendered to .pptx by build_deck(). Instead of going through
+python-pptx's per-shape object layer, each slide's shapes are written as
+DrawingML assembled from small cached fragments (fills, lines, run
+properties) and parsed in one batch into the slide's shape tree. The blank
+template is read once per process and shared by every deck.
+
+Spec format — geometry in inches, type sizes, spacing and line widths in
+points, colours as palette names or RRGGBB hex:
+
+  {
+    "output": "pitch-deck.pptx",          # relative to the repo root
+    "size": [13.333, 7.5],
+    "colors": {"DARK_BG": "0F172A", ...},
+    "slides": [
+      {"background": "DARK_BG", "shapes": [<shape>, ...]}
+    ]
+  }
+
+  Text box:   {"box": [x, y, w, h], "text": [<paragraph>, ...], "body": {...}}
+  Autoshape:  {"geom": "roundRect", "box": [...], "adj": [0.05],
+               "fill": "RED" | null, "line": null | {"color", "width", "dash"},
+               "shadow": false, "text": [...], "body": {...}}
+  Freeform:   {"geom": "custom", "parts": [["rect" | "ellipse", x, y, w, h], ...],
+               "fill", "line", ...}                 # one shape, one path
+  Group:      {"group": [<shape>, ...]}
+  Chart:      {"chart": "column|stacked_bar_100|line|doughnut|...", "box": [...],
+               "categories": [...], "series": [{"name", "values", "color" | "colors"}],
+               "legend": "bottom" | null, "labels": true, "number_format": "0%",
+               "label_format", "label_font": {"size", "color", ...}, "axis_format",
+               "gridlines": "DIM" | null, "axis_min", "axis_max", "gap_width",
+               "overlap", "size", "color", "face"}   # native chart, own part
+
+  Paragraph:  {"align": "left|center|right|justify", "margin": [marL, indent],
+               "space_before": pt, "space_after": pt, "line_spacing": pt,
+               "size", "bold", "italic", "color", "face",   # paragraph defaults
+               "text": "line\\nbreaks become <a:br/>"  |  "runs": [<run>, ...]}
+  Run:        "plain text" | "\\n" | {"text", "size", "bold", "italic", "color", "face"}
+
+"body" holds <a:bodyPr> attributes merged over the default for the shape
+kind (null removes one); "autofit": true adds <a:spAutoFit/>. An omitted
+"fill"/"line" keeps the theme style; null means none.
+
+Decorative runs of same-styled dots, bars or rules belong in one freeform
+(its box is the parts' bounds) and clusters of small text boxes in a
+group, rather than one shape each.
+"""
+
+import functools
+import io
+import itertools
+import json
+import os
+import re
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+
+import pptx
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.opc.oxml import serialize_part_xml
+from pptx.oxml import parse_xml
+from pptx.oxml.slide import CT_Slide
+from pptx.util import Pt
+
+try:
+    import yaml
+except ImportError:  # YAML specs are optional
+    yaml = None
+
+EMU_PER_INCH = 914400
+EMU_PER_PT = 12700
+BLANK_LAYOUT = 6
+
+NSDECL = ('xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+          'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+          'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"')
+
+DEFAULT_TEMPLATE = os.path.join(os.path.dirname(pptx.__file__), "templates", "default.pptx")
+
+ALIGN = {"left": "l", "center": "ctr", "right": "r", "justify": "just", "distributed": "dist"}
+ALIGN_NAMES = {v: k for k, v in ALIGN.items()}
+
+# Shape names PowerPoint (and python-pptx) give each preset geometry
+GEOM_NAMES = {"rect": "Rectangle", "roundRect": "Rounded Rectangle", "ellipse": "Oval",
+              "chevron": "Chevron", "rightArrow": "Right Arrow", "triangle": "Isosceles Triangle"}
+
+TEXTBOX_BODY = {"wrap": "square", "autofit": True}
+AUTOSHAPE_BODY = {"rtlCol": "0", "anchor": "ctr"}
+AUTOSHAPE_TEXT = [{"align": "center"}]
+
+# Theme style every autoshape carries (line/fill/effect/font references)
+AUTOSHAPE_STYLE = (
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+)
+
+CHART_TYPES = {
+    "column": XL_CHART_TYPE.COLUMN_CLUSTERED, "stacked_column": XL_CHART_TYPE.COLUMN_STACKED,
+    "stacked_column_100": XL_CHART_TYPE.COLUMN_STACKED_100, "bar": XL_CHART_TYPE.BAR_CLUSTERED,
+    "stacked_bar": XL_CHART_TYPE.BAR_STACKED, "stacked_bar_100": XL_CHART_TYPE.BAR_STACKED_100,
+    "line": XL_CHART_TYPE.LINE_MARKERS, "pie": XL_CHART_TYPE.PIE, "doughnut": XL_CHART_TYPE.DOUGHNUT,
+}
+LEGEND_POSITIONS = {"bottom": XL_LEGEND_POSITION.BOTTOM, "top": XL_LEGEND_POSITION.TOP,
+                    "right": XL_LEGEND_POSITION.RIGHT, "left": XL_LEGEND_POSITION.LEFT}
+
+_HEX = re.compile(r'^[0-9A-Fa-f]{6}$')
+
+
+# ──────────────────────────────────────────────────────────
+# Spec files
+# ──────────────────────────────────────────────────────────
+def load_spec(path):
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise RuntimeError(f"{path}: PyYAML is not installed (pip install pyyaml)")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def dump_spec(spec, f):
+    """Write a spec as JSON with one shape per line, so diffs stay readable."""
+    f.write("{\n")
+    top = [k for k in spec if k != "slides"]
+    for key in top:
+        f.write(f"  {json.dumps(key)}: {json.dumps(spec[key], ensure_ascii=False)},\n")
+    f.write('  "slides": [\n')
+    for i, slide in enumerate(spec.get("slides", [])):
+        f.write("    {\n")
+        items = [(k, v) for k, v in slide.items() if k != "shapes"]
+        for key, value in items:
+            f.write(f"      {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n")
+        f.write('      "shapes": [\n')
+        shapes = slide.get("shapes", [])
+        for j, shape in enumerate(shapes):
+            comma = "," if j < len(shapes) - 1 else ""
+            f.write(f"        {json.dumps(shape, ensure_ascii=False)}{comma}\n")
+        f.write("      ]\n")
+        f.write("    }" + ("," if i < len(spec["slides"]) - 1 else "") + "\n")
+    f.write("  ]\n}\n")
+
+
+# ──────────────────────────────────────────────────────────
+# Fragments
+# ──────────────────────────────────────────────────────────
+def emu(inches):
+    return int(round(inches * EMU_PER_INCH))
+
+
+class Palette:
+    """Resolves colour names from the spec's "colors" table to RRGGBB."""
+
+    def __init__(self, colors=None):
+        self.colors = {name: value.upper() for name, value in (colors or {}).items()}
+
+    def __call__(self, value):
+        hexval = self.colors.get(value, value)
+        if not isinstance(hexval, str) or not _HEX.match(hexval):
+            raise ValueError(f"Unknown colour {value!r}")
+        return hexval.upper()
+
+
+@functools.lru_cache(maxsize=1024)
+def solid_fill(hexval):
+    return f'<a:solidFill><a:srgbClr val="{hexval}"/></a:solidFill>'
+
+
+@functools.lru_cache(maxsize=4096)
+def _run_props(tag, size, bold, italic, color, face):
+    attrs = ""
+    if size is not None:
+        attrs += f' sz="{int(round(size * 100))}"'
+    if bold is not None:
+        attrs += f' b="{int(bool(bold))}"'
+    if italic is not None:
+        attrs += f' i="{int(bool(italic))}"'
+    children = (solid_fill(color) if color else "") + (f'<a:latin typeface={quoteattr(face)}/>' if face else "")
+    return f"<a:{tag}{attrs}>{children}</a:{tag}>" if children else f"<a:{tag}{attrs}/>"
+
+
+def run_props(tag, props, palette):
+    """<a:rPr>/<a:defRPr> for a run or paragraph, or '' when it sets nothing."""
+    keys = ("size", "bold", "italic", "color", "face")
+    if not any(k in props for k in keys):
+        return ""
+    color = palette(props["color"]) if props.get("color") else None
+    return _run_props(tag, props.get("size"), props.get("bold"), props.get("italic"),
+                      color, props.get("face"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _line(width, hexval, dash, hidden):
+    attrs = f' w="{int(round(width * EMU_PER_PT))}"' if width is not None else ""
+    inner = "<a:noFill/>" if hidden else (solid_fill(hexval) if hexval else "")
+    if dash:
+        inner += f'<a:prstDash val="{dash}"/>'
+    return f"<a:ln{attrs}>{inner}</a:ln>" if inner else f"<a:ln{attrs}/>"
+
+
+def line_xml(line, palette):
+    if line is None:
+        return _line(None, None, None, True)
+    color = palette(line["color"]) if line.get("color") else None
+    return _line(line.get("width"), color, line.get("dash"), bool(line.get("hidden")))
+
+
+# ──────────────────────────────────────────────────────────
+# Text
+# ──────────────────────────────────────────────────────────
+def runs_of(paragraph):
+    """A paragraph's runs, with "text" shorthand expanded (\\n -> line break)."""
+    if "runs" in paragraph:
+        return paragraph["runs"]
+    if "text" in paragraph:
+        return [part for part in re.split(r"(\n)", paragraph["text"]) if part]
+    return []
+
+
+def paragraph_xml(paragraph, palette):
+    ppr_attrs = ""
+    if "margin" in paragraph:
+        mar_l, indent = paragraph["margin"]
+        ppr_attrs += f' marL="{emu(mar_l)}" indent="{emu(indent)}"'
+    if "align" in paragraph:
+        ppr_attrs += f' algn="{ALIGN[paragraph["align"]]}"'
+    ppr_children = ""
+    if "line_spacing" in paragraph:
+        ppr_children += f'<a:lnSpc><a:spcPts val="{int(round(paragraph["line_spacing"] * 100))}"/></a:lnSpc>'
+    if "space_before" in paragraph:
+        ppr_children += f'<a:spcBef><a:spcPts val="{int(round(paragraph["space_before"] * 100))}"/></a:spcBef>'
+    if "space_after" in paragraph:
+        ppr_children += f'<a:spcAft><a:spcPts val="{int(round(paragraph["space_after"] * 100))}"/></a:spcAft>'
+    ppr_children += run_props("defRPr", paragraph, palette)
+
+    if ppr_children:
+        ppr = f"<a:pPr{ppr_attrs}>{ppr_children}</a:pPr>"
+    elif ppr_attrs or paragraph.get("pPr"):
+        ppr = f"<a:pPr{ppr_attrs}/>"
+    else:
+        ppr = ""
+
+    parts = [ppr]
+    for run in runs_of(paragraph):
+        if run == "\n":
+            parts.append("<a:br/>")
+        elif isinstance(run, str):
+            parts.append(f"<a:r><a:t>{escape(run)}</a:t></a:r>")
+        else:
+            parts.append(f"<a:r>{run_props('rPr', run, palette)}<a:t>{escape(run['text'])}</a:t></a:r>")
+    return f"<a:p>{''.join(parts)}</a:p>"
+
+
+def body_xml(defaults, body, paragraphs, palette):
+    attrs = dict(defaults)
+    attrs.update(body or {})
+    autofit = attrs.pop("autofit", False)
+    attr_xml = "".join(f" {k}={quoteattr(str(v))}" for k, v in attrs.items() if v is not None)
+    body_pr = f"<a:bodyPr{attr_xml}><a:spAutoFit/></a:bodyPr>" if autofit else f"<a:bodyPr{attr_xml}/>"
+    paras = "".join(paragraph_xml(p, palette) for p in paragraphs) or "<a:p/>"
+    return f"<p:txBody>{body_pr}<a:lstStyle/>{paras}</p:txBody>"
+
+
+# ──────────────────────────────────────────────────────────
+# Shapes
+# ──────────────────────────────────────────────────────────
+def emu_box(shape):
+    """A shape's (x, y, cx, cy) in EMU; freeforms and groups span their parts/children."""
+    if "box" in shape:
+        x, y, w, h = shape["box"]
+        return emu(x), emu(y), emu(w), emu(h)
+    if "group" in shape:
+        boxes = [emu_box(child) for child in shape["group"]]
+    else:
+        boxes = [(emu(x), emu(y), emu(w), emu(h)) for _, x, y, w, h in shape["parts"]]
+    x0, y0 = min(b[0] for b in boxes), min(b[1] for b in boxes)
+    return (x0, y0, max(b[0] + b[2] for b in boxes) - x0, max(b[1] + b[3] for b in boxes) - y0)
+
+
+def _xfrm(box, child=False):
+    x, y, cx, cy = box
+    xml = f'<a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/>'
+    if child:  # groups map children 1:1 onto the slide
+        xml += f'<a:chOff x="{x}" y="{y}"/><a:chExt cx="{cx}" cy="{cy}"/>'
+    return f"<a:xfrm>{xml}</a:xfrm>"
+
+
+def _subpath(kind, x, y, w, h):
+    if kind == "rect":
+        return (f'<a:moveTo><a:pt x="{x}" y="{y}"/></a:moveTo><a:lnTo><a:pt x="{x + w}" y="{y}"/></a:lnTo>'
+                f'<a:lnTo><a:pt x="{x + w}" y="{y + h}"/></a:lnTo><a:lnTo><a:pt x="{x}" y="{y + h}"/></a:lnTo>'
+                '<a:close/>')
+    if kind == "ellipse":
+        return (f'<a:moveTo><a:pt x="{x + w}" y="{y + h // 2}"/></a:moveTo>'
+                f'<a:arcTo wR="{w // 2}" hR="{h // 2}" stAng="0" swAng="21600000"/><a:close/>')
+    raise ValueError(f"Unknown freeform part {kind!r}")
+
+
+def _custom_geometry(parts, box):
+    """One path holding every part, in EMU relative to the shape's box."""
+    x0, y0, cx, cy = box
+    path = "".join(_subpath(kind, emu(x) - x0, emu(y) - y0, emu(w), emu(h)) for kind, x, y, w, h in parts)
+    return ('<a:custGeom><a:avLst/><a:gdLst/><a:ahLst/><a:cxnLst/><a:rect l="0" t="0" r="r" b="b"/>'
+            f'<a:pathLst><a:path w="{cx}" h="{cy}">{path}</a:path></a:pathLst></a:custGeom>')
+
+
+def _geometry(geom, adj):
+    if not adj:
+        return f'<a:prstGeom prst="{geom}"><a:avLst/></a:prstGeom>'
+    names = ["adj"] if len(adj) == 1 else [f"adj{i + 1}" for i in range(len(adj))]
+    gds = "".join(f'<a:gd name="{n}" fmla="val {int(round(a * 100000))}"/>' for n, a in zip(names, adj))
+    return f'<a:prstGeom prst="{geom}"><a:avLst>{gds}</a:avLst></a:prstGeom>'
+
+
+def shape_xml(shape, ids, palette):
+    """
+    DrawingML for one spec shape: a text box when it has no "geom", a group
+    for "group", otherwise an autoshape. Shape ids are drawn from `ids`.
+    """
+    shape_id = next(ids)
+    if "group" in shape:
+        children = "".join(shape_xml(child, ids, palette) for child in shape["group"])
+        nv = (f'<p:nvGrpSpPr><p:cNvPr id="{shape_id}" name="Group {shape_id - 1}"/>'
+              '<p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>')
+        return f"<p:grpSp>{nv}<p:grpSpPr>{_xfrm(emu_box(shape), child=True)}</p:grpSpPr>{children}</p:grpSp>"
+
+    geom = shape.get("geom")
+    box = emu_box(shape)
+    if geom is None:
+        name = f"TextBox {shape_id - 1}"
+        nv = f'<p:nvSpPr><p:cNvPr id="{shape_id}" name="{name}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+        sp_pr = f"<p:spPr>{_xfrm(box)}{_geometry('rect', None)}<a:noFill/></p:spPr>"
+        text = body_xml(TEXTBOX_BODY, shape.get("body"), shape.get("text", []), palette)
+        return f"<p:sp>{nv}{sp_pr}{text}</p:sp>"
+
+    if geom == "custom":
+        name = f"Freeform {shape_id - 1}"
+        geometry = _custom_geometry(shape["parts"], box)
+    else:
+        name = f"{GEOM_NAMES.get(geom, geom)} {shape_id - 1}"
+        geometry = _geometry(geom, shape.get("adj"))
+    nv = f'<p:nvSpPr><p:cNvPr id="{shape_id}" name={quoteattr(name)}/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    fill = ""
+    if "fill" in shape:
+        fill = solid_fill(palette(shape["fill"])) if shape["fill"] is not None else "<a:noFill/>"
+    line = line_xml(shape["line"], palette) if "line" in shape else ""
+    effects = "<a:effectLst/>" if shape.get("shadow") is False else ""
+    sp_pr = f"<p:spPr>{_xfrm(box)}{geometry}{fill}{line}{effects}</p:spPr>"
+    text = body_xml(AUTOSHAPE_BODY, shape.get("body"), shape.get("text", AUTOSHAPE_TEXT), palette)
+    return f"<p:sp>{nv}{sp_pr}{AUTOSHAPE_STYLE}{text}</p:sp>"
+
+
+def has_charts(spec):
+    return any("chart" in shape for shape in spec.get("shapes", []))
+
+
+def render_slide(slide, spec, palette):
+    """Fill a blank python-pptx slide from its spec."""
+    fill_slide(slide._element, spec, palette)
+    for i, shape in enumerate(spec.get("shapes", [])):
+        if "chart" in shape:
+            # After the nvGrpSpPr/grpSpPr header, in spec order
+            add_chart(slide, shape, palette, position=2 + i)
+
+
+def slide_part(spec, palette):
+    """
+    A slide's complete XML part, rendered without a presentation. Byte-for-byte
+    what render_slide() + save() would write for the same slide.
+    """
+    if has_charts(spec):
+        raise ValueError("Chart slides need their own package parts; render them with build_deck()")
+    sld = CT_Slide.new()
+    fill_slide(sld, spec, palette)
+    return serialize_part_xml(sld)
+
+
+def fill_slide(sld, spec, palette):
+    c_sld = sld.cSld
+    if spec.get("background"):
+        bg = f'<p:bg {NSDECL}><p:bgPr>{solid_fill(palette(spec["background"]))}<a:effectLst/></p:bgPr></p:bg>'
+        c_sld.insert(0, parse_xml(bg))
+    shapes = [shape for shape in spec.get("shapes", []) if "chart" not in shape]
+    if shapes:
+        # One parse for the whole slide; ids continue after the tree's own id 1
+        ids = itertools.count(2)
+        xml = "".join(shape_xml(shape, ids, palette) for shape in shapes)
+        c_sld.spTree.extend(list(parse_xml(f"<p:spTree {NSDECL}>{xml}</p:spTree>")))
+
+
+# ──────────────────────────────────────────────────────────
+# Charts
+# ──────────────────────────────────────────────────────────
+def _chart_text(font, props, palette):
+    if "size" in props:
+        font.size = Pt(props["size"])
+    if props.get("color"):
+        font.color.rgb = RGBColor.from_string(palette(props["color"]))
+    if props.get("face"):
+        font.name = props["face"]
+    if "bold" in props:
+        font.bold = props["bold"]
+
+
+def add_chart(slide, shape, palette, position=None):
+    """
+    Add a native chart (python-pptx builds its chart part and embedded
+    workbook) and move it to `position` in the shape tree.
+    """
+    data = CategoryChartData(number_format=shape.get("number_format", "General"))
+    data.categories = shape["categories"]
+    for series in shape["series"]:
+        data.add_series(series["name"], series["values"])
+    x, y, cx, cy = emu_box(shape)
+    kind = CHART_TYPES[shape["chart"]]
+    frame = slide.shapes.add_chart(kind, x, y, cx, cy, data)
+    chart = frame.chart
+
+    _chart_text(chart.font, shape, palette)
+    legend = shape.get("legend", "bottom")
+    chart.has_legend = legend is not None
+    if legend is not None:
+        chart.legend.position = LEGEND_POSITIONS[legend]
+        chart.legend.include_in_layout = False
+
+    plot = chart.plots[0]
+    if shape.get("labels"):
+        plot.has_data_labels = True
+        labels = plot.data_labels
+        labels.number_format = shape.get("label_format", shape.get("number_format", "General"))
+        labels.number_format_is_linked = False
+        _chart_text(labels.font, shape.get("label_font", {}), palette)
+    if "gap_width" in shape:
+        plot.gap_width = shape["gap_width"]
+    if "overlap" in shape:
+        plot.overlap = shape["overlap"]
+
+    pie = kind in (XL_CHART_TYPE.PIE, XL_CHART_TYPE.DOUGHNUT)
+    for series, series_spec in zip(plot.series, shape["series"]):
+        if pie:
+            for point, color in zip(series.points, series_spec.get("colors", [])):
+                point.format.fill.solid()
+                point.format.fill.fore_color.rgb = RGBColor.from_string(palette(color))
+        elif series_spec.get("color"):
+            color = RGBColor.from_string(palette(series_spec["color"]))
+            if kind == XL_CHART_TYPE.LINE_MARKERS:
+                series.format.line.color.rgb = color
+                series.format.line.width = Pt(series_spec.get("width", 2.25))
+                series.smooth = False
+                series.marker.format.fill.solid()
+                series.marker.format.fill.fore_color.rgb = color
+            else:
+                series.format.fill.solid()
+                series.format.fill.fore_color.rgb = color
+
+    if not pie:
+        value_axis = chart.value_axis
+        gridlines = shape.get("gridlines")
+        value_axis.has_major_gridlines = gridlines is not None
+        if gridlines is not None:
+            value_axis.major_gridlines.format.line.color.rgb = RGBColor.from_string(palette(gridlines))
+        if "axis_max" in shape:
+            value_axis.maximum_scale = shape["axis_max"]
+        if "axis_min" in shape:
+            value_axis.minimum_scale = shape["axis_min"]
+        value_axis.tick_labels.number_format = shape.get("axis_format", "General")
+        value_axis.tick_labels.number_format_is_linked = False
+        for axis in (value_axis, chart.category_axis):
+            axis.format.line.fill.background()
+
+    if position is not None:
+        tree = slide.shapes._spTree
+        tree.remove(frame._element)
+        tree.insert(position, frame._element)
+    return frame
+
+
+# ──────────────────────────────────────────────────────────
+# Decks
+# ──────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=8)
+def template_bytes(path=DEFAULT_TEMPLATE):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def build_deck(spec, out=None):
+    """
+    Render a deck spec.
+
+    Args:
+        spec: Parsed spec dict
+        out: Path or file object to save to (None: don't save)
+
+    Returns:
+        The python-pptx Presentation
+    """
+    prs = Presentation(io.BytesIO(template_bytes(spec.get("template", DEFAULT_TEMPLATE))))
+    width, height = spec.get("size", [13.333, 7.5])
+    prs.slide_width, prs.slide_height = emu(width), emu(height)
+    palette = Palette(spec.get("colors"))
+    layout = prs.slide_layouts[BLANK_LAYOUT]
+    for slide_spec in spec["slides"]:
+        render_slide(prs.slides.add_slide(layout), slide_spec, palette)
+    if out is not None:
+        prs.save(out)
+    return prs
+
+
+def slide_parts(data):
+    """Slide XML parts of a .pptx (path, file object or bytes) in presentation order."""
+    with zipfile.ZipFile(io.BytesIO(data) if isinstance(data, bytes) else data) as z:
+        names = sorted((n for n in z.namelist() if re.match(r"ppt/slides/slide\d+\.xml$", n)),
+                       key=lambda n: int(re.search(r"(\d+)\.xml$", n).group(1)))
+        return [z.read(n) for n in names]
+
+
+def assemble_deck(spec, parts, out):
+    """
+    Save a deck whose slides are already rendered by slide_part(). The package
+    is built with blank slides, then each slide entry is swapped for its part
+    while the zip is copied.
+    """
+    skeleton = io.BytesIO()
+    build_deck({**spec, "slides": [{}] * len(parts)}, skeleton)
+    slides = {f"ppt/slides/slide{i + 1}.xml": part for i, part in enumerate(parts)}
+    with zipfile.ZipFile(skeleton) as src, zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            dst.writestr(info, slides.get(info.filename) or src.read(info))
@@ -61,3 +61,41 @@ export function backendHeaders(contentType) {
   if (BACKEND_TOKEN) h['Authorization'] = `Bearer ${BACKEND_TOKEN}`;
   return h;
 }
+
+// Google endpoints the browser calls directly when no backend is configured
+const GOOGLE_API_URLS = {
+  nl: method => `https://language.googleapis.com/v1/documents:${method}`,
+  vision: method => `https://vision.googleapis.com/v1/images:${method}`,
+  gemini: method => `https://generativelanguage.googleapis.com/v1beta/models/${method}`,
+};
+
+/**
+ * POST a Google NL / Vision / Gemini request, through the backend's caching
+ * proxy (/google/...) when a backend is configured, so a passage or worksheet
+ * image already analyzed for another student isn't sent to Google again.
+ * Falls back to calling Google directly if the backend can't be reached.
+ * @param {'nl'|'vision'|'gemini'} service
+ * @param {string} method - e.g. 'analyzeSyntax', 'annotate', 'gemini-2.0-flash:generateContent'
+ * @param {string} apiKey
+ * @param {object} body - Request body, as Google expects it
+ * @returns {Promise<Response>}
+ */
+export async function googleFetch(service, method, apiKey, body) {
+  const payload = JSON.stringify(body);
+  if (BACKEND_URL) {
+    try {
+      return await fetch(`${BACKEND_URL}/google/${service}/${method}?key=${encodeURIComponent(apiKey)}`, {
+        method: 'POST',
+        headers: backendHeaders('application/json'),
+        body: payload
+      });
+    } catch (err) {
+      console.warn(`[google-proxy] backend unreachable, calling ${service} directly:`, err.message);
+    }
+  }
+  return fetch(`${GOOGLE_API_URLS[service](method)}?key=${apiKey}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: payload
+  });
+}
@@ -0,0 +1,103 @@
+// lexicon-index.js — Reader for data/lexicon.bin (compiled CMUdict + Dale–Chall)
+//
+// data/lexicon.bin is built by services/reverb/lexicon_index.py from
+// data/cmudict-phoneme-counts.json and data/dale-chall.json (see that file for
+// the byte layout). It is ~40% smaller than the JSON and needs no parse step:
+// lookups binary-search the front-coded block heads in the raw ArrayBuffer and
+// decode a single block of at most 16 words.
+
+const MAGIC = 'ORFLEX01';
+const HEADER_SIZE = 48;
+
+export const FLAG_DALE_CHALL = 0x01;
+export const FLAG_CMUDICT = 0x02;
+
+const _encoder = new TextEncoder();
+
+/** Lexicographic compare of bytes[start, start+len) against key. */
+function compareBytes(bytes, start, len, key) {
+  const n = Math.min(len, key.length);
+  for (let i = 0; i < n; i++) {
+    const d = bytes[start + i] - key[i];
+    if (d !== 0) return d;
+  }
+  return len - key.length;
+}
+
+/**
+ * Parse a lexicon.bin buffer into a lookup object. The buffer is used in
+ * place — nothing is copied or decoded up front.
+ *
+ * @param {ArrayBuffer} buffer - Contents of data/lexicon.bin
+ * @returns {{ size: number, find: Function, phonemeCount: Function, isDaleChall: Function }}
+ */
+export function parseLexicon(buffer) {
+  if (buffer.byteLength < HEADER_SIZE) throw new Error('Lexicon index truncated');
+  const bytes = new Uint8Array(buffer);
+  const view = new DataView(buffer);
+  if (String.fromCharCode(...bytes.subarray(0, 8)) !== MAGIC) {
+    throw new Error('Not a lexicon index');
+  }
+  const u32 = off => view.getUint32(off, true);
+  const size = u32(8);
+  const blockSize = u32(12);
+  const nBlocks = u32(16);
+  const phonemes = bytes.subarray(u32(20), u32(20) + size);
+  const flags = bytes.subarray(u32(28), u32(28) + size);
+  const blocksOff = u32(32);
+  const stringsOff = u32(36);
+  const blockStart = b => stringsOff + view.getUint32(blocksOff + 4 * b, true);
+
+  // Scratch buffer for front-coded decoding (words are capped at 255 bytes)
+  const current = new Uint8Array(256);
+
+  /** Entry index of an exact word, or -1. */
+  function find(word) {
+    const key = _encoder.encode(word);
+
+    // Last block whose head word is <= key
+    let lo = 0, hi = nBlocks - 1;
+    if (hi < 0) return -1;
+    let off = blockStart(0);
+    if (compareBytes(bytes, off + 1, bytes[off], key) > 0) return -1;
+    while (lo < hi) {
+      const mid = (lo + hi + 1) >> 1;
+      off = blockStart(mid);
+      if (compareBytes(bytes, off + 1, bytes[off], key) <= 0) lo = mid;
+      else hi = mid - 1;
+    }
+
+    off = blockStart(lo);
+    let len = bytes[off];
+    current.set(bytes.subarray(off + 1, off + 1 + len));
+    off += 1 + len;
+    let entry = lo * blockSize;
+    const last = Math.min(entry + blockSize, size) - 1;
+    for (;;) {
+      const cmp = compareBytes(current, 0, len, key);
+      if (cmp === 0) return entry;
+      if (cmp > 0 || entry === last) return -1;
+      const shared = bytes[off];
+      const suffix = bytes[off + 1];
+      current.set(bytes.subarray(off + 2, off + 2 + suffix), shared);
+      len = shared + suffix;
+      off += 2 + suffix;
+      entry++;
+    }
+  }
+
+  return {
+    size,
+    find,
+    /** CMUdict phoneme count, or null when the word has no CMUdict entry. */
+    phonemeCount(word) {
+      const i = find(word);
+      return i >= 0 && (flags[i] & FLAG_CMUDICT) ? phonemes[i] : null;
+    },
+    /** True if the word is on the Dale–Chall familiar list. */
+    isDaleChall(word) {
+      const i = find(word);
+      return i >= 0 && (flags[i] & FLAG_DALE_CHALL) !== 0;
+    }
+  };
+}
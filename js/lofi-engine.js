@@ -282,6 +282,7 @@ const TRAP_HAT_ROLLS = [0,0,0,3, 0,0,0,0, 0,0,3,0, 0,4,0,0, 0,0,0,3, 0,0,0,0, 0,
 // ─── Sample manifest ─────────────────────────────────────────────────────
 // Maps style → drum slot → filename. Loaded at init, falls back to synthesis.
 const SAMPLE_BASE_PATH = 'rhythm%20remix/samples';
+const SAMPLE_SPRITE_INDEX = `${SAMPLE_BASE_PATH}/sprites/sprites.json`;
 const SAMPLE_MANIFEST = {
   trap:     { kick: 'kick.wav', snare: 'clap.wav', hatClosed: 'hat-closed.wav', hatOpen: 'hat-open.wav' },
   lofi:     { kick: 'kick.wav', snare: 'snare.wav', hatClosed: 'hat-closed.wav', hatOpen: 'hat-open.wav' },
@@ -1172,10 +1173,39 @@ export class LofiEngine {
   /**
    * Load all drum samples asynchronously. Non-blocking — synthesis fallback
    * works until samples finish loading. Silent failure on missing files.
+   * Each style is fetched as one sprite (see SAMPLE_SPRITE_INDEX) and sliced
+   * into per-slot buffers; styles without a sprite load file by file.
    */
   async _loadSamples() {
+    let sprites = {};
+    try {
+      const resp = await fetch(SAMPLE_SPRITE_INDEX);
+      if (resp.ok) sprites = (await resp.json()).styles || {};
+    } catch (e) {
+      // No index: per-file loading below
+    }
+    const opus = typeof Audio !== 'undefined' &&
+      new Audio().canPlayType('audio/ogg; codecs=opus') === 'probably';
+
     for (const [style, slots] of Object.entries(SAMPLE_MANIFEST)) {
       this._samples[style] = {};
+      const sprite = sprites[style];
+      if (sprite) {
+        try {
+          const file = (opus && sprite.opus) || sprite.file;
+          const resp = await fetch(`${SAMPLE_BASE_PATH}/sprites/${file}`);
+          if (resp.ok) {
+            const whole = await this._ctx.decodeAudioData(await resp.arrayBuffer());
+            for (const [slot, filename] of Object.entries(slots)) {
+              const pos = sprite.samples[filename];
+              if (pos) this._samples[style][slot] = this._sliceBuffer(whole, pos[0], pos[1]);
+            }
+            continue;
+          }
+        } catch (e) {
+          // Fall through to per-file loading
+        }
+      }
       for (const [slot, filename] of Object.entries(slots)) {
         const url = `${SAMPLE_BASE_PATH}/${style}/${filename}`;
         try {
@@ -1190,6 +1220,21 @@ export class LofiEngine {
     }
   }
 
+  /**
+   * Copy [offset, offset + duration) seconds of a decoded sprite into its own
+   * AudioBuffer. Positions are in seconds because decodeAudioData() resamples
+   * to the context rate.
+   */
+  _sliceBuffer(buf, offset, duration) {
+    const start = Math.round(offset * buf.sampleRate);
+    const length = Math.max(1, Math.min(Math.round(duration * buf.sampleRate), buf.length - start));
+    const out = this._ctx.createBuffer(buf.numberOfChannels, length, buf.sampleRate);
+    for (let ch = 0; ch < buf.numberOfChannels; ch++) {
+      out.copyToChannel(buf.getChannelData(ch).subarray(start, start + length), ch);
+    }
+    return out;
+  }
+
   /**
    * Play a loaded sample at the given time. Returns true if played, false if
    * no sample loaded (caller should fall back to synthesis).
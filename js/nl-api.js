@@ -1,6 +1,8 @@
 // nl-api.js — Google Cloud Natural Language API integration
 // Analyzes passage text for POS tags, entities, and word tier classification
 
+import { googleFetch } from './backend-config.js';
+
 // Dolch + Fry top-220 high-frequency sight words
 const SIGHT_WORDS = new Set([
   'the','of','and','a','to','in','is','you','that','it','he','was','for','on','are',
@@ -143,16 +145,8 @@ export async function analyzePassageText(text, apiKey) {
 
   try {
     const [syntaxRes, entityRes] = await Promise.all([
-      fetch(`https://language.googleapis.com/v1/documents:analyzeSyntax?key=${apiKey}`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ document, encodingType: 'UTF8' })
-      }).then(r => r.json()),
-      fetch(`https://language.googleapis.com/v1/documents:analyzeEntities?key=${apiKey}`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ document, encodingType: 'UTF8' })
-      }).then(r => r.json())
+      googleFetch('nl', 'analyzeSyntax', apiKey, { document, encodingType: 'UTF8' }).then(r => r.json()),
+      googleFetch('nl', 'analyzeEntities', apiKey, { document, encodingType: 'UTF8' }).then(r => r.json())
     ]);
 
     if (syntaxRes.error) throw new Error(syntaxRes.error.message);
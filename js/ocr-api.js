@@ -7,6 +7,8 @@
  * reading order by looking at the image. Subset validation prevents hallucination.
  */
 
+import { googleFetch } from './backend-config.js';
+
 /**
  * Normalize Unicode characters commonly emitted by OCR engines.
  * NFKC decomposes ligatures (fi→fi, fl→fl) and normalizes compatibility chars.
@@ -78,15 +80,11 @@ export async function extractTextFromImage(file, apiKey) {
   const resized = await resizeImageIfNeeded(file);
   const base64 = await fileToBase64(resized);
 
-  const response = await fetch(`https://vision.googleapis.com/v1/images:annotate?key=${apiKey}`, {
-    method: 'POST',
-    headers: { 'Content-Type': 'application/json' },
-    body: JSON.stringify({
-      requests: [{
-        image: { content: base64 },
-        features: [{ type: 'DOCUMENT_TEXT_DETECTION' }]
-      }]
-    })
+  const response = await googleFetch('vision', 'annotate', apiKey, {
+    requests: [{
+      image: { content: base64 },
+      features: [{ type: 'DOCUMENT_TEXT_DETECTION' }]
+    }]
   });
 
   if (!response.ok) {
@@ -110,15 +108,11 @@ export async function extractTextFromImage(file, apiKey) {
  * Call Cloud Vision and return the full annotation (not just .text).
  */
 async function getVisionAnnotation(base64, apiKey) {
-  const response = await fetch(`https://vision.googleapis.com/v1/images:annotate?key=${apiKey}`, {
-    method: 'POST',
-    headers: { 'Content-Type': 'application/json' },
-    body: JSON.stringify({
-      requests: [{
-        image: { content: base64 },
-        features: [{ type: 'DOCUMENT_TEXT_DETECTION' }]
-      }]
-    })
+  const response = await googleFetch('vision', 'annotate', apiKey, {
+    requests: [{
+      image: { content: base64 },
+      features: [{ type: 'DOCUMENT_TEXT_DETECTION' }]
+    }]
   });
 
   if (!response.ok) {
@@ -272,27 +266,20 @@ The fox jumped over the lazy dog. He landed softly on the grass beside the fence
 Fragments:
 ${numberedList}`;
 
-  const response = await fetch(
-    `https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key=${geminiKey}`,
-    {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({
-        system_instruction: systemInstruction,
-        contents: [{
-          parts: [
-            { inline_data: { mime_type: mimeType, data: base64 } },
-            { text: userPrompt }
-          ]
-        }],
-        generationConfig: {
-          temperature: 0,
-          topK: 1,
-          topP: 1
-        }
-      })
+  const response = await googleFetch('gemini', 'gemini-2.0-flash:generateContent', geminiKey, {
+    system_instruction: systemInstruction,
+    contents: [{
+      parts: [
+        { inline_data: { mime_type: mimeType, data: base64 } },
+        { text: userPrompt }
+      ]
+    }],
+    generationConfig: {
+      temperature: 0,
+      topK: 1,
+      topP: 1
     }
-  );
+  });
 
   if (!response.ok) {
     const errBody = await response.text().catch(() => '');
@@ -398,27 +385,20 @@ Return ONLY the corrected passage text.` }]
 
 ${assembledText}`;
 
-  const response = await fetch(
-    `https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key=${geminiKey}`,
-    {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({
-        system_instruction: systemInstruction,
-        contents: [{
-          parts: [
-            { inline_data: { mime_type: mimeType, data: base64 } },
-            { text: userPrompt }
-          ]
-        }],
-        generationConfig: {
-          temperature: 0,
-          topK: 1,
-          topP: 1
-        }
-      })
+  const response = await googleFetch('gemini', 'gemini-2.0-flash:generateContent', geminiKey, {
+    system_instruction: systemInstruction,
+    contents: [{
+      parts: [
+        { inline_data: { mime_type: mimeType, data: base64 } },
+        { text: userPrompt }
+      ]
+    }],
+    generationConfig: {
+      temperature: 0,
+      topK: 1,
+      topP: 1
     }
-  );
+  });
 
   if (!response.ok) {
     const errBody = await response.text().catch(() => '');
@@ -12,6 +12,7 @@
 // See docs/phoneme-normalization-plan.md for full rationale and research references.
 
 import { countSyllables } from './syllable-counter.js';
+import { parseLexicon } from './lexicon-index.js';
 
 // Ratio of total phonemes to total syllables across all CMUdict entries.
 // Computed as Σphonemes / Σsyllables = 799853 / 309581 ≈ 2.5837.
@@ -19,7 +20,8 @@ import { countSyllables } from './syllable-counter.js';
 // total squared phoneme-count estimation error when estimating from syllable count.
 const PHONEMES_PER_SYLLABLE_RATIO = 2.5837;
 
-// Phoneme count lookup: loaded lazily from data/cmudict-phoneme-counts.json
+// Phoneme count lookup (word -> count | null): loaded lazily from the compiled
+// data/lexicon.bin, falling back to data/cmudict-phoneme-counts.json.
 let _phonemeCounts = null;
 let _loadPromise = null;
 let _loadFailed = false;
@@ -32,19 +34,32 @@ export function loadPhonemeData() {
   if (_phonemeCounts) return Promise.resolve();
   if (_loadPromise) return _loadPromise;
 
-  _loadPromise = fetch('data/cmudict-phoneme-counts.json')
+  _loadPromise = fetch('data/lexicon.bin')
     .then(resp => {
       if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
-      return resp.json();
+      return resp.arrayBuffer();
     })
-    .then(data => {
-      _phonemeCounts = data;
-      console.log(`[phoneme-counter] Loaded ${Object.keys(data).length} entries from CMUdict`);
+    .then(buffer => {
+      const lexicon = parseLexicon(buffer);
+      _phonemeCounts = w => lexicon.phonemeCount(w);
+      console.log(`[phoneme-counter] Loaded ${lexicon.size} entries from compiled lexicon`);
+    })
+    .catch(binErr => {
+      console.warn(`[phoneme-counter] Compiled lexicon unavailable (${binErr.message}), loading JSON`);
+      return fetch('data/cmudict-phoneme-counts.json')
+        .then(resp => {
+          if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+          return resp.json();
+        })
+        .then(data => {
+          _phonemeCounts = w => (Object.prototype.hasOwnProperty.call(data, w) ? data[w] : null);
+          console.log(`[phoneme-counter] Loaded ${Object.keys(data).length} entries from CMUdict`);
+        });
     })
     .catch(err => {
       console.warn(`[phoneme-counter] Failed to load CMUdict data, using syllable fallback: ${err.message}`);
       _loadFailed = true;
-      _phonemeCounts = {}; // empty — all lookups will use fallback
+      _phonemeCounts = () => null; // empty — all lookups will use fallback
     });
 
   return _loadPromise;
@@ -64,8 +79,8 @@ export function getPhonemeCount(word) {
   const w = word.toLowerCase().replace(/[^a-z'-]/g, '');
   if (!w) return null;
 
-  const count = _phonemeCounts[w];
-  return count !== undefined ? count : null;
+  const count = _phonemeCounts(w);
+  return count != null ? count : null;
 }
 
 /**
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Sound and speed regression check for generate_samples.py.
+
+Renders every sample (the float output before dither, so results are exact
+and repeatable), measures it, and compares against analysis-baseline.json:
+
+  peak       sample peak in dBFS, and its offset from PEAK_DBFS
+  rms, lufs  RMS level and BS.1770 loudness (see export_samples.py)
+  centroid   spectral centroid in Hz
+  decay      seconds from the peak until the 5 ms RMS envelope falls
+             DECAY_DROP_DB below its maximum
+  length     trimmed length in seconds
+  render     best-of-N generator time in ms
+
+Sound metrics are flagged when they move beyond TOLERANCES. Render times
+depend on the machine, so they are reported but not kept in the baseline;
+--check-speed compares them with the previous run on this machine
+(samples/analysis.json) and flags samples both SLOWDOWN_RATIO times and
+SLOWDOWN_MIN_MS slower. The current run is always written to
+samples/analysis.json.
+
+Usage:
+  python analyze_samples.py                    # compare with the baseline
+  python analyze_samples.py --only trap
+  python analyze_samples.py --check-speed      # also flag render slowdowns
+  python analyze_samples.py --update-baseline  # accept the current sound
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+import export_samples
+import generate_samples as gs
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "analysis-baseline.json")
+RESULTS_PATH = os.path.join(gs.OUTPUT_DIR, "analysis.json")
+
+ENVELOPE_FRAME_S = 0.005
+DECAY_DROP_DB = 40.0
+
+# metric -> (absolute tolerance, relative tolerance); either one passing is enough
+TOLERANCES = {
+    "peakDbfs": (0.1, 0.0),
+    "peakOffsetDb": (0.1, 0.0),
+    "rmsDbfs": (0.5, 0.0),
+    "lufs": (0.5, 0.0),
+    "centroidHz": (0.0, 0.03),
+    "decayS": (0.005, 0.10),
+    "lengthS": (0.005, 0.0),
+}
+SLOWDOWN_RATIO = 2.0
+SLOWDOWN_MIN_MS = 5.0
+
+
+# ──────────────────────────────────────────────────────────
+# Metrics
+# ──────────────────────────────────────────────────────────
+def _db(x, floor=1e-12):
+    return float(20 * np.log10(max(x, floor)))
+
+
+def spectral_centroid(x):
+    mag = np.abs(np.fft.rfft(x))
+    freqs = np.fft.rfftfreq(len(x), 1.0 / gs.SR)
+    total = mag.sum()
+    return float((freqs * mag).sum() / total) if total > 0 else 0.0
+
+
+def decay_time(x):
+    """Seconds from the loudest envelope frame to the last frame within DECAY_DROP_DB of it."""
+    frame = int(gs.SR * ENVELOPE_FRAME_S)
+    n_frames = len(x) // frame
+    if n_frames == 0:
+        return 0.0
+    env = np.sqrt(np.mean(x[:n_frames * frame].reshape(n_frames, frame) ** 2, axis=1))
+    peak = int(np.argmax(env))
+    floor = env[peak] * 10 ** (-DECAY_DROP_DB / 20)
+    last = peak + int(np.flatnonzero(env[peak:] >= floor)[-1])
+    return (last - peak + 1) * ENVELOPE_FRAME_S
+
+
+def measure(x):
+    peak = float(np.max(np.abs(x)))
+    return {
+        "peakDbfs": round(_db(peak), 3),
+        "peakOffsetDb": round(_db(peak) - gs.PEAK_DBFS, 3),
+        "rmsDbfs": round(_db(np.sqrt(np.mean(x ** 2))), 3),
+        "lufs": export_samples.loudness_lufs(x, gs.SR),
+        "centroidHz": round(spectral_centroid(x), 1),
+        "decayS": round(decay_time(x), 4),
+        "lengthS": round(len(x) / gs.SR, 4),
+    }
+
+
+def analyze(style, filename, repeat=3):
+    """Render one sample `repeat` times; metrics of the render plus the best time."""
+    gen_fn = gs.STYLES[style][filename]
+    seed = gs.sample_seed(style, filename)
+    times = []
+    for _ in range(repeat):
+        render_rng, _ = gs.sample_rngs(seed)
+        start = time.perf_counter()
+        data = gen_fn(gs.Variation(render_rng))
+        times.append(time.perf_counter() - start)
+    return {**measure(gs.trim_silence(data)), "renderMs": round(min(times) * 1000, 2)}
+
+
+# ──────────────────────────────────────────────────────────
+# Comparison
+# ──────────────────────────────────────────────────────────
+def compare(current, baseline, previous=None):
+    """
+    Sound regressions against the baseline, plus render slowdowns against
+    `previous` (an earlier run on this machine) when given.
+
+    Returns:
+        List of human-readable regressions for one sample
+    """
+    problems = []
+    for metric, (abs_tol, rel_tol) in TOLERANCES.items():
+        new, old = current.get(metric), baseline.get(metric)
+        if new is None or old is None:
+            if new != old:
+                problems.append(f"{metric} {old} -> {new}")
+            continue
+        diff = abs(new - old)
+        if diff > abs_tol and diff > rel_tol * abs(old):
+            problems.append(f"{metric} {old} -> {new}")
+    new_ms, old_ms = current["renderMs"], (previous or {}).get("renderMs")
+    if old_ms and new_ms > old_ms * SLOWDOWN_RATIO and new_ms - old_ms > SLOWDOWN_MIN_MS:
+        problems.append(f"renderMs {old_ms} -> {new_ms} ({new_ms / old_ms:.1f}x slower)")
+    return problems
+
+
+def load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", action="append", metavar="STYLE[/SAMPLE]",
+                        help="Analyze only this style or sample (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="Renders per sample for timing (best is kept)")
+    parser.add_argument("--check-speed", action="store_true",
+                        help="Flag render slowdowns against the previous run on this machine")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store this run as the new baseline instead of comparing")
+    args = parser.parse_args()
+
+    baseline = load_json(BASELINE_PATH)
+    previous = load_json(RESULTS_PATH) if args.check_speed else {}
+    results, regressions = {}, {}
+    print(f"  {'sample':28s} {'peak':>7s} {'lufs':>7s} {'centroid':>9s} {'decay':>7s} {'render':>8s}")
+    for style, filename in gs.select_samples(args.only):
+        rel = f"{style}/{filename}"
+        results[rel] = current = analyze(style, filename, args.repeat)
+        problems = []
+        if not args.update_baseline and rel in baseline:
+            problems = compare(current, baseline[rel], previous.get(rel))
+        if problems:
+            regressions[rel] = problems
+        lufs = f"{current['lufs']:7.2f}" if current["lufs"] is not None else "   -inf"
+        print(f"  {rel:28s} {current['peakDbfs']:7.2f} {lufs} {current['centroidHz']:8.0f}Hz "
+              f"{current['decayS']:6.3f}s {current['renderMs']:6.1f}ms"
+              + ("  REGRESSED" if problems else "" if rel in baseline else "  (new)"))
+
+    write_json(RESULTS_PATH, results)
+    if args.update_baseline:
+        sound = {rel: {k: v for k, v in r.items() if k != "renderMs"} for rel, r in results.items()}
+        write_json(BASELINE_PATH, {**baseline, **sound})
+        print(f"Baseline updated: {len(results)} samples")
+        return
+    for rel, problems in regressions.items():
+        print(f"\n{rel}:")
+        for problem in problems:
+            print(f"  {problem}")
+    if regressions:
+        raise SystemExit(f"\n{len(regressions)} sample(s) regressed")
+    print(f"\nNo regressions across {len(results)} samples")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Dynamics processing for the drum sample generator.
+
+The compressor's envelope follower is a one-pole smoother whose coefficient
+switches between attack and release depending on whether the input is above
+the previous output. That switch makes it nonlinear, so it cannot be a single
+IIR filter — but between switches it IS one. The follower therefore runs as
+a sequence of scipy lfilter() calls, one per constant-mode run, and drops to
+a plain scalar loop for short stretches where the mode flips every few
+samples (noise-like input). Output is identical to the per-sample loop up to
+float rounding.
+
+Run directly for a benchmark against the original per-sample loop:
+    python dynamics.py
+"""
+
+import time
+
+import numpy as np
+from scipy.signal import lfilter
+
+MIN_RUN = 32        # Runs shorter than this switch the follower to the scalar loop
+SCALAR_BLOCK = 256  # Samples processed per scalar-loop stretch
+FIRST_CHUNK = 64    # Initial speculative lfilter length (doubles while runs continue)
+
+
+def _coeff(time_ms, sr):
+    samples = int(sr * time_ms / 1000)
+    return 1.0 - np.exp(-1.0 / max(samples, 1))
+
+
+def envelope_follower(x, attack_ms, release_ms, sr):
+    """
+    Attack/release smoothed |x|.
+
+    smoothed[0] = |x[0]|; afterwards each sample moves toward |x[i]| with the
+    attack coefficient when |x[i]| is above the previous value, else with the
+    release coefficient.
+    """
+    env = np.abs(np.asarray(x, dtype=np.float64))
+    n = len(env)
+    out = np.empty(n)
+    if n == 0:
+        return out
+    ca = _coeff(attack_ms, sr)
+    cr = _coeff(release_ms, sr)
+
+    s = float(env[0])
+    out[0] = s
+    p, k = 1, FIRST_CHUNK
+    while p < n:
+        attack = env[p] > s
+        c = ca if attack else cr
+        q = min(n, p + k)
+        # Speculatively filter ahead in the current mode, then keep the prefix
+        # where the mode decision would not have changed.
+        seg, _ = lfilter([c], [1.0, c - 1.0], env[p:q], zi=[(1.0 - c) * s])
+        prev = np.empty(q - p)
+        prev[0] = s
+        prev[1:] = seg[:-1]
+        flips = np.flatnonzero((env[p:q] > prev) != attack)
+        m = int(flips[0]) if len(flips) else q - p
+        out[p:p + m] = seg[:m]
+        if m:
+            s = float(seg[m - 1])
+        p += m
+
+        if not len(flips):
+            k *= 2
+        elif m < MIN_RUN:
+            q = min(n, p + SCALAR_BLOCK)
+            block = []
+            for e in env[p:q].tolist():
+                s += (ca if e > s else cr) * (e - s)
+                block.append(s)
+            out[p:q] = block
+            p, k = q, FIRST_CHUNK
+        else:
+            k = max(FIRST_CHUNK, 2 * m)
+    return out
+
+
+def gain_reduction_db(level_db, threshold_db, ratio, knee_db=0.0):
+    """
+    Static compression curve: gain (dB, <= 0) for each input level.
+
+    knee_db = 0 is a hard knee (compress only above threshold); otherwise a
+    quadratic soft knee of that width is centred on the threshold.
+    """
+    over = level_db - threshold_db
+    slope = 1.0 / ratio - 1.0
+    gain = np.where(over > 0, slope * over, 0.0)
+    if knee_db > 0:
+        in_knee = np.abs(over) <= knee_db / 2
+        gain = np.where(in_knee, slope * (over + knee_db / 2) ** 2 / (2 * knee_db), gain)
+    return gain
+
+
+def compress(x, sr, threshold_db=-12, ratio=4.0, attack_ms=5, release_ms=50,
+             knee_db=0.0, makeup_db=0.0, lookahead_ms=0.0):
+    """
+    Feed-forward compressor.
+
+    Args:
+        x: Input signal
+        sr: Sample rate
+        threshold_db, ratio: Static curve
+        attack_ms, release_ms: Envelope follower times
+        knee_db: Soft-knee width in dB (0 = hard knee)
+        makeup_db: Gain applied after compression
+        lookahead_ms: Apply each gain value this much earlier, so transients
+            are caught as they start (offline: no added latency)
+    """
+    smoothed = envelope_follower(x, attack_ms, release_ms, sr)
+    level_db = 20 * np.log10(smoothed + 1e-10)
+    gain = 10 ** ((gain_reduction_db(level_db, threshold_db, ratio, knee_db) + makeup_db) / 20.0)
+
+    lookahead = int(sr * lookahead_ms / 1000)
+    if 0 < lookahead < len(gain):
+        gain = np.concatenate([gain[lookahead:], np.full(lookahead, gain[-1])])
+    return x * gain
+
+
+# ──────────────────────────────────────────────────────────
+# Benchmark
+# ──────────────────────────────────────────────────────────
+def _reference_compress(x, sr, threshold_db=-12, ratio=4.0, attack_ms=5, release_ms=50):
+    """The original per-sample compressor from generate_samples.py."""
+    threshold = 10 ** (threshold_db / 20.0)
+    attack_samples = int(sr * attack_ms / 1000)
+    release_samples = int(sr * release_ms / 1000)
+    envelope = np.abs(x)
+    smoothed = np.zeros_like(envelope)
+    for i in range(len(envelope)):
+        if i == 0:
+            smoothed[i] = envelope[i]
+        else:
+            if envelope[i] > smoothed[i - 1]:
+                coeff = 1.0 - np.exp(-1.0 / max(attack_samples, 1))
+            else:
+                coeff = 1.0 - np.exp(-1.0 / max(release_samples, 1))
+            smoothed[i] = smoothed[i - 1] + coeff * (envelope[i] - smoothed[i - 1])
+    gain = np.ones_like(smoothed)
+    above = smoothed > threshold
+    if np.any(above):
+        db = 20 * np.log10(smoothed[above] + 1e-10)
+        threshold_db_val = 20 * np.log10(threshold)
+        compressed_db = threshold_db_val + (db - threshold_db_val) / ratio
+        gain[above] = 10 ** ((compressed_db - db) / 20.0)
+    return x * gain
+
+
+def _bench():
+    import generate_samples as gs
+
+    rng = np.random.default_rng(0)
+    t = gs.make_time(1.2)
+    # trap_kick's pre-compression signal, plus a noise burst for the worst case
+    kick = gs.saturate(gs.exp_sweep(t, 160, 22, 0.3) * gs.exp_envelope(t, 0.5)
+                       + gs.exp_sweep(t, 80, 11, 0.3) * gs.exp_envelope(t, 0.6) * 0.5, drive=5)
+    hiss = rng.standard_normal(len(t)) * gs.exp_envelope(t, 0.3)
+
+    print(f"{'signal':10s} {'samples':>8s} {'reference':>10s} {'dynamics':>10s} {'speedup':>8s} {'max err':>9s}")
+    for name, x in (("kick", kick), ("noise", hiss)):
+        start = time.perf_counter()
+        ref = _reference_compress(x, gs.SR)
+        t_ref = time.perf_counter() - start
+        start = time.perf_counter()
+        new = compress(x, gs.SR)
+        t_new = time.perf_counter() - start
+        err = float(np.max(np.abs(ref - new)))
+        print(f"{name:10s} {len(x):>8d} {t_ref * 1e3:>8.1f}ms {t_new * 1e3:>8.1f}ms "
+              f"{t_ref / t_new:>7.1f}x {err:>9.1e}")
+
+
+if __name__ == "__main__":
+    _bench()
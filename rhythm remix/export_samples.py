@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Multi-rate, multi-format export of the drum sample library.
+
+Browsers decode every sample to the AudioContext rate, which is 48 kHz on
+most hardware, so shipping 48 kHz copies saves a resample per sample at
+load time. This stage renders each one-shot once at 44.1 kHz (the same float
+render generate_samples.py writes), polyphase-resamples all of them in one
+batched resample_poly() call per target rate, and writes each rate as 16-bit,
+24-bit or 32-bit float WAV. Integer formats get the same TPDF dither as
+dither_and_quantize(), drawn from the sample's own seeded dither generator,
+so a 44.1 kHz 16-bit export is byte-identical to the regular build. Other
+rates are re-peaked to PEAK_DBFS after resampling, like the source render.
+
+Every written file is measured (sample peak, 4x-oversampled true peak, RMS
+and BS.1770 loudness) into samples/export/report.json.
+
+Usage:
+  python export_samples.py                          # 44.1k + 48k, 16-bit
+  python export_samples.py --rate 48000 --format pcm24 float
+  python export_samples.py --only trap
+"""
+
+import argparse
+import functools
+import json
+import os
+import time
+import wave
+from math import gcd
+
+import numpy as np
+from scipy import signal as sig
+from scipy.io import wavfile
+
+import generate_samples as gs
+
+EXPORT_DIR = os.path.join(gs.OUTPUT_DIR, "export")
+REPORT_PATH = os.path.join(EXPORT_DIR, "report.json")
+
+RATES = (44100, 48000)
+FORMATS = {"pcm16": 16, "pcm24": 24, "float": None}  # name -> dither/quantize bits
+
+TRUE_PEAK_OVERSAMPLE = 4
+LUFS_BLOCK_S = 0.4       # BS.1770 gating block
+LUFS_ABSOLUTE_GATE = -70.0
+LUFS_RELATIVE_GATE = -10.0
+
+
+# ──────────────────────────────────────────────────────────
+# Resampling
+# ──────────────────────────────────────────────────────────
+def rate_ratio(src, dst):
+    g = gcd(src, dst)
+    return dst // g, src // g
+
+
+@functools.lru_cache(maxsize=None)
+def resample_filter(up, down):
+    """
+    Anti-aliasing FIR for resample_poly(up, down), designed once per ratio.
+    Same design resample_poly() uses by default (Kaiser, beta 5).
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    taps = sig.firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    taps.setflags(write=False)
+    return taps
+
+
+def resample_batch(clips, src, dst):
+    """Resample a list of 1-D clips from src to dst Hz in one polyphase pass."""
+    if src == dst:
+        return [np.asarray(c, dtype=np.float64) for c in clips]
+    up, down = rate_ratio(src, dst)
+    batch = np.zeros((len(clips), max(len(c) for c in clips)))
+    for row, clip in zip(batch, clips):
+        row[:len(clip)] = clip
+    out = sig.resample_poly(batch, up, down, axis=-1, window=resample_filter(up, down))
+    return [row[:-(-len(clip) * up // down)] for row, clip in zip(out, clips)]
+
+
+# ──────────────────────────────────────────────────────────
+# Writing
+# ──────────────────────────────────────────────────────────
+def write_wav(filepath, rate, data):
+    """Write int16, 24-bit (int32 holding 24-bit values) or float32 mono WAV."""
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    if data.dtype == np.int32:
+        # scipy only writes 32-bit ints; pack the low three bytes ourselves
+        packed = data.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3]
+        with wave.open(filepath, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(3)
+            f.setframerate(rate)
+            f.writeframes(packed.tobytes())
+    else:
+        wavfile.write(filepath, rate, data)
+
+
+def encode(x, fmt, rng):
+    bits = FORMATS[fmt]
+    if bits is None:
+        return np.clip(x, -1.0, 1.0).astype(np.float32)
+    return gs.dither_and_quantize(x, rng, bits=bits)
+
+
+def decoded(data):
+    """Integer or float samples back to float in [-1, 1]."""
+    if data.dtype == np.int16:
+        return data / 32767.0
+    if data.dtype == np.int32:
+        return data / float(2 ** 23 - 1)
+    return data.astype(np.float64)
+
+
+# ──────────────────────────────────────────────────────────
+# Measurement
+# ──────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=None)
+def k_weighting(rate):
+    """BS.1770 K-weighting (high shelf + RLB highpass) as SOS for any rate."""
+    # Stage 1: +4 dB high shelf at 1.5 kHz
+    a = 10 ** (4.0 / 40)
+    w0 = 2 * np.pi * 1500 / rate
+    alpha = np.sin(w0) / (2 / np.sqrt(2))
+    cos = np.cos(w0)
+    shelf = [a * ((a + 1) + (a - 1) * cos + 2 * np.sqrt(a) * alpha),
+             -2 * a * ((a - 1) + (a + 1) * cos),
+             a * ((a + 1) + (a - 1) * cos - 2 * np.sqrt(a) * alpha),
+             (a + 1) - (a - 1) * cos + 2 * np.sqrt(a) * alpha,
+             2 * ((a - 1) - (a + 1) * cos),
+             (a + 1) - (a - 1) * cos - 2 * np.sqrt(a) * alpha]
+    # Stage 2: highpass at 38 Hz, Q 0.5
+    w0 = 2 * np.pi * 38 / rate
+    alpha = np.sin(w0) / (2 * 0.5)
+    cos = np.cos(w0)
+    hp = [(1 + cos) / 2, -(1 + cos), (1 + cos) / 2, 1 + alpha, -2 * cos, 1 - alpha]
+    # Not marked read-only: sosfilt() needs a writable buffer
+    return np.array([[c / stage[3] for c in stage] for stage in (shelf, hp)])
+
+
+def _db(x):
+    return round(float(10 * np.log10(x)), 2) if x > 0 else None
+
+
+def loudness_lufs(x, rate):
+    """
+    Integrated loudness (BS.1770, mono). Clips shorter than one 400 ms
+    gating block are measured ungated over their full length.
+    """
+    y = sig.sosfilt(k_weighting(rate), x) ** 2
+    block = int(LUFS_BLOCK_S * rate)
+    if len(y) < block:
+        power = np.mean(y)
+    else:
+        hop = block // 4
+        starts = np.arange(0, len(y) - block + 1, hop)
+        csum = np.concatenate([[0.0], np.cumsum(y)])
+        powers = (csum[starts + block] - csum[starts]) / block
+        gated = powers[-0.691 + 10 * np.log10(powers + 1e-20) > LUFS_ABSOLUTE_GATE]
+        if not len(gated):
+            return None
+        relative = -0.691 + 10 * np.log10(np.mean(gated)) + LUFS_RELATIVE_GATE
+        gated = gated[-0.691 + 10 * np.log10(gated) > relative]
+        power = np.mean(gated)
+    return round(-0.691 + 10 * np.log10(power), 2) if power > 0 else None
+
+
+def measure(x, rate):
+    oversampled = sig.resample_poly(x, TRUE_PEAK_OVERSAMPLE, 1)
+    return {
+        "peakDbfs": _db(np.max(np.abs(x)) ** 2),
+        "truePeakDbtp": _db(np.max(np.abs(oversampled)) ** 2),
+        "rmsDbfs": _db(np.mean(x ** 2)),
+        "lufs": loudness_lufs(x, rate),
+    }
+
+
+# ──────────────────────────────────────────────────────────
+# Export
+# ──────────────────────────────────────────────────────────
+def render_clips(samples):
+    """Trimmed float renders at SR, exactly as the regular build produces them."""
+    clips = []
+    for style, filename in samples:
+        render_rng, _ = gs.sample_rngs(gs.sample_seed(style, filename))
+        clips.append(gs.trim_silence(gs.STYLES[style][filename](gs.Variation(render_rng))))
+    return clips
+
+
+def export(only=None, rates=RATES, formats=("pcm16",)):
+    """
+    Write every selected sample at each rate and format.
+
+    Returns:
+        Report entries, one per written file
+    """
+    samples = gs.select_samples(only)
+    clips = render_clips(samples)
+    report = []
+    for rate in rates:
+        resampled = resample_batch(clips, gs.SR, rate)
+        if rate != gs.SR:
+            # Resampling moves the peak; bring each clip back to the build's target
+            resampled = [gs.normalize(x) for x in resampled]
+        for fmt in formats:
+            for (style, filename), x in zip(samples, resampled):
+                # Same dither stream as the regular build for this sample
+                _, dither_rng = gs.sample_rngs(gs.sample_seed(style, filename))
+                data = encode(x, fmt, dither_rng)
+                rel = f"{rate}-{fmt}/{style}/{filename}"
+                write_wav(os.path.join(EXPORT_DIR, rel), rate, data)
+                report.append({"file": rel, "rate": rate, "format": fmt,
+                               "samples": len(data), **measure(decoded(data), rate)})
+
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    with open(REPORT_PATH, "w", encoding="utf-8") as f:
+        json.dump({"targetPeakDbfs": gs.PEAK_DBFS, "files": report}, f, indent=1)
+        f.write("\n")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", action="append", metavar="STYLE[/SAMPLE]",
+                        help="Export only this style or sample (repeatable)")
+    parser.add_argument("--rate", type=int, nargs="+", default=list(RATES), help="Output rates in Hz")
+    parser.add_argument("--format", nargs="+", default=["pcm16"], choices=sorted(FORMATS))
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = export(only=args.only, rates=args.rate, formats=args.format)
+
+    def fmt_db(value):
+        return f"{value:7.2f}" if value is not None else "   -inf"
+
+    print(f"  {'file':44s} {'peak':>7s} {'tp':>7s} {'rms':>7s} {'LUFS':>7s}")
+    for entry in report:
+        over = " over target" if (entry["truePeakDbtp"] or -np.inf) > gs.PEAK_DBFS + 0.5 else ""
+        print(f"  {entry['file']:44s} {fmt_db(entry['peakDbfs'])} {fmt_db(entry['truePeakDbtp'])} "
+              f"{fmt_db(entry['rmsDbfs'])} {fmt_db(entry['lufs'])}{over}")
+    print(f"{len(report)} files — export took {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
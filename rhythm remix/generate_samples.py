@@ -5,13 +5,47 @@ Generates professional-quality WAV samples for 5 styles using numpy + scipy.
 
 Styles: trap, lofi, jazzhop, bossa, chiptune
 Output: mono 44100Hz 16-bit PCM WAV files
+
+Builds are incremental: samples/.build-manifest.json records a hash of each
+generator's source (including the helpers and constants it uses) and seed,
+and only samples whose hash changed are re-rendered, in parallel. All
+randomness comes from numpy Generators seeded per sample, so a render is
+bit-reproducible and the manifest also records each output's sha256.
+
+Usage:
+  python generate_samples.py                      # build what changed
+  python generate_samples.py --only trap/hat-open # one sample (or a whole style)
+  python generate_samples.py --force              # rebuild everything
+  python generate_samples.py --variants 64        # plus 64-variant banks per drum
+  python generate_samples.py --opus               # plus Ogg/Opus sprites (needs ffmpeg)
+  python generate_samples.py --verify             # re-render, check against samples/
+
+Every build also packs each style's WAVs into samples/sprites/<style>.wav
+with an offset index (sprites.json), so the browser loads one file per style.
 """
 
+import argparse
+import functools
+import hashlib
+import inspect
+import json
 import os
+import shutil
+import subprocess
+import tempfile
+import time
+import types
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
 import numpy as np
 from scipy import signal as sig
 from scipy.io import wavfile
 
+import convolution
+import dynamics
+
 # ──────────────────────────────────────────────────────────
 # Constants
 # ──────────────────────────────────────────────────────────
@@ -21,6 +55,12 @@ PEAK_AMP = 10 ** (PEAK_DBFS / 20.0)  # ~0.891
 SILENCE_THRESHOLD_DB = -60.0
 SILENCE_AMP = 10 ** (SILENCE_THRESHOLD_DB / 20.0)
 
+# Variant banks: round-robin alternates per drum, split into velocity layers
+VELOCITY_LAYERS = (0.55, 0.78, 1.0)     # Peak gain per layer (soft -> hard)
+VELOCITY_TONE_HZ = (4500, 9000, None)   # Lowpass per layer: softer hits are darker
+PITCH_JITTER = 0.03                     # ± fraction (~±50 cents)
+DECAY_JITTER = 0.10                     # ± fraction
+
 # TR-808 hi-hat oscillator frequencies
 HAT_FREQS = [205.3, 304.4, 369.6, 523.3, 800.0, 1096.5]
 
@@ -47,7 +87,7 @@ def exp_sweep(t, f_start, f_end, sweep_time):
     ratio = f_end / f_start
     # Instantaneous frequency: f_start * ratio^(t/sweep_time)
     # Phase integral: f_start * sweep_time / ln(ratio) * (ratio^(t/T) - 1)
-    if abs(ratio - 1.0) < 1e-6:
+    if np.all(np.abs(ratio - 1.0) < 1e-6):
         phase = 2 * np.pi * f_start * t_clamped
     else:
         phase = 2 * np.pi * f_start * sweep_time / np.log(ratio) * (
@@ -60,14 +100,44 @@ def exp_sweep_freq(t, f_start, f_end, sweep_time):
     """Return instantaneous frequency at each time point."""
     t_clamped = np.minimum(t, sweep_time)
     ratio = f_end / f_start
-    if abs(ratio - 1.0) < 1e-6:
-        return np.full_like(t, f_start)
+    if np.all(np.abs(ratio - 1.0) < 1e-6):
+        return f_start * np.ones_like(t)
     return f_start * ratio ** (t_clamped / sweep_time)
 
 
 def exp_envelope(t, decay_time):
     """Exponential decay envelope."""
-    return np.exp(-t / max(decay_time, 1e-6))
+    return np.exp(-t / np.maximum(decay_time, 1e-6))
+
+
+@functools.lru_cache(maxsize=256)
+def butter_sos(btype, wn, order):
+    """
+    Butterworth design as second-order sections, memoized.
+
+    wn is the cutoff (or (low, high) pair) normalized to SR / 2, so the
+    cache key is effectively (type, cutoffs, order, SR). The returned array
+    is shared between callers — do not modify it. (It cannot be flagged
+    read-only: sosfilt's Cython kernel requires a writable buffer.)
+    """
+    return sig.butter(order, wn, btype=btype, output='sos')
+
+
+def apply_sos(sos, x, zi=None):
+    """
+    Filter along the last axis, so a 2-D batch (one signal per row) is one call.
+
+    With zi (from sos_state()) the filter state is carried in and the final
+    state returned, for processing a long signal in consecutive blocks.
+    """
+    if zi is None:
+        return sig.sosfilt(sos, x, axis=-1)
+    return sig.sosfilt(sos, x, axis=-1, zi=zi)
+
+
+def sos_state(sos, batch_shape=()):
+    """Zero initial state for apply_sos() over signals of the given batch shape."""
+    return np.zeros((sos.shape[0], *batch_shape, 2))
 
 
 def bandpass(x, low, high, order=4):
@@ -77,8 +147,7 @@ def bandpass(x, low, high, order=4):
     high_n = min(high / nyq, 0.999)
     if low_n >= high_n:
         return x
-    sos = sig.butter(order, [low_n, high_n], btype='band', output='sos')
-    return sig.sosfilt(sos, x)
+    return apply_sos(butter_sos('band', (low_n, high_n), order), x)
 
 
 def highpass(x, freq, order=4):
@@ -86,8 +155,7 @@ def highpass(x, freq, order=4):
     nyq = SR / 2
     wn = max(freq / nyq, 0.001)
     wn = min(wn, 0.999)
-    sos = sig.butter(order, wn, btype='high', output='sos')
-    return sig.sosfilt(sos, x)
+    return apply_sos(butter_sos('high', wn, order), x)
 
 
 def lowpass(x, freq, order=4):
@@ -95,8 +163,7 @@ def lowpass(x, freq, order=4):
     nyq = SR / 2
     wn = min(freq / nyq, 0.999)
     wn = max(wn, 0.001)
-    sos = sig.butter(order, wn, btype='low', output='sos')
-    return sig.sosfilt(sos, x)
+    return apply_sos(butter_sos('low', wn, order), x)
 
 
 def bandpass_resonant(x, center, q=1.0):
@@ -109,19 +176,57 @@ def bandpass_resonant(x, center, q=1.0):
     high = min(wn + bw / 2, 0.999)
     if low >= high:
         return x
-    sos = sig.butter(2, [low, high], btype='band', output='sos')
-    return sig.sosfilt(sos, x)
+    return apply_sos(butter_sos('band', (low, high), 2), x)
 
 
-def noise(n_samples):
-    """White noise."""
-    return np.random.randn(n_samples)
+class Variation(NamedTuple):
+    """
+    Render request for a generator: the RNG all of its randomness comes from,
+    plus per-variant jitter when rendering a batch (one output row per variant).
+    Variation(rng) alone renders the single canonical one-shot.
+    """
+    rng: np.random.Generator
+    pitch: object = 1.0  # 1.0, or (batch, 1) oscillator frequency multipliers
+    decay: object = 1.0  # 1.0, or (batch, 1) decay-time multipliers
 
+    @property
+    def batch(self):
+        """Number of variants, or None for a single 1-D render."""
+        return None if np.ndim(self.pitch) == 0 else len(self.pitch)
 
-def make_reverb_ir(duration_s, decay_time, low=200, high=8000):
-    """Synthetic reverb impulse response: filtered decaying noise."""
+    def shape(self, n_samples):
+        return n_samples if self.batch is None else (self.batch, n_samples)
+
+
+def pitch(v):
+    """Per-variant pitch multiplier (1.0 for a single render)."""
+    return v.pitch
+
+
+def decay(v):
+    """Per-variant decay-time multiplier (1.0 for a single render)."""
+    return v.decay
+
+
+def noise(n_samples, v):
+    """White noise from v.rng — one row per variant when rendering a batch."""
+    return v.rng.standard_normal(v.shape(n_samples))
+
+
+def silence(n_samples, v):
+    """Zero buffer shaped like noise(n_samples, v)."""
+    return np.zeros(v.shape(n_samples))
+
+
+def make_reverb_ir(duration_s, decay_time, low=200, high=8000, seed=0):
+    """Synthetic reverb impulse response: filtered decaying noise.
+
+    The noise is drawn from its own seeded generator, so the IR is the same on
+    every call, which is what lets reverb_ir_spectra() cache it.
+    """
     t = make_time(duration_s)
-    ir = noise(len(t)) * exp_envelope(t, decay_time)
+    n = np.random.default_rng(seed).standard_normal(len(t))
+    ir = n * exp_envelope(t, decay_time)
     ir = bandpass(ir, low, high, order=2)
     # Normalize IR
     peak = np.max(np.abs(ir))
@@ -130,45 +235,38 @@ def make_reverb_ir(duration_s, decay_time, low=200, high=8000):
     return ir
 
 
+@functools.lru_cache(maxsize=32)
+def reverb_ir_spectra(duration_s, decay_time, low=200, high=8000, seed=0):
+    """Partitioned FFT of a seeded make_reverb_ir(), computed once per parameter set."""
+    spectra, ir_len = convolution.partition_ir(make_reverb_ir(duration_s, decay_time, low, high, seed=seed))
+    spectra.setflags(write=False)
+    return spectra, ir_len
+
+
 def convolve_reverb(x, ir, wet=0.3):
-    """Apply convolution reverb. Returns signal extended by IR length."""
-    wet_signal = np.convolve(x, ir, mode='full')[:len(x) + len(ir) - 1]
+    """Apply convolution reverb. Returns signal extended by IR length.
+
+    ir is either an impulse response array or a (spectra, ir_len) pair from
+    reverb_ir_spectra(). Convolution is FFT overlap-add, so cost grows only
+    slowly with tail length.
+    """
+    spectra, ir_len = ir if isinstance(ir, tuple) else convolution.partition_ir(ir)
+    wet_signal = convolution.convolve_partitioned(x, spectra, ir_len)
     # Pad dry signal to match
-    dry_padded = np.zeros(len(wet_signal))
-    dry_padded[:len(x)] = x
+    dry_padded = np.zeros(wet_signal.shape)
+    dry_padded[..., :x.shape[-1]] = x
     return dry_padded * (1 - wet) + wet_signal * wet
 
 
-def compress(x, threshold_db=-12, ratio=4.0, attack_ms=5, release_ms=50):
-    """Simple compressor."""
-    threshold = 10 ** (threshold_db / 20.0)
-    attack_samples = int(SR * attack_ms / 1000)
-    release_samples = int(SR * release_ms / 1000)
-
-    envelope = np.abs(x)
-    # Smooth envelope
-    smoothed = np.zeros_like(envelope)
-    for i in range(len(envelope)):
-        if i == 0:
-            smoothed[i] = envelope[i]
-        else:
-            if envelope[i] > smoothed[i - 1]:
-                coeff = 1.0 - np.exp(-1.0 / max(attack_samples, 1))
-            else:
-                coeff = 1.0 - np.exp(-1.0 / max(release_samples, 1))
-            smoothed[i] = smoothed[i - 1] + coeff * (envelope[i] - smoothed[i - 1])
-
-    # Compute gain reduction
-    gain = np.ones_like(smoothed)
-    above = smoothed > threshold
-    if np.any(above):
-        # dB domain compression
-        db = 20 * np.log10(smoothed[above] + 1e-10)
-        threshold_db_val = 20 * np.log10(threshold)
-        compressed_db = threshold_db_val + (db - threshold_db_val) / ratio
-        gain[above] = 10 ** ((compressed_db - db) / 20.0)
-
-    return x * gain
+def compress(x, threshold_db=-12, ratio=4.0, attack_ms=5, release_ms=50,
+             knee_db=0.0, makeup_db=0.0, lookahead_ms=0.0):
+    """Feed-forward compressor (see dynamics.py). Rows of a 2-D batch are compressed independently."""
+    if np.ndim(x) > 1:
+        return np.stack([compress(row, threshold_db, ratio, attack_ms, release_ms,
+                                  knee_db, makeup_db, lookahead_ms) for row in x])
+    return dynamics.compress(x, SR, threshold_db=threshold_db, ratio=ratio,
+                             attack_ms=attack_ms, release_ms=release_ms, knee_db=knee_db,
+                             makeup_db=makeup_db, lookahead_ms=lookahead_ms)
 
 
 def bitcrush(x, levels=256):
@@ -178,11 +276,11 @@ def bitcrush(x, levels=256):
 
 
 def normalize(x, target=PEAK_AMP):
-    """Normalize to target peak amplitude."""
-    peak = np.max(np.abs(x))
-    if peak < 1e-10:
+    """Normalize to target peak amplitude (per row for a 2-D batch)."""
+    peak = np.max(np.abs(x), axis=-1, keepdims=True)
+    if np.all(peak < 1e-10):
         return x
-    return x * (target / peak)
+    return np.where(peak < 1e-10, x, x * (target / np.maximum(peak, 1e-10)))
 
 
 def trim_silence(x, threshold=SILENCE_AMP):
@@ -197,30 +295,31 @@ def trim_silence(x, threshold=SILENCE_AMP):
     return x[:end]
 
 
-def dither_and_quantize(x):
-    """Apply triangular dither and quantize to 16-bit."""
+def dither_and_quantize(x, rng, bits=16):
+    """Apply triangular dither (drawn from rng) and quantize to 16-bit (or 24-bit in int32)."""
+    full_scale = 2 ** (bits - 1) - 1
     # Triangular probability density dither (1 LSB amplitude)
-    lsb = 1.0 / 32767.0
-    dither = (np.random.random(len(x)) - np.random.random(len(x))) * lsb
+    lsb = 1.0 / full_scale
+    dither = (rng.random(len(x)) - rng.random(len(x))) * lsb
     x = x + dither
     # Clip to [-1, 1]
     x = np.clip(x, -1.0, 1.0)
-    # Quantize to 16-bit
-    return (x * 32767).astype(np.int16)
+    # Quantize
+    return (x * full_scale).astype(np.int16 if bits == 16 else np.int32)
 
 
-def save_wav(filepath, data_float):
+def save_wav(filepath, data_float, rng):
     """Full pipeline: normalize, trim, dither, save."""
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     data = trim_silence(data_float)
-    data = dither_and_quantize(data)
+    data = dither_and_quantize(data, rng)
     wavfile.write(filepath, SR, data)
     return filepath
 
 
 def hat_oscillators(t, freqs=HAT_FREQS):
     """Generate mixed square oscillators at given frequencies (808-style)."""
-    mix = np.zeros(len(t))
+    mix = np.zeros(np.shape(t))
     for f in freqs:
         mix += sig.square(2 * np.pi * f * t)
     return mix / len(freqs)
@@ -228,29 +327,38 @@ def hat_oscillators(t, freqs=HAT_FREQS):
 
 # ──────────────────────────────────────────────────────────
 # TRAP style (Metro Boomin / 808 style)
+#
+# Every generator takes a Variation (v) and draws all of its noise from
+# v.rng, so a render is a pure function of that generator's seed. A plain
+# Variation(rng) renders the single canonical one-shot; a batch Variation
+# renders v.batch variants at once as a (batch, samples) array, scaling
+# oscillator pitches by v.pitch and decay times by v.decay. Noise layers
+# share one filter design across the batch, so they vary by noise and
+# decay only.
 # ──────────────────────────────────────────────────────────
-def trap_kick():
+def trap_kick(v):
     t = make_time(1.2)
+    p, d = pitch(v), decay(v)
 
     # Click transient: 15ms noise burst, bandpass 3-5kHz
     click_dur = int(SR * 0.015)
-    click = noise(click_dur)
+    click = noise(click_dur, v)
     click = bandpass(click, 3000, 5000, order=2)
     click *= exp_envelope(make_time(0.015), 0.005)
-    click_padded = np.zeros(len(t))
-    click_padded[:click_dur] = click * 0.7
+    click_padded = silence(len(t), v)
+    click_padded[..., :click_dur] = click * 0.7
 
     # Main body: sine sweep 160->22Hz over 0.3s
-    body = exp_sweep(t, 160, 22, 0.3)
+    body = exp_sweep(t, 160 * p, 22 * p, 0.3)
     # Sustain envelope: fast attack, long decay
     body_env = np.ones(len(t))
-    body_env *= exp_envelope(t, 0.5)  # Long sustain
-    body *= body_env
+    body_env = body_env * exp_envelope(t, 0.5 * d)  # Long sustain
+    body = body * body_env
 
     # Sub harmonic at 0.5x frequency
-    sub = exp_sweep(t, 80, 11, 0.3)
-    sub_env = exp_envelope(t, 0.6)
-    sub *= sub_env * 0.5
+    sub = exp_sweep(t, 80 * p, 11 * p, 0.3)
+    sub_env = exp_envelope(t, 0.6 * d)
+    sub = sub * sub_env * 0.5
 
     # Combine
     combined = click_padded + body + sub
@@ -264,49 +372,49 @@ def trap_kick():
     return normalize(combined)
 
 
-def trap_clap():
+def trap_clap(v):
     t_total = make_time(0.5)
-    result = np.zeros(len(t_total))
+    d = decay(v)
+    result = silence(len(t_total), v)
 
     # 4 noise bursts at 12ms intervals
     burst_interval = int(SR * 0.012)
     burst_dur = int(SR * 0.008)
     for i in range(4):
-        np.random.seed(42 + i * 7)  # Different seeds
         start = i * burst_interval
-        if start + burst_dur > len(result):
+        if start + burst_dur > result.shape[-1]:
             break
-        burst = noise(burst_dur)
+        burst = noise(burst_dur, v)
         burst = bandpass(burst, 1500, 3000, order=2)
-        burst *= exp_envelope(make_time(burst_dur / SR), 0.003)
-        result[start:start + burst_dur] += burst * (0.8 + 0.2 * np.random.random())
-
-    np.random.seed(None)  # Reset seed
+        burst *= exp_envelope(make_time(burst_dur / SR), 0.003 * d)
+        level = v.rng.random(None if v.batch is None else (v.batch, 1))
+        result[..., start:start + burst_dur] += burst * (0.8 + 0.2 * level)
 
     # Reverb tail: 300ms filtered decaying noise
     tail_dur = int(SR * 0.3)
     tail_t = make_time(0.3)
-    tail = noise(tail_dur) * exp_envelope(tail_t, 0.1)
+    tail = noise(tail_dur, v) * exp_envelope(tail_t, 0.1 * d)
     tail = bandpass(tail, 1000, 2000, order=2)
-    tail_padded = np.zeros(len(t_total))
+    tail_padded = silence(len(t_total), v)
     tail_start = 4 * burst_interval
     end = min(tail_start + tail_dur, len(t_total))
-    tail_padded[tail_start:end] = tail[:end - tail_start] * 0.3
+    tail_padded[..., tail_start:end] = tail[..., :end - tail_start] * 0.3
 
     result += tail_padded
 
     # Convolution reverb with synthetic IR
-    ir = make_reverb_ir(0.3, 0.08, 800, 4000)
+    ir = reverb_ir_spectra(0.3, 0.08, 800, 4000, seed=1)
     result = convolve_reverb(result, ir, wet=0.25)
 
     return normalize(result)
 
 
-def trap_hat_closed():
+def trap_hat_closed(v):
     t = make_time(0.06)  # 60ms total, 40ms audible decay
+    p, d = pitch(v), decay(v)
 
     # 6 square oscillators at 808 frequencies
-    osc = hat_oscillators(t)
+    osc = hat_oscillators(t * p)
 
     # Highpass 7kHz
     osc = highpass(osc, 7000, order=4)
@@ -315,34 +423,35 @@ def trap_hat_closed():
     osc = bandpass_resonant(osc, 10000, q=1.5)
 
     # 40ms decay
-    env = exp_envelope(t, 0.012)
-    osc *= env
+    env = exp_envelope(t, 0.012 * d)
+    osc = osc * env
 
     # Noise layer for air
-    air = noise(len(t))
+    air = noise(len(t), v)
     air = bandpass(air, 9000, 14000, order=2)
-    air *= exp_envelope(t, 0.015)
+    air = air * exp_envelope(t, 0.015 * d)
 
     combined = osc * 0.6 + air * 0.4
     return normalize(combined)
 
 
-def trap_hat_open():
+def trap_hat_open(v):
     t = make_time(0.35)  # 350ms total, 250ms decay
+    p, d = pitch(v), decay(v)
 
     # Same oscillators
-    osc = hat_oscillators(t)
+    osc = hat_oscillators(t * p)
     osc = highpass(osc, 7000, order=4)
     osc = bandpass_resonant(osc, 10000, q=1.5)
 
     # 250ms decay
-    env = exp_envelope(t, 0.08)
-    osc *= env
+    env = exp_envelope(t, 0.08 * d)
+    osc = osc * env
 
     # Slightly louder noise layer
-    air = noise(len(t))
+    air = noise(len(t), v)
     air = bandpass(air, 9000, 14000, order=2)
-    air *= exp_envelope(t, 0.1)
+    air = air * exp_envelope(t, 0.1 * d)
 
     combined = osc * 0.5 + air * 0.5
     return normalize(combined)
@@ -351,17 +460,18 @@ def trap_hat_open():
 # ──────────────────────────────────────────────────────────
 # LO-FI style (boom-bap, J Dilla)
 # ──────────────────────────────────────────────────────────
-def lofi_kick():
+def lofi_kick(v):
     t = make_time(0.4)
+    p, d = pitch(v), decay(v)
 
     # Triangle wave sweep 150->50Hz over 80ms
-    freq = exp_sweep_freq(t, 150, 50, 0.08)
-    phase = np.cumsum(2 * np.pi * freq / SR)
+    freq = exp_sweep_freq(t, 150 * p, 50 * p, 0.08)
+    phase = np.cumsum(2 * np.pi * freq / SR, axis=-1)
     body = sig.sawtooth(phase, width=0.5)  # Triangle wave
 
     # Envelope: 300ms sustain
-    env = exp_envelope(t, 0.15)
-    body *= env
+    env = exp_envelope(t, 0.15 * d)
+    body = body * env
 
     # Tape saturation
     body = saturate(body, drive=2)
@@ -372,37 +482,39 @@ def lofi_kick():
     return normalize(body)
 
 
-def lofi_snare():
+def lofi_snare(v):
     t = make_time(0.4)
+    p, d = pitch(v), decay(v)
 
     # Triangle body at 180Hz, 100ms decay
-    body_phase = 2 * np.pi * 180 * t
+    body_phase = 2 * np.pi * 180 * p * t
     body = sig.sawtooth(body_phase, width=0.5)
-    body *= exp_envelope(t, 0.04)
+    body = body * exp_envelope(t, 0.04 * d)
 
     # Filtered noise burst, bandpass 2-4kHz, 150ms decay
-    n = noise(len(t))
+    n = noise(len(t), v)
     n = bandpass(n, 2000, 4000, order=3)
-    n *= exp_envelope(t, 0.06)
+    n = n * exp_envelope(t, 0.06 * d)
 
     combined = body * 0.5 + n * 0.6
 
     # Subtle room reverb
-    ir = make_reverb_ir(0.2, 0.06, 500, 6000)
+    ir = reverb_ir_spectra(0.2, 0.06, 500, 6000, seed=2)
     combined = convolve_reverb(combined, ir, wet=0.15)
 
     return normalize(combined)
 
 
-def lofi_hat_closed():
+def lofi_hat_closed(v):
     t = make_time(0.07)
+    p, d = pitch(v), decay(v)
 
-    osc = hat_oscillators(t)
+    osc = hat_oscillators(t * p)
     osc = highpass(osc, 6000, order=3)
     osc = bandpass_resonant(osc, 8000, q=0.8)
 
-    env = exp_envelope(t, 0.015)
-    osc *= env
+    env = exp_envelope(t, 0.015 * d)
+    osc = osc * env
 
     # Light tape saturation
     osc = saturate(osc, drive=1.5)
@@ -410,15 +522,16 @@ def lofi_hat_closed():
     return normalize(osc, target=PEAK_AMP * 0.8)
 
 
-def lofi_hat_open():
+def lofi_hat_open(v):
     t = make_time(0.28)
+    p, d = pitch(v), decay(v)
 
-    osc = hat_oscillators(t)
+    osc = hat_oscillators(t * p)
     osc = highpass(osc, 6000, order=3)
     osc = bandpass_resonant(osc, 8000, q=0.8)
 
-    env = exp_envelope(t, 0.065)
-    osc *= env
+    env = exp_envelope(t, 0.065 * d)
+    osc = osc * env
 
     osc = saturate(osc, drive=1.5)
 
@@ -428,17 +541,18 @@ def lofi_hat_open():
 # ──────────────────────────────────────────────────────────
 # JAZZHOP style
 # ──────────────────────────────────────────────────────────
-def jazzhop_kick():
+def jazzhop_kick(v):
     t = make_time(0.35)
+    p, d = pitch(v), decay(v)
 
     # Same as lofi but tighter (250ms) and cleaner
-    freq = exp_sweep_freq(t, 150, 50, 0.08)
-    phase = np.cumsum(2 * np.pi * freq / SR)
+    freq = exp_sweep_freq(t, 150 * p, 50 * p, 0.08)
+    phase = np.cumsum(2 * np.pi * freq / SR, axis=-1)
     body = sig.sawtooth(phase, width=0.5)
 
     # Tighter envelope
-    env = exp_envelope(t, 0.12)
-    body *= env
+    env = exp_envelope(t, 0.12 * d)
+    body = body * env
 
     # Less saturation
     body = saturate(body, drive=1.2)
@@ -447,43 +561,45 @@ def jazzhop_kick():
     return normalize(body)
 
 
-def jazzhop_snare():
+def jazzhop_snare(v):
     t = make_time(0.2)
+    d = decay(v)
 
     # Brush snare: ONLY filtered noise
-    n = noise(len(t))
+    n = noise(len(t), v)
     n = bandpass(n, 1500, 3000, order=2)  # Wider Q via lower order
 
-    env = exp_envelope(t, 0.04)
-    n *= env
+    env = exp_envelope(t, 0.04 * d)
+    n = n * env
 
     return normalize(n, target=PEAK_AMP * 0.45)
 
 
-def jazzhop_hat_closed():
+def jazzhop_hat_closed(v):
     # Same as lofi
-    return lofi_hat_closed()
+    return lofi_hat_closed(v)
 
 
-def jazzhop_hat_open():
+def jazzhop_hat_open(v):
     # Same as lofi
-    return lofi_hat_open()
+    return lofi_hat_open(v)
 
 
 # ──────────────────────────────────────────────────────────
 # BOSSA style
 # ──────────────────────────────────────────────────────────
-def bossa_kick():
+def bossa_kick(v):
     t = make_time(0.2)
+    p, d = pitch(v), decay(v)
 
     # Soft triangle sweep 120->55Hz over 50ms
-    freq = exp_sweep_freq(t, 120, 55, 0.05)
-    phase = np.cumsum(2 * np.pi * freq / SR)
+    freq = exp_sweep_freq(t, 120 * p, 55 * p, 0.05)
+    phase = np.cumsum(2 * np.pi * freq / SR, axis=-1)
     body = sig.sawtooth(phase, width=0.5)
 
     # Short envelope, 150ms total
-    env = exp_envelope(t, 0.06)
-    body *= env
+    env = exp_envelope(t, 0.06 * d)
+    body = body * env
 
     # Lowpass 3kHz, no saturation
     body = lowpass(body, 3000, order=3)
@@ -491,44 +607,47 @@ def bossa_kick():
     return normalize(body, target=0.5)
 
 
-def bossa_rim():
+def bossa_rim(v):
     t = make_time(0.06)
+    p, d = pitch(v), decay(v)
 
     # Rim click: triangle at 800Hz, sharp attack, fast decay
-    body = sig.sawtooth(2 * np.pi * 800 * t, width=0.5)
-    env = exp_envelope(t, 0.008)
-    body *= env
+    body = sig.sawtooth(2 * np.pi * 800 * p * t, width=0.5)
+    env = exp_envelope(t, 0.008 * d)
+    body = body * env
 
     # Add a tiny click transient
     click_samples = int(SR * 0.002)
-    click = np.zeros(len(t))
-    click[:click_samples] = noise(click_samples) * 0.3
+    click = silence(len(t), v)
+    click[..., :click_samples] = noise(click_samples, v) * 0.3
     click = highpass(click, 2000, order=2)
 
     combined = body * 0.7 + click
     return normalize(combined)
 
 
-def bossa_hat_closed():
+def bossa_hat_closed(v):
     t = make_time(0.06)
+    p, d = pitch(v), decay(v)
 
-    osc = hat_oscillators(t)
+    osc = hat_oscillators(t * p)
     osc = highpass(osc, 8000, order=4)
 
-    env = exp_envelope(t, 0.01)
-    osc *= env
+    env = exp_envelope(t, 0.01 * d)
+    osc = osc * env
 
     return normalize(osc, target=0.15)
 
 
-def bossa_hat_open():
+def bossa_hat_open(v):
     t = make_time(0.2)
+    p, d = pitch(v), decay(v)
 
-    osc = hat_oscillators(t)
+    osc = hat_oscillators(t * p)
     osc = highpass(osc, 8000, order=4)
 
-    env = exp_envelope(t, 0.05)
-    osc *= env
+    env = exp_envelope(t, 0.05 * d)
+    osc = osc * env
 
     return normalize(osc, target=0.2)
 
@@ -536,17 +655,18 @@ def bossa_hat_open():
 # ──────────────────────────────────────────────────────────
 # CHIPTUNE style (8-bit)
 # ──────────────────────────────────────────────────────────
-def chiptune_kick():
+def chiptune_kick(v):
     t = make_time(0.15)
+    p, d = pitch(v), decay(v)
 
     # Square wave sweep 200->40Hz over 60ms
-    freq = exp_sweep_freq(t, 200, 40, 0.06)
-    phase = np.cumsum(2 * np.pi * freq / SR)
+    freq = exp_sweep_freq(t, 200 * p, 40 * p, 0.06)
+    phase = np.cumsum(2 * np.pi * freq / SR, axis=-1)
     body = sig.square(phase)
 
     # 120ms envelope
-    env = exp_envelope(t, 0.04)
-    body *= env
+    env = exp_envelope(t, 0.04 * d)
+    body = body * env
 
     # Bitcrush
     body = bitcrush(body, levels=256)
@@ -554,21 +674,22 @@ def chiptune_kick():
     return normalize(body)
 
 
-def chiptune_snare():
+def chiptune_snare(v):
     t = make_time(0.1)
+    p, d = pitch(v), decay(v)
 
     # Noise burst, 60ms
-    n = noise(len(t))
-    noise_env = np.zeros(len(t))
+    n = noise(len(t), v)
+    noise_env = np.zeros(np.broadcast(t, d).shape)
     noise_dur = int(SR * 0.06)
-    noise_env[:noise_dur] = exp_envelope(make_time(0.06), 0.02)
-    n *= noise_env
+    noise_env[..., :noise_dur] = exp_envelope(make_time(0.06), 0.02 * d)
+    n = n * noise_env
 
     # Square body at 180Hz, 40ms
     body_dur = int(SR * 0.04)
-    body_env = np.zeros(len(t))
-    body_env[:body_dur] = exp_envelope(make_time(0.04), 0.015)
-    body = sig.square(2 * np.pi * 180 * t) * body_env
+    body_env = np.zeros(np.broadcast(t, d).shape)
+    body_env[..., :body_dur] = exp_envelope(make_time(0.04), 0.015 * d)
+    body = sig.square(2 * np.pi * 180 * p * t) * body_env
 
     combined = n * 0.6 + body * 0.5
     combined = bitcrush(combined, levels=256)
@@ -576,30 +697,32 @@ def chiptune_snare():
     return normalize(combined)
 
 
-def chiptune_hat_closed():
+def chiptune_hat_closed(v):
     t = make_time(0.05)
+    p, d = pitch(v), decay(v)
 
     # Very short square at ~12kHz
     # (Nyquist is 22050, so 12kHz is fine)
-    osc = sig.square(2 * np.pi * 12000 * t)
+    osc = sig.square(2 * np.pi * 12000 * p * t)
     osc = highpass(osc, 8000, order=3)
 
-    env = exp_envelope(t, 0.008)
-    osc *= env
+    env = exp_envelope(t, 0.008 * d)
+    osc = osc * env
 
     osc = bitcrush(osc, levels=256)
 
     return normalize(osc)
 
 
-def chiptune_hat_open():
+def chiptune_hat_open(v):
     t = make_time(0.15)
+    p, d = pitch(v), decay(v)
 
-    osc = sig.square(2 * np.pi * 12000 * t)
+    osc = sig.square(2 * np.pi * 12000 * p * t)
     osc = highpass(osc, 8000, order=3)
 
-    env = exp_envelope(t, 0.03)
-    osc *= env
+    env = exp_envelope(t, 0.03 * d)
+    osc = osc * env
 
     osc = bitcrush(osc, levels=256)
 
@@ -607,67 +730,393 @@ def chiptune_hat_open():
 
 
 # ──────────────────────────────────────────────────────────
-# Main: generate all samples
+# Sample registry
 # ──────────────────────────────────────────────────────────
-def main():
-    styles = {
-        "trap": {
-            "kick.wav": trap_kick,
-            "clap.wav": trap_clap,
-            "hat-closed.wav": trap_hat_closed,
-            "hat-open.wav": trap_hat_open,
-        },
-        "lofi": {
-            "kick.wav": lofi_kick,
-            "snare.wav": lofi_snare,
-            "hat-closed.wav": lofi_hat_closed,
-            "hat-open.wav": lofi_hat_open,
-        },
-        "jazzhop": {
-            "kick.wav": jazzhop_kick,
-            "snare.wav": jazzhop_snare,
-            "hat-closed.wav": jazzhop_hat_closed,
-            "hat-open.wav": jazzhop_hat_open,
-        },
-        "bossa": {
-            "kick.wav": bossa_kick,
-            "rim.wav": bossa_rim,
-            "hat-closed.wav": bossa_hat_closed,
-            "hat-open.wav": bossa_hat_open,
-        },
-        "chiptune": {
-            "kick.wav": chiptune_kick,
-            "snare.wav": chiptune_snare,
-            "hat-closed.wav": chiptune_hat_closed,
-            "hat-open.wav": chiptune_hat_open,
-        },
+STYLES = {
+    "trap": {
+        "kick.wav": trap_kick,
+        "clap.wav": trap_clap,
+        "hat-closed.wav": trap_hat_closed,
+        "hat-open.wav": trap_hat_open,
+    },
+    "lofi": {
+        "kick.wav": lofi_kick,
+        "snare.wav": lofi_snare,
+        "hat-closed.wav": lofi_hat_closed,
+        "hat-open.wav": lofi_hat_open,
+    },
+    "jazzhop": {
+        "kick.wav": jazzhop_kick,
+        "snare.wav": jazzhop_snare,
+        "hat-closed.wav": jazzhop_hat_closed,
+        "hat-open.wav": jazzhop_hat_open,
+    },
+    "bossa": {
+        "kick.wav": bossa_kick,
+        "rim.wav": bossa_rim,
+        "hat-closed.wav": bossa_hat_closed,
+        "hat-open.wav": bossa_hat_open,
+    },
+    "chiptune": {
+        "kick.wav": chiptune_kick,
+        "snare.wav": chiptune_snare,
+        "hat-closed.wav": chiptune_hat_closed,
+        "hat-open.wav": chiptune_hat_open,
+    },
+}
+
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, ".build-manifest.json")
+VARIANTS_INDEX_PATH = os.path.join(OUTPUT_DIR, "variants.json")
+SPRITE_DIR = os.path.join(OUTPUT_DIR, "sprites")
+SPRITE_INDEX_PATH = os.path.join(SPRITE_DIR, "sprites.json")
+SPRITE_GAP_S = 0.02  # Silence between clips so lossy codecs don't smear one into the next
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# ──────────────────────────────────────────────────────────
+# Variant banks
+# ──────────────────────────────────────────────────────────
+def make_variation(n_variants, rng):
+    """Pitch/decay jitter for n_variants renders, all drawn from rng."""
+    pitch_mult = 1.0 + rng.uniform(-PITCH_JITTER, PITCH_JITTER, (n_variants, 1))
+    decay_mult = 1.0 + rng.uniform(-DECAY_JITTER, DECAY_JITTER, (n_variants, 1))
+    return Variation(rng, pitch_mult, decay_mult)
+
+
+def velocity_layer_of(n_variants):
+    """Layer index per variant: contiguous, near-equal groups from soft to hard."""
+    return np.arange(n_variants) * len(VELOCITY_LAYERS) // n_variants
+
+
+def render_variant_bank(gen_fn, n_variants, rng):
+    """
+    Render n_variants alternates of one drum in a single batched pass.
+
+    Returns:
+        (clips, layers): trimmed float clips, and for each velocity layer the
+        indices of its clips
+    """
+    batch = gen_fn(make_variation(n_variants, rng))
+    layer_of = velocity_layer_of(n_variants)
+    for layer, (gain, tone_hz) in enumerate(zip(VELOCITY_LAYERS, VELOCITY_TONE_HZ)):
+        rows = layer_of == layer
+        # Relative to the generator's own peak, so per-style levels are kept
+        peak = np.max(np.abs(batch[rows]), axis=-1, keepdims=True)
+        layer_batch = batch[rows] if tone_hz is None else lowpass(batch[rows], tone_hz, order=2)
+        batch[rows] = normalize(layer_batch, target=peak * gain)
+    clips = [trim_silence(row) for row in batch]
+    layers = [np.flatnonzero(layer_of == layer).tolist() for layer in range(len(VELOCITY_LAYERS))]
+    return clips, layers
+
+
+def save_variant_bank(filepath, clips, layers, rng):
+    """
+    Write all clips back to back as one WAV.
+
+    Returns:
+        Per-layer lists of [offset, length] in samples, for the JSON index
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    offsets = np.concatenate([[0], np.cumsum([len(c) for c in clips])])
+    wavfile.write(filepath, SR, dither_and_quantize(np.concatenate(clips), rng))
+    return [[[int(offsets[i]), len(clips[i])] for i in rows] for rows in layers]
+
+
+def write_variants_index(manifest):
+    """samples/variants.json: style -> drum -> {file, layers: [[offset, length], ...]}."""
+    styles = {}
+    for rel, entry in sorted(manifest.items()):
+        if "layers" not in entry:
+            continue
+        style, filename = rel.split("/")[1:]
+        styles.setdefault(style, {})[filename[:-len(".wav")]] = {
+            "file": rel,
+            "layers": entry["layers"],
+        }
+    index = {"sampleRate": SR, "velocity": list(VELOCITY_LAYERS), "styles": styles}
+    with open(VARIANTS_INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+
+
+# ──────────────────────────────────────────────────────────
+# Audio sprites
+# ──────────────────────────────────────────────────────────
+def build_sprites(opus=False):
+    """
+    Pack each style's WAVs into one sprite (samples/sprites/<style>.wav).
+
+    sprites/sprites.json maps style -> sample filename -> [offset_s, duration_s].
+    Positions are in seconds because decodeAudioData() resamples to the
+    AudioContext rate. With opus=True an Ogg/Opus copy of each sprite is
+    encoded via ffmpeg (if installed) and listed under "opus".
+
+    Returns:
+        The index dict
+    """
+    os.makedirs(SPRITE_DIR, exist_ok=True)
+    ffmpeg = shutil.which("ffmpeg") if opus else None
+    if opus and not ffmpeg:
+        print("  ffmpeg not found — skipping Opus sprites")
+    gap = np.zeros(int(SR * SPRITE_GAP_S), dtype=np.int16)
+
+    index = {"sampleRate": SR, "styles": {}}
+    for style, samples in STYLES.items():
+        clips, positions, cursor = [], {}, 0
+        for filename in samples:
+            path = os.path.join(OUTPUT_DIR, style, filename)
+            if not os.path.exists(path):
+                continue
+            rate, data = wavfile.read(path)
+            if rate != SR or data.dtype != np.int16:
+                raise ValueError(f"{path}: expected {SR} Hz 16-bit PCM")
+            positions[filename] = [round(cursor / SR, 6), round(len(data) / SR, 6)]
+            clips.extend([data, gap])
+            cursor += len(data) + len(gap)
+        if not clips:
+            continue
+        sprite_path = os.path.join(SPRITE_DIR, f"{style}.wav")
+        wavfile.write(sprite_path, SR, np.concatenate(clips))
+        entry = {"file": f"{style}.wav", "samples": positions}
+        if ffmpeg:
+            opus_path = os.path.join(SPRITE_DIR, f"{style}.opus.ogg")
+            subprocess.run([ffmpeg, "-y", "-loglevel", "error", "-i", sprite_path,
+                            "-c:a", "libopus", "-b:a", "96k", opus_path], check=True)
+            entry["opus"] = os.path.basename(opus_path)
+        index["styles"][style] = entry
+        print(f"  sprites/{style}.wav  {len(positions)} clips, {os.path.getsize(sprite_path):,d} bytes")
+
+    with open(SPRITE_INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1)
+        f.write("\n")
+    return index
+
+
+# ──────────────────────────────────────────────────────────
+# Incremental build
+# ──────────────────────────────────────────────────────────
+def sample_seed(style, filename):
+    """Stable per-sample seed derived from its name."""
+    return zlib.crc32(f"{style}/{filename}".encode())
+
+
+def sample_rngs(seed):
+    """Independent (render, dither) generators for one sample's seed."""
+    render, dither = np.random.SeedSequence(seed).spawn(2)
+    return np.random.default_rng(render), np.random.default_rng(dither)
+
+
+def _local_dependencies(fn, seen):
+    """Source text of fn plus every helper, sibling module and constant it reaches."""
+    parts = []
+    code_objects = [fn.__code__]
+    while code_objects:
+        code = code_objects.pop()
+        code_objects.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+        for name in code.co_names:
+            value = fn.__globals__.get(name)
+            key = (name, id(value))
+            if value is None or key in seen:
+                continue
+            seen.add(key)
+            if isinstance(value, types.FunctionType) and value.__module__ == fn.__module__:
+                parts.append(inspect.getsource(value))
+                parts.append(repr(value.__defaults__))
+                parts.extend(_local_dependencies(value, seen))
+            elif isinstance(value, types.ModuleType) and os.path.dirname(
+                    os.path.abspath(getattr(value, "__file__", "") or "")) == _SCRIPT_DIR:
+                with open(value.__file__, encoding="utf-8") as f:
+                    parts.append(f.read())
+            elif isinstance(value, (int, float, str, tuple, list)):
+                parts.append(f"{name}={value!r}")
+    return parts
+
+
+def generator_hash(gen_fn, seed):
+    """Hash of everything that determines a sample's bytes: source, constants, seed, output pipeline."""
+    parts = [inspect.getsource(gen_fn), repr(gen_fn.__defaults__), f"seed={seed}"]
+    seen = set()
+    parts.extend(_local_dependencies(gen_fn, seen))
+    for fn in (sample_rngs, save_wav):
+        parts.append(inspect.getsource(fn))
+        parts.extend(_local_dependencies(fn, seen))
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest):
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def file_sha256(filepath):
+    with open(filepath, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def render_sample(style, filename, seed, variants=0, output_dir=OUTPUT_DIR):
+    """
+    Render and save one sample, or its variant bank when variants > 0.
+    Top-level so process-pool workers can run it. Output bytes depend only
+    on the generator and seed, never on process or render order.
+    """
+    start = time.perf_counter()
+    render_rng, dither_rng = sample_rngs(seed)
+    gen_fn = STYLES[style][filename]
+    if variants:
+        filepath = os.path.join(output_dir, "variants", style, filename)
+        clips, layers = render_variant_bank(gen_fn, variants, render_rng)
+        extra = {"layers": save_variant_bank(filepath, clips, layers, dither_rng)}
+        n_samples = sum(len(c) for c in clips)
+    else:
+        filepath = os.path.join(output_dir, style, filename)
+        data = gen_fn(Variation(render_rng))
+        save_wav(filepath, data, dither_rng)
+        extra = {}
+        n_samples = len(data)
+    return {
+        "seconds": round(time.perf_counter() - start, 4),
+        "duration": round(n_samples / SR, 4),
+        "bytes": os.path.getsize(filepath),
+        "sha256": file_sha256(filepath),
+        **extra,
     }
 
-    generated_files = []
-    total_size = 0
-
-    for style_name, samples in styles.items():
-        print(f"\n--- {style_name.upper()} ---")
-        for filename, gen_fn in samples.items():
-            filepath = os.path.join(OUTPUT_DIR, style_name, filename)
-            try:
-                data = gen_fn()
-                save_wav(filepath, data)
-                size = os.path.getsize(filepath)
-                total_size += size
-                generated_files.append((filepath, size))
-                print(f"  {filename:20s} {size:>8,d} bytes  ({len(data)/SR:.3f}s)")
-            except Exception as e:
-                print(f"  ERROR generating {filename}: {e}")
-                import traceback
-                traceback.print_exc()
 
+def select_samples(only):
+    """(style, filename) pairs matching --only selectors ('trap', 'trap/kick', 'trap/kick.wav')."""
+    selected = []
+    for style, samples in STYLES.items():
+        for filename in samples:
+            key = f"{style}/{filename}"
+            if not only or any(sel in (style, key, key[:-len(".wav")]) for sel in only):
+                selected.append((style, filename))
+    return selected
+
+
+def build(only=None, force=False, jobs=None, variants=0):
+    """
+    Render every selected sample whose generator hash changed since the last build.
+
+    With variants > 0, each sample's variant bank (variants/<style>/<sample>)
+    is built too and samples/variants.json is rewritten.
+
+    Returns:
+        Manifest dict (relative path -> hash, seed, timing, size)
+    """
+    manifest = load_manifest()
+    todo = []
+    for style, filename in select_samples(only):
+        seed = sample_seed(style, filename)
+        digest = generator_hash(STYLES[style][filename], seed)
+        outputs = [(f"{style}/{filename}", 0, digest)]
+        if variants:
+            bank_digest = hashlib.sha256(f"{digest}:variants={variants}".encode()).hexdigest()[:16]
+            outputs.append((f"variants/{style}/{filename}", variants, bank_digest))
+        for rel, n_variants, out_digest in outputs:
+            entry = manifest.get(rel)
+            up_to_date = (entry and entry.get("hash") == out_digest
+                          and os.path.exists(os.path.join(OUTPUT_DIR, rel)))
+            if up_to_date and not force:
+                print(f"  {rel:36s} unchanged")
+                continue
+            todo.append((rel, style, filename, seed, out_digest, n_variants))
+
+    def record(rel, seed, digest, result):
+        manifest[rel] = {"hash": digest, "seed": seed, **result}
+        print(f"  {rel:36s} {result['bytes']:>9,d} bytes  ({result['duration']:.3f}s)"
+              f"  rendered in {result['seconds'] * 1000:.0f}ms")
+
+    if len(todo) <= 1 or jobs == 1:
+        # A pool costs more to start than one sample costs to render
+        for rel, style, filename, seed, digest, n_variants in todo:
+            record(rel, seed, digest, render_sample(style, filename, seed, n_variants))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(render_sample, style, filename, seed, n_variants): (rel, seed, digest)
+                       for rel, style, filename, seed, digest, n_variants in todo}
+            for future in as_completed(futures):
+                rel, seed, digest = futures[future]
+                try:
+                    record(rel, seed, digest, future.result())
+                except Exception as e:
+                    print(f"  ERROR generating {rel}: {e}")
+
+    save_manifest(manifest)
+    if variants:
+        write_variants_index(manifest)
+    return manifest
+
+
+def verify(only=None, variants=0):
+    """
+    Re-render the selected samples into a scratch directory and compare their
+    bytes with the files in samples/ (the checked-in WAVs, and variant banks
+    from a --variants build).
+
+    Returns:
+        (number of samples compared, relative paths whose output differs)
+    """
+    compared, mismatched = 0, []
+    with tempfile.TemporaryDirectory() as scratch:
+        for style, filename in select_samples(only):
+            seed = sample_seed(style, filename)
+            outputs = [(f"{style}/{filename}", 0)]
+            if variants:
+                outputs.append((f"variants/{style}/{filename}", variants))
+            for rel, n_variants in outputs:
+                reference = os.path.join(OUTPUT_DIR, rel)
+                if not os.path.exists(reference):
+                    print(f"  {rel:36s} missing — nothing to compare")
+                    continue
+                result = render_sample(style, filename, seed, n_variants, output_dir=scratch)
+                ok = result["sha256"] == file_sha256(reference)
+                compared += 1
+                print(f"  {rel:36s} {'identical' if ok else 'DIFFERS'}")
+                if not ok:
+                    mismatched.append(rel)
+    return compared, mismatched
+
+
+# ──────────────────────────────────────────────────────────
+# Main
+# ──────────────────────────────────────────────────────────
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", action="append", metavar="STYLE[/SAMPLE]",
+                        help="Build only this style or sample (repeatable), e.g. trap or trap/hat-closed")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if unchanged")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--variants", type=int, default=0, metavar="N",
+                        help="Also build N round-robin/velocity variants per drum into samples/variants/")
+    parser.add_argument("--opus", action="store_true",
+                        help="Also encode Ogg/Opus copies of the sprites (needs ffmpeg)")
+    parser.add_argument("--verify", action="store_true",
+                        help="Re-render and check outputs are bit-identical to the files in samples/")
+    args = parser.parse_args()
+
+    if args.verify:
+        compared, mismatched = verify(only=args.only, variants=args.variants)
+        if not compared:
+            raise SystemExit("Nothing verified: no matching samples on disk")
+        raise SystemExit(f"{len(mismatched)} of {compared} sample(s) not reproducible" if mismatched else 0)
+
+    start = time.perf_counter()
+    manifest = build(only=args.only, force=args.force, jobs=args.jobs, variants=args.variants)
+    build_sprites(opus=args.opus)
+
+    total_size = sum(e["bytes"] for e in manifest.values())
     print(f"\n{'='*50}")
-    print(f"Total: {len(generated_files)} files, {total_size:,d} bytes ({total_size/1024:.1f} KB)")
-    print(f"\nAll files:")
-    for fp, sz in generated_files:
-        rel = os.path.relpath(fp, OUTPUT_DIR)
-        print(f"  {rel:35s} {sz:>8,d} bytes")
+    print(f"Total: {len(manifest)} files, {total_size:,d} bytes ({total_size/1024:.1f} KB)"
+          f"  — build took {time.perf_counter() - start:.2f}s")
 
 
 if __name__ == "__main__":
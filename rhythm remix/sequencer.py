@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Offline drum-loop renderer for the Rhythm Remix styles.
+
+Renders a style's drum pattern (the DRUM_PATTERNS table in js/lofi-engine.js)
+at a given BPM into one seamless WAV loop, using the generate_samples.py
+one-shots at the gains the engine plays them with. Instead of scheduling one
+buffer source per hit, the mix is built by scatter-adding every hit of a
+one-shot into the output buffer with a single np.bincount; tails that run past
+the loop end wrap around to the start so the loop repeats without a click.
+
+Renders are cached in samples/loops/, keyed by a hash of the pattern, voices,
+BPM, bar count, density and the generator sources, and listed in
+samples/loops/loops.json. Re-running with the same settings is a no-op.
+
+Usage:
+  python sequencer.py                              # every style at 75 BPM
+  python sequencer.py --style trap --bpm 70 140    # one style, two tempos
+  python sequencer.py --bars 4 --density normal    # first 4 bars, no open hats
+  python sequencer.py --force                      # re-render cached loops
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+from scipy.io import wavfile
+
+import generate_samples as gs
+
+LOOP_DIR = os.path.join(gs.OUTPUT_DIR, "loops")
+LOOP_INDEX_PATH = os.path.join(LOOP_DIR, "loops.json")
+
+STEPS_PER_BAR = 4
+MAX_BARS = 8
+SWING = 0.3  # Fraction of a step that odd hat steps are delayed in swung styles
+
+# ──────────────────────────────────────────────────────────
+# Patterns (kept in sync with DRUM_PATTERNS in js/lofi-engine.js)
+# ──────────────────────────────────────────────────────────
+PATTERNS = {
+    "lofi": {
+        "kick":  [1,0,0,0, 1,0,0,0, 1,0,0,0, 1,0,0,0, 1,0,0,0, 1,0,0,0, 1,0,0,0, 1,0,0,0],
+        "snare": [0,0,1,0, 0,0,1,0, 0,0,1,0, 0,0,1,0, 0,0,1,0, 0,0,1,0, 0,0,1,0, 0,0,1,0],
+        "hatC":  [1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1],
+        "hatO":  [0,0,0,0, 0,0,0,1, 0,0,0,0, 0,0,0,1, 0,0,0,0, 0,0,0,1, 0,0,0,0, 0,0,0,1],
+    },
+    "jazzhop": {
+        "kick":  [1,0,0,0, 1,0,0,1, 1,0,0,0, 1,0,0,1, 1,0,0,0, 1,0,0,1, 1,0,0,0, 1,0,0,1],
+        "snare": [0,0,1,0, 0,0,1,0, 0,0,1,0, 0,1,1,0, 0,0,1,0, 0,0,1,0, 0,0,1,0, 0,1,1,0],
+        "hatC":  [1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1],
+        "hatO":  [0,0,0,0, 0,0,0,0, 0,0,0,1, 0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,1, 0,0,0,0],
+    },
+    "bossa": {
+        "kick":  [1,0,0,0, 0,1,0,0, 0,0,0,0, 1,0,0,0, 0,0,0,0, 1,0,0,0, 0,1,0,0, 1,0,0,0],
+        "snare": [1,0,1,0, 0,0,1,0, 0,0,0,0, 0,0,0,0, 0,0,0,0, 1,0,0,0, 1,0,0,0, 0,0,0,0],
+        "hatC":  [1,0,1,0, 1,0,1,0, 1,0,1,0, 1,0,1,0, 1,0,1,0, 1,0,1,0, 1,0,1,0, 1,0,1,0],
+        "hatO":  [0] * 32,
+    },
+    "chiptune": {
+        "kick":  [1,0,0,0, 1,0,0,0, 1,0,0,0, 1,0,0,0, 1,0,0,0, 1,0,0,0, 1,0,0,0, 1,0,0,0],
+        "snare": [0,0,1,0, 0,0,1,0, 0,0,1,0, 0,0,1,1, 0,0,1,0, 0,0,1,0, 0,0,1,0, 0,0,1,1],
+        "hatC":  [1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1],
+        "hatO":  [0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,1],
+    },
+    "trap": {
+        "kick":  [1,0,0,0, 0,0,1,0, 0,0,0,0, 1,0,0,1, 1,0,0,0, 0,0,1,0, 0,0,0,0, 1,0,0,1],
+        "snare": [0,0,0,0, 1,0,0,0, 0,0,0,0, 1,0,0,0, 0,0,0,0, 1,0,0,0, 0,0,0,0, 1,0,0,0],
+        "hatC":  [1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1, 1,1,1,1],
+        "hatO":  [0,0,1,0, 0,0,1,1, 0,0,1,0, 0,1,0,0, 0,0,1,0, 0,0,1,1, 0,0,1,0, 0,1,0,0],
+    },
+}
+
+# Trap hi-hat rolls: 0 = single hit, 3/4 = triplet/quadruplet roll within the step
+TRAP_HAT_ROLLS = [0,0,0,3, 0,0,0,0, 0,0,3,0, 0,4,0,0, 0,0,0,3, 0,0,0,0, 0,0,3,0, 0,4,0,0]
+SWING_STYLES = {"jazzhop", "bossa"}
+
+# Pattern slot -> (sample file, gain). Gains are the volumes the engine's
+# _play* methods pass to _playSample() for each style's kick/snare/hat style.
+VOICES = {
+    "lofi":     {"kick": ("kick.wav", 0.9), "snare": ("snare.wav", 0.85),
+                 "hatC": ("hat-closed.wav", 0.7), "hatO": ("hat-open.wav", 0.75)},
+    "jazzhop":  {"kick": ("kick.wav", 0.9), "snare": ("snare.wav", 0.85),
+                 "hatC": ("hat-closed.wav", 0.7), "hatO": ("hat-open.wav", 0.75)},
+    "bossa":    {"kick": ("kick.wav", 0.6), "snare": ("rim.wav", 0.7),
+                 "hatC": ("hat-closed.wav", 0.4), "hatO": ("hat-open.wav", 0.7)},
+    "chiptune": {"kick": ("kick.wav", 0.85), "snare": ("snare.wav", 0.8),
+                 "hatC": ("hat-closed.wav", 0.7), "hatO": ("hat-closed.wav", 0.7)},
+    "trap":     {"kick": ("kick.wav", 1.0), "snare": ("clap.wav", 0.9),
+                 "hatC": ("hat-closed.wav", 0.7), "hatO": ("hat-open.wav", 0.98)},
+}
+LOFI_GHOST_HAT_GAIN = 0.28  # Off-beat ghost hats at full density (0.4x a closed hat)
+
+# Slots played at each density, as in _scheduleBeatsAt()
+DENSITIES = {
+    "sparse": ("kick",),
+    "normal": ("kick", "snare", "hatC"),
+    "full":   ("kick", "snare", "hatC", "hatO"),
+}
+
+
+# ──────────────────────────────────────────────────────────
+# Sequencing
+# ──────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=None)
+def load_clip(style, filename):
+    """The trimmed float one-shot, rendered exactly as generate_samples.py does."""
+    render_rng, _ = gs.sample_rngs(gs.sample_seed(style, filename))
+    return gs.trim_silence(gs.STYLES[style][filename](gs.Variation(render_rng)))
+
+
+def pattern_events(style, bpm, bars=MAX_BARS, density="full", seed=0):
+    """
+    Hit times for one loop, grouped by sample.
+
+    Returns:
+        {filename: (onsets, gains)} with onsets in samples (int64) and gains
+        as float arrays of the same length
+    """
+    pattern = PATTERNS[style]
+    voices = VOICES[style]
+    n_steps = bars * STEPS_PER_BAR
+    step = gs.SR * 60.0 / bpm
+    rng = np.random.default_rng(seed)
+
+    times, gains, files = [], [], []
+
+    def add(filename, t, g):
+        times.append(t)
+        gains.append(np.broadcast_to(np.asarray(g, dtype=np.float64), t.shape))
+        files.append(np.full(len(t), filename, dtype=object))
+
+    for slot in DENSITIES[density]:
+        filename, gain = voices[slot]
+        hits = np.flatnonzero(pattern[slot][:n_steps])
+        if not len(hits):
+            continue
+        t = hits * step
+        if slot.startswith("hat") and style in SWING_STYLES:
+            t = t + (hits % 2) * step * SWING
+
+        if slot == "hatC" and style == "trap":
+            # Each roll step becomes `count` evenly spaced hits at 80-100% volume
+            counts = np.maximum(np.asarray(TRAP_HAT_ROLLS)[hits], 1)
+            sub = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            t = np.repeat(t, counts) + sub * step / np.repeat(counts, counts)
+            rolled = np.repeat(counts > 1, counts)
+            add(filename, t, np.where(rolled, gain * (0.8 + 0.2 * rng.random(len(t))), gain))
+        else:
+            add(filename, t, gain)
+
+    if style == "lofi" and density == "full":
+        hits = np.flatnonzero(pattern["hatC"][:n_steps])
+        add(voices["hatC"][0], hits * step + step * 0.5, LOFI_GHOST_HAT_GAIN)
+
+    if not times:
+        return {}
+    times = np.concatenate(times)
+    gains = np.concatenate(gains)
+    files = np.concatenate(files)
+    return {f: (np.round(times[files == f]).astype(np.int64), gains[files == f])
+            for f in dict.fromkeys(files.tolist())}
+
+
+def mix_events(events, clips, n_samples, wrap=True):
+    """
+    Scatter-add every hit into one buffer.
+
+    All hits of a clip are placed with a single np.bincount over the
+    (hits x clip length) index grid. With wrap=True the buffer is a loop of
+    n_samples and tails wrap to the start; otherwise it grows to fit them.
+    """
+    if not wrap:
+        ends = [int(on.max()) + len(clips[f]) for f, (on, _) in events.items() if len(on)]
+        n_samples = max([n_samples] + ends)
+    out = np.zeros(n_samples)
+    for filename, (onsets, gains) in events.items():
+        clip = clips[filename]
+        idx = onsets[:, None] + np.arange(len(clip))
+        if wrap:
+            idx %= n_samples
+        out += np.bincount(idx.ravel(), weights=(gains[:, None] * clip).ravel(),
+                           minlength=n_samples)
+    return out
+
+
+def render_loop(style, bpm, bars=MAX_BARS, density="full", seed=0, wrap=True):
+    """Float mix of one loop, limited to PEAK_AMP."""
+    events = pattern_events(style, bpm, bars, density, seed)
+    clips = {f: load_clip(style, f) for f in events}
+    n_samples = int(round(bars * STEPS_PER_BAR * gs.SR * 60.0 / bpm))
+    mix = mix_events(events, clips, n_samples, wrap)
+    peak = np.max(np.abs(mix)) if len(mix) else 0.0
+    if peak > gs.PEAK_AMP:
+        mix *= gs.PEAK_AMP / peak
+    return mix
+
+
+# ──────────────────────────────────────────────────────────
+# Cache
+# ──────────────────────────────────────────────────────────
+def loop_key(style, bpm, bars, density, seed):
+    """Hash of everything that determines a loop's bytes."""
+    with open(os.path.abspath(__file__), "rb") as f:
+        source = f.read()
+    params = {
+        "style": style, "bpm": bpm, "bars": bars, "density": density, "seed": seed,
+        "generators": {fn: gs.generator_hash(gs.STYLES[style][fn], gs.sample_seed(style, fn))
+                       for fn, _ in VOICES[style].values()},
+    }
+    digest = hashlib.sha256(source)
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    return digest.hexdigest()[:16]
+
+
+def load_index():
+    try:
+        with open(LOOP_INDEX_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"sampleRate": gs.SR, "loops": {}}
+
+
+def save_index(index):
+    os.makedirs(LOOP_DIR, exist_ok=True)
+    with open(LOOP_INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+def build_loop(index, style, bpm, bars=MAX_BARS, density="full", seed=0, force=False):
+    """
+    Render one loop into samples/loops/ unless an identical render is cached.
+
+    Returns:
+        (entry, rendered): the index entry and whether it was re-rendered
+    """
+    name = f"{style}/{bpm:g}/{density}/{bars}"
+    key = loop_key(style, bpm, bars, density, seed)
+    entry = index["loops"].get(name)
+    if (not force and entry and entry["key"] == key
+            and os.path.exists(os.path.join(LOOP_DIR, entry["file"]))):
+        return entry, False
+
+    mix = render_loop(style, bpm, bars, density, seed)
+    filename = f"{style}-{bpm:g}bpm-{density}-{bars}bar-{key[:8]}.wav"
+    os.makedirs(LOOP_DIR, exist_ok=True)
+    # No trim: the file length is the loop length
+    wavfile.write(os.path.join(LOOP_DIR, filename), gs.SR, gs.dither_and_quantize(mix, np.random.default_rng(seed)))
+    if entry and entry["file"] != filename:
+        stale = os.path.join(LOOP_DIR, entry["file"])
+        if os.path.exists(stale):
+            os.remove(stale)
+    entry = {"file": filename, "key": key, "bpm": bpm, "bars": bars,
+             "density": density, "duration": round(len(mix) / gs.SR, 4)}
+    index["loops"][name] = entry
+    return entry, True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render drum loops for Rhythm Remix styles.")
+    parser.add_argument("--style", action="append", choices=sorted(PATTERNS),
+                        help="Style to render (repeatable; default: all)")
+    parser.add_argument("--bpm", type=float, nargs="+", default=[75.0],
+                        help="Tempo(s) in BPM (default: 75, the engine's default)")
+    parser.add_argument("--bars", type=int, default=MAX_BARS, choices=range(1, MAX_BARS + 1),
+                        metavar=f"1-{MAX_BARS}", help="Bars per loop (default: the full pattern)")
+    parser.add_argument("--density", default="full", choices=sorted(DENSITIES))
+    parser.add_argument("--seed", type=int, default=0, help="Seed for hat-roll velocities and dither")
+    parser.add_argument("--force", action="store_true", help="Re-render cached loops")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = load_index()
+    rendered = 0
+    for style in args.style or sorted(PATTERNS):
+        for bpm in args.bpm:
+            entry, fresh = build_loop(index, style, bpm, args.bars, args.density,
+                                      args.seed, args.force)
+            rendered += fresh
+            status = "rendered" if fresh else "cached  "
+            print(f"  {status} loops/{entry['file']}  {entry['duration']:.2f}s")
+    save_index(index)
+    print(f"{rendered} rendered — took {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
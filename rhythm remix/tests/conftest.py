@@ -0,0 +1,5 @@
+import os
+import sys
+
+# generate_samples.py imports its sibling modules (convolution, dynamics) as top-level modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,40 @@
+"""Seeded renders are bit-identical, and the checked-in WAVs are what they produce."""
+
+import os
+
+import pytest
+
+import generate_samples as gs
+
+# Bump when a generator change is meant to alter trap/kick (and re-render samples/)
+TRAP_KICK_SHA256 = "08c73e58428a175ea144a969c34db6b8590524d3c4cfc3a5face6f90efbdb712"
+
+
+def _render(style, filename, output_dir, variants=0):
+    return gs.render_sample(style, filename, gs.sample_seed(style, filename), variants, output_dir=str(output_dir))
+
+
+def test_render_is_bit_identical(tmp_path):
+    first = _render("trap", "hat-open.wav", tmp_path / "a")
+    second = _render("trap", "hat-open.wav", tmp_path / "b")
+    with open(tmp_path / "a" / "trap" / "hat-open.wav", "rb") as a, \
+            open(tmp_path / "b" / "trap" / "hat-open.wav", "rb") as b:
+        assert a.read() == b.read()
+    assert first["sha256"] == second["sha256"]
+
+
+def test_variant_bank_is_bit_identical(tmp_path):
+    first = _render("lofi", "snare.wav", tmp_path / "a", variants=6)
+    second = _render("lofi", "snare.wav", tmp_path / "b", variants=6)
+    assert first["sha256"] == second["sha256"]
+    assert first["layers"] == second["layers"]
+
+
+def test_pinned_sha256(tmp_path):
+    assert _render("trap", "kick.wav", tmp_path)["sha256"] == TRAP_KICK_SHA256
+
+
+@pytest.mark.parametrize("style,filename", gs.select_samples(None))
+def test_checked_in_sample_matches_render(style, filename, tmp_path):
+    result = _render(style, filename, tmp_path)
+    assert result["sha256"] == gs.file_sha256(os.path.join(gs.OUTPUT_DIR, style, filename))
@@ -0,0 +1,779 @@
+"""
+Word-level alignment engine for server-side analysis.
+
+Python port of js/alignment.js: Needleman-Wunsch global alignment of an STT
+transcript against the reference text with graded substitution costs,
+followed by the same post-processing passes (compound words, abbreviation
+and number expansions, contractions, disfluency re-injection) and the
+spillover-fragment consolidation that app.js runs per engine.
+
+Output entries use the same keys as the JS alignment (ref, hyp, type,
+hypIndex, compound, parts, _mergedFrom, ...) so the browser can consume a
+server alignment unchanged.
+
+Scoring (based on texterrors: https://github.com/RuABraun/texterrors):
+  Match (exact canonical):  +2.0
+  Gap (insertion/omission): -1.0
+  Mismatch (graded):        -1.5 × (1 - levenshteinRatio)
+
+Unlike the JS version, the score matrix is built with numpy (Levenshtein
+distances for all distinct word pairs are computed in one vectorized pass)
+and the DP is filled one anti-diagonal at a time inside a diagonal band, so
+long passages align in milliseconds. Arithmetic and tie-breaking are
+identical to the JS loop, so results match whenever the optimal path stays
+inside the band (always, for passages up to FULL_DP_MAX_CELLS).
+"""
+
+import re
+
+import numpy as np
+
+from number_words import decimal_to_word_forms, number_to_ordinal_forms, number_to_word_forms
+from text_normalize import DISFLUENCIES, normalize_text, strip_edge_punct
+from word_equivalences import get_canonical
+
+# --- Needleman-Wunsch scoring parameters ---
+MATCH_BONUS = 2.0     # Exact canonical match reward
+GAP_PENALTY = -1.0    # Insertion or omission penalty
+MAX_MISMATCH = -1.5   # Worst-case mismatch (1.5× multiplier prevents over-favoring subs)
+
+# Passages up to this many DP cells run the full matrix (exact JS parity).
+# Larger inputs are restricted to a diagonal band of BAND_MARGIN words on
+# either side of the straight path from (0, 0) to (m, n).
+FULL_DP_MAX_CELLS = 400 * 400
+BAND_MARGIN = 64
+
+# Traceback pointers
+_DIAG, _UP, _LEFT = 0, 1, 2
+
+_NUMERIC = re.compile(r'^\d+(\.\d+)?$', re.ASCII)
+_NON_ALPHA = re.compile(r"[^a-z']")
+
+
+# =============================================================================
+# Levenshtein utilities
+# =============================================================================
+
+def levenshtein(a: str, b: str) -> int:
+    """Levenshtein edit distance between two strings."""
+    if len(a) < len(b):
+        a, b = b, a
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        cur = [i]
+        for j, cb in enumerate(b, start=1):
+            cur.append(prev[j - 1] if ca == cb else 1 + min(prev[j], cur[j - 1], prev[j - 1]))
+        prev = cur
+    return prev[-1]
+
+
+def levenshtein_ratio(a: str, b: str) -> float:
+    """Levenshtein similarity ratio (0..1, 1 = identical). Mirrors nl-api.js."""
+    if not a and not b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    dist = levenshtein(a.lower(), b.lower())
+    return 1 - dist / max(len(a), len(b))
+
+
+def _encode(words: list):
+    """Pack words into a zero-padded codepoint matrix plus a length vector."""
+    lengths = np.fromiter((len(w) for w in words), dtype=np.int64, count=len(words))
+    width = int(lengths.max()) if len(words) else 0
+    codes = np.zeros((len(words), max(width, 1)), dtype=np.int64)
+    for k, w in enumerate(words):
+        if w:
+            codes[k, :len(w)] = np.frombuffer(w.encode('utf-32-le'), dtype=np.uint32)
+    return codes, lengths
+
+
+def pairwise_levenshtein(a_codes, a_lens, b_codes, b_lens) -> np.ndarray:
+    """
+    Levenshtein distance for many string pairs at once.
+
+    Row i of the DP is computed for every pair simultaneously; the in-row
+    insertion chain is resolved with a cumulative minimum, so the Python loop
+    runs once per character of the longest left-hand string. Arrays are laid
+    out (position, pair) so every vector op and the accumulate run over
+    contiguous pair rows.
+
+    Args:
+        a_codes, b_codes: (P, L) padded codepoint matrices (pair k = row k)
+        a_lens, b_lens: (P,) true string lengths
+
+    Returns:
+        (P,) int array of edit distances
+    """
+    pairs = len(a_lens)
+    out = b_lens.astype(np.int64)
+    if pairs == 0:
+        return out
+    # Longest left-hand strings first, so the pairs still in play at row i
+    # are always a prefix of the arrays.
+    order = np.argsort(-a_lens, kind='stable')
+    a_sorted = a_lens[order]
+    b_sorted = b_lens[order]
+    la_max = int(a_sorted[0])
+    lb_max = int(b_lens.max())
+    a_t = np.ascontiguousarray(a_codes[order, :la_max].T.astype(np.int32))
+    b_t = np.ascontiguousarray(b_codes[order, :lb_max].T.astype(np.int32))
+    cols = np.arange(lb_max + 1, dtype=np.int16)[:, None]
+    prev = np.broadcast_to(cols, (lb_max + 1, pairs)).copy()
+    row = np.empty_like(prev)
+    dist = b_sorted.astype(np.int64)
+    for i in range(1, la_max + 1):
+        active = int(np.searchsorted(-a_sorted, -i, side='right'))
+        p, r = prev[:, :active], row[:, :active]
+        # Substitution vs deletion, then the insertion chain:
+        # cur[j] = min(r[j], cur[j-1] + 1)  ==  min_k<=j(r[k] + j - k)
+        np.minimum(p[:-1] + (a_t[i - 1, :active] != b_t[:, :active]), p[1:] + 1, out=r[1:])
+        r[0] = i
+        r -= cols
+        np.minimum.accumulate(r, axis=0, out=p)
+        p += cols
+        done = np.flatnonzero(a_sorted[:active] == i)
+        dist[done] = p[b_sorted[done], done]
+    out[order] = dist
+    return out
+
+
+# =============================================================================
+# Needleman-Wunsch core
+# =============================================================================
+
+def _band_limits(m: int, n: int, band):
+    """Return the (lo, hi) range of d = j - i cells the DP visits."""
+    if band is None:
+        band = max(m, n) if m * n <= FULL_DP_MAX_CELLS else BAND_MARGIN
+    return min(0, n - m) - band, max(0, n - m) + band
+
+
+def _score_band(ref_canon: list, hyp_canon: list, d_lo: int, d_hi: int) -> np.ndarray:
+    """
+    Pair scores for every in-band cell, laid out as S[i, d - d_lo].
+
+    Scores depend only on the two canonical strings, so Levenshtein distance
+    is computed once per distinct (ref word, hyp word) pair in the band.
+    """
+    m, n = len(ref_canon), len(hyp_canon)
+    vocab = {}
+    ref_ids = np.array([vocab.setdefault(w, len(vocab)) for w in ref_canon], dtype=np.int64)
+    hyp_ids = np.array([vocab.setdefault(w, len(vocab)) for w in hyp_canon], dtype=np.int64)
+    words = list(vocab)
+    codes, lengths = _encode(words)
+
+    width = d_hi - d_lo + 1
+    i = np.arange(m)[:, None]
+    j = i + np.arange(d_lo, d_hi + 1)[None, :]
+    valid = (j >= 0) & (j < n)
+    r = np.broadcast_to(ref_ids[:, None], (m, width))[valid]
+    h = hyp_ids[j[valid]]
+
+    keys, inverse = np.unique(r * len(words) + h, return_inverse=True)
+    ra, hb = np.divmod(keys, len(words))
+    dist = pairwise_levenshtein(codes[ra], lengths[ra], codes[hb], lengths[hb])
+    max_len = np.maximum(lengths[ra], lengths[hb])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio = np.where(max_len > 0, 1 - dist / max_len, 1.0)
+    pair_scores = np.where(ra == hb, MATCH_BONUS, MAX_MISMATCH * (1 - ratio))
+
+    scores = np.full((m, width), -np.inf)
+    scores[valid] = pair_scores[inverse.ravel()]
+    return scores
+
+
+def _needleman_wunsch(ref_canon: list, hyp_canon: list, band=None) -> list:
+    """
+    Global alignment returning (op, ref_idx, hyp_idx) triples in order.
+
+    F and the pointer matrix are stored in band coordinates: cell (i, j) lives
+    at column j - i - d_lo + 1 (one -inf guard column on each side). Cells on
+    one anti-diagonal only depend on the two previous anti-diagonals, so each
+    anti-diagonal is filled with a handful of vector operations using the
+    same additions and tie-break order (diag > up > left) as alignment.js.
+    """
+    m, n = len(ref_canon), len(hyp_canon)
+    d_lo, d_hi = _band_limits(m, n, band)
+    width = d_hi - d_lo + 1
+    scores = _score_band(ref_canon, hyp_canon, d_lo, d_hi)
+
+    F = np.full((m + 1, width + 2), -np.inf)
+    P = np.full((m + 1, width + 2), _LEFT, dtype=np.int8)
+
+    # First row: all insertions; first column: all omissions
+    for j in range(0, min(n, d_hi) + 1):
+        F[0, j - d_lo + 1] = -float(j)
+    for i in range(1, min(m, -d_lo) + 1):
+        F[i, -i - d_lo + 1] = -float(i)
+        P[i, -i - d_lo + 1] = _UP
+
+    for k in range(2, m + n + 1):
+        i_lo = max(1, k - n, -((d_hi - k) // 2))
+        i_hi = min(m, k - 1, (k - d_lo) // 2)
+        if i_lo > i_hi:
+            continue
+        i = np.arange(i_lo, i_hi + 1)
+        c = k - 2 * i - d_lo + 1
+        diag = F[i - 1, c] + scores[i - 1, c - 1]
+        up = F[i - 1, c + 1] + GAP_PENALTY
+        left = F[i, c - 1] + GAP_PENALTY
+        best = np.maximum(np.maximum(diag, up), left)
+        F[i, c] = best
+        P[i, c] = np.where(best == diag, _DIAG, np.where(best == up, _UP, _LEFT))
+
+    ops = []
+    i, j = m, n
+    while i > 0 or j > 0:
+        p = P[i, j - i - d_lo + 1]
+        if i > 0 and j > 0 and p == _DIAG:
+            i -= 1
+            j -= 1
+            ops.append((_DIAG, i, j))
+        elif i > 0 and (j == 0 or p == _UP):
+            i -= 1
+            ops.append((_UP, i, None))
+        else:
+            j -= 1
+            ops.append((_LEFT, None, j))
+    ops.reverse()
+    return ops
+
+
+def _canon(word: str) -> str:
+    return get_canonical(word).replace("'", '')
+
+
+# =============================================================================
+# Post-processing passes
+# =============================================================================
+
+def merge_compound_words(alignment: list) -> list:
+    """
+    Detect compound words split by ASR (reference "hotdog" heard as "hot" + "dog").
+
+    Pattern A: substitution(ref=X, hyp=A) + insertions(B...) where A+B... = X
+    Pattern B: insertions(A...) + substitution(ref=X, hyp=B), the reversed order
+    NW traceback produces when tie-breaking favors the later diagonal.
+    """
+    result = []
+    i = 0
+    while i < len(alignment):
+        current = alignment[i]
+
+        if current['type'] == 'substitution' and current.get('ref') and current.get('hyp'):
+            ref_canon = get_canonical(current['ref'])
+            combined = current['hyp']
+            consumed = 0
+            matched = False
+            j = i + 1
+            while j < len(alignment) and alignment[j]['type'] == 'insertion':
+                combined += alignment[j]['hyp']
+                consumed += 1
+                if get_canonical(combined) == ref_canon:
+                    entry = {
+                        'ref': current['ref'],
+                        'hyp': combined,
+                        'type': 'correct',
+                        'compound': True,
+                        'hypIndex': current['hypIndex'],
+                        'parts': [current['hyp']] + [a['hyp'] for a in alignment[i + 1:i + 1 + consumed]],
+                    }
+                    # Canonical-only match ("etcetera" -> "etc") is an abbreviation
+                    # expansion, which compound struggle reclassification skips.
+                    if combined.lower() != current['ref'].lower():
+                        entry['_abbreviationExpansion'] = True
+                    result.append(entry)
+                    i += 1 + consumed
+                    matched = True
+                    break
+                j += 1
+            if not matched:
+                result.append(current)
+                i += 1
+
+        elif current['type'] == 'insertion' and current.get('hyp'):
+            count = 0
+            while i + count < len(alignment) and alignment[i + count]['type'] == 'insertion':
+                count += 1
+
+            sub_idx = i + count
+            sub = alignment[sub_idx] if sub_idx < len(alignment) else None
+            matched = False
+            if sub and sub['type'] == 'substitution' and sub.get('ref'):
+                ref_canon = get_canonical(sub['ref'])
+                combined = ''
+                for k in range(count):
+                    combined += alignment[i + k]['hyp']
+                    with_sub = combined + sub['hyp']
+                    if get_canonical(with_sub) == ref_canon:
+                        entry = {
+                            'ref': sub['ref'],
+                            'hyp': with_sub,
+                            'type': 'correct',
+                            'compound': True,
+                            'hypIndex': sub['hypIndex'],
+                            'parts': [a['hyp'] for a in alignment[i:i + k + 1]] + [sub['hyp']],
+                        }
+                        if with_sub.lower() != sub['ref'].lower():
+                            entry['_abbreviationExpansion'] = True
+                        result.append(entry)
+                        i = sub_idx + 1
+                        matched = True
+                        break
+            if not matched:
+                # The substitution (if any) is handled on the next iteration
+                result.extend(alignment[i:i + count])
+                i += count
+
+        else:
+            result.append(current)
+            i += 1
+
+    return result
+
+
+# Known abbreviation -> multi-word expansion mappings.
+# Keys are period-stripped forms (after normalize_text).
+ABBREVIATION_EXPANSIONS = {
+    # Latin / general
+    'ie':    [['that', 'is']],
+    'eg':    [['for', 'example']],
+    'etc':   [['et', 'cetera']],
+    'aka':   [['also', 'known', 'as']],
+    'diy':   [['do', 'it', 'yourself']],
+    'rsvp':  [['please', 'respond']],
+    'ps':    [['post', 'script']],
+    # Time
+    'am':    [['in', 'the', 'morning']],
+    'pm':    [['in', 'the', 'afternoon'], ['in', 'the', 'evening']],
+    # Historical eras
+    'bc':    [['before', 'christ']],
+    'ad':    [['anno', 'domini']],
+    'bce':   [['before', 'common', 'era']],
+    'ce':    [['common', 'era']],
+    # Geography / organizations
+    'us':    [['united', 'states']],
+    'usa':   [['united', 'states', 'of', 'america']],
+    'uk':    [['united', 'kingdom']],
+    'dc':    [['district', 'of', 'columbia']],
+    'nyc':   [['new', 'york', 'city']],
+    'un':    [['united', 'nations']],
+    'eu':    [['european', 'union']],
+    # Speed / rate units
+    'mph':   [['miles', 'per', 'hour']],
+    'kph':   [['kilometers', 'per', 'hour']],
+    # War / history
+    'wwi':   [['world', 'war', 'one'], ['world', 'war', 'i']],
+    'wwii':  [['world', 'war', 'two'], ['world', 'war', 'ii']],
+}
+
+
+def _lower(word):
+    return word.lower() if word is not None else None
+
+
+def merge_multi_word_expansions(alignment: list, get_expansions, flag_key: str) -> list:
+    """
+    Merge one ref token that was spoken as several hyp tokens.
+
+    Pattern A: sub(ref=X, hyp=first) + ins(second) + ins(third) ...
+    Pattern B: ins(first) + ... + sub(ref=X, hyp=last)
+
+    Args:
+        alignment: Current alignment list
+        get_expansions: ref_norm -> list of word lists, or None
+        flag_key: Property set on merged entries
+
+    Returns:
+        New alignment list with expansions merged
+    """
+    result = []
+    i = 0
+    while i < len(alignment):
+        current = alignment[i]
+
+        if current['type'] == 'substitution' and current.get('ref') and current.get('hyp'):
+            expansions = get_expansions(current['ref'].lower())
+            if expansions:
+                matched = False
+                for expansion in expansions:
+                    if current['hyp'].lower() != expansion[0]:
+                        continue
+                    remaining = expansion[1:]
+                    all_match = True
+                    for k, word in enumerate(remaining):
+                        nxt = i + 1 + k
+                        if (nxt >= len(alignment) or alignment[nxt]['type'] != 'insertion'
+                                or _lower(alignment[nxt].get('hyp')) != word):
+                            all_match = False
+                            break
+                    if all_match:
+                        parts = [current['hyp']] + [alignment[i + 1 + k]['hyp'] for k in range(len(remaining))]
+                        result.append({
+                            'ref': current['ref'],
+                            'hyp': ' '.join(parts),
+                            'type': 'correct',
+                            'compound': True,
+                            'hypIndex': current['hypIndex'],
+                            flag_key: True,
+                            'parts': parts,
+                        })
+                        i += 1 + len(remaining)
+                        matched = True
+                        break
+                if not matched:
+                    result.append(current)
+                    i += 1
+                continue
+
+        if current['type'] == 'insertion' and current.get('hyp'):
+            count = 0
+            while i + count < len(alignment) and alignment[i + count]['type'] == 'insertion':
+                count += 1
+
+            sub_idx = i + count
+            sub = alignment[sub_idx] if sub_idx < len(alignment) else None
+            if sub and sub['type'] == 'substitution' and sub.get('ref'):
+                expansions = get_expansions(sub['ref'].lower())
+                if expansions:
+                    matched = False
+                    for expansion in expansions:
+                        if _lower(sub.get('hyp')) != expansion[-1]:
+                            continue
+                        prefix = expansion[:-1]
+                        if len(prefix) > count:
+                            continue
+                        start = count - len(prefix)
+                        if all(_lower(alignment[i + start + k].get('hyp')) == word
+                               for k, word in enumerate(prefix)):
+                            result.extend(alignment[i:i + start])
+                            parts = [alignment[i + start + k]['hyp'] for k in range(len(prefix))] + [sub['hyp']]
+                            result.append({
+                                'ref': sub['ref'],
+                                'hyp': ' '.join(parts),
+                                'type': 'correct',
+                                'compound': True,
+                                'hypIndex': sub['hypIndex'],
+                                flag_key: True,
+                                'parts': parts,
+                            })
+                            i = sub_idx + 1
+                            matched = True
+                            break
+                    if not matched:
+                        result.extend(alignment[i:i + count])
+                        i += count
+                    continue
+
+            result.extend(alignment[i:i + count])
+            i += count
+            continue
+
+        result.append(current)
+        i += 1
+
+    return result
+
+
+def merge_abbreviation_expansions(alignment: list) -> list:
+    """Merge abbreviation -> multi-word expansions (ref "ie" -> hyp "that is")."""
+    return merge_multi_word_expansions(
+        alignment, ABBREVIATION_EXPANSIONS.get, '_abbreviationExpansion')
+
+
+def _number_expansions(ref_norm: str):
+    if not _NUMERIC.match(ref_norm):
+        return None
+    if '.' in ref_norm:
+        expansions = decimal_to_word_forms(ref_norm)
+    else:
+        expansions = number_to_word_forms(ref_norm) + number_to_ordinal_forms(ref_norm)
+    return expansions or None
+
+
+def merge_number_expansions(alignment: list) -> list:
+    """Merge number -> multi-word spoken forms (ref "2014" -> hyp "twenty fourteen")."""
+    return merge_multi_word_expansions(alignment, _number_expansions, '_numberExpansion')
+
+
+def merge_contractions(alignment: list) -> list:
+    """
+    Detect ASR merging two reference words into one (mirror of compound merge).
+
+    Matches sub(ref=X, hyp=C) + omission(ref=Y), or the reverse order, when C
+    is a known contraction of "X Y" (you will -> you'll) or their plain
+    concatenation (long term -> longterm). Both ref words become correct.
+    """
+    result = []
+    i = 0
+    while i < len(alignment):
+        current = alignment[i]
+        nxt = alignment[i + 1] if i + 1 < len(alignment) else None
+
+        pair = None
+        if (current['type'] == 'substitution' and current.get('ref') and current.get('hyp')
+                and nxt and nxt['type'] == 'omission' and nxt.get('ref')):
+            pair = current
+        elif (current['type'] == 'omission' and current.get('ref')
+                and nxt and nxt['type'] == 'substitution' and nxt.get('ref') and nxt.get('hyp')):
+            pair = nxt
+
+        if pair is not None:
+            hyp_canon = _canon(pair['hyp'])
+            spaced = current['ref'] + ' ' + nxt['ref']
+            concat = current['ref'] + nxt['ref']
+            if _canon(spaced) == hyp_canon or _canon(concat) == hyp_canon:
+                result.append({
+                    'ref': current['ref'],
+                    'hyp': pair['hyp'],
+                    'type': 'correct',
+                    'compound': True,
+                    'hypIndex': pair['hypIndex'],
+                    '_mergedFrom': spaced,
+                })
+                result.append({
+                    'ref': nxt['ref'],
+                    'hyp': pair['hyp'],
+                    'type': 'correct',
+                    'compound': True,
+                    'hypIndex': pair['hypIndex'],
+                    '_mergedInto': pair['hyp'],
+                })
+                i += 2
+                continue
+
+        result.append(current)
+        i += 1
+
+    return result
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+def align_words(reference_text: str, transcript_words: list, band=None) -> list:
+    """
+    Align reference text against STT transcript words.
+
+    Args:
+        reference_text: The passage the student should read
+        transcript_words: STT word dicts (each has a "word" key)
+        band: Optional DP band half-width in words; None picks full DP for
+            normal passages and BAND_MARGIN for very long ones
+
+    Returns:
+        List of alignment entries {ref, hyp, type, hypIndex, ...}; type is one
+        of "correct", "substitution", "omission", "insertion"
+    """
+    ref_words = normalize_text(reference_text)
+
+    # hypIndex must map back to the original transcript position, through the
+    # disfluency filter and hyphen splits ("in-person" -> two entries, one index).
+    raw_normed = [
+        (norm, orig_idx)
+        for orig_idx, w in enumerate(transcript_words or [])
+        for norm in normalize_text(w.get('word'))
+        if norm
+    ]
+    filtered = [p for p in raw_normed if p[0] not in DISFLUENCIES]
+    hyp_words = [p[0] for p in filtered]
+
+    if not ref_words and not hyp_words:
+        return []
+
+    if not ref_words:
+        return [{'ref': None, 'hyp': w, 'type': 'insertion', 'hypIndex': idx} for w, idx in filtered]
+    if not hyp_words:
+        return [{'ref': w, 'hyp': None, 'type': 'omission', 'hypIndex': -1} for w in ref_words]
+
+    ref_canon = [_canon(w) for w in ref_words]
+    hyp_canon = [_canon(w) for w in hyp_words]
+    result = []
+    for op, ri, hi in _needleman_wunsch(ref_canon, hyp_canon, band):
+        if op == _DIAG:
+            result.append({
+                'ref': ref_words[ri],
+                'hyp': hyp_words[hi],
+                'type': 'correct' if ref_canon[ri] == hyp_canon[hi] else 'substitution',
+                'hypIndex': filtered[hi][1],
+            })
+        elif op == _UP:
+            result.append({'ref': ref_words[ri], 'hyp': None, 'type': 'omission', 'hypIndex': -1})
+        else:
+            result.append({'ref': None, 'hyp': hyp_words[hi], 'type': 'insertion', 'hypIndex': filtered[hi][1]})
+
+    # Post-process: compound words, abbreviation expansions, number
+    # expansions, then contractions spanning two ref words.
+    result = merge_compound_words(result)
+    result = merge_abbreviation_expansions(result)
+    result = merge_number_expansions(result)
+    result = merge_contractions(result)
+
+    # Re-inject pre-filtered disfluencies as insertions so the UI can render them
+    for norm, orig_idx in raw_normed:
+        if norm not in DISFLUENCIES:
+            continue
+        insert_pos = len(result)
+        for k, entry in enumerate(result):
+            if entry['hypIndex'] >= 0 and entry['hypIndex'] > orig_idx:
+                insert_pos = k
+                break
+        result.insert(insert_pos, {
+            'ref': None,
+            'hyp': norm,
+            'type': 'insertion',
+            'hypIndex': orig_idx,
+            '_preFilteredDisfluency': True,
+        })
+
+    return result
+
+
+def is_near_miss(insertion_text: str, reference_word: str) -> bool:
+    """
+    True if an attempt is a plausible near-miss for a reference word.
+
+    Mirrors isNearMiss() in js/diagnostics.js: both words need >= 3 letters
+    and share a 3+ char prefix or suffix, or have Levenshtein ratio >= 0.4.
+    """
+    a = _NON_ALPHA.sub('', (insertion_text or '').lower())
+    b = _NON_ALPHA.sub('', (reference_word or '').lower())
+    if len(a) < 3 or len(b) < 3:
+        return False
+
+    min_len = min(len(a), len(b))
+    prefix = 0
+    while prefix < min_len and a[prefix] == b[prefix]:
+        prefix += 1
+    if prefix >= 3:
+        return True
+
+    suffix = 0
+    while suffix < min_len and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    if suffix >= 3:
+        return True
+
+    return levenshtein_ratio(a, b) >= 0.4
+
+
+def consolidate_spillover_fragments(aligned: list, near_miss_fn=is_near_miss) -> list:
+    """
+    Re-home struggle fragments that NW spread across later reference slots.
+
+    A ref slot whose hyp is NOT a near-miss for its own ref, but whose hyp
+    concatenated onto the preceding substitution IS a near-miss for that
+    preceding ref, is converted to insertion(s) + omission.
+
+    Args:
+        aligned: Alignment list (modified in place)
+        near_miss_fn: (a, b) -> bool near-miss test
+
+    Returns:
+        Log entries for the debug stage
+    """
+    ref_entries = [(idx, e) for idx, e in enumerate(aligned) if e['type'] != 'insertion']
+    targets = set()
+    log = []
+
+    for r in range(1, len(ref_entries)):
+        anchor = ref_entries[r - 1][1]
+        if anchor['type'] != 'substitution':
+            continue
+        concat = anchor['hyp']
+        for c in range(r, len(ref_entries)):
+            candidate = ref_entries[c][1]
+            if candidate['type'] != 'substitution':
+                break
+            if near_miss_fn(candidate['hyp'], candidate['ref']):
+                break
+            concat += candidate['hyp']
+            if not near_miss_fn(concat, anchor['ref']):
+                continue
+            targets.update(ref_entries[t][0] for t in range(r, c + 1))
+            log.append({
+                'anchorRef': anchor['ref'],
+                'anchorHyp': anchor['hyp'],
+                'concat': concat,
+                'absorbed': [{'ref': ref_entries[t][1]['ref'], 'hyp': ref_entries[t][1]['hyp']}
+                             for t in range(r, c + 1)],
+            })
+            break
+
+    if not targets:
+        return log
+
+    result = []
+    i = 0
+    while i < len(aligned):
+        entry = aligned[i]
+        if i not in targets:
+            result.append(entry)
+            i += 1
+            continue
+        result.append({
+            'ref': None,
+            'type': 'insertion',
+            'hyp': entry['hyp'],
+            'hypIndex': entry['hypIndex'],
+            '_spillover': True,
+        })
+        j = i + 1
+        while j < len(aligned) and aligned[j]['type'] == 'insertion':
+            result.append({**aligned[j], '_spillover': True})
+            j += 1
+        result.append({
+            'ref': entry['ref'],
+            'hyp': None,
+            'type': 'omission',
+            'hypIndex': -1,
+            '_spilloverOmission': True,
+        })
+        i = j
+
+    aligned[:] = result
+    return log
+
+
+def split_hyphenated_words(words: list) -> list:
+    """
+    Pre-split hyphenated engine words into per-part words with proportional timing.
+
+    Mirrors the Parakeet pre-split in app.js so each part gets its own index:
+    "in-person" -> [{word: "in", ...}, {word: "person", ...}]. Single-letter
+    prefixes (e-mail, x-ray) stay joined, matching normalize_text.
+    """
+    out = []
+    for w in words or []:
+        raw = w.get('word') or ''
+        if '-' not in raw:
+            out.append(w)
+            continue
+        core = strip_edge_punct(raw.lower()).replace('.', '')
+        parts = [p for p in core.split('-') if p]
+        if len(parts) <= 1 or len(parts[0]) == 1:
+            out.append(w)
+            continue
+        start = _seconds(w.get('startTime'))
+        end = _seconds(w.get('endTime'))
+        total_chars = sum(len(p) for p in parts)
+        cursor = start
+        for k, part in enumerate(parts):
+            part_end = end if k == len(parts) - 1 else cursor + (end - start) * len(part) / total_chars
+            out.append({
+                'word': part,
+                'startTime': f'{cursor:.3f}s',
+                'endTime': f'{part_end:.3f}s',
+            })
+            cursor = part_end
+    return out
+
+
+def _seconds(value) -> float:
+    """parseFloat() for "1.23s" timestamps; 0.0 when unparseable."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.match(r'\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?', value or '')
+    return float(match.group(0)) if match else 0.0
@@ -0,0 +1,412 @@
+"""
+SQLite persistence for students and assessments.
+
+Server-side alternative to the single `orf_data` localStorage blob in
+js/storage.js, where every save() re-serializes every assessment (alignment,
+sttWords and all). Here each student and assessment is its own row, so a
+write costs one upsert, and the dashboard can page through exactly what it
+renders:
+
+  - students(id, name, grade, created_at), indexed on grade
+  - assessments: the fields the dashboard lists (date, wcpm, accuracy,
+    totalWords, errors, duration, passagePreview) as columns, indexed on
+    (student_id, date) and date; everything else (errorBreakdown, alignment,
+    sttWords, gamification, prosody, ...) as one JSON `detail` column that
+    is only read when a full record is asked for
+  - a per-row revision number, so a client can pull only what changed since
+    its last sync; deletes leave tombstones (deleted, with their own
+    revision) so the same pull also reports what was removed
+
+Dates are normalised to Date.toISOString() form (UTC, milliseconds, "Z"),
+which keeps the text (date, id) ordering chronological.
+
+Every write also refreshes the touched students' trend rollups
+(rollups.py) in the same transaction, so dashboard reads are precomputed.
+
+Records go in and come out in the storage.js shape (camelCase keys), so an
+exported orf_data object can be imported as-is. Lists use keyset pagination
+on (date, id): a page costs the same however deep it is.
+
+Connections are per thread (WAL journal, so readers never block the
+writer). The database path comes from ORF_STORE_PATH.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+import rollups
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+BUSY_TIMEOUT_S = 10
+
+DB_PATH = os.environ.get(
+    "ORF_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "store", "assessments.sqlite3"),
+)
+
+# storage.js assessment key -> column; the rest of the record lives in `detail`
+SUMMARY_COLUMNS = {
+    "id": "id", "studentId": "student_id", "date": "date", "wcpm": "wcpm", "accuracy": "accuracy",
+    "totalWords": "total_words", "errors": "errors", "duration": "duration",
+    "passagePreview": "passage_preview",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id          TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    grade       INTEGER,
+    created_at  TEXT,
+    rev         INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS students_grade ON students (grade);
+
+CREATE TABLE IF NOT EXISTS assessments (
+    id              TEXT PRIMARY KEY,
+    student_id      TEXT NOT NULL REFERENCES students (id) ON DELETE CASCADE,
+    date            TEXT NOT NULL,
+    wcpm            REAL,
+    accuracy        REAL,
+    total_words     INTEGER,
+    errors          INTEGER,
+    duration        REAL,
+    passage_preview TEXT,
+    detail          TEXT NOT NULL DEFAULT '{}',
+    rev             INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assessments_student_date ON assessments (student_id, date, id);
+CREATE INDEX IF NOT EXISTS assessments_date ON assessments (date, id);
+CREATE INDEX IF NOT EXISTS assessments_rev ON assessments (rev);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('rev', 0);
+
+CREATE TABLE IF NOT EXISTS deleted (
+    kind  TEXT NOT NULL,  -- 'student' | 'assessment'
+    id    TEXT NOT NULL,
+    rev   INTEGER NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS deleted_rev ON deleted (rev);
+"""
+
+_ASSESSMENT_UPSERT = """
+INSERT INTO assessments (id, student_id, date, wcpm, accuracy, total_words, errors, duration,
+                         passage_preview, detail, rev)
+VALUES (:id, :student_id, :date, :wcpm, :accuracy, :total_words, :errors, :duration,
+        :passage_preview, :detail, :rev)
+ON CONFLICT (id) DO UPDATE SET
+    student_id = excluded.student_id, date = excluded.date, wcpm = excluded.wcpm,
+    accuracy = excluded.accuracy, total_words = excluded.total_words, errors = excluded.errors,
+    duration = excluded.duration, passage_preview = excluded.passage_preview,
+    detail = excluded.detail, rev = excluded.rev
+"""
+
+_STUDENT_UPSERT = """
+INSERT INTO students (id, name, grade, created_at, rev) VALUES (:id, :name, :grade, :created_at, :rev)
+ON CONFLICT (id) DO UPDATE SET
+    name = excluded.name, grade = excluded.grade, created_at = excluded.created_at, rev = excluded.rev
+"""
+
+
+class StoreError(ValueError):
+    """A record the store can't accept (missing id, bad date, unknown student, bad cursor)."""
+
+
+# =============================================================================
+# Row <-> record conversion
+# =============================================================================
+
+def _grade(value):
+    # updateStudentGrade() keeps 1-12 and nulls anything else
+    return value if isinstance(value, int) and not isinstance(value, bool) and 1 <= value <= 12 else None
+
+
+def _student_row(student, rev):
+    if not student.get("id"):
+        raise StoreError("student needs an id")
+    return {"id": str(student["id"]), "name": str(student.get("name") or ""),
+            "grade": _grade(student.get("grade")), "created_at": student.get("createdAt"), "rev": rev}
+
+
+def _student_record(row):
+    return {"id": row["id"], "name": row["name"], "grade": row["grade"], "createdAt": row["created_at"],
+            "rev": row["rev"]}
+
+
+def _iso_date(value):
+    """Any ISO 8601 date/timestamp -> Date.toISOString() form; naive times are taken as UTC."""
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except (AttributeError, ValueError):
+        raise StoreError(f"bad assessment date {value!r} (expected ISO 8601)") from None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return f"{parsed:%Y-%m-%dT%H:%M:%S}.{parsed.microsecond // 1000:03d}Z"
+
+
+def _assessment_row(assessment, rev):
+    if not assessment.get("id") or not assessment.get("studentId") or not assessment.get("date"):
+        raise StoreError("assessment needs id, studentId and date")
+    row = {column: assessment.get(key) for key, column in SUMMARY_COLUMNS.items()}
+    row["id"], row["student_id"] = str(row["id"]), str(row["student_id"])
+    row["date"] = _iso_date(row["date"])
+    detail = {k: v for k, v in assessment.items() if k not in SUMMARY_COLUMNS and k != "rev"}
+    row["detail"] = json.dumps(detail, separators=(",", ":"))
+    row["rev"] = rev
+    return row
+
+
+def _assessment_record(row, full):
+    record = {key: row[column] for key, column in SUMMARY_COLUMNS.items()}
+    record["rev"] = row["rev"]
+    if full:
+        record.update(json.loads(row["detail"]))
+    return record
+
+
+def _cursor(row):
+    return f"{row['date']}|{row['id']}"
+
+
+def _parse_cursor(cursor):
+    date, sep, assessment_id = cursor.rpartition("|")
+    if not sep or not date:
+        raise StoreError(f"bad cursor {cursor!r}")
+    return date, assessment_id
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+class AssessmentStore:
+    """Students and assessments in one SQLite file; safe to share across threads."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(SCHEMA)
+            conn.executescript(rollups.SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_S)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _next_rev(conn, count=1):
+        """Reserve `count` revision numbers; returns the first."""
+        value = conn.execute("UPDATE meta SET value = value + ? WHERE key = 'rev' RETURNING value",
+                             (count,)).fetchone()[0]
+        return value - count + 1
+
+    @staticmethod
+    def _revive(conn, kind, ids):
+        """Drop the tombstones of re-created records."""
+        conn.executemany("DELETE FROM deleted WHERE kind = ? AND id = ?", [(kind, i) for i in ids])
+
+    # ── Students ──
+
+    def list_students(self, grade=None):
+        sql, args = "SELECT * FROM students", ()
+        if grade is not None:
+            sql, args = sql + " WHERE grade = ?", (grade,)
+        rows = self._conn().execute(sql + " ORDER BY created_at, id", args).fetchall()
+        return [_student_record(r) for r in rows]
+
+    def upsert_student(self, student):
+        with self._conn() as conn:
+            conn.execute(_STUDENT_UPSERT, _student_row(student, self._next_rev(conn)))
+            self._revive(conn, "student", [str(student["id"])])
+            rollups.refresh(conn, [str(student["id"])])
+            return _student_record(conn.execute("SELECT * FROM students WHERE id = ?",
+                                                (str(student["id"]),)).fetchone())
+
+    def delete_student(self, student_id):
+        """
+        Delete a student and their assessments, leaving tombstones for
+        incremental sync.
+
+        Returns:
+            IDs of the deleted assessments (the client drops their audio blobs),
+            or None if there was no such student
+        """
+        with self._conn() as conn:
+            ids = [r[0] for r in conn.execute("SELECT id FROM assessments WHERE student_id = ?",
+                                              (student_id,))]
+            if not conn.execute("DELETE FROM students WHERE id = ?", (student_id,)).rowcount:
+                return None
+            rev = self._next_rev(conn, len(ids) + 1)
+            conn.executemany("INSERT OR REPLACE INTO deleted (kind, id, rev) VALUES (?, ?, ?)",
+                             [("assessment", i, rev + n) for n, i in enumerate(ids)]
+                             + [("student", student_id, rev + len(ids))])
+        return ids
+
+    # ── Assessments ──
+
+    def get_assessment(self, assessment_id, full=True):
+        row = self._conn().execute("SELECT * FROM assessments WHERE id = ?", (assessment_id,)).fetchone()
+        return _assessment_record(row, full) if row else None
+
+    def upsert_assessment(self, assessment):
+        """Insert or replace one whole assessment record."""
+        row = _assessment_row(assessment, None)
+        try:
+            with self._conn() as conn:
+                old = conn.execute("SELECT student_id FROM assessments WHERE id = ?", (row["id"],)).fetchone()
+                row["rev"] = self._next_rev(conn)
+                conn.execute(_ASSESSMENT_UPSERT, row)
+                self._revive(conn, "assessment", [row["id"]])
+                rollups.refresh(conn, [row["student_id"]] + ([old[0]] if old else []))
+        except sqlite3.IntegrityError:
+            raise StoreError(f"unknown student {assessment.get('studentId')!r}") from None
+        return self.get_assessment(str(assessment["id"]), full=False)
+
+    def update_assessment(self, assessment_id, fields):
+        """
+        Merge `fields` into a stored assessment (e.g. {"gamification": ...}).
+
+        Returns:
+            The updated summary record, or None if there is no such assessment
+        """
+        with self._conn() as conn:
+            row = conn.execute("SELECT * FROM assessments WHERE id = ?", (assessment_id,)).fetchone()
+            if row is None:
+                return None
+            merged = {**_assessment_record(row, full=True), **fields, "id": assessment_id}
+            try:
+                conn.execute(_ASSESSMENT_UPSERT, _assessment_row(merged, self._next_rev(conn)))
+                rollups.refresh(conn, [row["student_id"], str(merged["studentId"])])
+            except sqlite3.IntegrityError:
+                raise StoreError(f"unknown student {merged.get('studentId')!r}") from None
+        return self.get_assessment(assessment_id, full=False)
+
+    def list_assessments(self, student_id=None, grade=None, since=None, until=None, since_rev=None,
+                         limit=DEFAULT_PAGE_SIZE, cursor=None, descending=False, full=False):
+        """
+        One page of assessments ordered by (date, id).
+
+        Args:
+            student_id / grade: Filter to one student / one grade
+            since / until: ISO date bounds (inclusive / exclusive)
+            since_rev: Only rows changed after this revision (incremental sync);
+                the first page also lists what was deleted since then
+            limit: Page size, capped at MAX_PAGE_SIZE
+            cursor: `next_cursor` from the previous page
+            descending: Newest first
+            full: Include the detail fields (alignment, sttWords, ...)
+
+        Returns:
+            {"assessments": [...], "next_cursor": str | None}, plus with
+            since_rev on the first page "deleted": {"students": [...],
+            "assessments": [...]} and "deleted_rev", the highest tombstone
+            revision listed
+        """
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        where, args = [], []
+        join = ""
+        if student_id is not None:
+            where.append("a.student_id = ?")
+            args.append(student_id)
+        if grade is not None:
+            join = " JOIN students s ON s.id = a.student_id"
+            where.append("s.grade = ?")
+            args.append(grade)
+        if since is not None:
+            where.append("a.date >= ?")
+            args.append(since)
+        if until is not None:
+            where.append("a.date < ?")
+            args.append(until)
+        if since_rev is not None:
+            where.append("a.rev > ?")
+            args.append(since_rev)
+        if cursor:
+            where.append(f"(a.date, a.id) {'<' if descending else '>'} (?, ?)")
+            args.extend(_parse_cursor(cursor))
+
+        columns = "a.*" if full else ", ".join(f"a.{c}" for c in (*SUMMARY_COLUMNS.values(), "rev"))
+        direction = "DESC" if descending else "ASC"
+        sql = (f"SELECT {columns} FROM assessments a{join}"
+               f"{' WHERE ' + ' AND '.join(where) if where else ''}"
+               f" ORDER BY a.date {direction}, a.id {direction} LIMIT ?")
+        rows = self._conn().execute(sql, (*args, limit + 1)).fetchall()
+        page = rows[:limit]
+        result = {"assessments": [_assessment_record(r, full) for r in page],
+                  "next_cursor": _cursor(page[-1]) if len(rows) > limit else None}
+        if since_rev is not None and not cursor:
+            tombstones = self._conn().execute("SELECT kind, id, rev FROM deleted WHERE rev > ? ORDER BY rev",
+                                              (since_rev,)).fetchall()
+            result["deleted"] = {"students": [r["id"] for r in tombstones if r["kind"] == "student"],
+                                 "assessments": [r["id"] for r in tombstones if r["kind"] == "assessment"]}
+            result["deleted_rev"] = tombstones[-1]["rev"] if tombstones else None
+        return result
+
+    # ── Bulk ──
+
+    def import_data(self, data):
+        """
+        Upsert a whole orf_data object ({students[], assessments[]}) in one
+        transaction. Assessments of students not in the store or the import
+        are skipped.
+
+        Returns:
+            {"students": n, "assessments": n, "skipped": n}
+        """
+        students = data.get("students") or []
+        assessments = data.get("assessments") or []
+        with self._conn() as conn:
+            rev = self._next_rev(conn, len(students) + len(assessments) or 1)
+            conn.executemany(_STUDENT_UPSERT, [_student_row(s, rev + i) for i, s in enumerate(students)])
+            self._revive(conn, "student", [str(s["id"]) for s in students])
+            known = {r[0] for r in conn.execute("SELECT id FROM students")}
+            rows = [_assessment_row(a, rev + len(students) + i) for i, a in enumerate(assessments)]
+            kept = [r for r in rows if r["student_id"] in known]
+            conn.executemany(_ASSESSMENT_UPSERT, kept)
+            self._revive(conn, "assessment", [r["id"] for r in kept])
+            rollups.refresh(conn, [str(s["id"]) for s in students] + [r["student_id"] for r in kept])
+        return {"students": len(students), "assessments": len(kept), "skipped": len(rows) - len(kept)}
+
+    # ── Rollups ──
+
+    def student_rollup(self, student_id):
+        """A student's trend summary and celeration series, or None."""
+        return rollups.student(self._conn(), student_id)
+
+    def class_rollup(self, grade=None, student_ids=None):
+        """Trend summaries for one grade or a list of students, plus the class's weekly series."""
+        return rollups.class_view(self._conn(), grade=grade, student_ids=student_ids)
+
+    def revision(self):
+        return self._conn().execute("SELECT value FROM meta WHERE key = 'rev'").fetchone()[0]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Process-wide store, opened on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = AssessmentStore()
+            print(f"[store] {_store.path} (rev {_store.revision()})")
+        return _store
@@ -0,0 +1,304 @@
+"""
+Content-addressed archive for assessment recordings.
+
+Server-side counterpart to js/audio-store.js (raw blobs in each browser's
+IndexedDB). Uploads are stored once, compressed, and shared by every
+assessment that refers to them:
+
+  1. The upload is hashed (SHA-256). An upload seen before resolves to the
+     object already stored for it, without decoding anything.
+  2. New audio is transcoded with ffmpeg to mono Opus in WebM (TRANSCODE_ARGS,
+     ~32 kbps: plenty for speech and for re-transcription), unless ffmpeg is
+     missing, fails, or the result isn't smaller; then the upload is kept as-is.
+  3. The stored bytes are hashed again and written to objects/<aa>/<hash>,
+     so two different uploads that encode to the same object share it too.
+
+An SQLite index (archive.sqlite3) maps upload hashes to objects and
+assessment IDs to objects; an object is deleted when its last assessment
+is. Objects are immutable and served with byte-range support; their
+sha256 is the ETag, since an assessment's URL can be re-pointed at a new
+object by a later upload. The archive lives in ORF_AUDIO_DIR.
+
+<audio src> can't send an Authorization header, so playback uses signed
+URLs: ?expires=<unix time>&sig=<HMAC-SHA256 of assessment_id and expires>,
+valid for one recording until it expires.
+"""
+
+import hashlib
+import hmac
+import os
+import re
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import threading
+import time
+import zipfile
+
+BUSY_TIMEOUT_S = 10
+TRANSCODE_TIMEOUT_S = 120
+STORED_MIME = "audio/webm"
+TRANSCODE_ARGS = ["-vn", "-ac", "1", "-c:a", "libopus", "-b:a", "32k", "-application", "voip", "-f", "webm"]
+
+ARCHIVE_DIR = os.environ.get(
+    "ORF_AUDIO_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "store", "audio"),
+)
+
+EXTENSIONS = {"audio/webm": ".webm", "audio/ogg": ".ogg", "audio/wav": ".wav", "audio/x-wav": ".wav",
+              "audio/mpeg": ".mp3", "audio/mp4": ".m4a", "audio/flac": ".flac"}
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    sha256       TEXT PRIMARY KEY,
+    mime         TEXT NOT NULL,
+    size         INTEGER NOT NULL,
+    source_size  INTEGER NOT NULL,
+    transcoded   INTEGER NOT NULL,
+    created_at   REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sources (
+    source_sha256 TEXT PRIMARY KEY,
+    sha256        TEXT NOT NULL REFERENCES objects (sha256) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS sources_object ON sources (sha256);
+CREATE TABLE IF NOT EXISTS refs (
+    assessment_id TEXT PRIMARY KEY,
+    sha256        TEXT NOT NULL REFERENCES objects (sha256)
+);
+CREATE INDEX IF NOT EXISTS refs_object ON refs (sha256);
+"""
+
+
+class RangeNotSatisfiable(ValueError):
+    pass
+
+
+def parse_range(header, size):
+    """
+    (start, end) inclusive for a single-range `Range: bytes=...` header, or
+    None to send the whole object (no header, or a multi-range one).
+    Raises RangeNotSatisfiable for ranges outside the object.
+    """
+    if not header:
+        return None
+    match = _RANGE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:  # suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable(header)
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise RangeNotSatisfiable(header)
+    return start, end
+
+
+def sign_audio_url(secret, assessment_id, expires):
+    """Signature for a playback URL of `assessment_id` valid until `expires` (unix seconds)."""
+    message = f"{assessment_id}\n{int(expires)}".encode()
+    return hmac.new(secret, message, hashlib.sha256).hexdigest()
+
+
+def check_audio_signature(secret, assessment_id, expires, sig, now=None):
+    """True if `sig` signs this assessment's URL and `expires` hasn't passed."""
+    try:
+        expires = int(expires)
+    except (TypeError, ValueError):
+        return False
+    if expires < (time.time() if now is None else now) or not sig:
+        return False
+    return hmac.compare_digest(sign_audio_url(secret, assessment_id, expires), sig)
+
+
+def transcode(data):
+    """Upload bytes -> Opus/WebM bytes, or None if ffmpeg is unavailable or fails."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return None
+    try:
+        result = subprocess.run([ffmpeg, "-hide_banner", "-loglevel", "error", "-i", "pipe:0",
+                                 *TRANSCODE_ARGS, "pipe:1"],
+                                input=data, capture_output=True, timeout=TRANSCODE_TIMEOUT_S)
+    except subprocess.TimeoutExpired:
+        return None
+    if result.returncode != 0 or not result.stdout:
+        print(f"[audio] transcode failed: {result.stderr.decode(errors='replace').strip()[:200]}")
+        return None
+    return result.stdout
+
+
+class AudioArchive:
+    """Objects on disk plus their SQLite index; safe to share across threads."""
+
+    def __init__(self, root=ARCHIVE_DIR):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.executescript(SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(os.path.join(self.root, "archive.sqlite3"), timeout=BUSY_TIMEOUT_S)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+        return conn
+
+    def object_path(self, sha256):
+        return os.path.join(self.root, "objects", sha256[:2], sha256)
+
+    def _write_object(self, sha256, data):
+        path = self.object_path(sha256)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    # ── Lookup ──
+
+    def info(self, sha256):
+        row = self._conn().execute("SELECT * FROM objects WHERE sha256 = ?", (sha256,)).fetchone()
+        return dict(row) if row else None
+
+    def resolve(self, assessment_id):
+        """Object info for an assessment's recording, or None."""
+        row = self._conn().execute(
+            "SELECT o.* FROM refs r JOIN objects o ON o.sha256 = r.sha256 WHERE r.assessment_id = ?",
+            (assessment_id,)).fetchone()
+        return dict(row) if row else None
+
+    # ── Writes ──
+
+    def put(self, data, mime, assessment_id=None):
+        """
+        Archive an upload (and point `assessment_id` at it).
+
+        Returns:
+            Object info plus "deduplicated": True when no new object was written
+        """
+        source_sha = hashlib.sha256(data).hexdigest()
+        row = self._conn().execute("SELECT sha256 FROM sources WHERE source_sha256 = ?",
+                                   (source_sha,)).fetchone()
+        deduplicated = row is not None
+        if deduplicated:
+            sha256 = row["sha256"]
+        else:
+            encoded = transcode(data)
+            transcoded = encoded is not None and len(encoded) < len(data)
+            stored, stored_mime = (encoded, STORED_MIME) if transcoded else (data, mime)
+            sha256 = hashlib.sha256(stored).hexdigest()
+            deduplicated = self.info(sha256) is not None
+            self._write_object(sha256, stored)
+            with self._conn() as conn:
+                conn.execute("INSERT OR IGNORE INTO objects VALUES (?, ?, ?, ?, ?, ?)",
+                             (sha256, stored_mime, len(stored), len(data), int(transcoded), time.time()))
+                conn.execute("INSERT OR IGNORE INTO sources VALUES (?, ?)", (source_sha, sha256))
+        if assessment_id is not None:
+            self.link(assessment_id, sha256)
+        return {**self.info(sha256), "deduplicated": deduplicated}
+
+    def link(self, assessment_id, sha256):
+        """Point an assessment at an object, releasing whatever it referred to before."""
+        with self._conn() as conn:
+            old = conn.execute("SELECT sha256 FROM refs WHERE assessment_id = ?", (assessment_id,)).fetchone()
+            conn.execute("INSERT INTO refs VALUES (?, ?) ON CONFLICT (assessment_id) DO UPDATE "
+                         "SET sha256 = excluded.sha256", (assessment_id, sha256))
+        if old and old["sha256"] != sha256:
+            self._collect([old["sha256"]])
+
+    def unlink(self, assessment_ids):
+        """Drop assessments' references; objects nothing refers to any more are deleted. Returns that count."""
+        ids = list(assessment_ids)
+        if not ids:
+            return 0
+        with self._conn() as conn:
+            marks = ",".join("?" * len(ids))
+            shas = [r[0] for r in conn.execute(f"SELECT DISTINCT sha256 FROM refs WHERE assessment_id IN ({marks})",
+                                               ids)]
+            conn.execute(f"DELETE FROM refs WHERE assessment_id IN ({marks})", ids)
+        return self._collect(shas)
+
+    def _collect(self, shas):
+        removed = []
+        with self._conn() as conn:
+            for sha256 in shas:
+                if conn.execute("SELECT 1 FROM refs WHERE sha256 = ? LIMIT 1", (sha256,)).fetchone() is None:
+                    conn.execute("DELETE FROM objects WHERE sha256 = ?", (sha256,))
+                    removed.append(sha256)
+        for sha256 in removed:
+            try:
+                os.remove(self.object_path(sha256))
+            except FileNotFoundError:
+                pass
+        return len(removed)
+
+    # ── Reads ──
+
+    def read(self, sha256, start=0, end=None):
+        """Bytes start..end (inclusive) of an object."""
+        with open(self.object_path(sha256), "rb") as f:
+            f.seek(start)
+            return f.read(-1 if end is None else end - start + 1)
+
+    def export(self, assessment_ids, out):
+        """
+        Zip the recordings of `assessment_ids` into `out` (path or file
+        object). Each object is stored once, however many assessments share
+        it; manifest.csv maps assessment_id -> file. Entries aren't
+        recompressed, since the audio already is.
+
+        Returns:
+            {"files": n, "assessments": n, "missing": [ids without audio]}
+        """
+        written, missing, manifest = set(), [], ["assessment_id,file,mime,sha256"]
+        with zipfile.ZipFile(out, "w", zipfile.ZIP_STORED) as z:
+            for assessment_id in assessment_ids:
+                obj = self.resolve(assessment_id)
+                if obj is None:
+                    missing.append(assessment_id)
+                    continue
+                name = f"audio/{obj['sha256']}{EXTENSIONS.get(obj['mime'], '')}"
+                if obj["sha256"] not in written:
+                    z.write(self.object_path(obj["sha256"]), name)
+                    written.add(obj["sha256"])
+                manifest.append(f"{assessment_id},{name},{obj['mime']},{obj['sha256']}")
+            z.writestr("manifest.csv", "\n".join(manifest) + "\n")
+        return {"files": len(written), "assessments": len(manifest) - 1, "missing": missing}
+
+    def stats(self):
+        row = self._conn().execute("SELECT COUNT(*) AS objects, COALESCE(SUM(size), 0) AS bytes, "
+                                   "COALESCE(SUM(source_size), 0) AS source_bytes FROM objects").fetchone()
+        refs = self._conn().execute("SELECT COUNT(*) FROM refs").fetchone()[0]
+        return {**dict(row), "assessments": refs}
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_archive():
+    """Process-wide archive, opened on first use."""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = AudioArchive()
+            stats = _archive.stats()
+            print(f"[audio] {_archive.root}: {stats['objects']} objects, {stats['bytes'] / 1e6:.1f}MB "
+                  f"(ffmpeg {'found' if shutil.which('ffmpeg') else 'missing; storing uploads as-is'})")
+        return _archive
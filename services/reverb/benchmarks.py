@@ -0,0 +1,208 @@
+"""
+Hasbrouck–Tindal ORF norms (port of js/benchmarks.js).
+
+Grades 1-6: 2017 Technical Report #1702
+Grades 7-8: 2006 compiled norms (2017 report only covers 1-6)
+Grade 1 has no fall norms (testing begins in winter).
+
+Besides the JS status bands, percentile ranks place a WCPM on the
+percentile scale by linear interpolation between the published
+percentiles: from 0 WCPM (rank 0) up to p10, and past p90 at the p75–p90
+slope, clipped to 1..99.
+
+The table is also loaded once into NORM_TABLE[grade, season, percentile]
+(NaN where there are no norms), so rank_batch() ranks and tiers a whole
+cohort with a handful of array operations: one gather of each student's
+norm row, a count of the percentiles reached to pick the interpolation
+segment, and one vectorized interpolation.
+"""
+
+import numpy as np
+
+# ── Constants (kept in lockstep with js/benchmarks.js) ──
+
+HT_NORMS = {
+    1: {
+        "winter": {"p10": 12, "p25": 28, "p50": 53, "p75": 82, "p90": 111},
+        "spring": {"p10": 28, "p25": 46, "p50": 72, "p75": 100, "p90": 126},
+    },
+    2: {
+        "fall":   {"p10": 25, "p25": 44, "p50": 72, "p75": 100, "p90": 124},
+        "winter": {"p10": 42, "p25": 64, "p50": 89, "p75": 114, "p90": 136},
+        "spring": {"p10": 55, "p25": 78, "p50": 104, "p75": 127, "p90": 148},
+    },
+    3: {
+        "fall":   {"p10": 44, "p25": 66, "p50": 93, "p75": 120, "p90": 146},
+        "winter": {"p10": 61, "p25": 82, "p50": 108, "p75": 133, "p90": 157},
+        "spring": {"p10": 69, "p25": 91, "p50": 118, "p75": 143, "p90": 166},
+    },
+    4: {
+        "fall":   {"p10": 65, "p25": 87, "p50": 113, "p75": 139, "p90": 165},
+        "winter": {"p10": 74, "p25": 98, "p50": 125, "p75": 152, "p90": 177},
+        "spring": {"p10": 83, "p25": 105, "p50": 133, "p75": 160, "p90": 185},
+    },
+    5: {
+        "fall":   {"p10": 75, "p25": 99, "p50": 126, "p75": 153, "p90": 179},
+        "winter": {"p10": 84, "p25": 109, "p50": 136, "p75": 163, "p90": 189},
+        "spring": {"p10": 90, "p25": 115, "p50": 144, "p75": 171, "p90": 197},
+    },
+    6: {
+        "fall":   {"p10": 82, "p25": 107, "p50": 136, "p75": 164, "p90": 190},
+        "winter": {"p10": 89, "p25": 115, "p50": 145, "p75": 173, "p90": 199},
+        "spring": {"p10": 96, "p25": 122, "p50": 150, "p75": 177, "p90": 204},
+    },
+    # Grades 7-8: Hasbrouck & Tindal 2006 compiled norms
+    7: {
+        "fall":   {"p10": 102, "p25": 109, "p50": 128, "p75": 153, "p90": 177},
+        "winter": {"p10": 109, "p25": 117, "p50": 136, "p75": 160, "p90": 182},
+        "spring": {"p10": 112, "p25": 123, "p50": 150, "p75": 177, "p90": 199},
+    },
+    8: {
+        "fall":   {"p10": 106, "p25": 115, "p50": 133, "p75": 157, "p90": 185},
+        "winter": {"p10": 113, "p25": 124, "p50": 146, "p75": 171, "p90": 199},
+        "spring": {"p10": 115, "p25": 126, "p50": 151, "p75": 177, "p90": 199},
+    },
+}
+
+PERCENTILES = (10, 25, 50, 75, 90)
+MIN_RANK, MAX_RANK = 1, 99
+MAX_GRADE = 12
+SEASONS = ("fall", "winter", "spring")
+STATUSES = ("unknown", "at-risk", "some-risk", "on-track")
+
+# Season index per month (0 = January): Mar-Jul spring, Aug-Nov fall, Dec-Feb winter
+SEASON_OF_MONTH = np.array([1, 1, 2, 2, 2, 2, 2, 0, 0, 0, 0, 1])
+# Interpolation anchors: 0 WCPM is rank 0, then the published percentiles
+_ANCHOR_RANKS = np.array((0,) + PERCENTILES, dtype=float)
+
+
+def _norm_table():
+    table = np.full((MAX_GRADE + 1, len(SEASONS), len(PERCENTILES)), np.nan)
+    for grade, seasons in HT_NORMS.items():
+        for season, norms in seasons.items():
+            table[grade, SEASONS.index(season)] = [norms[f"p{p}"] for p in PERCENTILES]
+    return table
+
+
+NORM_TABLE = _norm_table()
+
+
+def get_season(month):
+    """Season for a 1-12 month: Aug-Nov fall, Dec-Feb winter, Mar-Jul spring."""
+    if 8 <= month <= 11:
+        return "fall"
+    if month == 12 or month <= 2:
+        return "winter"
+    return "spring"
+
+
+def get_benchmark_status(wcpm, grade, season):
+    """Same bands as getBenchmarkStatus(): on-track >= p50, some-risk >= p25, else at-risk."""
+    norms = HT_NORMS.get(grade, {}).get(season)
+    if not norms or wcpm is None:
+        return "unknown"
+    if wcpm >= norms["p50"]:
+        return "on-track"
+    if wcpm >= norms["p25"]:
+        return "some-risk"
+    return "at-risk"
+
+
+def percentile_rank(wcpm, grade, season):
+    """Interpolated percentile rank (1-99), or None without norms or WCPM."""
+    if wcpm is None or season not in SEASONS:
+        return None
+    rank = percentile_ranks(np.array([wcpm], dtype=float), np.array([grade or 0]),
+                            np.array([SEASONS.index(season)]))[0]
+    return None if np.isnan(rank) else float(rank)
+
+
+# =============================================================================
+# Vectorized ranking
+# =============================================================================
+
+def _norm_rows(grade, season):
+    """Each student's [p10..p90] row; NaN for out-of-range grades/seasons or no norms."""
+    grade = np.asarray(grade, dtype=np.int64)
+    season = np.asarray(season, dtype=np.int64)
+    known = (grade >= 0) & (grade <= MAX_GRADE) & (season >= 0) & (season < len(SEASONS))
+    rows = NORM_TABLE[np.where(known, grade, 0), np.where(known, season, 0)]
+    rows[~known] = np.nan
+    return rows
+
+
+def seasons_of_months(months):
+    """1-12 month array -> season index array (SEASONS order)."""
+    return SEASON_OF_MONTH[np.asarray(months, dtype=np.int64) - 1]
+
+
+def percentile_ranks(wcpm, grade, season):
+    """
+    Percentile ranks for whole arrays.
+
+    Args:
+        wcpm: float array (NaN = not assessed)
+        grade: int array (0 or out of range = unknown)
+        season: int array of SEASONS indexes (-1 = unknown)
+
+    Returns:
+        float array of ranks in MIN_RANK..MAX_RANK, NaN where there are no
+        norms or no WCPM
+    """
+    wcpm = np.asarray(wcpm, dtype=float)
+    anchors = np.concatenate([np.zeros((len(wcpm), 1)), _norm_rows(grade, season)], axis=1)
+    # Segment k spans anchors k..k+1; past p90 the last segment is extended
+    segment = np.minimum((wcpm[:, None] >= anchors[:, 1:]).sum(axis=1), len(PERCENTILES) - 1)
+    rows = np.arange(len(wcpm))
+    w0, w1 = anchors[rows, segment], anchors[rows, segment + 1]
+    p0, p1 = _ANCHOR_RANKS[segment], _ANCHOR_RANKS[segment + 1]
+    with np.errstate(invalid="ignore"):
+        rank = np.clip(p0 + (wcpm - w0) * (p1 - p0) / (w1 - w0), MIN_RANK, MAX_RANK)
+    return np.where(np.isnan(anchors).any(axis=1) | np.isnan(wcpm), np.nan, rank)
+
+
+def benchmark_statuses(wcpm, grade, season):
+    """STATUSES index per student: getBenchmarkStatus() bands, 0 (unknown) without norms or WCPM."""
+    wcpm = np.asarray(wcpm, dtype=float)
+    norms = _norm_rows(grade, season)
+    with np.errstate(invalid="ignore"):
+        status = np.where(wcpm >= norms[:, 2], 3, np.where(wcpm >= norms[:, 1], 2, 1))
+    return np.where(np.isnan(norms[:, 0]) | np.isnan(wcpm), 0, status)
+
+
+def rank_batch(wcpm, grade, season=None, month=None):
+    """
+    Rank and tier a cohort.
+
+    Args:
+        wcpm: WCPM per student (None = not assessed)
+        grade: grade per student (None = unknown)
+        season: season name per student, or
+        month: 1-12 assessment month per student (season derived as in getSeason())
+
+    Returns:
+        {"percentile": [...], "status": [...], "season": [...], "counts": {status: n}}
+        with one entry per student, None where unknown
+    """
+    n = len(wcpm)
+    w = np.array([np.nan if v is None else v for v in wcpm], dtype=float)
+    g = np.array([0 if v is None else v for v in grade], dtype=np.int64)
+    if season is not None:
+        s = np.array([SEASONS.index(v) if v in SEASONS else -1 for v in season], dtype=np.int64)
+    elif month is not None:
+        m = np.array([0 if v is None else v for v in month], dtype=np.int64)
+        s = np.where((m >= 1) & (m <= 12), SEASON_OF_MONTH[np.clip(m, 1, 12) - 1], -1)
+    else:
+        raise ValueError("season or month required")
+    if not len(g) == len(s) == n:
+        raise ValueError("wcpm, grade and season/month must be the same length")
+
+    ranks = np.round(percentile_ranks(w, g, s), 1)
+    status = benchmark_statuses(w, g, s)
+    counts = np.bincount(status, minlength=len(STATUSES))
+    return {
+        "percentile": [None if np.isnan(r) else float(r) for r in ranks],
+        "status": [STATUSES[i] for i in status],
+        "season": [SEASONS[i] if i >= 0 else None for i in s],
+        "counts": {name: int(c) for name, c in zip(STATUSES, counts)},
+    }
@@ -0,0 +1,1259 @@
+"""
+Fluency diagnostics for server-side (batch) analysis.
+
+Python port of the scoring half of js/diagnostics.js: runDiagnostics()
+(onset delays, long pauses, morphological errors, struggle words) plus the
+prosody metrics app.js computes afterwards (phrasing quality, pause at
+punctuation, pace consistency, word duration outliers, word speed tiers).
+
+Transcript words are parsed once into a WordColumns view — timestamps,
+cross-validation flags and next/previous confirmed-word indices as numpy
+arrays — so every gap-based metric is a handful of vectorized operations
+instead of a per-word scan. Alignment walks (hypIndex tracking) stay plain
+Python; they are linear and do string work that numpy cannot help with.
+
+Output dicts use the same camelCase keys and rounding as the JS so stored
+sessions re-scored here are directly comparable with browser results.
+Pipeline steps that mutate the alignment before diagnostics
+(resolveNearMissClusters, absorbMispronunciationFragments) and the
+VAD/NL enrichments are not ported; pass the stored post-pipeline alignment
+to reproduce the browser's numbers exactly.
+"""
+
+import math
+import re
+
+import numpy as np
+
+from alignment import align_words, is_near_miss
+from phoneme_counter import get_phoneme_count_with_fallback, load_phoneme_data
+from syllable_counter import count_syllables
+from text_normalize import split_reference_for_display
+
+# Minimum effective phoneme count for duration normalization. Short words
+# ("a", "is") have a fixed articulatory overhead that would otherwise inflate
+# their ms/phoneme; 3 is the cost of one CVC syllable.
+PHONEME_FLOOR = 3
+
+# Onset-delay thresholds (seconds) by punctuation after the previous word
+ONSET_THRESHOLDS = {'period': 1.2, 'comma': 0.8}
+DEFAULT_ONSET_THRESHOLD = 0.5
+LONG_PAUSE_SEC = 3.0
+
+# Minimum pause (seconds) that counts as honoring a punctuation mark
+PUNCT_MIN_PAUSE = {'period': 0.150, 'comma': 0.100}
+
+# Word speed tier upper bounds on (ms/phoneme) / median(ms/phoneme)
+SPEED_TIER_BOUNDS = np.array([0.75, 1.25, 1.75, 2.50])
+SPEED_TIERS = ['quick', 'steady', 'slow', 'very-slow', 'slowest']
+
+_FLOAT_PREFIX = re.compile(r'\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?')
+_TRAILING_CLOSERS = re.compile('["\'“”‘’)}\\]]+$')
+_NON_WORD_CHARS = re.compile(r"[^a-z'-]")
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def parse_time(t) -> float:
+    """Parse an STT time ("1.200s" or 1.2) to float seconds; 0.0 if unparseable."""
+    if isinstance(t, bool) or t is None:
+        return 0.0
+    if isinstance(t, (int, float)):
+        return 0.0 if math.isnan(t) else float(t)
+    match = _FLOAT_PREFIX.match(str(t).replace('s', '', 1))
+    return float(match.group(0)) if match else 0.0
+
+
+def _js_round(x):
+    """Math.round(): halves round toward +infinity (Python's round() is banker's)."""
+    return int(math.floor(x + 0.5))
+
+
+def _round_to(x, places: int) -> float:
+    """Math.round(x * 10^places) / 10^places."""
+    scale = 10 ** places
+    return math.floor(x * scale + 0.5) / scale
+
+
+def _median(values):
+    """Median of a numeric sequence, or None when empty."""
+    if len(values) == 0:
+        return None
+    s = np.sort(np.asarray(values, dtype=np.float64))
+    mid = len(s) // 2
+    return float(s[mid]) if len(s) % 2 else float((s[mid - 1] + s[mid]) / 2)
+
+
+def _percentile(values, p):
+    """Linear-interpolated percentile (0-100), same formula as diagnostics.js."""
+    if len(values) == 0:
+        return None
+    s = np.sort(np.asarray(values, dtype=np.float64))
+    if len(s) == 1:
+        return float(s[0])
+    idx = (p / 100) * (len(s) - 1)
+    lower, upper = math.floor(idx), math.ceil(idx)
+    if lower == upper:
+        return float(s[lower])
+    return float(s[lower] + (s[upper] - s[lower]) * (idx - lower))
+
+
+def _entry_type(entry):
+    return entry.get('type') or entry.get('operation')
+
+
+def _effective_hyp(entry, counter: int) -> int:
+    """entry.hypIndex when set (shared-hypIndex entries), else the running counter."""
+    h = entry.get('hypIndex')
+    return h if h is not None and h >= 0 else counter
+
+
+def _first_set(d, key, fallback):
+    """d[key] ?? d[fallback]"""
+    value = d.get(key)
+    return value if value is not None else d.get(fallback)
+
+
+def _parts_count(entry) -> int:
+    # JS truthiness: an empty parts array still counts as present
+    return len(entry['parts']) if entry.get('compound') and entry.get('parts') is not None else 1
+
+
+def get_punctuation_positions(reference_text: str) -> dict:
+    """
+    Trailing punctuation per reference word index: 'period' | 'colon' | 'comma'.
+
+    Indices come from split_reference_for_display() so they line up with
+    normalize_text() and therefore with alignment ref positions.
+    """
+    positions = {}
+    for i, w in enumerate(split_reference_for_display(reference_text)):
+        stripped = _TRAILING_CLOSERS.sub('', w)
+        if not stripped:
+            continue
+        last = stripped[-1]
+        if last in '.!?':
+            positions[i] = 'period'
+        elif last == ':':
+            positions[i] = 'colon'
+        elif last in ',;':
+            positions[i] = 'comma'
+    return positions
+
+
+def build_hyp_to_ref_map(alignment: list) -> dict:
+    """Map hypothesis word index -> reference word index by walking alignment ops."""
+    mapping = {}
+    ref_index = 0
+    hyp_index = 0
+    for op in alignment:
+        op_type = _entry_type(op)
+        if op_type == 'insertion':
+            hyp_index = _effective_hyp(op, hyp_index) + 1
+        elif op_type in ('omission', 'deletion'):
+            ref_index += 1
+        else:
+            h = _effective_hyp(op, hyp_index)
+            mapping[h] = ref_index
+            ref_index += 1
+            hyp_index = h + 1
+    return mapping
+
+
+class WordColumns:
+    """
+    Columnar view of transcript words for vectorized gap analysis.
+
+    Attributes (all numpy arrays of length n):
+        start, end: primary timestamps in seconds
+        reverb_start, reverb_end: Reverb timestamps (0 when absent)
+        speech_start, speech_end: Reverb-or-primary span, used for the
+            speech that unconfirmed words contribute inside a gap
+        unconfirmed: crossValidation == 'unconfirmed'
+        next_confirmed: index of the next confirmed word after i (n if none)
+        prev_confirmed: index of the previous confirmed word before i (-1 if none)
+    """
+
+    def __init__(self, transcript_words: list):
+        self.words = transcript_words
+        n = self.n = len(transcript_words)
+        raw = [(w.get('startTime'), w.get('endTime'), w.get('_reverbStartTime'),
+                w.get('_reverbEndTime')) for w in transcript_words]
+        self.start = np.array([parse_time(r[0]) for r in raw], dtype=np.float64)
+        self.end = np.array([parse_time(r[1]) for r in raw], dtype=np.float64)
+        self.reverb_start = np.array([parse_time(r[2]) for r in raw], dtype=np.float64)
+        self.reverb_end = np.array([parse_time(r[3]) for r in raw], dtype=np.float64)
+        self.speech_start = np.array([parse_time(r[2] or r[0]) for r in raw], dtype=np.float64)
+        self.speech_end = np.array([parse_time(r[3] or r[1]) for r in raw], dtype=np.float64)
+        self.unconfirmed = np.array(
+            [w.get('crossValidation') == 'unconfirmed' for w in transcript_words], dtype=bool)
+
+        idx = np.arange(n)
+        confirmed = ~self.unconfirmed
+        # Suffix-min / prefix-max over confirmed indices give the nearest
+        # confirmed neighbour in O(n) without a per-word skip loop.
+        nearest_at_or_after = np.minimum.accumulate(np.where(confirmed, idx, n)[::-1])[::-1]
+        self.next_confirmed = np.append(nearest_at_or_after[1:], n).astype(np.int64)
+        nearest_at_or_before = np.maximum.accumulate(np.where(confirmed, idx, -1))
+        self.prev_confirmed = np.insert(nearest_at_or_before[:-1], 0, -1).astype(np.int64)
+
+    def confirmed_gaps(self):
+        """
+        Gaps between each confirmed word and the next confirmed word.
+
+        Returns:
+            (positions, next_indices, gaps) arrays; positions are the hyp
+            indices the gap follows, in ascending order.
+        """
+        if self.n < 2:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0)
+        pos = np.flatnonzero(~self.unconfirmed[:-1] & (self.next_confirmed[:-1] < self.n))
+        nxt = self.next_confirmed[pos]
+        return pos, nxt, self.start[nxt] - self.end[pos]
+
+    def longest_silence(self, gap_start: float, gap_end: float, lo: int, hi: int) -> float:
+        """
+        Longest silence in [gap_start, gap_end] after removing the speech of
+        skipped (unconfirmed) words lo..hi-1, which lack cross-validator
+        timestamps but still prove the student was talking.
+        """
+        s = self.speech_start[lo:hi]
+        e = self.speech_end[lo:hi]
+        keep = (e > s) & (s < gap_end) & (e > gap_start)
+        if not keep.any():
+            return gap_end - gap_start
+        s = np.maximum(s[keep], gap_start)
+        e = np.minimum(e[keep], gap_end)
+        order = np.argsort(s, kind='stable')
+        s, e = s[order], e[order]
+        # Merged-interval end reaching each start = running max of prior ends
+        covered = np.maximum.accumulate(e)
+        silences = np.maximum(s[1:] - covered[:-1], 0.0) if len(s) > 1 else np.zeros(0)
+        best = max(s[0] - gap_start, gap_end - covered[-1])
+        return float(max(best, silences.max())) if len(silences) else float(best)
+
+    def gap_after(self, pos: int):
+        """Gap from word pos to the next confirmed word, or None at the end."""
+        if pos >= self.n - 1:
+            return None
+        nxt = self.next_confirmed[pos]
+        if nxt >= self.n:
+            return None
+        return float(self.start[nxt] - self.end[pos])
+
+
+def _as_columns(transcript_words):
+    return transcript_words if isinstance(transcript_words, WordColumns) else WordColumns(transcript_words)
+
+
+# =============================================================================
+# runDiagnostics detectors
+# =============================================================================
+
+def detect_onset_delays(transcript_words, reference_text: str, alignment: list,
+                        xval_raw_words: list | None = None) -> list:
+    """
+    Flag inter-word hesitations (gap >= threshold and < 3s).
+
+    Threshold depends on punctuation after the previous word: 1.2s after
+    . ! ?, 0.8s after a comma, 0.5s otherwise. Unconfirmed words are skipped
+    both as flagged words and as gap boundaries; Reverb timestamps, skipped
+    words' speech and raw cross-validator words can each narrow the gap.
+
+    Returns:
+        List of {wordIndex, word, gap, threshold, punctuationType}
+    """
+    cols = _as_columns(transcript_words)
+    n = cols.n
+    if n < 2:
+        return []
+
+    idx = np.arange(1, n)
+    idx = idx[~cols.unconfirmed[1:]]
+    prev = cols.prev_confirmed[idx]
+    idx, prev = idx[prev >= 0], prev[prev >= 0]
+    if len(idx) == 0:
+        return []
+
+    start = cols.start[idx]
+    prev_end = cols.end[prev]
+    gap = start - prev_end
+
+    # Parakeet decoding blackouts shift timestamps; trust a shorter Reverb gap
+    r_start, r_end = cols.reverb_start[idx], cols.reverb_end[prev]
+    gap = np.where(r_start > r_end, np.minimum(gap, r_start - r_end), gap)
+
+    for k in np.flatnonzero(idx - prev > 1):
+        gap[k] = min(gap[k], cols.longest_silence(prev_end[k], start[k], prev[k] + 1, idx[k]))
+
+    # Raw cross-validator words (including fragments) inside the gap window
+    # prove the silence is shorter than the aligned timestamps suggest.
+    xval = [(parse_time(_first_set(w, 'start', 'startTime')), parse_time(_first_set(w, 'end', 'endTime')))
+            for w in (xval_raw_words or [])]
+    xval = np.array([t for t in xval if t[0] > 0 and t[1] > 0], dtype=np.float64).reshape(-1, 2)
+    if len(xval):
+        cand = np.flatnonzero(gap >= 0.5)
+        if len(cand):
+            pe, st = prev_end[cand, None], start[cand, None]
+            overlaps = (xval[None, :, 1] > pe) & (xval[None, :, 0] < st)
+            latest = np.where(overlaps, xval[None, :, 1], pe).max(axis=1)
+            narrowed = latest > prev_end[cand]
+            gap[cand] = np.where(narrowed, np.minimum(gap[cand], start[cand] - latest), gap[cand])
+
+    punct_map = get_punctuation_positions(reference_text) if reference_text else {}
+    hyp_to_ref = build_hyp_to_ref_map(alignment) if alignment else {}
+    punct_types = [punct_map.get(hyp_to_ref.get(int(p))) for p in prev]
+    threshold = np.array([ONSET_THRESHOLDS.get(t, DEFAULT_ONSET_THRESHOLD) for t in punct_types])
+
+    results = []
+    for k in np.flatnonzero((gap >= threshold) & (gap < LONG_PAUSE_SEC)):
+        i = int(idx[k])
+        results.append({
+            'wordIndex': i,
+            'word': cols.words[i].get('word'),
+            'gap': _round_to(float(gap[k]), 3),
+            'threshold': float(threshold[k]),
+            'punctuationType': punct_types[k],
+        })
+    return results
+
+
+def detect_long_pauses(transcript_words) -> list:
+    """
+    Flag pauses >= 3s between confirmed words.
+
+    Returns:
+        List of {afterWordIndex, gap} with gap rounded to 0.1s
+    """
+    cols = _as_columns(transcript_words)
+    pos, nxt, raw_gap = cols.confirmed_gaps()
+    cand = np.flatnonzero(raw_gap >= LONG_PAUSE_SEC)
+    if len(cand) == 0:
+        return []
+
+    pos, nxt = pos[cand], nxt[cand]
+    gap = raw_gap[cand]
+    r_end, r_start = cols.reverb_end[pos], cols.reverb_start[nxt]
+    gap = np.where(r_start > r_end, np.minimum(gap, r_start - r_end), gap)
+    for k in np.flatnonzero(nxt > pos + 1):
+        gap[k] = min(gap[k], cols.longest_silence(cols.end[pos[k]], cols.start[nxt[k]], pos[k] + 1, nxt[k]))
+
+    keep = gap >= LONG_PAUSE_SEC
+    return [{'afterWordIndex': int(p), 'gap': _round_to(float(g), 1)}
+            for p, g in zip(pos[keep], gap[keep])]
+
+
+def detect_morphological_errors(alignment: list, transcript_words) -> list:
+    """
+    Flag substitutions where ref and hyp share a 3+ char prefix or suffix
+    ("running" -> "runned", "unhappy" -> "happy"). One-character differences
+    are too minor to count.
+
+    Returns:
+        List of {ref, hyp, sharedPart, matchType, crossValidation}
+    """
+    words = transcript_words.words if isinstance(transcript_words, WordColumns) else (transcript_words or [])
+    results = []
+    hyp_index = 0
+
+    for op in alignment:
+        op_type = _entry_type(op)
+        if op_type in ('omission', 'deletion'):
+            continue
+
+        if op_type == 'substitution':
+            ref = (op.get('ref') or op.get('reference') or '').lower()
+            hyp = (op.get('hyp') or op.get('hypothesis') or '').lower()
+            if ref != hyp:
+                min_len = min(len(ref), len(hyp))
+                prefix_len = 0
+                while prefix_len < min_len and ref[prefix_len] == hyp[prefix_len]:
+                    prefix_len += 1
+                suffix_len = 0
+                while suffix_len < min_len and ref[-1 - suffix_len] == hyp[-1 - suffix_len]:
+                    suffix_len += 1
+                shared_len = max(prefix_len, suffix_len)
+                diff_len = abs(len(ref) - len(hyp)) + (min_len - shared_len)
+
+                if diff_len > 1 and shared_len >= 3:
+                    e_hyp = _effective_hyp(op, hyp_index)
+                    stt_word = words[e_hyp] if 0 <= e_hyp < len(words) else None
+                    match_type = 'prefix' if prefix_len >= suffix_len else 'suffix'
+                    results.append({
+                        'ref': op.get('ref') or op.get('reference'),
+                        'hyp': op.get('hyp') or op.get('hypothesis'),
+                        'sharedPart': ref[:prefix_len] if match_type == 'prefix' else ref[len(ref) - suffix_len:],
+                        'matchType': match_type,
+                        'crossValidation': (stt_word or {}).get('crossValidation') or 'unavailable',
+                    })
+
+        hyp_index = _effective_hyp(op, hyp_index) + _parts_count(op)
+
+    return results
+
+
+def detect_struggle_words(transcript_words, reference_text: str, alignment: list,
+                          long_pauses: list | None = None) -> list:
+    """
+    Upgrade substitutions to struggles via Path 1 (>= 3s pause before the
+    word) and Path 3 (cross-validator unconfirmed + near-miss attempt).
+
+    Mutates alignment entries in place (_isStruggle, _hesitationGap,
+    _hasHesitation, _abandonedAttempt), like the JS.
+
+    Args:
+        long_pauses: detect_long_pauses() output, recomputed when omitted
+
+    Returns:
+        List of evidence records for diagnostics logging
+    """
+    cols = _as_columns(transcript_words)
+    if long_pauses is None:
+        long_pauses = detect_long_pauses(cols)
+
+    pause_before = {}
+    for p in long_pauses:
+        after = p['afterWordIndex']
+        nxt = int(cols.next_confirmed[after]) if 0 <= after < cols.n else cols.n
+        if nxt < cols.n:
+            pause_before[nxt] = p['gap']
+
+    results = []
+    hyp_index = 0
+    for entry in alignment:
+        entry_type = entry.get('type')
+        if entry_type == 'insertion':
+            hyp_index = _effective_hyp(entry, hyp_index) + 1
+            continue
+        if entry_type == 'omission':
+            continue
+
+        e_hyp = _effective_hyp(entry, hyp_index)
+        if entry_type == 'substitution':
+            ref_clean = _NON_WORD_CHARS.sub('', (entry.get('ref') or '').lower())
+
+            if len(ref_clean) > 3 and e_hyp in pause_before:
+                gap = pause_before[e_hyp]
+                if entry.get('_isStruggle'):
+                    entry['_hasHesitation'] = True
+                else:
+                    entry['_isStruggle'] = True
+                entry['_hesitationGap'] = gap
+                results.append({'hypIndex': e_hyp, 'word': entry.get('ref'), 'hyp': entry.get('hyp'),
+                                'gap': _round_to(gap, 3)})
+
+            if (0 <= e_hyp < cols.n and cols.unconfirmed[e_hyp]
+                    and is_near_miss(entry.get('hyp'), entry.get('ref'))):
+                entry['_isStruggle'] = True
+                entry['_abandonedAttempt'] = True
+                results.append({'hypIndex': e_hyp, 'word': entry.get('ref'), 'hyp': entry.get('hyp'),
+                                'crossValidation': 'unconfirmed'})
+
+        hyp_index = e_hyp + _parts_count(entry)
+
+    return results
+
+
+def run_diagnostics(transcript_words, alignment: list, reference_text: str,
+                    xval_raw_words: list | None = None) -> dict:
+    """
+    Run all runDiagnostics() detectors over one session.
+
+    Args:
+        transcript_words: Merged STT words (or a prebuilt WordColumns)
+        alignment: Alignment entries (struggle flags are written in place)
+        reference_text: Reference passage text
+        xval_raw_words: Raw cross-validator words for onset-gap narrowing
+
+    Returns:
+        {onsetDelays, longPauses, morphologicalErrors, struggleWords}
+    """
+    cols = _as_columns(transcript_words)
+    long_pauses = detect_long_pauses(cols)
+    return {
+        'onsetDelays': detect_onset_delays(cols, reference_text, alignment, xval_raw_words),
+        'longPauses': long_pauses,
+        'morphologicalErrors': detect_morphological_errors(alignment, cols),
+        'struggleWords': detect_struggle_words(cols, reference_text, alignment, long_pauses),
+    }
+
+
+# =============================================================================
+# Prosody metrics
+# =============================================================================
+
+def compute_phrasing_quality(diagnostics: dict, transcript_words, reference_text: str,
+                             alignment: list) -> dict:
+    """
+    Metric 1: phrase breaks and reading-pattern classification.
+
+    Breaks come from hesitations (A), long pauses (B) and IQR-fenced medium
+    pauses (C); each is classified as at-punctuation or unexpected and
+    words-per-phrase statistics are reported. Read-only on diagnostics.
+
+    Returns:
+        Same structure as computePhrasingQuality(); '_breakSet' is a list of
+        break positions in discovery order.
+    """
+    cols = _as_columns(transcript_words)
+    n = cols.n
+    words = cols.words
+    if n < 2:
+        return {'insufficient': True, 'reason': 'Too few words'}
+
+    exclude = set()
+    compound_positions = set()
+    hyp_idx = 0
+    for entry in alignment:
+        if entry.get('type') in ('omission', 'deletion'):
+            continue
+        e_hyp = _effective_hyp(entry, hyp_idx)
+        in_range = 0 <= e_hyp < n
+        if entry.get('type') == 'insertion':
+            if in_range and words[e_hyp].get('isDisfluency'):
+                exclude.add(e_hyp)
+            if entry.get('_partOfStruggle') or entry.get('_partOfOOVForgiven'):
+                exclude.add(e_hyp)
+        if in_range and cols.unconfirmed[e_hyp]:
+            exclude.add(e_hyp)
+        if entry.get('compound') and entry.get('parts') is not None:
+            compound_positions.update(range(e_hyp, e_hyp + len(entry['parts']) - 1))
+        hyp_idx = e_hyp + _parts_count(entry)
+
+    onset_delays = diagnostics.get('onsetDelays') or []
+    long_pauses = diagnostics.get('longPauses') or []
+
+    # Dict as an insertion-ordered set, matching the JS Set iteration order
+    break_set = {}
+    ab_positions = set()
+    vad_filtered = source_a = source_b = 0
+    for delay in onset_delays:
+        vad = delay.get('_vadAnalysis')
+        if vad and vad.get('speechPercent', 0) >= 80:
+            vad_filtered += 1
+            continue
+        after = delay['wordIndex'] - 1
+        if after >= 0:
+            break_set[after] = None
+            ab_positions.add(after)
+            source_a += 1
+    for pause in long_pauses:
+        break_set[pause['afterWordIndex']] = None
+        ab_positions.add(pause['afterWordIndex'])
+        source_b += 1
+
+    pos, _, gaps = cols.confirmed_gaps()
+    non_negative = gaps >= 0
+    is_compound = np.array([p in compound_positions for p in pos.tolist()], dtype=bool)
+    is_ab = np.array([p in ab_positions for p in pos.tolist()], dtype=bool)
+    baseline = gaps[non_negative & ~is_ab & ~is_compound]
+
+    median_gap = _median(baseline)
+    q1 = _percentile(baseline, 25)
+    q3 = _percentile(baseline, 75)
+    iqr = q3 - q1 if q1 is not None and q3 is not None else 0
+    effective_iqr = max(iqr, 0.050)
+    raw_fence = q3 + 1.5 * effective_iqr if q3 is not None else 0.200
+    gap_fence = max(raw_fence, 0.200)
+
+    source_c = 0
+    over_fence = non_negative & (gaps >= gap_fence)
+    compound_skipped = int((over_fence & is_compound).sum())
+    for p in pos[over_fence & ~is_compound].tolist():
+        if p not in break_set:
+            break_set[p] = None
+            source_c += 1
+
+    if median_gap is None:
+        classification = 'connected'
+    elif median_gap > 0.350:
+        classification = 'word-by-word'
+    elif median_gap > 0.250:
+        classification = 'choppy'
+    elif median_gap > 0.150:
+        classification = 'phrase-level'
+    else:
+        classification = 'connected'
+
+    punct_map = get_punctuation_positions(reference_text)
+    hyp_to_ref = build_hyp_to_ref_map(alignment)
+    hesitation_positions = {d['wordIndex'] - 1 for d in onset_delays}
+    long_pause_positions = {p['afterWordIndex'] for p in long_pauses}
+
+    def gap_ms_after(p):
+        g = cols.gap_after(p)
+        return _js_round(g * 1000) if g is not None else None
+
+    breaks = []
+    break_info = {}
+    unexpected_breaks = set()
+    at_punct_count = unexpected_count = 0
+    for p in break_set:
+        ref_idx = hyp_to_ref.get(p)
+        at_punct = ref_idx is not None and ref_idx in punct_map
+        source = 'mediumPause'
+        if p in hesitation_positions:
+            source = 'hesitation'
+        if p in long_pause_positions:
+            source = 'longPause'
+        if at_punct:
+            at_punct_count += 1
+        else:
+            unexpected_count += 1
+            unexpected_breaks.add(p)
+        info = {'position': p, 'type': 'at-punctuation' if at_punct else 'unexpected',
+                'punctType': punct_map[ref_idx] if at_punct else None,
+                'source': source, 'gapMs': gap_ms_after(p)}
+        breaks.append(info)
+        break_info.setdefault(p, info)
+
+    # Prefix sums over the counted-word mask give each phrase's word count
+    counted = np.ones(n, dtype=bool)
+    excluded_in_range = [e for e in exclude if 0 <= e < n]
+    counted[excluded_in_range] = False
+    counted_cum = np.concatenate(([0], np.cumsum(counted)))
+
+    def build_phrases(break_positions):
+        phrases = []
+        start = 0
+        for bp in sorted(break_positions):
+            if bp >= start:
+                phrases.append(single_phrase(start, bp))
+                start = bp + 1
+        if start < n:
+            phrases.append(single_phrase(start, n - 1))
+        return phrases
+
+    def single_phrase(start, end):
+        stop = min(end, n - 1) + 1
+        info = break_info.get(end)
+        return {
+            'startHypIndex': start,
+            'endHypIndex': end,
+            'wordCount': int(counted_cum[stop] - counted_cum[start]) if stop > start else 0,
+            'words': [words[i].get('word') for i in range(start, stop) if counted[i]],
+            'gapAfterMs': gap_ms_after(end),
+            'breakSource': info['source'] if info else None,
+            'breakType': info['type'] if info else None,
+        }
+
+    fluency_phrases = build_phrases(unexpected_breaks)
+    overall_phrases = build_phrases(break_set)
+    fluency_lengths = [p['wordCount'] for p in fluency_phrases if p['wordCount'] > 0]
+    overall_lengths = [p['wordCount'] for p in overall_phrases if p['wordCount'] > 0]
+
+    def mean_1dp(values):
+        return _round_to(sum(values) / len(values), 1) if values else None
+
+    disfluency_count = struggle_part_count = unconfirmed_count = 0
+    hyp_idx = 0
+    for entry in alignment:
+        if entry.get('type') in ('omission', 'deletion'):
+            continue
+        e_hyp = _effective_hyp(entry, hyp_idx)
+        if e_hyp in exclude:
+            in_range = 0 <= e_hyp < n
+            if entry.get('type') == 'insertion' and in_range and words[e_hyp].get('isDisfluency'):
+                disfluency_count += 1
+            elif entry.get('_partOfStruggle'):
+                struggle_part_count += 1
+            elif in_range and cols.unconfirmed[e_hyp]:
+                unconfirmed_count += 1
+        hyp_idx = e_hyp + _parts_count(entry)
+
+    return {
+        'fluencyPhrasing': {
+            'mean': mean_1dp(fluency_lengths),
+            'median': _median(fluency_lengths),
+            'totalPhrases': len(fluency_phrases),
+            'phraseLengths': fluency_lengths,
+        },
+        'overallPhrasing': {
+            'mean': mean_1dp(overall_lengths),
+            'median': _median(overall_lengths),
+            'totalPhrases': len(overall_phrases),
+            'phraseLengths': overall_lengths,
+            'phrases': overall_phrases,
+        },
+        'readingPattern': {
+            'medianGap': _round_to(median_gap, 3) if median_gap is not None else None,
+            'classification': classification,
+        },
+        'breakClassification': {
+            'total': len(break_set),
+            'atPunctuation': at_punct_count,
+            'unexpected': unexpected_count,
+            'breaks': breaks,
+        },
+        'gapDistribution': {
+            'Q1': _round_to(q1, 3) if q1 is not None else None,
+            'Q3': _round_to(q3, 3) if q3 is not None else None,
+            'IQR': _round_to(iqr, 3),
+            'effectiveIQR': _round_to(effective_iqr, 3),
+            'gapFence': _round_to(gap_fence, 3),
+            'isFenceFloored': raw_fence < 0.200,
+            'isIQRFloored': iqr < 0.050,
+            'totalGapsAnalyzed': int(len(baseline)),
+        },
+        'breakSources': {
+            'fromHesitations': source_a,
+            'fromLongPauses': source_b,
+            'fromMediumPauses': source_c,
+            'vadFiltered': vad_filtered,
+            'compoundSkipped': compound_skipped,
+            'totalBreaks': len(break_set),
+        },
+        'excludedFromCount': {
+            'disfluencies': disfluency_count,
+            'struggleParts': struggle_part_count,
+            'unconfirmed': unconfirmed_count,
+            'totalExcluded': len(exclude),
+        },
+        '_breakSet': list(break_set),
+    }
+
+
+def compute_pause_at_punctuation(transcript_words, reference_text: str, alignment: list,
+                                 break_classification: dict, break_set) -> dict:
+    """
+    Metric 2: punctuation coverage (marks honored with a pause) and
+    precision (share of pauses that fall at punctuation).
+    """
+    cols = _as_columns(transcript_words)
+    break_set = set(break_set)
+    punct_map = get_punctuation_positions(reference_text)
+    ref_to_hyp = {r: h for h, r in build_hyp_to_ref_map(alignment).items()}
+    ref_words = split_reference_for_display(reference_text)
+
+    # Raw (not confirmed-skipping) gap after each hyp word
+    raw_gaps = cols.start[1:] - cols.end[:-1]
+    gap_after_hyp = {int(i): float(raw_gaps[i]) for i in np.flatnonzero(raw_gaps >= 0)}
+    median_baseline = _median(raw_gaps[raw_gaps >= 0]) or 0.050
+    punct_pause_threshold = max(median_baseline * 1.5, PUNCT_MIN_PAUSE['comma'])
+
+    encountered = [r for r in punct_map if r in ref_to_hyp]
+    last_encountered = max(encountered) if encountered else -1
+
+    encountered_count = covered_count = 0
+    uncovered = []
+    for ref_idx, punct_type in punct_map.items():
+        hyp_idx = ref_to_hyp.get(ref_idx)
+        if hyp_idx is None or ref_idx == last_encountered:
+            continue
+        encountered_count += 1
+        gap = gap_after_hyp.get(hyp_idx)
+        # ±1 tolerance: ASR boundaries can put the break at the next word's onset
+        in_break_set = hyp_idx in break_set or (hyp_idx + 1) in break_set
+        min_pause = PUNCT_MIN_PAUSE.get(punct_type, PUNCT_MIN_PAUSE['period'])
+        if in_break_set or (gap is not None and gap >= min_pause):
+            covered_count += 1
+        else:
+            uncovered.append({
+                'refIndex': ref_idx,
+                'refWord': ref_words[ref_idx] if ref_idx < len(ref_words) else '',
+                'punctType': punct_type,
+                'gapMs': _js_round(gap * 1000) if gap is not None else None,
+                'thresholdMs': _js_round(min_pause * 1000),
+            })
+
+    coverage = _round_to(covered_count / encountered_count, 2) if encountered_count else None
+    if coverage is None:
+        coverage_label = 'No punctuation encountered'
+    elif coverage < 0.30:
+        coverage_label = 'Rarely pauses at punctuation'
+    elif coverage < 0.60:
+        coverage_label = 'Pauses at some punctuation'
+    elif coverage < 0.80:
+        coverage_label = 'Pauses at most punctuation'
+    else:
+        coverage_label = 'Consistently pauses at punctuation'
+
+    total_pauses = break_classification['total']
+    precision = _round_to(break_classification['atPunctuation'] / total_pauses, 2) if total_pauses > 0 else None
+    if precision is None:
+        precision_label = 'No pauses detected'
+    elif precision < 0.30:
+        precision_label = 'Pauses rarely align with sentences'
+    elif precision < 0.60:
+        precision_label = 'Some pauses at punctuation, many mid-sentence'
+    elif precision < 0.80:
+        precision_label = 'Most pauses at punctuation'
+    else:
+        precision_label = 'Pauses well-aligned with text structure'
+
+    # Period:comma pause ratio — fluent readers ~2:1, struggling readers ~1:1
+    period_gaps, comma_gaps = [], []
+    for ref_idx, punct_type in punct_map.items():
+        g = gap_after_hyp.get(ref_to_hyp.get(ref_idx))
+        if g is not None and g > 0:
+            if punct_type == 'period':
+                period_gaps.append(g)
+            elif punct_type == 'comma':
+                comma_gaps.append(g)
+    mean_period = sum(period_gaps) / len(period_gaps) if period_gaps else None
+    mean_comma = sum(comma_gaps) / len(comma_gaps) if comma_gaps else None
+    ratio = _round_to(mean_period / mean_comma, 2) if mean_period and mean_comma else None
+
+    if ratio is None:
+        diff_label = 'Insufficient data'
+    elif ratio >= 1.5:
+        diff_label = 'Good differentiation'
+    elif ratio >= 1.2:
+        diff_label = 'Some differentiation'
+    else:
+        diff_label = 'Undifferentiated pausing'
+
+    return {
+        'coverage': {
+            'ratio': coverage,
+            'label': coverage_label,
+            'coveredCount': covered_count,
+            'encounteredPunctuationMarks': encountered_count,
+            'totalPunctuationMarks': len(punct_map),
+            'uncoveredMarks': uncovered,
+            'punctPauseThresholdMs': _js_round(punct_pause_threshold * 1000),
+            'periodMinPauseMs': _js_round(PUNCT_MIN_PAUSE['period'] * 1000),
+            'commaMinPauseMs': _js_round(PUNCT_MIN_PAUSE['comma'] * 1000),
+        },
+        'precision': {
+            'ratio': precision,
+            'label': precision_label,
+            'atPunctuationCount': break_classification['atPunctuation'],
+            'notAtPunctuationCount': break_classification['unexpected'],
+            'totalPauses': total_pauses,
+        },
+        'pauseDifferentiation': {
+            'meanPeriodPauseMs': _js_round(mean_period * 1000) if mean_period is not None else None,
+            'meanCommaPauseMs': _js_round(mean_comma * 1000) if mean_comma is not None else None,
+            'periodCommaRatio': ratio,
+            'label': diff_label,
+        },
+        'passagePunctuationDensity': _round_to(len(punct_map) / len(ref_words), 3) if ref_words else 0,
+    }
+
+
+def compute_pace_consistency(overall_phrasing: dict, transcript_words) -> dict:
+    """Metric 3: coefficient of variation of per-phrase reading rates."""
+    phrases = (overall_phrasing or {}).get('phrases') or []
+    if len(phrases) < 3:
+        return {'insufficient': True, 'reason': 'Too few phrases'}
+
+    cols = _as_columns(transcript_words)
+    measurable = [(pi, p) for pi, p in enumerate(phrases) if p['wordCount'] > 0]
+    if measurable:
+        starts = cols.start[[p['startHypIndex'] for _, p in measurable]]
+        ends = cols.end[[p['endHypIndex'] for _, p in measurable]]
+        durations = ends - starts
+    else:
+        durations = np.zeros(0)
+
+    local_rates = []
+    for (pi, phrase), duration in zip(measurable, durations.tolist()):
+        if duration <= 0:
+            continue
+        local_rates.append({
+            'phraseIndex': pi,
+            'wordsPerMinute': _js_round(phrase['wordCount'] / duration * 60),
+            'wordCount': phrase['wordCount'],
+            'durationSec': _round_to(duration, 2),
+        })
+
+    if len(local_rates) < 3:
+        return {'insufficient': True, 'reason': 'Too few measurable phrases'}
+
+    rates = np.array([r['wordsPerMinute'] for r in local_rates], dtype=np.float64)
+    mean_rate = float(rates.sum() / len(rates))
+    if mean_rate == 0:
+        return {'insufficient': True, 'reason': 'Zero mean rate'}
+    sd_rate = math.sqrt(float(((rates - mean_rate) ** 2).sum() / len(rates)))
+    cv = sd_rate / mean_rate
+
+    if cv < 0.15:
+        classification, label = 'consistent', 'Consistent pace throughout'
+    elif cv < 0.30:
+        classification, label = 'mostly-steady', 'Mostly steady pace'
+    elif cv < 0.50:
+        classification, label = 'variable', 'Variable pace — speeds up and slows down'
+    else:
+        classification, label = 'highly-variable', 'Highly variable pace — significant speed changes'
+
+    return {
+        'cv': _round_to(cv, 2),
+        'classification': classification,
+        'label': label,
+        'meanLocalRate': _js_round(mean_rate),
+        'sdLocalRate': _js_round(sd_rate),
+        'phraseCount': len(local_rates),
+        'localRates': local_rates,
+    }
+
+
+def _phoneme_info(entry, text):
+    """(phonemes, syllables, source) for a word, summing parts of compounds."""
+    parts = entry.get('parts') if entry.get('compound') else None
+    if parts and len(parts) > 1:
+        infos = [get_phoneme_count_with_fallback(p) for p in parts]
+        return (sum(i['count'] for i in infos), sum(count_syllables(p) for p in parts),
+                'fallback' if any(i['source'] == 'fallback' for i in infos) else 'cmudict')
+    info = get_phoneme_count_with_fallback(text)
+    return info['count'], count_syllables(text), info['source']
+
+
+def compute_word_duration_outliers(transcript_words, alignment: list) -> dict:
+    """
+    Metric 4: self-normed word duration outliers.
+
+    Durations prefer cross-validator timestamps, fall back to primary ones,
+    are normalized per phoneme (floored at PHONEME_FLOOR) and flagged above
+    an IQR fence (IQR floored at 50ms).
+    """
+    words = transcript_words.words if isinstance(transcript_words, WordColumns) else transcript_words
+    n = len(words)
+    all_words = []
+    skipped_no_ts = xval_count = primary_count = 0
+    hyp_index = 0
+    last_hyp_idx = -1
+
+    def word_at(i):
+        return words[i] if 0 <= i < n else None
+
+    for entry in alignment:
+        entry_type = entry.get('type')
+        if entry_type in ('omission', 'deletion'):
+            continue
+        parts_count = _parts_count(entry)
+        e_hyp = _effective_hyp(entry, hyp_index)
+        hyp_index = e_hyp + parts_count
+
+        if entry_type == 'insertion':
+            w = word_at(e_hyp)
+            if (w and w.get('isDisfluency')) or entry.get('_partOfStruggle'):
+                continue
+
+        # Shared hypIndex ("on"+"to" -> "onto"): reuse the previous word's timing
+        if e_hyp == last_hyp_idx and all_words:
+            prev = all_words[-1]
+            all_words.append({**prev, 'refWord': entry.get('ref') or prev['refWord'], 'refIndex': None})
+            continue
+        last_hyp_idx = e_hyp
+
+        word = word_at(e_hyp)
+        if not word:
+            continue
+
+        multi_part = entry.get('compound') and entry.get('parts') and len(entry['parts']) > 1
+        last_part = word_at(e_hyp + len(entry['parts']) - 1) if multi_part else None
+        if word.get('_xvalStartTime') is not None and word.get('_xvalEndTime') is not None:
+            start_ms = parse_time(word['_xvalStartTime']) * 1000
+            end_src = last_part['_xvalEndTime'] if last_part and last_part.get('_xvalEndTime') is not None \
+                else word['_xvalEndTime']
+            ts_source = 'cross-validator'
+            xval_count += 1
+        elif word.get('startTime') is not None and word.get('endTime') is not None:
+            start_ms = parse_time(word['startTime']) * 1000
+            end_src = last_part['endTime'] if last_part and last_part.get('endTime') is not None \
+                else word['endTime']
+            ts_source = 'primary'
+            primary_count += 1
+        else:
+            skipped_no_ts += 1
+            continue
+        duration_ms = parse_time(end_src) * 1000 - start_ms
+        if duration_ms <= 0:
+            continue
+
+        text = (entry.get('hyp') or entry.get('ref') or word.get('word')) if entry.get('compound') else word.get('word')
+        phonemes, syllables, ph_source = _phoneme_info(entry, text)
+        all_words.append({
+            'hypIndex': e_hyp,
+            'word': text,
+            'refWord': entry.get('ref') or entry.get('reference') or text,
+            'refIndex': None,
+            'durationMs': _js_round(duration_ms),
+            'phonemes': phonemes,
+            'phonemeSource': ph_source,
+            'syllables': syllables,
+            'normalizedDurationMs': _js_round(duration_ms / max(phonemes, PHONEME_FLOOR)),
+            'alignmentType': entry_type,
+            'isOutlier': False,
+            'timestampSource': ts_source,
+        })
+
+    hyp_to_ref = build_hyp_to_ref_map(alignment)
+    for w in all_words:
+        w['refIndex'] = hyp_to_ref.get(w['hypIndex'])
+
+    if len(all_words) < 4:
+        return {'insufficient': True,
+                'reason': f'Too few words with timestamps (xval: {xval_count}, primary: {primary_count}, '
+                          f'skipped: {skipped_no_ts})',
+                'allWords': all_words}
+
+    durations = np.array([w['normalizedDurationMs'] for w in all_words], dtype=np.float64)
+    q1 = _percentile(durations, 25)
+    q3 = _percentile(durations, 75)
+    iqr = q3 - q1
+    effective_iqr = max(iqr, 50)
+    upper_fence = q3 + 1.5 * effective_iqr
+    median_dur = _median(durations)
+    mean_dur = float(durations.sum() / len(durations))
+    sd_dur = math.sqrt(float(((durations - mean_dur) ** 2).sum() / len(durations)))
+
+    outliers = []
+    for k in np.flatnonzero(durations > upper_fence):
+        w = all_words[k]
+        w['isOutlier'] = True
+        outliers.append({
+            'hypIndex': w['hypIndex'],
+            'word': w['word'],
+            'refWord': w['refWord'],
+            'refIndex': w['refIndex'],
+            'durationMs': w['durationMs'],
+            'phonemes': w['phonemes'],
+            'phonemeSource': w['phonemeSource'],
+            'syllables': w['syllables'],
+            'normalizedDurationMs': w['normalizedDurationMs'],
+            'aboveFenceBy': _js_round(w['normalizedDurationMs'] - upper_fence),
+            'ratio': _round_to(w['normalizedDurationMs'] / median_dur, 2) if median_dur > 0 else None,
+            'alignmentType': w['alignmentType'],
+        })
+    outliers.sort(key=lambda o: -o['normalizedDurationMs'])
+
+    return {
+        'baseline': {
+            'normalizationUnit': 'phoneme',
+            'medianDurationPerPhoneme': _js_round(median_dur),
+            'meanDurationPerPhoneme': _js_round(mean_dur),
+            'sdDurationPerPhoneme': _js_round(sd_dur),
+            # Legacy aliases kept for the UI
+            'medianDurationPerSyllable': _js_round(median_dur),
+            'meanDurationPerSyllable': _js_round(mean_dur),
+            'sdDurationPerSyllable': _js_round(sd_dur),
+            'Q1': _js_round(q1),
+            'Q3': _js_round(q3),
+            'IQR': _js_round(iqr),
+            'effectiveIQR': _js_round(effective_iqr),
+            'upperFence': _js_round(upper_fence),
+            'isFenceFloored': iqr < 50,
+            'totalWordsAnalyzed': len(all_words),
+            'wordsSkippedNoTimestamps': skipped_no_ts,
+            'xvalTimestamps': xval_count,
+            'primaryTimestamps': primary_count,
+        },
+        'outliers': outliers,
+        'outlierCount': len(outliers),
+        'allWords': all_words,
+    }
+
+
+def compute_word_speed_tiers(word_outliers: dict, alignment: list, transcript_words,
+                             reference_text: str) -> dict:
+    """
+    Classify every reference word into a speed tier relative to the
+    student's own median ms/phoneme (quick / steady / slow / very-slow /
+    slowest, plus omitted and no-data).
+
+    Metric 4 outliers are never shown faster than 'slow', since the two
+    metrics use different baselines and can disagree.
+    """
+    if not word_outliers or word_outliers.get('insufficient'):
+        return {'insufficient': True,
+                'reason': (word_outliers or {}).get('reason') or 'Word duration data insufficient'}
+
+    cols = _as_columns(transcript_words)
+    words_in = cols.words
+    punct_map = get_punctuation_positions(reference_text) if reference_text else {}
+    sentence_final = {i for i, t in punct_map.items() if t == 'period'}
+    m4_by_hyp = {w['hypIndex']: w for w in word_outliers['allWords']}
+
+    def no_data_row(ref_index, entry, hyp, word, tier, alignment_type):
+        return {'refIndex': ref_index, 'refWord': entry.get('ref'), 'hypIndex': hyp, 'word': word,
+                'durationMs': None, 'syllables': None, 'normalizedMs': None, 'ratio': None,
+                'tier': tier, 'alignmentType': alignment_type, 'isOutlier': False,
+                'sentenceFinal': ref_index in sentence_final}
+
+    rows = []
+    normed = []
+    hyp_index = ref_index = 0
+    last_spoken = -1
+    for entry in alignment:
+        entry_type = entry.get('type')
+        if entry_type == 'insertion':
+            hyp_index = _effective_hyp(entry, hyp_index) + _parts_count(entry)
+            continue
+        if entry.get('_notAttempted'):
+            rows.append(no_data_row(ref_index, entry, None, None, 'no-data', 'not-attempted'))
+            ref_index += 1
+            continue
+        if entry_type in ('omission', 'deletion'):
+            forgiven = bool(entry.get('forgiven'))
+            rows.append(no_data_row(ref_index, entry, None, None, 'no-data' if forgiven else 'omitted',
+                                    'forgiven-omission' if forgiven else 'omission'))
+            ref_index += 1
+            continue
+
+        parts_count = _parts_count(entry)
+        e_hyp = _effective_hyp(entry, hyp_index)
+        hyp_index = e_hyp + parts_count
+
+        if e_hyp == last_spoken and rows:
+            prev = rows[-1]
+            rows.append({
+                'refIndex': ref_index, 'refWord': entry.get('ref'),
+                'hypIndex': e_hyp, 'word': prev['word'],
+                'durationMs': prev['durationMs'], 'phonemes': prev.get('phonemes'),
+                'phonemeSource': prev.get('phonemeSource'), 'syllables': prev['syllables'],
+                'normalizedMs': prev['normalizedMs'],
+                'ratio': None, 'tier': None,
+                'alignmentType': entry_type,
+                'isOutlier': prev['isOutlier'],
+                'sentenceFinal': ref_index in sentence_final,
+                '_tsSource': prev.get('_tsSource'),
+            })
+            if prev['durationMs'] is not None and prev['durationMs'] > 0:
+                normed.append(prev['normalizedMs'])
+            ref_index += 1
+            continue
+        last_spoken = e_hyp
+
+        duration_ms = ts_source = None
+        if 0 <= e_hyp < cols.n:
+            start_s = cols.start[e_hyp]
+            stop = min(e_hyp + parts_count, cols.n)
+            end_s = cols.end[e_hyp:stop].max()
+            if start_s > 0 and end_s > start_s:
+                duration_ms = _js_round(float(end_s - start_s) * 1000)
+                ts_source = 'cross-validator' if words_in[e_hyp].get('_xvalStartTime') else 'reverb'
+
+        m4 = m4_by_hyp.get(e_hyp)
+        if duration_ms is None and m4 and m4.get('durationMs') is not None:
+            duration_ms = m4['durationMs']
+            ts_source = 'metric4'
+
+        if duration_ms is not None and duration_ms > 0:
+            phonemes, syllables, ph_source = _phoneme_info(entry, entry.get('ref') or entry.get('hyp') or '')
+            normalized_ms = _js_round(duration_ms / max(phonemes, PHONEME_FLOOR))
+            normed.append(normalized_ms)
+            rows.append({
+                'refIndex': ref_index, 'refWord': entry.get('ref'),
+                'hypIndex': e_hyp, 'word': entry.get('hyp') or (m4 or {}).get('word') or '',
+                'durationMs': duration_ms, 'phonemes': phonemes, 'phonemeSource': ph_source,
+                'syllables': syllables, 'normalizedMs': normalized_ms,
+                'ratio': None, 'tier': None,
+                'alignmentType': entry_type,
+                'isOutlier': bool(m4 and m4.get('isOutlier')),
+                'sentenceFinal': ref_index in sentence_final,
+                '_tsSource': ts_source,
+            })
+        else:
+            rows.append(no_data_row(ref_index, entry, e_hyp, entry.get('hyp'), 'no-data', entry_type))
+        ref_index += 1
+
+    baseline = word_outliers.get('baseline')
+    if len(normed) >= 4:
+        median_ms = _median(normed)
+    elif baseline:
+        median_ms = baseline['medianDurationPerPhoneme']
+    else:
+        return {'insufficient': True, 'reason': 'Too few words for baseline'}
+    if not median_ms or median_ms <= 0:
+        return {'insufficient': True, 'reason': 'Zero or missing median'}
+
+    upper_fence = (baseline or {}).get('upperFence') or None
+    pending = [w for w in rows if w['tier'] is None]
+    if pending:
+        # Shared-hypIndex rows copied from a no-data word have no duration; JS
+        # treats null / median as 0, so they land in 'quick'.
+        ratios = np.array([w['normalizedMs'] or 0 for w in pending], dtype=np.float64) / median_ms
+        tiers = np.searchsorted(SPEED_TIER_BOUNDS, ratios, side='right')
+        for w, ratio, tier in zip(pending, ratios.tolist(), tiers.tolist()):
+            w['ratio'] = _round_to(ratio, 2)
+            w['_medianMs'] = _js_round(median_ms)
+            w['_upperFence'] = upper_fence
+            w['tier'] = 'slow' if w['isOutlier'] and tier < 2 else SPEED_TIERS[tier]
+
+    distribution = {t: 0 for t in SPEED_TIERS + ['omitted', 'no-data']}
+    for w in rows:
+        if w['tier'] in distribution:
+            distribution[w['tier']] += 1
+    classifiable = sum(distribution[t] for t in SPEED_TIERS)
+    at_pace = distribution['quick'] + distribution['steady']
+
+    return {
+        'words': rows,
+        'baseline': {
+            'normalizationUnit': 'phoneme',
+            'medianMs': _js_round(median_ms),
+            'totalWords': len(rows),
+            'upperFence': upper_fence,
+        },
+        'distribution': distribution,
+        'atPacePercent': _round_to(at_pace / classifiable * 100, 1) if classifiable > 0 else 0,
+    }
+
+
+# =============================================================================
+# Session / batch entry points
+# =============================================================================
+
+def diagnose_session(reference_text: str, transcript_words: list, alignment: list | None = None,
+                     xval_raw_words: list | None = None) -> dict:
+    """
+    Full diagnostics for one stored session, in app.js order: detectors,
+    then phrasing, pause at punctuation, pace, duration outliers and tiers.
+
+    When alignment is omitted it is recomputed with align_words(), which
+    skips the browser's near-miss/fragment post-passes.
+    """
+    if alignment is None:
+        alignment = align_words(reference_text, transcript_words)
+    cols = WordColumns(transcript_words)
+
+    diagnostics = run_diagnostics(cols, alignment, reference_text, xval_raw_words)
+    phrasing = compute_phrasing_quality(diagnostics, cols, reference_text, alignment)
+    if phrasing.get('insufficient'):
+        pause_at_punctuation = {'coverage': {'ratio': None, 'label': 'Insufficient data'},
+                                'precision': {'ratio': None, 'label': 'Insufficient data'},
+                                'passagePunctuationDensity': 0}
+        pace = {'insufficient': True, 'reason': 'Phrasing insufficient'}
+    else:
+        pause_at_punctuation = compute_pause_at_punctuation(
+            cols, reference_text, alignment, phrasing['breakClassification'], phrasing['_breakSet'])
+        pace = compute_pace_consistency(phrasing['overallPhrasing'], cols)
+    word_outliers = compute_word_duration_outliers(cols, alignment)
+    word_speed_tiers = compute_word_speed_tiers(word_outliers, alignment, cols, reference_text)
+
+    return {
+        'diagnostics': diagnostics,
+        'phrasing': phrasing,
+        'pauseAtPunctuation': pause_at_punctuation,
+        'paceConsistency': pace,
+        'wordOutliers': word_outliers,
+        'wordSpeedTiers': word_speed_tiers,
+    }
+
+
+def diagnose_batch(sessions: list) -> list:
+    """
+    Re-diagnose many stored sessions.
+
+    Each session is a dict with reference_text, transcript_words and
+    optionally alignment / xval_raw_words. A failing session yields
+    {"error": "..."} instead of aborting the whole batch.
+    """
+    load_phoneme_data()
+    results = []
+    for session in sessions:
+        try:
+            results.append(diagnose_session(
+                session.get('reference_text') or '',
+                session.get('transcript_words') or [],
+                session.get('alignment'),
+                session.get('xval_raw_words'),
+            ))
+        except Exception as e:
+            results.append({'error': f'{type(e).__name__}: {e}'})
+    return results
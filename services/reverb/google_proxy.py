@@ -0,0 +1,338 @@
+"""
+Caching proxy for the Google APIs the browser calls per passage.
+
+nl-api.js (analyzeSyntax + analyzeEntities) and ocr-api.js (Vision
+images:annotate, then two Gemini generateContent passes) send the same
+passage text or worksheet image again for every student who reads it. The
+proxy forwards each call unchanged and keeps the response on disk under a
+hash of the request:
+
+  key = sha256(service, method, canonical JSON of the request body)
+
+The body holds the passage text or the base64 image, so the key is in
+effect a content hash; the API key is not part of it, so every client
+shares the cache. Only successful responses are stored: a 200 whose body
+has no error (Vision reports per-image failures as responses[i].error in a
+200) and, for Gemini, at least one candidate with content (a blocked prompt
+is a 200 with promptFeedback.blockReason and no content). Gemini calls are
+cached only when generationConfig.temperature is 0 (what ocr-api.js sends);
+other samples are forwarded every time. Concurrent identical requests wait for
+one upstream call instead of each making their own.
+
+Upstream base URLs come from ORF_NL_API_BASE / ORF_VISION_API_BASE /
+ORF_GEMINI_API_BASE, so the proxy can be pointed at the local stub server
+(`python google_proxy.py stub`). Requests without ?key= use the server's
+GOOGLE_API_KEY (NL, Vision) or GEMINI_API_KEY. The cache lives in
+ORF_PROXY_CACHE_DIR.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+UPSTREAM_TIMEOUT_S = 60
+MEMORY_CACHE_SIZE = 256
+
+CACHE_DIR = os.environ.get(
+    "ORF_PROXY_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "store", "google-cache"),
+)
+
+# service -> (base URL env var, default base, path template, key env var)
+SERVICES = {
+    "nl": ("ORF_NL_API_BASE", "https://language.googleapis.com", "/v1/documents:{method}", "GOOGLE_API_KEY"),
+    "vision": ("ORF_VISION_API_BASE", "https://vision.googleapis.com", "/v1/images:{method}", "GOOGLE_API_KEY"),
+    "gemini": ("ORF_GEMINI_API_BASE", "https://generativelanguage.googleapis.com",
+               "/v1beta/models/{method}", "GEMINI_API_KEY"),
+}
+METHODS = {
+    "nl": re.compile(r"^(analyzeSyntax|analyzeEntities)$"),
+    "vision": re.compile(r"^annotate$"),
+    "gemini": re.compile(r"^[\w.-]+:generateContent$"),
+}
+
+
+class ProxyError(Exception):
+    """Bad proxy request (unknown method, no API key) or unreachable upstream."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def cache_key(service, method, body):
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(f"{service}\n{method}\n{canonical}".encode()).hexdigest()
+
+
+def cacheable(service, body):
+    if service != "gemini":
+        return True
+    config = body.get("generationConfig") or body.get("generation_config") or {}
+    return config.get("temperature") == 0
+
+
+def cacheable_response(service, payload):
+    """True if a 200 body is a real result rather than an error or a blocked/empty generation."""
+    try:
+        body = json.loads(payload)
+    except ValueError:
+        return False
+    if not isinstance(body, dict) or body.get("error"):
+        return False
+    if service == "vision":
+        return not any(isinstance(r, dict) and r.get("error") for r in body.get("responses") or [])
+    if service == "gemini":
+        return any((c.get("content") or {}).get("parts") for c in body.get("candidates") or []
+                   if isinstance(c, dict))
+    return True
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+class ResponseCache:
+    """Response bodies on disk (<dir>/<aa>/<key>.json) behind a small in-memory LRU."""
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = root
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.json")
+
+    def get(self, key):
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                return value
+        try:
+            with open(self.path(key), "rb") as f:
+                value = f.read()
+        except FileNotFoundError:
+            return None
+        self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        os.replace(tmp, path)
+        self._remember(key, value)
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+
+    def stats(self):
+        entries = size = 0
+        for dirpath, _, files in os.walk(self.root):
+            for name in files:
+                if name.endswith(".json"):
+                    entries += 1
+                    size += os.path.getsize(os.path.join(dirpath, name))
+        return {"entries": entries, "bytes": size}
+
+
+# =============================================================================
+# Proxy
+# =============================================================================
+
+class GoogleProxy:
+    def __init__(self, cache=None):
+        self.cache = cache or ResponseCache()
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+    def _key_lock(self, key):
+        with self._inflight_lock:
+            lock, users = self._inflight.get(key, (threading.Lock(), 0))
+            self._inflight[key] = (lock, users + 1)
+            return lock
+
+    def _release(self, key):
+        with self._inflight_lock:
+            lock, users = self._inflight[key]
+            if users == 1:
+                del self._inflight[key]
+            else:
+                self._inflight[key] = (lock, users - 1)
+
+    def upstream_url(self, service, method, api_key):
+        base_env, default_base, path, key_env = SERVICES[service]
+        key = api_key or os.environ.get(key_env)
+        if not key:
+            raise ProxyError(400, f"No API key: pass ?key= or set {key_env} on the server")
+        base = os.environ.get(base_env, default_base).rstrip("/")
+        return f"{base}{path.format(method=method)}?key={urllib.parse.quote(key)}"
+
+    def forward(self, service, method, body, api_key=None):
+        """
+        Serve one API call, from the cache when possible.
+
+        Returns:
+            (HTTP status, response body bytes, "HIT" | "MISS" | "BYPASS")
+        """
+        if service not in SERVICES or not METHODS[service].match(method):
+            raise ProxyError(404, f"Unsupported {service} method {method!r}")
+        if not cacheable(service, body):
+            return (*self._call(service, method, body, api_key), "BYPASS")
+
+        key = cache_key(service, method, body)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return 200, cached, "HIT"
+        lock = self._key_lock(key)
+        try:
+            with lock:
+                cached = self.cache.get(key)  # filled while we waited
+                if cached is not None:
+                    return 200, cached, "HIT"
+                status, payload = self._call(service, method, body, api_key)
+                if status == 200 and cacheable_response(service, payload):
+                    self.cache.put(key, payload)
+                return status, payload, "MISS"
+        finally:
+            self._release(key)
+
+    def _call(self, service, method, body, api_key):
+        request = urllib.request.Request(
+            self.upstream_url(service, method, api_key), data=json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"}, method="POST")
+        try:
+            with urllib.request.urlopen(request, timeout=UPSTREAM_TIMEOUT_S) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+        except (urllib.error.URLError, TimeoutError) as e:
+            raise ProxyError(502, f"{service} upstream unreachable: {e}")
+
+
+_proxy = None
+_proxy_lock = threading.Lock()
+
+
+def get_proxy():
+    """Process-wide proxy, created on first use."""
+    global _proxy
+    with _proxy_lock:
+        if _proxy is None:
+            _proxy = GoogleProxy()
+            print(f"[google-proxy] cache {_proxy.cache.root}")
+        return _proxy
+
+
+# =============================================================================
+# Local stub server
+# =============================================================================
+
+STUB_ERROR_IMAGE = "U1RVQi1FUlJPUg=="  # base64 "STUB-ERROR"
+STUB_BLOCK_TEXT = "STUB-BLOCK"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Answers the proxied endpoints with fixed, well-formed payloads and counts
+    calls. Vision images whose content is STUB_ERROR_IMAGE get a per-image
+    error, and Gemini prompts containing STUB_BLOCK_TEXT a blocked response,
+    both with status 200 as Google sends them.
+    """
+
+    calls = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        path = urllib.parse.urlparse(self.path).path
+        type(self).calls += 1
+        if path.endswith(":analyzeSyntax"):
+            words = (body.get("document", {}).get("content") or "").split()
+            offset, tokens = 0, []
+            for word in words:
+                tokens.append({"text": {"content": word, "beginOffset": offset},
+                               "partOfSpeech": {"tag": "NOUN"}, "lemma": word.lower()})
+                offset += len(word) + 1
+            payload = {"tokens": tokens, "language": "en"}
+        elif path.endswith(":analyzeEntities"):
+            payload = {"entities": [], "language": "en"}
+        elif path.endswith("images:annotate"):
+            payload = {"responses": [
+                {"error": {"code": 3, "message": "Bad image data."}}
+                if (r.get("image") or {}).get("content") == STUB_ERROR_IMAGE
+                else {"fullTextAnnotation": {"text": "stub passage text", "pages": []}}
+                for r in body.get("requests") or [{}]]}
+        elif path.endswith(":generateContent"):
+            if STUB_BLOCK_TEXT in json.dumps(body.get("contents")):
+                payload = {"promptFeedback": {"blockReason": "SAFETY"}}
+            else:
+                payload = {"candidates": [{"content": {"parts": [{"text": "stub passage text"}], "role": "model"}}]}
+        else:
+            self.send_error(404)
+            return
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        print(f"[stub] call {type(self).calls}: {path}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def stub_server(port=0):
+    """The stub's server bound to localhost:port (0 = any free port); call serve_forever() to run it."""
+    return ThreadingHTTPServer(("127.0.0.1", port), _StubHandler)
+
+
+def run_stub(port):
+    """Serve the stub on localhost:port until interrupted."""
+    server = stub_server(port)
+    print(f"[stub] listening on http://127.0.0.1:{port} — set ORF_NL_API_BASE, ORF_VISION_API_BASE and "
+          f"ORF_GEMINI_API_BASE to this URL")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Google API caching proxy tools.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    stub = sub.add_parser("stub", help="Run a local stand-in for the NL, Vision and Gemini APIs")
+    stub.add_argument("--port", type=int, default=8790)
+
+    stats = sub.add_parser("stats", help="Report the response cache's size")
+    stats.add_argument("--cache-dir", default=CACHE_DIR)
+
+    args = parser.parse_args()
+    if args.command == "stub":
+        run_stub(args.port)
+    else:
+        s = ResponseCache(args.cache_dir).stats()
+        print(f"[google-proxy] {args.cache_dir}: {s['entries']} responses, {s['bytes'] / 1e6:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
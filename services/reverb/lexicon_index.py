@@ -0,0 +1,330 @@
+"""
+Compiled word lexicon: CMUdict phoneme counts + Dale–Chall familiarity.
+
+Build step and memory-mapped reader for data/lexicon.bin, a compact binary
+replacement for data/cmudict-phoneme-counts.json (1.5MB of JSON that has to
+be fully parsed before the first lookup) and data/dale-chall.json.
+
+File layout (little-endian):
+
+    header      48 bytes   magic "ORFLEX01", entry/block counts, section offsets
+    phonemes    u8[n]      CMUdict phoneme count, 0 = not in CMUdict
+    syllables   u8[n]      count_syllables() of the word, precomputed
+    flags       u8[n]      FLAG_* bits (Dale–Chall familiar, CMUdict present)
+    blocks      u32[b]     offset of each block in the string table
+    strings                sorted (UTF-8 byte order) words, front-coded in
+                           blocks of BLOCK_SIZE: the first word is stored as
+                           <len><bytes>, the rest as <shared prefix><len><suffix>
+
+Lookups binary-search the block heads, then decode at most BLOCK_SIZE - 1
+entries — no parse step, and the OS page cache shares the mapping across
+worker processes. js/phoneme-counter.js reads the same file in the browser.
+
+Usage:
+    python lexicon_index.py build [--cmudict PATH] [--dale-chall PATH] [--out PATH]
+    python lexicon_index.py bench [--index PATH]
+"""
+
+import argparse
+import bisect
+import functools
+import gzip
+import json
+import mmap
+import os
+import struct
+import time
+
+import numpy as np
+
+from syllable_counter import count_syllables
+
+MAGIC = b"ORFLEX01"
+BLOCK_SIZE = 16
+# Decoded blocks kept per reader; passage vocabulary is Zipfian, so a small
+# cache absorbs most repeat lookups.
+DECODED_BLOCK_CACHE = 2048
+# magic, n_entries, block_size, n_blocks, phonemes, syllables, flags, blocks, strings, strings_size
+_HEADER = struct.Struct("<8s9I")
+HEADER_SIZE = 48
+
+FLAG_DALE_CHALL = 0x01
+FLAG_CMUDICT = 0x02
+
+DATA_DIR = os.environ.get(
+    "ORF_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data"),
+)
+INDEX_PATH = os.path.join(DATA_DIR, "lexicon.bin")
+
+
+# =============================================================================
+# Build
+# =============================================================================
+
+def build_index(cmudict_counts: dict, dale_chall_words: list) -> bytes:
+    """
+    Compile word tables into the lexicon.bin byte layout.
+
+    Args:
+        cmudict_counts: {word: phoneme count} from cmudict-phoneme-counts.json
+        dale_chall_words: Dale–Chall familiar word list
+
+    Returns:
+        Serialized index
+    """
+    dale_chall = set(dale_chall_words)
+    words = sorted(set(cmudict_counts) | dale_chall, key=lambda w: w.encode("utf-8"))
+    n = len(words)
+
+    phonemes = np.zeros(n, dtype=np.uint8)
+    syllables = np.zeros(n, dtype=np.uint8)
+    flags = np.zeros(n, dtype=np.uint8)
+    for i, w in enumerate(words):
+        count = cmudict_counts.get(w)
+        if count is not None:
+            if not 0 < count < 256:
+                raise ValueError(f"Phoneme count out of range for {w!r}: {count}")
+            phonemes[i] = count
+            flags[i] |= FLAG_CMUDICT
+        if w in dale_chall:
+            flags[i] |= FLAG_DALE_CHALL
+        syllables[i] = min(count_syllables(w), 255)
+
+    strings = bytearray()
+    block_offsets = []
+    prev = b""
+    for i, w in enumerate(words):
+        raw = w.encode("utf-8")
+        if len(raw) > 255:
+            raise ValueError(f"Word too long for index: {w!r}")
+        if i % BLOCK_SIZE == 0:
+            block_offsets.append(len(strings))
+            strings.append(len(raw))
+            strings += raw
+        else:
+            shared = 0
+            limit = min(len(prev), len(raw))
+            while shared < limit and prev[shared] == raw[shared]:
+                shared += 1
+            strings.append(shared)
+            strings.append(len(raw) - shared)
+            strings += raw[shared:]
+        prev = raw
+
+    n_blocks = len(block_offsets)
+    off_phonemes = HEADER_SIZE
+    off_syllables = off_phonemes + n
+    off_flags = off_syllables + n
+    off_blocks = (off_flags + n + 3) & ~3
+    off_strings = off_blocks + 4 * n_blocks
+
+    out = bytearray(off_strings + len(strings))
+    _HEADER.pack_into(out, 0, MAGIC, n, BLOCK_SIZE, n_blocks, off_phonemes, off_syllables,
+                      off_flags, off_blocks, off_strings, len(strings))
+    out[off_phonemes:off_phonemes + n] = phonemes.tobytes()
+    out[off_syllables:off_syllables + n] = syllables.tobytes()
+    out[off_flags:off_flags + n] = flags.tobytes()
+    out[off_blocks:off_strings] = np.asarray(block_offsets, dtype="<u4").tobytes()
+    out[off_strings:] = strings
+    return bytes(out)
+
+
+def compile_files(cmudict_path: str, dale_chall_path: str, out_path: str) -> dict:
+    """Read the JSON sources, write the index, and return size stats."""
+    with open(cmudict_path, encoding="utf-8") as f:
+        counts = json.load(f)
+    with open(dale_chall_path, encoding="utf-8") as f:
+        dale_chall = json.load(f)
+    data = build_index(counts, dale_chall)
+    with open(out_path, "wb") as f:
+        f.write(data)
+    return {
+        "entries": len(set(counts) | set(dale_chall)),
+        "bytes": len(data),
+        "gzip_bytes": len(gzip.compress(data, 9)),
+        "json_bytes": os.path.getsize(cmudict_path) + os.path.getsize(dale_chall_path),
+    }
+
+
+# =============================================================================
+# Reader
+# =============================================================================
+
+class LexiconIndex:
+    """
+    Read-only, memory-mapped view of lexicon.bin.
+
+    Opening costs a header read. The first lookup decodes the block heads
+    (one word per BLOCK_SIZE) for bisection; each lookup after that decodes
+    only the block that can contain the word, through a bounded LRU.
+    """
+
+    def __init__(self, path: str = INDEX_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self.n_entries, self.block_size, self.n_blocks, off_ph, off_syl, off_flags,
+         off_blocks, self._strings, _) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a lexicon index: {path}")
+        n = self.n_entries
+        self.phonemes = np.frombuffer(self._mm, dtype=np.uint8, count=n, offset=off_ph)
+        self.syllables = np.frombuffer(self._mm, dtype=np.uint8, count=n, offset=off_syl)
+        self.flags = np.frombuffer(self._mm, dtype=np.uint8, count=n, offset=off_flags)
+        self._blocks = np.frombuffer(self._mm, dtype="<u4", count=self.n_blocks, offset=off_blocks)
+        self._heads = None
+        self._decoded = functools.lru_cache(maxsize=DECODED_BLOCK_CACHE)(self._decode_block)
+
+    def __len__(self):
+        return self.n_entries
+
+    def _block_heads(self):
+        # Benign race: concurrent first calls build identical lists
+        if self._heads is None:
+            mm = self._mm
+            offsets = (self._blocks.astype(np.int64) + self._strings).tolist()
+            self._heads = ([mm[off + 1:off + 1 + mm[off]] for off in offsets], offsets)
+        return self._heads
+
+    def find(self, word: str) -> int:
+        """Entry index of an exact word, or -1."""
+        key = word.encode("utf-8")
+        heads, _ = self._block_heads()
+        block = bisect.bisect_right(heads, key) - 1
+        if block < 0:
+            return -1
+        words = self._decoded(block)
+        i = bisect.bisect_left(words, key)
+        return block * self.block_size + i if i < len(words) and words[i] == key else -1
+
+    def _decode_block(self, block: int) -> list:
+        heads, offsets = self._block_heads()
+        start = block * self.block_size
+        count = min(self.block_size, self.n_entries - start)
+        end = offsets[block + 1] if block + 1 < self.n_blocks else len(self._mm)
+        data = self._mm[offsets[block]:end]
+        current = heads[block]
+        words = [current]
+        off = 1 + len(current)
+        for _ in range(count - 1):
+            shared, length = data[off], data[off + 1]
+            current = current[:shared] + data[off + 2:off + 2 + length]
+            words.append(current)
+            off += 2 + length
+        return words
+
+    def phoneme_count(self, word: str):
+        """CMUdict phoneme count, or None when the word has no CMUdict entry."""
+        i = self.find(word)
+        return int(self.phonemes[i]) if i >= 0 and self.flags[i] & FLAG_CMUDICT else None
+
+    def is_dale_chall(self, word: str) -> bool:
+        """True if the word is on the Dale–Chall familiar list."""
+        i = self.find(word)
+        return i >= 0 and bool(self.flags[i] & FLAG_DALE_CHALL)
+
+    def iter_entries(self):
+        """Yield (index, word) for every entry in sorted order."""
+        mm = self._mm
+        off = self._strings
+        current = b""
+        for i in range(self.n_entries):
+            if i % self.block_size == 0:
+                length = mm[off]
+                current = mm[off + 1:off + 1 + length]
+                off += 1 + length
+            else:
+                shared, length = mm[off], mm[off + 1]
+                current = current[:shared] + mm[off + 2:off + 2 + length]
+                off += 2 + length
+            yield i, current.decode("utf-8")
+
+    def close(self):
+        # numpy views hold buffer exports; drop them before unmapping
+        self.phonemes = self.syllables = self.flags = self._blocks = None
+        self._heads = None
+        self._decoded.cache_clear()
+        self._mm.close()
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _bench(index_path: str, cmudict_path: str, rounds: int = 200_000):
+    """Compare load + lookup cost of the JSON dict against the mapped index."""
+    import random
+
+    t0 = time.perf_counter()
+    with open(cmudict_path, encoding="utf-8") as f:
+        table = json.load(f)
+    json_load = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    index = LexiconIndex(index_path)
+    index_open = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    index.phoneme_count("reading")
+    first_lookup = time.perf_counter() - t0
+
+    rng = random.Random(0)
+    words = list(table)
+    # Uniform draws over the whole dictionary defeat the block cache (worst
+    # case); a 2,000-word vocabulary is closer to scoring a passage library.
+    vocabulary = rng.sample(words, 2000)
+    workloads = {
+        "uniform": [rng.choice(words) if rng.random() < 0.9 else rng.choice(words) + "zq"
+                    for _ in range(rounds)],
+        "2k vocab": [rng.choice(vocabulary) for _ in range(rounds)],
+    }
+
+    timings = {}
+    for name, queries in workloads.items():
+        t0 = time.perf_counter()
+        for q in queries:
+            table.get(q)
+        dict_lookup = (time.perf_counter() - t0) / rounds
+        t0 = time.perf_counter()
+        for q in queries:
+            index.phoneme_count(q)
+        timings[name] = (dict_lookup, (time.perf_counter() - t0) / rounds)
+
+    mismatches = sum(index.phoneme_count(w) != c for w, c in table.items())
+
+    print(f"{'':24}{'JSON + dict':>14}{'lexicon.bin':>14}")
+    print(f"{'file size (KB)':24}{os.path.getsize(cmudict_path) / 1024:>14.0f}"
+          f"{os.path.getsize(index_path) / 1024:>14.0f}")
+    print(f"{'load (ms)':24}{json_load * 1e3:>14.2f}{index_open * 1e3:>14.3f}")
+    print(f"{'first lookup (ms)':24}{'-':>14}{first_lookup * 1e3:>14.3f}")
+    for name, (dict_lookup, index_lookup) in timings.items():
+        label = f"lookup, {name} (us)"
+        print(f"{label:24}{dict_lookup * 1e6:>14.3f}{index_lookup * 1e6:>14.3f}")
+    print(f"verified {len(table)} entries, {mismatches} mismatches")
+    index.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or benchmark the compiled word lexicon.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Compile JSON word tables into lexicon.bin")
+    build.add_argument("--cmudict", default=os.path.join(DATA_DIR, "cmudict-phoneme-counts.json"))
+    build.add_argument("--dale-chall", default=os.path.join(DATA_DIR, "dale-chall.json"))
+    build.add_argument("--out", default=INDEX_PATH)
+
+    bench = sub.add_parser("bench", help="Load/lookup benchmark against the JSON dict")
+    bench.add_argument("--index", default=INDEX_PATH)
+    bench.add_argument("--cmudict", default=os.path.join(DATA_DIR, "cmudict-phoneme-counts.json"))
+
+    args = parser.parse_args()
+    if args.command == "build":
+        stats = compile_files(args.cmudict, args.dale_chall, args.out)
+        print(f"[lexicon] {stats['entries']} entries -> {args.out}: {stats['bytes']} bytes "
+              f"({stats['gzip_bytes']} gzipped; JSON sources {stats['json_bytes']} bytes)")
+    else:
+        _bench(args.index, args.cmudict)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,715 @@
+"""
+Server-side maze round generation with precomputed distractor indexes.
+
+Python port of js/maze-generator.js. Sentence extraction, target selection
+and option shuffling follow the JS rules exactly (same mulberry32 seeding,
+so a given seed produces the same option order as the browser). Distractor
+choice is driven by a per-passage DistractorIndex built once and shared
+across students:
+
+  - every candidate content word, the sentences it occurs in and its POS
+  - CMUdict phoneme counts (lexicon index, syllable fallback)
+  - the full pairwise Levenshtein similarity matrix over candidates
+
+Distractors must still pass the JS quality guards (not a homophone, ratio
+< 0.7 to the target); among valid candidates those within
+PHONEME_TOLERANCE phonemes of the target are preferred, so options are
+similar in spoken length. Selection uses a seeded PRNG instead of
+Math.random(), so a (passage, difficulty, seed) triple always yields the
+same rounds and can be cached.
+
+Each item also carries "keyterms" for /deepgram-maze: the three options
+plus their homophones, which verifyMazeResponse() accepts as matches.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from alignment import _encode, pairwise_levenshtein
+from phoneme_counter import get_phoneme_count_with_fallback
+
+MIN_DISTRACTOR_DISSIMILARITY = 0.7   # levenshteinRatio >= this is too close to the target
+PHONEME_TOLERANCE = 2                # Preferred |phonemes(distractor) - phonemes(target)|
+INDEX_CACHE_SIZE = 512
+ROUND_CACHE_SIZE = 4096
+
+# ── Constants (kept in lockstep with js/maze-generator.js) ──
+
+SIGHT_WORDS = frozenset([
+    'the', 'of', 'and', 'a', 'to', 'in', 'is', 'you', 'that', 'it', 'he', 'was', 'for', 'on', 'are',
+    'as', 'with', 'his', 'they', 'i', 'at', 'be', 'this', 'have', 'from', 'or', 'one', 'had', 'by',
+    'but', 'not', 'what', 'all', 'were', 'we', 'when', 'your', 'can', 'said', 'there', 'each',
+    'which', 'she', 'do', 'how', 'their', 'if', 'will', 'up', 'other', 'about', 'out', 'many',
+    'then', 'them', 'these', 'so', 'some', 'her', 'would', 'make', 'like', 'him', 'into', 'time',
+    'has', 'look', 'two', 'more', 'write', 'go', 'see', 'number', 'no', 'way', 'could', 'people',
+    'my', 'than', 'first', 'water', 'been', 'call', 'who', 'oil', 'its', 'now', 'find', 'long',
+    'down', 'day', 'did', 'get', 'come', 'made', 'may', 'part', 'over', 'new', 'after', 'also',
+    'back', 'use', 'an', 'just', 'know', 'take', 'came', 'work', 'three', 'word', 'must', 'because',
+    'does', 'still', 'well', 'should', 'here', 'big', 'high', 'every', 'near', 'add', 'food',
+    'between', 'own', 'below', 'country', 'last', 'school', 'father', 'keep', 'tree', 'never',
+    'start', 'city', 'earth', 'eye', 'light', 'thought', 'head', 'under', 'story', 'saw', 'far',
+    'left', 'few', 'while', 'along', 'might', 'close', 'something', 'seem', 'next', 'hard',
+    'open', 'example', 'begin', 'life', 'always', 'those', 'both', 'paper', 'together', 'got',
+    'group', 'often', 'run', 'important', 'until', 'children', 'side', 'feet', 'car', 'mile',
+    'night', 'walk', 'white', 'sea', 'began', 'grow', 'took', 'river', 'four', 'carry', 'state',
+    'once', 'book', 'hear', 'stop', 'without', 'second', 'late', 'miss', 'idea', 'enough', 'eat',
+    'face', 'watch', 'far', 'really', 'almost', 'let', 'above', 'girl', 'sometimes', 'mountain',
+    'cut', 'young', 'talk', 'soon', 'list', 'song', 'being', 'leave', 'family', 'am', 'old',
+    'red', 'blue', 'green', 'little', 'yes', 'good', 'any', 'help', 'tell', 'boy', 'house',
+    'give', 'very', 'much', 'before', 'right', 'too', 'mean', 'same', 'where', 'think', 'say',
+    'great', 'small', 'end', 'put', 'hand', 'large', 'spell', 'air', 'away', 'animal', 'again',
+    'play', 'why', 'went', 'read', 'need', 'land', 'different', 'home', 'us', 'move', 'try',
+    'kind', 'off', 'turn', 'round', 'man', 'want', 'show', 'form', 'set', 'change', 'point',
+    'such', 'place', 'only', 'through', 'much', 'line', 'just', 'name', 'say', 'great', 'where',
+    'most', 'than',
+])
+
+FUNCTION_WORDS = frozenset([
+    'a', 'an', 'the',
+    'i', 'me', 'my', 'mine', 'myself', 'you', 'your', 'yours', 'yourself',
+    'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 'herself',
+    'it', 'its', 'itself', 'we', 'us', 'our', 'ours', 'ourselves',
+    'they', 'them', 'their', 'theirs', 'themselves',
+    'this', 'that', 'these', 'those', 'who', 'whom', 'whose', 'which', 'what',
+    'in', 'on', 'at', 'to', 'for', 'with', 'by', 'from', 'of', 'about',
+    'into', 'through', 'during', 'before', 'after', 'above', 'below',
+    'between', 'under', 'over', 'up', 'down', 'out', 'off', 'near', 'around',
+    'and', 'but', 'or', 'nor', 'for', 'yet', 'so', 'because', 'although',
+    'while', 'if', 'when', 'since', 'until', 'unless', 'though', 'whereas',
+    'is', 'am', 'are', 'was', 'were', 'be', 'been', 'being',
+    'has', 'have', 'had', 'do', 'does', 'did',
+    'will', 'would', 'shall', 'should', 'may', 'might', 'can', 'could', 'must',
+    'not', 'no', 'very', 'too', 'also', 'just', 'only', 'than', 'then',
+    'as', 'so', 'such',
+])
+
+HOMOPHONE_GROUPS = [
+    ['their', 'there', "they're"],
+    ['to', 'too', 'two'],
+    ['your', "you're"],
+    ['its', "it's"],
+    ['hear', 'here'],
+    ['write', 'right'],
+    ['no', 'know'],
+    ['new', 'knew'],
+    ['one', 'won'],
+    ['see', 'sea'],
+    ['would', 'wood'],
+    ['flower', 'flour'],
+    ['bear', 'bare'],
+    ['peace', 'piece'],
+    ['wear', 'where'],
+    ['son', 'sun'],
+    ['rode', 'road'],
+    ['tale', 'tail'],
+    ['meet', 'meat'],
+    ['break', 'brake'],
+]
+
+BUILTIN_DISTRACTORS = {
+    'NOUN': ['banana', 'mountain', 'pocket', 'blanket', 'garden', 'window', 'basket', 'dragon', 'pillow', 'forest'],
+    'VERB': ['whispered', 'crawled', 'bounced', 'melted', 'folded', 'twisted', 'scattered', 'wobbled', 'tumbled', 'drifted'],
+    'ADJ': ['purple', 'fuzzy', 'enormous', 'tiny', 'wooden', 'golden', 'crooked', 'slippery', 'hollow', 'dusty'],
+    'ADV': ['slowly', 'loudly', 'carefully', 'silently', 'gently', 'suddenly', 'bravely', 'eagerly', 'calmly', 'fiercely'],
+    'DEFAULT': ['banana', 'purple', 'whispered', 'slowly', 'garden', 'enormous', 'crawled', 'carefully'],
+}
+
+DIFFICULTY_PROFILES = {
+    'easy': {
+        'preferRepeatedWords': True,
+        'allowAdverbs': False,
+        'minWordLength': 3,
+        'maxWordLength': 7,
+        'positionPreference': 'mid',
+        'sightWordBonus': 3,
+        'distractorSource': 'different_pos',
+    },
+    'standard': {
+        'preferRepeatedWords': False,
+        'allowAdverbs': False,
+        'minWordLength': 3,
+        'maxWordLength': 10,
+        'positionPreference': 'any',
+        'sightWordBonus': 1,
+        'distractorSource': 'mixed',
+    },
+    'challenge': {
+        'preferRepeatedWords': False,
+        'allowAdverbs': True,
+        'minWordLength': 4,
+        'maxWordLength': 15,
+        'positionPreference': 'any',
+        'sightWordBonus': -1,
+        'distractorSource': 'same_pos',
+    },
+}
+
+ABBREVIATIONS = [
+    'Mr', 'Mrs', 'Ms', 'Dr', 'Jr', 'Sr', 'St', 'Ave', 'Blvd',
+    'Prof', 'Gen', 'Gov', 'Sgt', 'Cpl', 'Pvt', 'Lt', 'Capt',
+    'Col', 'Maj', 'Rev', 'Vol', 'Dept', 'Est', 'Fig', 'vs',
+]
+
+# JS regex \w, \d and \b are ASCII-only; re.ASCII keeps Python in agreement.
+_EDGE_PUNCT = re.compile(r"^[^\w'-]+|[^\w'-]+$", re.ASCII)
+_WHITESPACE = re.compile(r'\s+')
+_DIGITS = re.compile(r'^\d+$', re.ASCII)
+_CONTRACTION = re.compile(r"'\w", re.ASCII)
+_CAPITALIZED = re.compile(r'^[A-Z]')
+_ABBREVIATION_PERIODS = [(re.compile(rf'\b{a}\.', re.ASCII), f'{a}\u00A7') for a in ABBREVIATIONS]
+_DECIMAL = re.compile(r'(\d)\.(\d)', re.ASCII)
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z"\u201C]|$)')
+_CLAUSE_SPLIT = re.compile(r',\s+|;\s+|:\s+|\s+—\s+|\s+-\s+')
+
+_HOMOPHONES = {w: frozenset(group) for group in HOMOPHONE_GROUPS for w in group}
+
+_M32 = 0xFFFFFFFF
+
+
+# =============================================================================
+# Utilities
+# =============================================================================
+
+def clean_word(w: str) -> str:
+    return _EDGE_PUNCT.sub('', w).lower()
+
+
+def _words(text: str) -> list:
+    """text.split(/\\s+/) — keeps the leading '' JS produces for leading whitespace."""
+    return _WHITESPACE.split(text)
+
+
+def are_homophones(word_a: str, word_b: str) -> bool:
+    a, b = word_a.lower(), word_b.lower()
+    return a == b or b in _HOMOPHONES.get(a, ())
+
+
+def _imul(a: int, b: int) -> int:
+    return (a * b) & _M32
+
+
+def seeded_random(seed: int):
+    """mulberry32, bit-identical to seededRandom() in maze-generator.js."""
+    t = seed & _M32
+
+    def rng():
+        nonlocal t
+        t = (t + 0x6D2B79F5) & _M32
+        r = _imul(t ^ (t >> 15), 1 | t)
+        r = ((r + _imul(r ^ (r >> 7), 61 | r)) & _M32) ^ r
+        return (r ^ (r >> 14)) / 4294967296
+
+    return rng
+
+
+def hash_string(s: str) -> int:
+    """hashString() from maze-generator.js (31x rolling hash over UTF-16 units)."""
+    h = 0
+    units = s.encode('utf-16-le')
+    for k in range(0, len(units), 2):
+        h = (((h << 5) - h) + (units[k] | units[k + 1] << 8)) & _M32
+    if h >= 0x80000000:
+        h -= 0x100000000
+    return abs(h)
+
+
+def seeded_shuffle(array: list, seed: int) -> list:
+    arr = list(array)
+    rng = seeded_random(seed)
+    for i in range(len(arr) - 1, 0, -1):
+        j = int(rng() * (i + 1))
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+def _annotation_index(nl_annotations):
+    """
+    Word-level lookups over NL annotations, or None when there are none.
+
+    getWordPOS() returns the first annotation for the word that has a POS;
+    getWordTier() returns the tier of the first annotation for the word.
+    """
+    if not isinstance(nl_annotations, list):
+        return None
+    pos, tier = {}, {}
+    for ann in nl_annotations:
+        word = ann.get('word') if isinstance(ann, dict) else None
+        if not word:
+            continue
+        lower = word.lower()
+        tier.setdefault(lower, ann.get('tier') or None)
+        if ann.get('pos'):
+            pos.setdefault(lower, ann['pos'])
+    return {'pos': pos, 'tier': tier}
+
+
+def _word_pos(word: str, annotations):
+    return annotations['pos'].get(word.lower()) if annotations is not None else None
+
+
+def _word_tier(word: str, annotations):
+    return annotations['tier'].get(word.lower()) if annotations is not None else None
+
+
+def count_word_in_passage(word: str, passage_text: str) -> int:
+    lower = word.lower()
+    return sum(1 for w in _words(passage_text.lower()) if clean_word(w) == lower)
+
+
+# =============================================================================
+# Sentence / clause extraction
+# =============================================================================
+
+def split_into_sentences(passage_text: str) -> list:
+    text = passage_text
+    for pattern, placeholder in _ABBREVIATION_PERIODS:
+        text = pattern.sub(placeholder, text)
+    text = _DECIMAL.sub('\\1\u00A7\\2', text)
+    text = text.replace('...', '\u2026')
+
+    raw = _SENTENCE_SPLIT.split(text)
+    sentences = [s.replace('\u00A7', '.').replace('\u2026', '...').strip() for s in raw]
+    sentences = [s for s in sentences if s and len(_words(s)) >= 4]
+
+    # Fallback for one long sentence: clause-level splitting
+    if len(sentences) < 3:
+        clauses = split_into_clauses(passage_text)
+        if len(clauses) > len(sentences):
+            return clauses
+    return sentences
+
+
+def split_into_clauses(passage_text: str) -> list:
+    clauses = (c.strip() for c in _CLAUSE_SPLIT.split(passage_text))
+    return [c for c in clauses if c and len(_words(c)) >= 4]
+
+
+def can_run_maze(passage_text: str) -> bool:
+    """canRunMaze(): 15+ words and at least one usable segment."""
+    if not passage_text:
+        return False
+    if len(_words(passage_text.strip())) < 15:
+        return False
+    return len(split_into_sentences(passage_text)) >= 1
+
+
+# =============================================================================
+# Sentence scoring & target selection
+# =============================================================================
+
+def score_sentence(sentence: str, sent_idx: int) -> int:
+    words = _words(sentence)
+    score = 0
+    if 5 <= len(words) <= 15:
+        score += 2
+    elif len(words) == 4:
+        score += 1
+    elif len(words) < 4:
+        score -= 10
+
+    content = sum(1 for w in words if len(clean_word(w)) >= 3 and clean_word(w) not in FUNCTION_WORDS)
+    if content >= 2:
+        score += 2
+    if sent_idx > 0:
+        score += 1
+    return score
+
+
+def select_with_spread(scores: list, target_count: int) -> list:
+    n = len(scores)
+    if n <= target_count:
+        return list(range(n))
+
+    zone_size = -(-n // target_count)
+    selected = []
+    for z in range(target_count):
+        start = z * zone_size
+        end = min(start + zone_size, n)
+        if start < end:
+            best = max(range(start, end), key=lambda i: (scores[i], -i))
+            selected.append(best)
+
+    while len(selected) < target_count and len(selected) < n:
+        unused = [i for i in range(n) if i not in selected]
+        if not unused:
+            break
+        selected.append(max(unused, key=lambda i: (scores[i], -i)))
+
+    return sorted(selected)
+
+
+def _is_eligible_target(word, word_idx, n_words, annotations, profile) -> bool:
+    clean = clean_word(word)
+    if len(clean) < profile['minWordLength'] or len(clean) > profile['maxWordLength']:
+        return False
+    if clean in FUNCTION_WORDS or _DIGITS.match(clean) or _CONTRACTION.search(clean):
+        return False
+
+    if annotations is not None:
+        pos = _word_pos(clean, annotations)
+        tier = _word_tier(clean, annotations)
+        if tier in ('proper', 'function') or pos == 'NUM':
+            return False
+        if pos and pos not in ('NOUN', 'VERB', 'ADJ', 'ADV'):
+            return False
+        if pos == 'ADV' and not profile['allowAdverbs']:
+            return False
+    elif word_idx > 0 and _CAPITALIZED.match(word) and len(clean) >= 2:
+        # Mid-sentence capitalized -> likely proper noun
+        return False
+
+    if profile['positionPreference'] == 'mid' and word_idx in (0, n_words - 1):
+        return False
+    return True
+
+
+def _score_candidate(word, word_idx, n_words, passage_text, annotations, profile) -> int:
+    clean = clean_word(word)
+    score = 0
+    repeats = count_word_in_passage(clean, passage_text)
+    if repeats >= 2:
+        score += 3
+
+    if 0 < word_idx < n_words - 1:
+        score += 2
+    elif word_idx == n_words - 1:
+        score += 1
+    else:
+        score -= 2
+
+    if 4 <= len(clean) <= 8:
+        score += 1
+    if clean in SIGHT_WORDS:
+        score += profile['sightWordBonus']
+    elif len(clean) > 6:
+        score -= 1
+
+    if annotations is not None:
+        pos = _word_pos(clean, annotations)
+        if pos == 'NOUN':
+            score += 2
+        elif pos in ('VERB', 'ADJ'):
+            score += 1
+
+    if profile['preferRepeatedWords'] and repeats < 2:
+        score -= 2
+    return score
+
+
+def select_target_word(sentence, passage_text, annotations, profile):
+    words = _words(sentence)
+    best_word, best_score, best_idx = None, float('-inf'), -1
+    half = len(words) / 2
+
+    for i, w in enumerate(words):
+        if not _is_eligible_target(w, i, len(words), annotations, profile):
+            continue
+        score = _score_candidate(w, i, len(words), passage_text, annotations, profile)
+        center_dist = abs(i - half)
+        if score - center_dist * 0.01 > best_score:
+            if score > best_score or (score == best_score and center_dist < abs(best_idx - half)):
+                best_word, best_score, best_idx = w, score, i
+
+    return {'word': best_word, 'index': best_idx, 'score': best_score} if best_word else None
+
+
+# =============================================================================
+# Distractor index
+# =============================================================================
+
+class DistractorIndex:
+    """
+    Per-passage distractor candidates, built once and shared by every round.
+
+    Candidates are the unique cleaned content words of the passage (length
+    >= 3, not a function word, number or contraction), in first-occurrence
+    order. Alongside each word the index stores the set of sentences it
+    occurs in, its POS, its phoneme count and its Levenshtein similarity to
+    every other candidate.
+    """
+
+    def __init__(self, passage_text: str, nl_annotations=None):
+        self.passage_text = passage_text
+        self.annotations = _annotation_index(nl_annotations)
+        self.sentences = split_into_sentences(passage_text)
+
+        words, sentence_sets = [], []
+        position = {}
+        for s, sentence in enumerate(self.sentences):
+            for w in _words(sentence):
+                clean = clean_word(w)
+                if (len(clean) < 3 or clean in FUNCTION_WORDS
+                        or _DIGITS.match(clean) or _CONTRACTION.search(clean)):
+                    continue
+                k = position.get(clean)
+                if k is None:
+                    position[clean] = k = len(words)
+                    words.append(clean)
+                    sentence_sets.append(set())
+                sentence_sets[k].add(s)
+
+        self.words = words
+        self.position = position
+        self.sentence_sets = sentence_sets
+        self.pos = [_word_pos(w, self.annotations) for w in words]
+        self.phonemes = np.array([get_phoneme_count_with_fallback(w)['count'] for w in words],
+                                 dtype=np.int64)
+        self.similarity = self._similarity_matrix(words)
+
+    @staticmethod
+    def _similarity_matrix(words: list) -> np.ndarray:
+        n = len(words)
+        sim = np.eye(n, dtype=np.float64)
+        if n < 2:
+            return sim
+        codes, lens = _encode(words)
+        ia, ib = np.triu_indices(n, 1)
+        dist = pairwise_levenshtein(codes[ia], lens[ia], codes[ib], lens[ib])
+        ratio = 1 - dist / np.maximum(lens[ia], lens[ib])
+        sim[ia, ib] = ratio
+        sim[ib, ia] = ratio
+        return sim
+
+    def valid_pool(self, target: str, target_sent_idx: int) -> list:
+        """
+        Candidate ids usable as distractors for a target in a given sentence.
+
+        Mirrors generateDistractors(): words from other sentences, excluding
+        the target itself, its homophones and anything with levenshteinRatio
+        >= MIN_DISTRACTOR_DISSIMILARITY.
+        """
+        t = self.position.get(target)
+        ids = []
+        for k, sents in enumerate(self.sentence_sets):
+            if k == t or not (sents - {target_sent_idx}):
+                continue
+            if are_homophones(self.words[k], target):
+                continue
+            ids.append(k)
+        if not ids:
+            return ids
+        if t is not None:
+            ratios = self.similarity[t, ids]
+        else:
+            codes, lens = _encode([target] + [self.words[k] for k in ids])
+            dist = pairwise_levenshtein(np.repeat(codes[:1], len(ids), axis=0),
+                                        np.repeat(lens[:1], len(ids)), codes[1:], lens[1:])
+            ratios = 1 - dist / np.maximum(lens[0], lens[1:])
+        return [k for k, r in zip(ids, ratios.tolist()) if r < MIN_DISTRACTOR_DISSIMILARITY]
+
+    def target_phonemes(self, target: str) -> int:
+        t = self.position.get(target)
+        if t is not None:
+            return int(self.phonemes[t])
+        return get_phoneme_count_with_fallback(target)['count']
+
+
+def _pick(ids, index: DistractorIndex, target_phonemes: int, rng):
+    """Seeded pick, preferring candidates close to the target's phoneme count."""
+    if not ids:
+        return None
+    near = [k for k in ids if abs(int(index.phonemes[k]) - target_phonemes) <= PHONEME_TOLERANCE]
+    pool = near or ids
+    return pool[int(rng() * len(pool))]
+
+
+def _pick_builtin(pos, exclude: str, rng) -> str:
+    pool = BUILTIN_DISTRACTORS.get(pos) or BUILTIN_DISTRACTORS['DEFAULT']
+    filtered = [w for w in pool if w.lower() != exclude.lower()]
+    return filtered[int(rng() * len(filtered))] if filtered else pool[0]
+
+
+def generate_distractors(index: DistractorIndex, target_word: str, target_sent_idx: int,
+                         profile: dict, rng) -> list:
+    target = clean_word(target_word)
+    target_pos = _word_pos(target, index.annotations)
+    target_ph = index.target_phonemes(target)
+    valid = index.valid_pool(target, target_sent_idx)
+    pos = index.pos
+
+    def pick(ids):
+        return _pick(ids, index, target_ph, rng)
+
+    def without(ids, k):
+        return [i for i in ids if i != k]
+
+    source = profile['distractorSource']
+    if source == 'same_pos':
+        same = [k for k in valid if pos[k] == target_pos] if target_pos else valid
+        a = pick(same)
+        if a is None:
+            a = pick(valid)
+        b = pick(without(same, a))
+        if b is None:
+            b = pick(without(valid, a))
+    elif source == 'different_pos':
+        diff = [k for k in valid if pos[k] and pos[k] != target_pos] if target_pos else valid
+        a = pick(diff)
+        if a is None:
+            a = pick(valid)
+        b = pick(without(diff, a))
+        if b is None:
+            b = pick(without(valid, a))
+    else:
+        if target_pos:
+            a = pick([k for k in valid if pos[k] == target_pos])
+            if a is None:
+                a = pick(valid)
+        else:
+            a = pick(valid)
+        remaining = without(valid, a)
+        if target_pos:
+            b = pick([k for k in remaining if pos[k] != target_pos])
+            if b is None:
+                b = pick(remaining)
+        else:
+            b = pick(remaining)
+
+    word_a = index.words[a] if a is not None else _pick_builtin(target_pos, target, rng)
+    word_b = (index.words[b] if b is not None
+              else _pick_builtin('VERB' if target_pos == 'NOUN' else 'NOUN', target, rng))
+    if word_a == word_b:
+        word_b = _pick_builtin('DEFAULT', word_a, rng)
+    return [word_a, word_b]
+
+
+def keyterms_for(options: list) -> list:
+    """Options plus their homophones, deduplicated, for Deepgram keyterm boosting."""
+    terms = []
+    for option in options:
+        for term in [option, *sorted(_HOMOPHONES.get(option.lower(), ()))]:
+            if term not in terms:
+                terms.append(term)
+    return terms
+
+
+# =============================================================================
+# Caches
+# =============================================================================
+
+_index_cache = OrderedDict()
+_round_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(cache: OrderedDict, key):
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict, key, value, limit: int):
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+
+def _passage_key(passage_text: str, nl_annotations) -> str:
+    payload = json.dumps([passage_text, nl_annotations], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def get_distractor_index(passage_text: str, nl_annotations=None) -> DistractorIndex:
+    """DistractorIndex for a passage, built on first use and cached by content hash."""
+    key = _passage_key(passage_text, nl_annotations)
+    index = _cache_get(_index_cache, key)
+    if index is None:
+        index = DistractorIndex(passage_text, nl_annotations)
+        _cache_put(_index_cache, key, index, INDEX_CACHE_SIZE)
+    return index
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+def generate_maze_items(passage_text: str, nl_annotations=None, difficulty: str = 'standard',
+                        seed: str = None) -> dict:
+    """
+    Generate maze rounds for a passage.
+
+    Args:
+        passage_text: The full passage text
+        nl_annotations: NL API per-word annotations (word/pos/tier) or None
+        difficulty: 'easy' | 'standard' | 'challenge'
+        seed: Seed for deterministic output (e.g. assessment ID); without one
+              the current time is used, as in the browser
+
+    Returns:
+        {"maze_id": str, "items": [...]} — items have the same fields as
+        generateMazeItems() plus "keyterms". maze_id resolves the rounds
+        later via get_maze_items().
+    """
+    profile = DIFFICULTY_PROFILES.get(difficulty) or DIFFICULTY_PROFILES['standard']
+    seed_num = hash_string(seed) if seed else int(time.time() * 1000)
+    passage_key = _passage_key(passage_text, nl_annotations)
+    maze_id = hashlib.sha1(f"{passage_key}:{difficulty}:{seed_num}".encode()).hexdigest()
+
+    cached = _cache_get(_round_cache, maze_id)
+    if cached is not None:
+        return {"maze_id": maze_id, "items": cached}
+
+    index = get_distractor_index(passage_text, nl_annotations)
+    sentences = index.sentences
+    items = []
+    if sentences:
+        n = len(sentences)
+        target_count = min(3, n) if n <= 4 else min(5, n) if n <= 8 else min(8, n)
+        scores = [score_sentence(s, i) for i, s in enumerate(sentences)]
+        candidates = select_with_spread(scores, min(n, target_count * 2))
+        used_targets = set()
+
+        for idx in candidates:
+            if len(items) >= target_count:
+                break
+            sent = sentences[idx]
+            target = select_target_word(sent, passage_text, index.annotations, profile)
+            if not target:
+                continue
+            clean_target = clean_word(target['word'])
+            if clean_target in used_targets:
+                continue
+            used_targets.add(clean_target)
+
+            item_seed = seed_num + len(items) * 7919
+            d1, d2 = generate_distractors(index, target['word'], idx, profile,
+                                          seeded_random(item_seed ^ 0x5BD1E995))
+
+            words = _words(sent)
+            blank = list(words)
+            blank[target['index']] = '________'
+            options = [clean_target, d1, d2]
+            shuffled = seeded_shuffle(options, item_seed)
+
+            items.append({
+                'sentence': sent,
+                'blankSentence': ' '.join(blank),
+                'contextBefore': sentences[idx - 1] if idx > 0 else '',
+                'contextAfter': sentences[idx + 1] if idx < n - 1 else '',
+                'targetWord': clean_target,
+                'targetIndex': target['index'],
+                'sentenceIndex': idx,
+                'score': target['score'],
+                'options': options,
+                'shuffledOptions': shuffled,
+                'correctShuffledIndex': shuffled.index(clean_target),
+                'keyterms': keyterms_for(shuffled),
+            })
+
+    _cache_put(_round_cache, maze_id, items, ROUND_CACHE_SIZE)
+    return {"maze_id": maze_id, "items": items}
+
+
+def get_maze_items(maze_id: str):
+    """Previously generated rounds for a maze_id, or None if evicted/unknown."""
+    return _cache_get(_round_cache, maze_id)
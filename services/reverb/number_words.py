@@ -0,0 +1,269 @@
+"""
+Algorithmic number-to-words converter for server-side alignment.
+
+Python port of js/number-words.js. When a reading passage contains digits
+like "2014", readers naturally say "twenty fourteen" or "two thousand
+fourteen". These functions generate all valid spoken forms so the alignment
+engine can recognize them as correct.
+
+Coverage: integers 0–999,999 and decimals (e.g., "3.3", "2.5").
+Form order matches the JS module (first-generated first, duplicates dropped).
+"""
+
+ONES = ['', 'one', 'two', 'three', 'four', 'five', 'six', 'seven',
+        'eight', 'nine', 'ten', 'eleven', 'twelve', 'thirteen', 'fourteen',
+        'fifteen', 'sixteen', 'seventeen', 'eighteen', 'nineteen']
+
+TENS = ['', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty',
+        'seventy', 'eighty', 'ninety']
+
+ORDINAL_ONES = ['', 'first', 'second', 'third', 'fourth', 'fifth',
+                'sixth', 'seventh', 'eighth', 'ninth', 'tenth', 'eleventh',
+                'twelfth', 'thirteenth', 'fourteenth', 'fifteenth', 'sixteenth',
+                'seventeenth', 'eighteenth', 'nineteenth']
+
+ORDINAL_TENS = ['', '', 'twentieth', 'thirtieth', 'fortieth', 'fiftieth',
+                'sixtieth', 'seventieth', 'eightieth', 'ninetieth']
+
+
+class _Forms:
+    """Ordered, de-duplicated collection of word arrays (JS Set of JSON keys)."""
+
+    def __init__(self):
+        self._forms = {}
+
+    def add(self, words):
+        if words:
+            self._forms.setdefault(tuple(words), None)
+
+    def to_list(self):
+        return [list(f) for f in self._forms]
+
+
+def _parse_int(num_str: str):
+    """parseInt(numStr, 10) semantics for digit strings."""
+    digits = ''
+    for ch in num_str.strip():
+        if not ch.isdigit():
+            break
+        digits += ch
+    return int(digits) if digits else None
+
+
+def two_digit_words(n: int) -> list:
+    """Word form of 0–99: [] for 0, one word for 1–19, up to two for 21–99."""
+    if n == 0:
+        return []
+    if n < 20:
+        return [ONES[n]]
+    t, o = divmod(n, 10)
+    if o == 0:
+        return [TENS[t]]
+    return [TENS[t], ONES[o]]
+
+
+def _hundreds_word_sets(n: int) -> list:
+    """Word sets for 1–999 used as the leading part of a larger number."""
+    if n < 20:
+        return [[ONES[n]]]
+    if n < 100:
+        return [two_digit_words(n)]
+    h, rem = divmod(n, 100)
+    if rem == 0:
+        return [[ONES[h], 'hundred']]
+    rem_words = two_digit_words(rem)
+    return [[ONES[h], 'hundred', *rem_words],
+            [ONES[h], 'hundred', 'and', *rem_words]]
+
+
+def number_to_word_forms(num_str: str) -> list:
+    """
+    Generate all valid spoken forms for a pure-digit number string.
+
+    Example:
+        number_to_word_forms("2014") -> [
+            ["two", "thousand", "fourteen"],
+            ["two", "thousand", "and", "fourteen"],
+            ["twenty", "fourteen"],
+        ]
+
+    Args:
+        num_str: Pure digit string (e.g., "2014", "365", "80")
+
+    Returns:
+        List of word lists, one per valid pronunciation
+    """
+    n = _parse_int(num_str)
+    if n is None or n < 0 or n > 999999:
+        return []
+    if n == 0:
+        return [['zero']]
+
+    forms = _Forms()
+
+    if n < 20:
+        forms.add([ONES[n]])
+    elif n < 100:
+        forms.add(two_digit_words(n))
+
+    if 100 <= n <= 999:
+        for words in _hundreds_word_sets(n):
+            forms.add(words)
+
+    if 1000 <= n <= 9999:
+        th, rem = divmod(n, 1000)
+        if rem == 0:
+            forms.add([ONES[th], 'thousand'])
+        elif rem < 100:
+            rem_words = two_digit_words(rem)
+            forms.add([ONES[th], 'thousand', *rem_words])
+            forms.add([ONES[th], 'thousand', 'and', *rem_words])
+        else:
+            h, h_rem = divmod(rem, 100)
+            h_rem_words = two_digit_words(h_rem)
+            if h_rem == 0:
+                forms.add([ONES[th], 'thousand', ONES[h], 'hundred'])
+            else:
+                forms.add([ONES[th], 'thousand', ONES[h], 'hundred', *h_rem_words])
+                forms.add([ONES[th], 'thousand', ONES[h], 'hundred', 'and', *h_rem_words])
+
+        # Year-style pronunciation: "2014" -> "twenty" + "fourteen"
+        hi, lo = divmod(n, 100)
+        if 10 <= hi <= 99:
+            hi_words = two_digit_words(hi)
+            if lo == 0:
+                forms.add([*hi_words, 'hundred'])
+            else:
+                forms.add([*hi_words, *two_digit_words(lo)])
+                if 1 <= lo <= 9:
+                    forms.add([*hi_words, 'oh', ONES[lo]])
+
+    if 10000 <= n <= 999999:
+        th_part, rem = divmod(n, 1000)
+        for th_words in _hundreds_word_sets(th_part):
+            if rem == 0:
+                forms.add([*th_words, 'thousand'])
+            elif rem < 100:
+                rem_words = two_digit_words(rem)
+                forms.add([*th_words, 'thousand', *rem_words])
+                forms.add([*th_words, 'thousand', 'and', *rem_words])
+            else:
+                h, h_rem = divmod(rem, 100)
+                h_rem_words = two_digit_words(h_rem)
+                if h_rem == 0:
+                    forms.add([*th_words, 'thousand', ONES[h], 'hundred'])
+                else:
+                    forms.add([*th_words, 'thousand', ONES[h], 'hundred', *h_rem_words])
+                    forms.add([*th_words, 'thousand', ONES[h], 'hundred', 'and', *h_rem_words])
+
+    return forms.to_list()
+
+
+def decimal_to_word_forms(num_str: str) -> list:
+    """
+    Generate spoken forms for a decimal string (e.g., "3.3", "3.25").
+
+    Left side uses standard number words; right side is read digit-by-digit,
+    plus the standard form for multi-digit right sides ("point twenty five").
+    """
+    if '.' not in num_str:
+        return []
+    left_str, right_str = num_str.split('.', 1)
+    if not left_str.isdigit() or not right_str.isdigit():
+        return []
+
+    left_n = int(left_str)
+    left_forms = [['zero']] if left_n == 0 else number_to_word_forms(left_str)
+    if not left_forms:
+        return []
+
+    digit_by_digit = ['zero' if d == '0' else ONES[int(d)] for d in right_str]
+    right_n = int(right_str)
+    standard_forms = number_to_word_forms(right_str) if len(right_str) > 1 and right_n > 0 else []
+
+    forms = _Forms()
+    for left in left_forms:
+        forms.add([*left, 'point', *digit_by_digit])
+        for right in standard_forms:
+            forms.add([*left, 'point', *right])
+    return forms.to_list()
+
+
+def two_digit_ordinal_words(n: int) -> list:
+    """Ordinal word form of 1–99 ("twenty first")."""
+    if n <= 0 or n >= 100:
+        return []
+    if n < 20:
+        return [ORDINAL_ONES[n]]
+    t, o = divmod(n, 10)
+    if o == 0:
+        return [ORDINAL_TENS[t]]
+    return [TENS[t], ORDINAL_ONES[o]]
+
+
+def number_to_ordinal_forms(num_str: str) -> list:
+    """
+    Generate ordinal spoken forms for a digit string.
+
+    Only the last word changes from cardinal to ordinal:
+        number_to_ordinal_forms("21") -> [["twenty", "first"]]
+    """
+    n = _parse_int(num_str)
+    if n is None or n <= 0 or n > 999999:
+        return []
+
+    forms = _Forms()
+
+    if n < 100:
+        forms.add(two_digit_ordinal_words(n))
+
+    if 100 <= n <= 999:
+        h, rem = divmod(n, 100)
+        if rem == 0:
+            forms.add([ONES[h], 'hundredth'])
+        else:
+            rem_ord = two_digit_ordinal_words(rem)
+            forms.add([ONES[h], 'hundred', *rem_ord])
+            forms.add([ONES[h], 'hundred', 'and', *rem_ord])
+
+    if 1000 <= n <= 9999:
+        th, rem = divmod(n, 1000)
+        if rem == 0:
+            forms.add([ONES[th], 'thousandth'])
+        elif rem < 100:
+            rem_ord = two_digit_ordinal_words(rem)
+            forms.add([ONES[th], 'thousand', *rem_ord])
+            forms.add([ONES[th], 'thousand', 'and', *rem_ord])
+        else:
+            h, h_rem = divmod(rem, 100)
+            if h_rem == 0:
+                forms.add([ONES[th], 'thousand', ONES[h], 'hundredth'])
+            else:
+                h_rem_ord = two_digit_ordinal_words(h_rem)
+                forms.add([ONES[th], 'thousand', ONES[h], 'hundred', *h_rem_ord])
+                forms.add([ONES[th], 'thousand', ONES[h], 'hundred', 'and', *h_rem_ord])
+
+        # Year-style: "nineteen seventy fifth"
+        hi, lo = divmod(n, 100)
+        if 10 <= hi <= 99 and lo > 0:
+            forms.add([*two_digit_words(hi), *two_digit_ordinal_words(lo)])
+
+    if 10000 <= n <= 999999:
+        th_part, rem = divmod(n, 1000)
+        for th_words in _hundreds_word_sets(th_part):
+            if rem == 0:
+                forms.add([*th_words, 'thousandth'])
+            elif rem < 100:
+                rem_ord = two_digit_ordinal_words(rem)
+                forms.add([*th_words, 'thousand', *rem_ord])
+                forms.add([*th_words, 'thousand', 'and', *rem_ord])
+            else:
+                h, h_rem = divmod(rem, 100)
+                if h_rem == 0:
+                    forms.add([*th_words, 'thousand', ONES[h], 'hundredth'])
+                else:
+                    h_rem_ord = two_digit_ordinal_words(h_rem)
+                    forms.add([*th_words, 'thousand', ONES[h], 'hundred', *h_rem_ord])
+                    forms.add([*th_words, 'thousand', ONES[h], 'hundred', 'and', *h_rem_ord])
+
+    return forms.to_list()
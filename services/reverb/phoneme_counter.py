@@ -0,0 +1,96 @@
+"""
+CMUdict-based phoneme count lookup for server-side duration normalization.
+
+Python port of js/phoneme-counter.js. Exact counts come from the compiled,
+memory-mapped data/lexicon.bin (see lexicon_index.py), or from
+data/cmudict-phoneme-counts.json when the index has not been built; unknown
+words fall back to syllable count x PHONEMES_PER_SYLLABLE_RATIO.
+
+The data directory lives outside the Docker build context, so it is located
+via ORF_DATA_DIR (docker-compose mounts the repo's data/ there) and defaults
+to the repo checkout when running from source.
+"""
+
+import functools
+import json
+import os
+import re
+import threading
+
+from lexicon_index import DATA_DIR, INDEX_PATH, LexiconIndex
+from syllable_counter import count_syllables
+
+# Ratio of total phonemes to total syllables across all CMUdict entries
+# (Σphonemes / Σsyllables = 799853 / 309581 ≈ 2.5837).
+PHONEMES_PER_SYLLABLE_RATIO = 2.5837
+
+CMUDICT_COUNTS_PATH = os.path.join(DATA_DIR, "cmudict-phoneme-counts.json")
+
+_NON_WORD_CHARS = re.compile(r"[^a-z'-]")
+
+_lookup = None
+_load_lock = threading.Lock()
+
+
+def load_phoneme_data():
+    """
+    Load the phoneme count table once. Safe to call from any thread.
+
+    Returns:
+        Callable word -> phoneme count or None. On failure every lookup
+        returns None so callers use the syllable fallback, matching the
+        browser's behaviour when the fetch fails.
+    """
+    global _lookup
+    if _lookup is not None:
+        return _lookup
+    with _load_lock:
+        if _lookup is None:
+            _lookup = _open_table()
+    return _lookup
+
+
+def _open_table():
+    try:
+        index = LexiconIndex(INDEX_PATH)
+        print(f"[phoneme-counter] Mapped {len(index)} entries from {INDEX_PATH}")
+        # Reading vocabulary repeats heavily across sessions; memoize hot words
+        return functools.lru_cache(maxsize=65536)(index.phoneme_count)
+    except (OSError, ValueError) as e:
+        print(f"[phoneme-counter] Compiled lexicon unavailable ({e}), loading JSON")
+    try:
+        with open(CMUDICT_COUNTS_PATH, encoding="utf-8") as f:
+            counts = json.load(f)
+        print(f"[phoneme-counter] Loaded {len(counts)} entries from CMUdict")
+        return counts.get
+    except (OSError, ValueError) as e:
+        print(f"[phoneme-counter] Failed to load CMUdict data, using syllable fallback: {e}")
+        return lambda word: None
+
+
+def get_phoneme_count(word):
+    """
+    Exact phoneme count from CMUdict, or None if the word is not listed.
+
+    Use get_phoneme_count_with_fallback() if you always want a number.
+    """
+    if not word or not isinstance(word, str):
+        return None
+    w = _NON_WORD_CHARS.sub('', word.lower())
+    if not w:
+        return None
+    return load_phoneme_data()(w)
+
+
+def get_phoneme_count_with_fallback(word) -> dict:
+    """
+    Phoneme count with syllable-based fallback for unknown words.
+
+    Returns:
+        {"count": int >= 1, "source": "cmudict" | "fallback"}
+    """
+    exact = get_phoneme_count(word)
+    if exact is not None:
+        return {"count": exact, "source": "cmudict"}
+    estimated = int(count_syllables(word) * PHONEMES_PER_SYLLABLE_RATIO + 0.5)
+    return {"count": max(estimated, 1), "source": "fallback"}
@@ -0,0 +1,272 @@
+"""
+Batch passage readability (Flesch–Kincaid, Coleman–Liau, Dale–Chall).
+
+Python port of js/readability.js for scoring whole passage libraries. Word
+lists are loaded once per process from the compiled lexicon (Dale–Chall
+flags and precomputed syllable counts), and a batch is scored by:
+
+  1. tokenizing every passage and interning tokens into one vocabulary,
+  2. computing syllables / letters / difficulty once per unique token,
+  3. summing per-passage counts with np.add.reduceat over the token ids.
+
+Results are cached by SHA-1 of the passage text, so re-grading a library
+only pays for passages that changed. Output matches analyzeReadability()
+key-for-key, including its rounding.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from lexicon_index import DATA_DIR, FLAG_DALE_CHALL, INDEX_PATH, LexiconIndex
+from syllable_counter import count_syllables
+
+MIN_WORDS = 10
+RESULT_CACHE_SIZE = 10000
+
+_WHITESPACE = re.compile(r'\s+')
+_EDGE_NON_ALNUM = re.compile(r'^[^a-zA-Z0-9]+|[^a-zA-Z0-9]+$')
+_NON_LETTER = re.compile(r'[^a-zA-Z]')
+_DIGITS = re.compile(r'^[0-9]+$')
+_SENTENCE_END = re.compile(r'[.!?]+(?:\s|$)')
+
+# Suffixes stripped (with optional replacement) before the Dale–Chall lookup,
+# in the order readability.js tries them.
+_DALE_CHALL_STEMS = [('s', ''), ('es', ''), ('ed', ''), ('d', ''), ('ing', ''),
+                     ('ing', 'e'), ('ly', ''), ('er', ''), ('est', '')]
+
+
+# =============================================================================
+# Word lists
+# =============================================================================
+
+class _WordLists:
+    """Dale–Chall set and syllable lookup, loaded once per process."""
+
+    def __init__(self):
+        self.syllable_cache = {}
+        try:
+            index = LexiconIndex(INDEX_PATH)
+            self.dale_chall = frozenset(w for i, w in index.iter_entries()
+                                        if index.flags[i] & FLAG_DALE_CHALL)
+            self._index = index
+            print(f"[readability] Dale-Chall list: {len(self.dale_chall)} words (lexicon index)")
+        except (OSError, ValueError):
+            with open(os.path.join(DATA_DIR, "dale-chall.json"), encoding="utf-8") as f:
+                self.dale_chall = frozenset(json.load(f))
+            self._index = None
+            print(f"[readability] Dale-Chall list: {len(self.dale_chall)} words (JSON)")
+
+    def syllables(self, word: str) -> int:
+        count = self.syllable_cache.get(word)
+        if count is None:
+            i = self._index.find(word) if self._index is not None else -1
+            # The index column holds count_syllables() of the exact entry
+            count = int(self._index.syllables[i]) if i >= 0 else count_syllables(word)
+            self.syllable_cache[word] = count
+        return count
+
+    def is_difficult(self, word: str) -> bool:
+        base = word.replace("'", '')
+        if _DIGITS.match(base) or base in self.dale_chall:
+            return False
+        for suffix, replacement in _DALE_CHALL_STEMS:
+            if base.endswith(suffix) and base[:-len(suffix)] + replacement in self.dale_chall:
+                return False
+        return True
+
+
+_lists = None
+_lists_lock = threading.Lock()
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _word_lists() -> _WordLists:
+    global _lists
+    if _lists is None:
+        with _lists_lock:
+            if _lists is None:
+                _lists = _WordLists()
+    return _lists
+
+
+# =============================================================================
+# Formulas (same coefficients and grade mapping as readability.js)
+# =============================================================================
+
+def _round_to(x, places: int) -> float:
+    """Math.round(x * 10^places) / 10^places."""
+    scale = 10 ** places
+    return float(np.floor(x * scale + 0.5) / scale)
+
+
+def dale_chall_to_grade(score: float) -> int:
+    """New Dale–Chall (1995) raw score -> grade level."""
+    for limit, grade in ((4.9, 3), (5.9, 5), (6.9, 7), (7.9, 9), (8.9, 11)):
+        if score <= limit:
+            return grade
+    return 13
+
+
+def grade_band(median: float) -> str:
+    clamped = max(1, min(median, 16))
+    low = max(1, int(np.floor(clamped)))
+    if low >= 13:
+        return '12+'
+    if low <= 1:
+        return 'K-1'
+    return f'{low}-{min(low + 1, 13)}'
+
+
+def grade_label(grade: float) -> str:
+    if grade <= 1:
+        return 'Early Elementary'
+    if grade <= 3:
+        return 'Elementary'
+    if grade <= 5:
+        return 'Upper Elementary'
+    if grade <= 8:
+        return 'Middle School'
+    if grade <= 12:
+        return 'High School'
+    return 'College'
+
+
+def _tokenize(text: str) -> list:
+    words = (_EDGE_NON_ALNUM.sub('', w).lower() for w in _WHITESPACE.split(text))
+    return [w for w in words if w]
+
+
+def _score(text: str, words: int, syllables: int, letters: int, difficult: list):
+    """Assemble the analyzeReadability() result from per-passage counts."""
+    sentences = max(len(_SENTENCE_END.findall(text)), 1)
+    words_per_sentence = words / sentences
+
+    fk = 0.39 * words_per_sentence + 11.8 * (syllables / words) - 15.59
+    cl = 0.0588 * (letters / words * 100) - 0.296 * (sentences / words * 100) - 15.8
+    pct_difficult = len(difficult) / words
+    dc_raw = 0.1579 * (pct_difficult * 100) + 0.0496 * words_per_sentence
+    if pct_difficult > 0.05:
+        dc_raw += 3.6365
+    dc_grade = dale_chall_to_grade(dc_raw)
+
+    median = sorted([fk, cl, dc_grade])[1]
+    return {
+        'band': grade_band(median),
+        'median': _round_to(median, 1),
+        'label': grade_label(median),
+        'formulas': {
+            'fleschKincaid': _round_to(fk, 1),
+            'colemanLiau': _round_to(cl, 1),
+            'daleChallRaw': _round_to(dc_raw, 1),
+            'daleChallGrade': dc_grade,
+        },
+        'stats': {
+            'words': words,
+            'sentences': sentences,
+            'syllables': syllables,
+            'syllablesPerWord': _round_to(syllables / words, 2),
+            'avgSentenceLength': _round_to(words_per_sentence, 1),
+            'difficultWords': len(difficult),
+            'pctDifficult': float(np.floor(pct_difficult * 1000 + 0.5) / 10),
+            'difficultWordList': difficult[:15],
+        },
+    }
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+def text_hash(text: str) -> str:
+    """Cache key for a passage: SHA-1 of its trimmed UTF-8 text."""
+    return hashlib.sha1(text.strip().encode('utf-8')).hexdigest()
+
+
+def analyze_readability_batch(texts: list) -> list:
+    """
+    Score a list of passages.
+
+    Args:
+        texts: Raw passage texts
+
+    Returns:
+        One analyzeReadability()-shaped dict per passage, or None for
+        passages that are empty or shorter than MIN_WORDS words
+    """
+    lists = _word_lists()
+    results = [None] * len(texts)
+    keys = [text_hash(t) if t and t.strip() else None for t in texts]
+
+    pending = {}
+    with _cache_lock:
+        for i, key in enumerate(keys):
+            if key is None:
+                continue
+            if key in _cache:
+                _cache.move_to_end(key)
+                results[i] = _cache[key]
+            else:
+                pending.setdefault(key, []).append(i)
+    if not pending:
+        return results
+
+    # Intern tokens across the whole batch so per-word work runs once
+    vocab = {}
+    token_ids = []
+    offsets = []
+    stripped = {}
+    for key, slots in pending.items():
+        text = texts[slots[0]].strip()
+        stripped[key] = text
+        offsets.append(len(token_ids))
+        for w in _tokenize(text):
+            token_ids.append(vocab.setdefault(w, len(vocab)))
+    vocab_words = list(vocab)
+
+    syllables = np.array([lists.syllables(w) for w in vocab_words], dtype=np.int64)
+    letters = np.array([len(_NON_LETTER.sub('', w)) for w in vocab_words], dtype=np.int64)
+    difficult = np.array([lists.is_difficult(w) for w in vocab_words], dtype=bool)
+
+    ids = np.asarray(token_ids, dtype=np.int64)
+    starts = np.asarray(offsets, dtype=np.int64)
+    ends = np.append(starts[1:], len(ids))
+    counts = ends - starts
+    # Per-passage sums as prefix-sum differences, so passages with no tokens
+    # come out 0 without touching their neighbours
+    syl_prefix = np.concatenate([[0], np.cumsum(syllables[ids])])
+    letter_prefix = np.concatenate([[0], np.cumsum(letters[ids])])
+    syl_sums = syl_prefix[ends] - syl_prefix[starts]
+    letter_sums = letter_prefix[ends] - letter_prefix[starts]
+    is_difficult = difficult[ids]
+
+    scored = {}
+    for p, key in enumerate(pending):
+        n = int(counts[p])
+        if n < MIN_WORDS:
+            scored[key] = None
+            continue
+        lo = int(starts[p])
+        hard = [vocab_words[t] for t in ids[lo:lo + n][is_difficult[lo:lo + n]].tolist()]
+        scored[key] = _score(stripped[key], n, int(syl_sums[p]), int(letter_sums[p]), hard)
+
+    with _cache_lock:
+        for key, result in scored.items():
+            _cache[key] = result
+            for i in pending[key]:
+                results[i] = result
+        while len(_cache) > RESULT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return results
+
+
+def analyze_readability(text: str):
+    """Single-passage convenience wrapper around analyze_readability_batch()."""
+    return analyze_readability_batch([text])[0]
@@ -0,0 +1,243 @@
+"""
+Precomputed per-student trend rollups for the dashboard and celeration chart.
+
+The assessment store calls refresh() inside every write transaction with
+the students the write touched, so a rollup is always current and a
+dashboard read is one indexed lookup per student instead of a pass over
+the whole assessment history. Each refresh reads only those students'
+summary columns (assessments_student_date index) and computes, for all of
+them at once with numpy grouping:
+
+  - weekly buckets (Monday-start): median WCPM, mean accuracy, count
+  - the celeration fit: least squares of log10(WCPM) on calendar days since
+    the student's first assessment; celeration = 10^(7·slope). This is the
+    math of calculateCeleration() in celeration-chart.js, but not its input:
+    the chart fits celeration.correctPerMinute against celeration.calendarDay,
+    which dashboard.html builds at render time from wcpm and the assessment's
+    index (not its date), so the two only agree for one reading a day
+  - the latest WCPM's Hasbrouck–Tindal percentile rank and benchmark status
+    for the student's grade in that assessment's season
+
+Rollups are stored as two JSON columns: `summary` (what a class view lists)
+and `series` (per-assessment points for the chart), so a class read never
+pulls the points.
+"""
+
+import json
+import statistics
+
+import numpy as np
+
+from benchmarks import SEASONS, STATUSES, benchmark_statuses, percentile_ranks, seasons_of_months
+
+MIN_FIT_POINTS = 2
+SQL_VARIABLE_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS student_rollups (
+    student_id  TEXT PRIMARY KEY REFERENCES students (id) ON DELETE CASCADE,
+    grade       INTEGER,
+    summary     TEXT NOT NULL,
+    series      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS student_rollups_grade ON student_rollups (grade);
+"""
+
+
+# =============================================================================
+# Computation
+# =============================================================================
+
+def _dates(values):
+    """ISO timestamps -> (datetime64[s] array, whole days since epoch)."""
+    stamps = np.array([v.rstrip("Z")[:19] for v in values], dtype="datetime64[s]")
+    return stamps, stamps.astype("datetime64[D]").astype(np.int64)
+
+
+def _round(value, digits=1):
+    return None if value is None or not np.isfinite(value) else round(float(value), digits)
+
+
+def celeration_fit(days, wcpm, groups, n_groups):
+    """
+    Per-group least-squares fit of log10(wcpm) on day (wcpm > 0 only).
+
+    Returns:
+        (slope per day, intercept, points used) arrays; NaN where a group has
+        fewer than MIN_FIT_POINTS points or all on one day
+    """
+    ok = wcpm > 0
+    x, y, g = days[ok].astype(float), np.log10(wcpm[ok]), groups[ok]
+    n = np.bincount(g, minlength=n_groups).astype(float)
+    sx = np.bincount(g, weights=x, minlength=n_groups)
+    sy = np.bincount(g, weights=y, minlength=n_groups)
+    sxy = np.bincount(g, weights=x * y, minlength=n_groups)
+    sxx = np.bincount(g, weights=x * x, minlength=n_groups)
+    denom = n * sxx - sx * sx
+    valid = (n >= MIN_FIT_POINTS) & (denom > 1e-9)
+    safe = np.where(valid, denom, 1.0)
+    slope = np.where(valid, (n * sxy - sx * sy) / safe, np.nan)
+    intercept = np.where(valid, (sy - slope * sx) / np.maximum(n, 1), np.nan)
+    return slope, intercept, n.astype(int)
+
+
+def weekly_buckets(weeks, wcpm, accuracy, groups):
+    """
+    Median WCPM / mean accuracy per (group, week).
+
+    Returns:
+        (group, week, median wcpm, mean accuracy, count) arrays, sorted by
+        group then week (inputs must be non-empty)
+    """
+    order = np.lexsort((wcpm, weeks, groups))
+    g, w, v, a = groups[order], weeks[order], wcpm[order], accuracy[order]
+    starts = np.flatnonzero(np.r_[True, (g[1:] != g[:-1]) | (w[1:] != w[:-1])])
+    counts = np.diff(np.r_[starts, len(g)])
+    # NaN WCPMs sort last within a bucket, so medians use the leading finite ones
+    finite = np.add.reduceat(np.isfinite(v).astype(int), starts)
+    lo = starts + np.maximum(finite - 1, 0) // 2
+    hi = starts + finite // 2
+    median = np.where(finite > 0, (v[lo] + v[np.minimum(hi, len(v) - 1)]) / 2, np.nan)
+    acc_ok = np.isfinite(a)
+    acc_n = np.add.reduceat(acc_ok.astype(int), starts)
+    acc_sum = np.add.reduceat(np.where(acc_ok, a, 0), starts)
+    accuracy_mean = np.where(acc_n > 0, acc_sum / np.maximum(acc_n, 1), np.nan)
+    return g[starts], w[starts], median, accuracy_mean, counts
+
+
+def compute(student_grades, rows):
+    """
+    Rollups for a set of students.
+
+    Args:
+        student_grades: student id -> grade (None when unset)
+        rows: (student_id, date ISO, wcpm, accuracy) tuples, sorted by
+            student then date
+
+    Returns:
+        student id -> (summary dict, series dict)
+    """
+    ids = list(student_grades)
+    index = {sid: i for i, sid in enumerate(ids)}
+    out = {sid: ({"studentId": sid, "grade": student_grades[sid], "assessments": 0, "weeks": None,
+                  "celeration": None, "latest": None}, {"start": None, "days": [], "wcpm": [], "accuracy": [],
+                                                        "fit": None})
+           for sid in ids}
+    rows = [r for r in rows if r[1]]
+    if not rows:
+        return out
+
+    groups = np.array([index[r[0]] for r in rows])
+    stamps, days = _dates([r[1] for r in rows])
+    wcpm = np.array([np.nan if r[2] is None else r[2] for r in rows], dtype=float)
+    accuracy = np.array([np.nan if r[3] is None else r[3] for r in rows], dtype=float)
+    first = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    last = np.r_[first[1:], len(groups)] - 1
+    first_day = np.zeros(len(ids), dtype=np.int64)
+    first_day[groups[first]] = days[first]
+    rel_days = days - first_day[groups]
+
+    slope, intercept, fit_n = celeration_fit(rel_days, wcpm, groups, len(ids))
+    # 1970-01-01 was a Thursday: shift so weeks start on Monday
+    mondays = days - (days + 3) % 7
+    wg, ww, wmed, wacc, wn = weekly_buckets(mondays, wcpm, accuracy, groups)
+    week_bounds = np.searchsorted(wg, np.arange(len(ids) + 1))
+
+    # Latest assessment per student, ranked in its own season
+    grades = np.array([student_grades[ids[i]] or 0 for i in groups[last]])
+    seasons = seasons_of_months(stamps[last].astype("datetime64[M]").astype(np.int64) % 12 + 1)
+    ranks = percentile_ranks(wcpm[last], grades, seasons)
+    statuses = benchmark_statuses(wcpm[last], grades, seasons)
+
+    for k, (lo_row, hi_row) in enumerate(zip(first, last)):
+        i = groups[lo_row]
+        sid = ids[i]
+        summary, series = out[sid]
+        span = slice(lo_row, hi_row + 1)
+        wspan = slice(week_bounds[i], week_bounds[i + 1])
+        summary["assessments"] = int(hi_row - lo_row + 1)
+        summary["weeks"] = {
+            "start": [str(np.datetime64(int(d), "D")) for d in ww[wspan]],
+            "medianWcpm": [_round(v) for v in wmed[wspan]],
+            "accuracy": [_round(v) for v in wacc[wspan]],
+            "count": wn[wspan].tolist(),
+        }
+        if np.isfinite(slope[i]):
+            summary["celeration"] = {"weekly": _round(10 ** (7 * slope[i]), 3), "points": int(fit_n[i])}
+
+        summary["latest"] = {
+            "date": rows[hi_row][1], "wcpm": _round(wcpm[hi_row]),
+            "accuracy": _round(accuracy[hi_row]), "season": SEASONS[seasons[k]],
+            "percentile": _round(ranks[k]), "status": STATUSES[statuses[k]],
+        }
+
+        series["start"] = str(stamps[lo_row].astype("datetime64[D]"))
+        series["days"] = rel_days[span].tolist()
+        series["wcpm"] = [_round(v) for v in wcpm[span]]
+        series["accuracy"] = [_round(v) for v in accuracy[span]]
+        if np.isfinite(slope[i]):
+            series["fit"] = {"slopePerDay": float(slope[i]), "interceptLog10": float(intercept[i])}
+    return out
+
+
+# =============================================================================
+# Storage
+# =============================================================================
+
+def refresh(conn, student_ids):
+    """Recompute and store the rollups of `student_ids` (call inside the write's transaction)."""
+    ids = list(dict.fromkeys(student_ids))
+    for offset in range(0, len(ids), SQL_VARIABLE_CHUNK):
+        chunk = ids[offset:offset + SQL_VARIABLE_CHUNK]
+        marks = ",".join("?" * len(chunk))
+        grades = dict(conn.execute(f"SELECT id, grade FROM students WHERE id IN ({marks})", chunk).fetchall())
+        rows = conn.execute(f"SELECT student_id, date, wcpm, accuracy FROM assessments "
+                            f"WHERE student_id IN ({marks}) ORDER BY student_id, date, id", chunk).fetchall()
+        rollups = compute(grades, [tuple(r) for r in rows])
+        conn.executemany(
+            "INSERT OR REPLACE INTO student_rollups (student_id, grade, summary, series) VALUES (?, ?, ?, ?)",
+            [(sid, grades[sid], json.dumps(s, separators=(",", ":")), json.dumps(p, separators=(",", ":")))
+             for sid, (s, p) in rollups.items()])
+
+
+def student(conn, student_id):
+    """Summary plus chart series for one student, or None."""
+    row = conn.execute("SELECT summary, series FROM student_rollups WHERE student_id = ?",
+                       (student_id,)).fetchone()
+    if row is None:
+        return None
+    return {**json.loads(row[0]), "series": json.loads(row[1])}
+
+
+def class_view(conn, grade=None, student_ids=None):
+    """
+    Summaries for a class (a grade, or an explicit list of students) plus the
+    class's weekly series: per week, the median of the students' weekly
+    median WCPM and how many students were assessed.
+    """
+    if student_ids is not None:
+        summaries = []
+        for offset in range(0, len(student_ids), SQL_VARIABLE_CHUNK):
+            chunk = student_ids[offset:offset + SQL_VARIABLE_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            summaries += [json.loads(r[0]) for r in conn.execute(
+                f"SELECT summary FROM student_rollups WHERE student_id IN ({marks})", chunk)]
+    else:
+        summaries = [json.loads(r[0]) for r in conn.execute(
+            "SELECT summary FROM student_rollups WHERE grade IS ?", (grade,))]
+
+    by_week = {}
+    for s in summaries:
+        weeks = s["weeks"] or {"start": [], "medianWcpm": []}
+        for start, median in zip(weeks["start"], weeks["medianWcpm"]):
+            if median is not None:
+                by_week.setdefault(start, []).append(median)
+    starts = sorted(by_week)
+    celerations = [s["celeration"]["weekly"] for s in summaries if s["celeration"]]
+    return {
+        "students": summaries,
+        "weeks": {"start": starts,
+                  "medianWcpm": [_round(statistics.median(by_week[w])) for w in starts],
+                  "students": [len(by_week[w]) for w in starts]},
+        "medianCeleration": _round(statistics.median(celerations), 3) if celerations else None,
+    }
@@ -5,6 +5,15 @@ Endpoints:
   POST /ensemble - Dual-pass transcription (v=1.0 verbatim + v=0.0 clean)
   POST /deepgram - Deepgram Nova-3 transcription proxy (cross-validation)
   POST /parakeet - Parakeet TDT 0.6B v2 local transcription (cross-validation)
+  POST /maze/generate - Maze rounds from a cached per-passage distractor index
+  POST /analyze  - Reference-to-transcript word alignment (port of alignment.js)
+  POST /diagnostics/batch - Re-run fluency diagnostics over stored sessions
+  POST /readability/batch - Grade-level estimates for a passage library
+  /store/...     - Student and assessment persistence (SQLite, paginated queries)
+  /audio/...     - Deduplicated, compressed recording archive with range playback
+  GET  /rollups/... - Precomputed student/class trends and celeration series
+  POST /benchmarks/rank - Hasbrouck–Tindal percentile ranks and tiers for a cohort
+  POST /google/... - Caching proxy for Google NL, Vision and Gemini passage analysis
   GET  /health   - Health check with GPU status and model info
 
 Requirements:
@@ -12,24 +21,40 @@ Requirements:
   - Docker with NVIDIA Container Toolkit
   - 8GB+ VRAM recommended for long audio
   - DEEPGRAM_API_KEY environment variable (optional, for /deepgram endpoint)
+  - GOOGLE_API_KEY / GEMINI_API_KEY (optional, for /google/... without ?key=)
   - nemo_toolkit[asr] (optional, for /parakeet endpoint)
 """
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.background import BackgroundTask
 from starlette.middleware.base import BaseHTTPMiddleware
 from pydantic import BaseModel
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 import asyncio
 import base64
+import hashlib
+import hmac
+import re
 import tempfile
+import time
 import os
+from urllib.parse import quote
 import torch
 import wenet
 from deepgram import DeepgramClient
 
+from alignment import align_words, consolidate_spillover_fragments, split_hyphenated_words
+from assessment_store import StoreError, get_store
+from audio_archive import RangeNotSatisfiable, check_audio_signature, get_archive, parse_range, sign_audio_url
+from benchmarks import rank_batch
+from diagnostics import diagnose_batch
+from google_proxy import ProxyError, get_proxy
+from maze import generate_maze_items, get_maze_items
+from readability import analyze_readability_batch
+
 # =============================================================================
 # Application Setup
 # =============================================================================
@@ -56,8 +81,9 @@ ALLOWED_ORIGINS = _cors_origins.split(",") if _cors_origins else _default_origin
 app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
-    allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "Range"],
+    expose_headers=["Content-Range", "Accept-Ranges", "X-Missing-Count", "X-Cache"],
 )
 
 # --- Request size limit middleware (25MB max) ---
@@ -81,13 +107,31 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     return JSONResponse(status_code=429, content={"error": "rate limit exceeded — try again shortly"})
 
 # Optional auth token — set ORF_AUTH_TOKEN env var to require Bearer token.
-# /health is always public (needed for connection testing).
+# /health is always public (needed for connection testing). Audio GETs may
+# instead use a short-lived signed URL from GET /audio/{id}/url, since
+# <audio src> can't send headers; the token itself never goes in a URL.
 AUTH_TOKEN = os.environ.get("ORF_AUTH_TOKEN")
 
+# Audio URL signing key: ORF_AUDIO_URL_SECRET, else derived from the auth
+# token so every worker process agrees on it
+AUDIO_URL_TTL_S = 15 * 60
+AUDIO_URL_SECRET = (os.environ.get("ORF_AUDIO_URL_SECRET") or hmac.new(
+    (AUTH_TOKEN or "").encode(), b"pacer-audio-url", hashlib.sha256).hexdigest()).encode()
+_AUDIO_GET_PATH = re.compile(r"^/audio/([^/]+)$")
+
+
+def _signed_audio_request(request: Request):
+    match = _AUDIO_GET_PATH.match(request.url.path)
+    return (request.method == "GET" and match is not None
+            and check_audio_signature(AUDIO_URL_SECRET, match.group(1),
+                                      request.query_params.get("expires"), request.query_params.get("sig")))
+
 @app.middleware("http")
 async def check_auth(request: Request, call_next):
     if AUTH_TOKEN and request.url.path != "/health" and request.method != "OPTIONS":
         auth_header = request.headers.get("Authorization", "")
+        if not auth_header and _signed_audio_request(request):
+            return await call_next(request)
         if not auth_header.startswith("Bearer "):
             print(f"[AUTH] Rejected (bad format): {request.method} {request.url.path} from {request.client.host}")
             return JSONResponse(status_code=401, content={"error": "invalid auth format — use Bearer token"})
@@ -284,7 +328,75 @@ class ParakeetRequest(BaseModel):
 class MazeRequest(BaseModel):
     """Request model for /deepgram-maze endpoint."""
     audio_base64: str
-    keyterms: list[str]  # The 3 option words to boost
+    keyterms: list[str] | None = None  # The 3 option words to boost
+    maze_id: str | None = None         # From /maze/generate: boost that round's keyterms instead
+    item_index: int | None = None
+
+
+class MazeGenerateRequest(BaseModel):
+    """Request model for /maze/generate endpoint."""
+    passage_text: str
+    nl_annotations: list[dict] | None = None  # Per-word NL API annotations (word/pos/tier)
+    difficulty: str = "standard"              # easy | standard | challenge
+    seed: str | None = None                   # e.g. assessment ID, for deterministic rounds
+
+
+class AnalyzeRequest(BaseModel):
+    """Request model for /analyze endpoint."""
+    reference_text: str
+    words: list[dict]                        # Reverb verbatim words (each has "word")
+    parakeet_words: list[dict] | None = None  # Raw Parakeet words, pre-split server-side
+
+
+class DiagnosticsSession(BaseModel):
+    """One stored session to re-diagnose."""
+    reference_text: str
+    transcript_words: list[dict]              # Merged STT words (startTime/endTime/crossValidation...)
+    alignment: list[dict] | None = None       # Stored alignment; re-aligned server-side when omitted
+    xval_raw_words: list[dict] | None = None  # Raw cross-validator words for onset-gap narrowing
+
+
+class DiagnosticsBatchRequest(BaseModel):
+    """Request model for /diagnostics/batch endpoint."""
+    sessions: list[DiagnosticsSession]
+
+
+class ReadabilityBatchRequest(BaseModel):
+    """Request model for /readability/batch endpoint."""
+    passages: list[str]
+
+
+class StudentRecord(BaseModel):
+    """Request model for PUT /store/students/{id} (storage.js student fields)."""
+    name: str
+    grade: int | None = None
+    createdAt: str | None = None
+
+
+class StoreImportRequest(BaseModel):
+    """Request model for /store/import: an orf_data object, or a slice of one."""
+    students: list[dict] = []
+    assessments: list[dict] = []  # storage.js assessment records
+
+
+class AudioUploadRequest(BaseModel):
+    """Request model for /audio endpoint."""
+    assessment_id: str
+    audio_base64: str
+    mime_type: str = "audio/webm"  # The recording's Blob type
+
+
+class AudioExportRequest(BaseModel):
+    """Request model for /audio/export endpoint."""
+    assessment_ids: list[str]
+
+
+class BenchmarkRankRequest(BaseModel):
+    """Request model for /benchmarks/rank endpoint (columnar: one entry per student)."""
+    wcpm: list[float | None]
+    grade: list[int | None]
+    season: list[str | None] | None = None  # fall | winter | spring
+    month: list[int | None] | None = None   # 1-12; season derived as in getSeason()
 
 
 class Word(BaseModel):
@@ -538,6 +650,29 @@ async def parakeet_transcribe(req: ParakeetRequest, request: Request):
 # Maze Game Endpoint (Short-audio keyterm-boosted recognition)
 # =============================================================================
 
+@app.post("/maze/generate")
+@limiter.limit("60/minute")
+async def maze_generate(req: MazeGenerateRequest, request: Request):
+    """
+    Generate maze rounds server-side.
+
+    Items have the same fields as generateMazeItems() in maze-generator.js,
+    plus "keyterms" for recognition. The passage's distractor index and the
+    generated rounds are cached, so repeat requests (other students, same
+    passage) are served without recomputation. Pass the returned maze_id
+    and an item index to /deepgram-maze to boost that round's keyterms.
+    """
+    loop = asyncio.get_event_loop()
+    try:
+        result = await loop.run_in_executor(None, lambda: generate_maze_items(
+            req.passage_text, req.nl_annotations, req.difficulty, req.seed))
+        return {"maze_id": result["maze_id"], "items": result["items"], "count": len(result["items"])}
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Maze generation error: {e}")
+
+
 @app.post("/deepgram-maze")
 @limiter.limit("20/minute")
 async def deepgram_maze(req: MazeRequest, request: Request):
@@ -545,7 +680,18 @@ async def deepgram_maze(req: MazeRequest, request: Request):
     Short-audio transcription optimized for maze game.
     Uses Nova-3 keyterm prompting to boost recognition of the 3 option words.
     Expects 1-3 second audio clips (single spoken word).
+    Keyterms come from the request, or from a cached /maze/generate round
+    when maze_id + item_index are given instead.
     """
+    keyterms = req.keyterms
+    if not keyterms and req.maze_id is not None:
+        items = get_maze_items(req.maze_id)
+        if items is None or req.item_index is None or not 0 <= req.item_index < len(items):
+            raise HTTPException(status_code=404, detail="Unknown maze_id or item_index")
+        keyterms = items[req.item_index]["keyterms"]
+    if not keyterms:
+        raise HTTPException(status_code=400, detail="keyterms or maze_id + item_index required")
+
     client = get_deepgram_client()
     if client is None:
         raise HTTPException(
@@ -565,13 +711,13 @@ async def deepgram_maze(req: MazeRequest, request: Request):
             model="nova-3",
             language="en-US",
             smart_format=False,
-            keyterm=req.keyterms,
+            keyterm=keyterms,
         )
 
         transcript = response.results.channels[0].alternatives[0].transcript
         confidence = response.results.channels[0].alternatives[0].confidence
 
-        print(f"[maze] Deepgram heard: '{transcript}' (conf={confidence:.2f}, options={req.keyterms})")
+        print(f"[maze] Deepgram heard: '{transcript}' (conf={confidence:.2f}, options={keyterms})")
 
         return {
             "transcript": transcript,
@@ -596,3 +742,446 @@ async def deepgram_maze(req: MazeRequest, request: Request):
             return {"transcript": transcript, "confidence": confidence}
         except Exception as e2:
             raise HTTPException(status_code=500, detail=f"Deepgram maze error: {e2}")
+
+
+# =============================================================================
+# Analysis Endpoint (Server-side alignment)
+# =============================================================================
+
+def run_alignment(reference_text: str, words: list, parakeet_words: list | None) -> dict:
+    """
+    Align Reverb (and optionally Parakeet) words against the reference.
+
+    Mirrors app.js steps 4a-4c: independent NW alignment per engine, Parakeet
+    hyphen pre-split, then spillover consolidation on each alignment.
+    """
+    alignment = align_words(reference_text, words)
+    pk_words = split_hyphenated_words(parakeet_words)
+    parakeet_alignment = align_words(reference_text, pk_words) if pk_words else None
+
+    v1_spillover = consolidate_spillover_fragments(alignment)
+    pk_spillover = consolidate_spillover_fragments(parakeet_alignment) if parakeet_alignment else []
+
+    return {
+        "alignment": alignment,
+        "parakeet_alignment": parakeet_alignment,
+        "spillover": {"v1": v1_spillover, "pk": pk_spillover},
+    }
+
+
+@app.post("/analyze")
+@limiter.limit("60/minute")
+async def analyze(req: AnalyzeRequest, request: Request):
+    """
+    Align transcript words to the reference text on the server.
+
+    Returns the same alignment entries as alignWords() in js/alignment.js
+    (ref, hyp, type, hypIndex, compound flags), after spillover
+    consolidation, so low-end clients can skip the DP entirely.
+    CPU-only — does not take the GPU lock.
+    """
+    loop = asyncio.get_event_loop()
+    try:
+        return await loop.run_in_executor(
+            None, lambda: run_alignment(req.reference_text, req.words, req.parakeet_words))
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Alignment error: {e}")
+
+
+# =============================================================================
+# Diagnostics Endpoint (Batch re-scoring)
+# =============================================================================
+
+MAX_DIAGNOSTICS_BATCH = 5000
+
+
+@app.post("/diagnostics/batch")
+@limiter.limit("10/minute")
+async def diagnostics_batch(req: DiagnosticsBatchRequest, request: Request):
+    """
+    Re-run fluency diagnostics over a batch of stored sessions.
+
+    Each result mirrors what app.js computes client-side: runDiagnostics()
+    output plus phrasing, pause-at-punctuation, pace consistency, word
+    duration outliers and word speed tiers. A session that fails returns
+    {"error": ...} in its slot; the rest of the batch still completes.
+    CPU-only — does not take the GPU lock.
+    """
+    if len(req.sessions) > MAX_DIAGNOSTICS_BATCH:
+        raise HTTPException(status_code=413, detail=f"Too many sessions (max {MAX_DIAGNOSTICS_BATCH})")
+
+    sessions = [{"reference_text": s.reference_text, "transcript_words": s.transcript_words,
+                 "alignment": s.alignment, "xval_raw_words": s.xval_raw_words} for s in req.sessions]
+    loop = asyncio.get_event_loop()
+    try:
+        results = await loop.run_in_executor(None, lambda: diagnose_batch(sessions))
+        return {"results": results, "count": len(results)}
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Diagnostics error: {e}")
+
+
+# =============================================================================
+# Readability Endpoint (Passage library grading)
+# =============================================================================
+
+MAX_READABILITY_BATCH = 5000
+
+
+@app.post("/readability/batch")
+@limiter.limit("30/minute")
+async def readability_batch(req: ReadabilityBatchRequest, request: Request):
+    """
+    Grade-level estimates for a batch of passages.
+
+    Each result has the same shape as analyzeReadability() in readability.js,
+    or null for passages under 10 words. Results are cached by text hash,
+    so re-submitting an unchanged library is nearly free.
+    """
+    if len(req.passages) > MAX_READABILITY_BATCH:
+        raise HTTPException(status_code=413, detail=f"Too many passages (max {MAX_READABILITY_BATCH})")
+
+    loop = asyncio.get_event_loop()
+    try:
+        results = await loop.run_in_executor(None, lambda: analyze_readability_batch(req.passages))
+        return {"results": results, "count": len(results)}
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Readability error: {e}")
+
+
+# =============================================================================
+# Assessment Store Endpoints (Server-side persistence)
+# =============================================================================
+
+async def run_store(fn):
+    """Run a store call off the event loop; StoreError becomes a 400."""
+    loop = asyncio.get_event_loop()
+    try:
+        return await loop.run_in_executor(None, fn)
+    except StoreError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/store/students")
+@limiter.limit("300/minute")
+async def store_list_students(request: Request, grade: int | None = None):
+    """All students (optionally one grade), in creation order."""
+    students = await run_store(lambda: get_store().list_students(grade))
+    return {"students": students, "count": len(students)}
+
+
+@app.put("/store/students/{student_id}")
+@limiter.limit("300/minute")
+async def store_put_student(student_id: str, req: StudentRecord, request: Request):
+    """Create or update one student."""
+    record = {"id": student_id, **req.model_dump()}
+    return await run_store(lambda: get_store().upsert_student(record))
+
+
+@app.delete("/store/students/{student_id}")
+@limiter.limit("60/minute")
+async def store_delete_student(student_id: str, request: Request):
+    """
+    Delete a student and all their assessments. Returns the deleted
+    assessment IDs so the client can drop their IndexedDB audio blobs.
+    """
+    ids = await run_store(lambda: get_store().delete_student(student_id))
+    if ids is None:
+        raise HTTPException(status_code=404, detail="Unknown student")
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, lambda: get_archive().unlink(ids))
+    return {"deleted_assessments": ids}
+
+
+@app.get("/store/assessments")
+@limiter.limit("600/minute")
+async def store_list_assessments(
+    request: Request,
+    student_id: str | None = None,
+    grade: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    since_rev: int | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = None,
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    full: bool = False,
+):
+    """
+    One page of assessments ordered by date, filtered by student, grade,
+    date range (ISO, since inclusive / until exclusive) or revision.
+
+    Pages carry only the listed fields unless full=true. Pass next_cursor
+    back as cursor for the following page; it is null on the last page.
+    For incremental sync, keep the highest "rev" seen (including
+    "deleted_rev") and pass it as since_rev; the first page then also lists
+    the students and assessments deleted since.
+    """
+    return await run_store(lambda: get_store().list_assessments(
+        student_id=student_id, grade=grade, since=since, until=until, since_rev=since_rev,
+        limit=limit, cursor=cursor, descending=order == "desc", full=full))
+
+
+@app.get("/store/assessments/{assessment_id}")
+@limiter.limit("600/minute")
+async def store_get_assessment(assessment_id: str, request: Request):
+    """One full assessment record (alignment, sttWords, prosody, ...)."""
+    record = await run_store(lambda: get_store().get_assessment(assessment_id))
+    if record is None:
+        raise HTTPException(status_code=404, detail="Unknown assessment")
+    return record
+
+
+@app.put("/store/assessments/{assessment_id}")
+@limiter.limit("300/minute")
+async def store_put_assessment(assessment_id: str, record: dict, request: Request):
+    """
+    Create or replace one assessment (the saveAssessment() record). Its
+    student must already be stored. Returns the summary fields and new rev.
+    """
+    record = {**record, "id": assessment_id}
+    return await run_store(lambda: get_store().upsert_assessment(record))
+
+
+@app.patch("/store/assessments/{assessment_id}")
+@limiter.limit("300/minute")
+async def store_patch_assessment(assessment_id: str, fields: dict, request: Request):
+    """Merge fields into one assessment, e.g. {"gamification": {...}} from saveGamification()."""
+    record = await run_store(lambda: get_store().update_assessment(assessment_id, fields))
+    if record is None:
+        raise HTTPException(status_code=404, detail="Unknown assessment")
+    return record
+
+
+@app.post("/store/import")
+@limiter.limit("10/minute")
+async def store_import(req: StoreImportRequest, request: Request):
+    """
+    Bulk upsert an exported orf_data object in one transaction, e.g. to move
+    a browser's localStorage data server-side. Bodies are capped at 25MB, so
+    large classes are sent in slices (students first, then assessments).
+    """
+    data = {"students": req.students, "assessments": req.assessments}
+    return await run_store(lambda: get_store().import_data(data))
+
+
+@app.get("/rollups/students/{student_id}")
+@limiter.limit("600/minute")
+async def rollups_student(student_id: str, request: Request):
+    """
+    One student's precomputed trends: weekly median WCPM and accuracy,
+    weekly celeration, latest percentile rank/benchmark status, and the
+    celeration chart series (days since the first assessment, WCPM,
+    accuracy, and the log10 fit line).
+    """
+    rollup = await run_store(lambda: get_store().student_rollup(student_id))
+    if rollup is None:
+        raise HTTPException(status_code=404, detail="Unknown student")
+    return rollup
+
+
+@app.get("/rollups/class")
+@limiter.limit("300/minute")
+async def rollups_class(request: Request, grade: int | None = None, student_ids: str | None = None):
+    """
+    Trend summaries for a class — one grade, or comma-separated student_ids —
+    plus the class's weekly median WCPM series and median celeration.
+    Chart series are left out; fetch /rollups/students/{id} for those.
+    """
+    if grade is None and not student_ids:
+        raise HTTPException(status_code=400, detail="grade or student_ids required")
+    ids = [i for i in student_ids.split(",") if i] if student_ids else None
+    return await run_store(lambda: get_store().class_rollup(grade=grade, student_ids=ids))
+
+# =============================================================================
+# Benchmark Ranking Endpoint (Cohort screening)
+# =============================================================================
+
+MAX_RANK_BATCH = 200000
+
+
+@app.post("/benchmarks/rank")
+@limiter.limit("60/minute")
+async def benchmarks_rank(req: BenchmarkRankRequest, request: Request):
+    """
+    Percentile rank and benchmark tier for every student in a cohort.
+
+    Columns are parallel arrays; give either season or month per student.
+    Ranks interpolate between the Hasbrouck–Tindal percentiles for the
+    student's grade and season; tiers match getBenchmarkStatus() in
+    benchmarks.js. Entries without norms or WCPM come back as null /
+    "unknown". The whole batch is ranked in one vectorized pass, off the
+    event loop.
+    """
+    if len(req.wcpm) > MAX_RANK_BATCH:
+        raise HTTPException(status_code=413, detail=f"Too many students (max {MAX_RANK_BATCH})")
+    loop = asyncio.get_event_loop()
+    try:
+        result = await loop.run_in_executor(
+            None, lambda: rank_batch(req.wcpm, req.grade, season=req.season, month=req.month))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {**result, "count": len(req.wcpm)}
+
+# =============================================================================
+# Audio Archive Endpoints (Recording storage and playback)
+# =============================================================================
+
+MAX_AUDIO_EXPORT = 5000
+# /audio/{id} can be re-pointed at a new recording, so browsers revalidate
+# every time; the sha256 ETag makes that a cheap 304
+AUDIO_CACHE_CONTROL = "private, no-cache"
+
+
+@app.post("/audio")
+@limiter.limit("60/minute")
+async def audio_upload(req: AudioUploadRequest, request: Request):
+    """
+    Archive an assessment's recording. Identical uploads resolve to the
+    object already stored; new audio is transcoded to Opus/WebM (when ffmpeg
+    is available) before it is written. Returns the stored object's
+    sha256, mime, size and "deduplicated".
+    """
+    try:
+        audio_bytes = base64.b64decode(req.audio_base64)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid base64: {e}")
+    if not audio_bytes:
+        raise HTTPException(status_code=400, detail="Empty audio")
+
+    loop = asyncio.get_event_loop()
+    try:
+        return await loop.run_in_executor(
+            None, lambda: get_archive().put(audio_bytes, req.mime_type, req.assessment_id))
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Audio archive error: {e}")
+
+
+@app.get("/audio/{assessment_id}")
+@limiter.limit("600/minute")
+async def audio_get(assessment_id: str, request: Request):
+    """
+    An assessment's recording, usable directly as an <audio> src (with
+    auth on, through the signed URL from /audio/{id}/url). Honours
+    single byte ranges (206 Partial Content) so players can seek without
+    downloading the whole file. The ETag is the object's sha256, so a
+    re-uploaded recording replaces the cached one on the next revalidation.
+    """
+    archive = get_archive()
+    loop = asyncio.get_event_loop()
+    obj = await loop.run_in_executor(None, lambda: archive.resolve(assessment_id))
+    if obj is None:
+        raise HTTPException(status_code=404, detail="No audio for this assessment")
+    headers = {"Accept-Ranges": "bytes", "ETag": f'"{obj["sha256"]}"', "Cache-Control": AUDIO_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+
+    size = obj["size"]
+    try:
+        byte_range = parse_range(request.headers.get("range"), size)
+    except RangeNotSatisfiable:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+    if byte_range is None:
+        return FileResponse(archive.object_path(obj["sha256"]), media_type=obj["mime"], headers=headers)
+
+    start, end = byte_range
+    body = await loop.run_in_executor(None, lambda: archive.read(obj["sha256"], start, end))
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return Response(content=body, status_code=206, media_type=obj["mime"], headers=headers)
+
+
+@app.get("/audio/{assessment_id}/url")
+@limiter.limit("600/minute")
+async def audio_url(assessment_id: str, request: Request):
+    """
+    A playback URL for <audio src>: GET /audio/{id} signed for this one
+    recording, valid for AUDIO_URL_TTL_S. Relative to the server.
+    """
+    loop = asyncio.get_event_loop()
+    obj = await loop.run_in_executor(None, lambda: get_archive().resolve(assessment_id))
+    if obj is None:
+        raise HTTPException(status_code=404, detail="No audio for this assessment")
+    expires = int(time.time()) + AUDIO_URL_TTL_S
+    sig = sign_audio_url(AUDIO_URL_SECRET, assessment_id, expires)
+    return {"url": f"/audio/{quote(assessment_id, safe='')}?expires={expires}&sig={sig}", "expires": expires}
+
+
+@app.delete("/audio/{assessment_id}")
+@limiter.limit("300/minute")
+async def audio_delete(assessment_id: str, request: Request):
+    """Forget an assessment's recording; the object goes once nothing refers to it."""
+    loop = asyncio.get_event_loop()
+    removed = await loop.run_in_executor(None, lambda: get_archive().unlink([assessment_id]))
+    return {"objects_removed": removed}
+
+
+@app.post("/audio/export")
+@limiter.limit("5/minute")
+async def audio_export(req: AudioExportRequest, request: Request):
+    """
+    Zip the recordings of many assessments (e.g. for re-scoring), with a
+    manifest.csv mapping assessment_id -> file. Shared recordings are
+    included once. Assessments without audio are listed in the
+    X-Missing-Count header.
+    """
+    if len(req.assessment_ids) > MAX_AUDIO_EXPORT:
+        raise HTTPException(status_code=413, detail=f"Too many assessments (max {MAX_AUDIO_EXPORT})")
+
+    fd, path = tempfile.mkstemp(suffix=".zip")
+    os.close(fd)
+    loop = asyncio.get_event_loop()
+    try:
+        result = await loop.run_in_executor(None, lambda: get_archive().export(req.assessment_ids, path))
+    except Exception as e:
+        os.unlink(path)
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Audio export error: {e}")
+    return FileResponse(path, media_type="application/zip", filename="pacer-audio.zip",
+                        headers={"X-Missing-Count": str(len(result["missing"]))},
+                        background=BackgroundTask(os.unlink, path))
+
+
+# =============================================================================
+# Google API Proxy Endpoint (Cached passage analysis)
+# =============================================================================
+
+@app.post("/google/{service}/{method}")
+@limiter.limit("120/minute")
+async def google_proxy(service: str, method: str, request: Request):
+    """
+    Forward a Google API call from nl-api.js / ocr-api.js, answering repeats
+    of the same request from the on-disk cache.
+
+    service/method: nl/analyzeSyntax, nl/analyzeEntities, vision/annotate,
+    gemini/<model>:generateContent. The body is Google's request body
+    unchanged; ?key= is passed on (or the server's key is used). The
+    response is Google's, with X-Cache: HIT, MISS or BYPASS (uncacheable
+    Gemini sampling).
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Request body must be JSON")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+
+    loop = asyncio.get_event_loop()
+    try:
+        status, payload, cache = await loop.run_in_executor(
+            None, lambda: get_proxy().forward(service, method, body, request.query_params.get("key")))
+    except ProxyError as e:
+        raise HTTPException(status_code=e.status, detail=str(e))
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Google proxy error: {e}")
+    return Response(content=payload, status_code=status, media_type="application/json",
+                    headers={"X-Cache": cache})
@@ -0,0 +1,612 @@
+"""
+Dependency-free English syllable counter for server-side analysis.
+
+Python port of js/syllable-counter.js. Heuristic estimate used as the
+fallback when a word is missing from CMUdict (see phoneme_counter.py) and
+by the duration-normalization metrics in diagnostics.py. The exception
+table and regex rules are copied verbatim so browser and service agree.
+"""
+
+import re
+
+# ── Exception dictionary ────────────────────────────────────────────────
+# Words whose syllable counts are notoriously wrong under heuristic rules.
+# This covers the most common problematic words at grade 1-8 reading levels.
+
+EXCEPTIONS = {
+  # Silent-e words that trip up the algorithm
+  'simile': 3,
+  'recipe': 3,
+  'epitome': 4,
+  'hyperbole': 4,
+  'apostrophe': 4,
+  'catastrophe': 4,
+  'anemone': 4,
+  'calliope': 4,
+
+  # -ed endings that are pronounced as separate syllables
+  'aged': 2,
+  'blessed': 2,
+  'crooked': 2,
+  'dogged': 2,
+  'learned': 2,
+  'naked': 2,
+  'ragged': 2,
+  'rugged': 2,
+  'sacred': 2,
+  'wicked': 2,
+  'wretched': 2,
+
+  # Short words where silent-e rule can't fire (length <= 3)
+  'ice': 1,
+  'ace': 1,
+  'age': 1,
+  'ape': 1,
+  'ate': 1,
+  'awe': 1,
+  'axe': 1,
+  'aye': 1,
+  'dye': 1,
+  'eye': 1,
+  'ire': 1,
+  'ode': 1,
+  'one': 1,
+  'ore': 1,
+  'owe': 1,
+  'rye': 1,
+  'use': 1,
+
+  # Common words with unusual vowel patterns
+  'experience': 4,
+  'area': 3,
+  'idea': 3,
+  'real': 1,
+  'deal': 1,
+  'seal': 1,
+  'meal': 1,
+  'oil': 1,
+  'soil': 1,
+  'coil': 1,
+  'poem': 2,
+  'poet': 2,
+  'lion': 2,
+  'quiet': 2,
+  'quite': 1,
+  'science': 2,
+  'being': 2,
+  'seeing': 2,
+  'going': 2,
+  'doing': 2,
+  'every': 3,
+  'different': 3,
+  'family': 3,
+  'favorite': 3,
+  'evening': 3,
+  'several': 3,
+  'interest': 3,
+  'chocolate': 3,
+  'comfortable': 4,
+  'vegetable': 4,
+  'beautiful': 3,
+  'business': 3,
+  'camera': 3,
+  'general': 3,
+  'usually': 4,
+  'actually': 4,
+  'finally': 3,
+  'animal': 3,
+  'library': 3,
+  'opening': 3,
+  'diamond': 3,
+  'violet': 3,
+  'pioneer': 3,
+
+  # Tricky single-syllable words
+  'fire': 1,
+  'hire': 1,
+  'tire': 1,
+  'wire': 1,
+  'cure': 1,
+  'pure': 1,
+  'sure': 1,
+  'were': 1,
+  'where': 1,
+  'there': 1,
+  'here': 1,
+  'gone': 1,
+  'done': 1,
+  'none': 1,
+  'come': 1,
+  'some': 1,
+  'love': 1,
+  'move': 1,
+  'give': 1,
+  'live': 1,
+  'have': 1,
+  'clothes': 1,
+  'league': 1,
+  'tongue': 1,
+  'plague': 1,
+  'vague': 1,
+  'rogue': 1,
+  'breathe': 1,
+  'soothe': 1,
+  'loathe': 1,
+  'bathe': 1,
+  'lathe': 1,
+  'scathe': 1,
+  'clothe': 1,
+  'whole': 1,
+  'whose': 1,
+  'once': 1,
+  'since': 1,
+  'prince': 1,
+  'hence': 1,
+  'fence': 1,
+  'sense': 1,
+  'dense': 1,
+  'tense': 1,
+  'rinse': 1,
+  'moose': 1,
+  'goose': 1,
+  'loose': 1,
+  'choose': 1,
+  'cheese': 1,
+  'breeze': 1,
+  'freeze': 1,
+  'squeeze': 1,
+  'sneeze': 1,
+  'geese': 1,
+  'these': 1,
+  'twelve': 1,
+  'nerve': 1,
+  'serve': 1,
+  'curve': 1,
+  'nurse': 1,
+  'purse': 1,
+  'horse': 1,
+  'course': 1,
+  'source': 1,
+  'force': 1,
+  'large': 1,
+  'charge': 1,
+  'strange': 1,
+  'change': 1,
+  'range': 1,
+  'bridge': 1,
+  'ridge': 1,
+  'edge': 1,
+  'ledge': 1,
+  'judge': 1,
+  'fudge': 1,
+  'badge': 1,
+  'lodge': 1,
+  'knowledge': 2,
+  'college': 2,
+  'village': 2,
+  'cabbage': 2,
+  'garbage': 2,
+  'storage': 2,
+  'average': 3,
+  'coverage': 3,
+  'leverage': 3,
+
+  # -ire words
+  'entire': 3,
+  'desire': 3,
+  'admire': 3,
+  'inspire': 3,
+  'require': 3,
+  'retire': 3,
+  'vampire': 3,
+  'empire': 3,
+  'campfire': 2,
+  'bonfire': 2,
+  'gunfire': 2,
+  'crossfire': 2,
+  'hellfire': 2,
+  'wildfire': 2,
+  'spitfire': 2,
+
+  # Tricky two-syllable words
+  'people': 2,
+  'little': 2,
+  'middle': 2,
+  'trouble': 2,
+  'double': 2,
+  'couple': 2,
+  'purple': 2,
+  'simple': 2,
+  'single': 2,
+  'gentle': 2,
+  'candle': 2,
+  'handle': 2,
+  'castle': 2,
+  'muscle': 2,
+  'hustle': 2,
+  'wrestle': 2,
+  'whistle': 2,
+  'bottle': 2,
+  'rattle': 2,
+  'battle': 2,
+  'cattle': 2,
+  'saddle': 2,
+  'paddle': 2,
+  'puddle': 2,
+  'riddle': 2,
+  'fiddle': 2,
+  'giggle': 2,
+  'wiggle': 2,
+  'struggle': 2,
+  'jungle': 2,
+  'humble': 2,
+  'tumble': 2,
+  'stumble': 2,
+  'crumble': 2,
+  'rumble': 2,
+  'fumble': 2,
+  'grumble': 2,
+  'mumble': 2,
+  'nimble': 2,
+  'thimble': 2,
+  'tremble': 2,
+  'resemble': 3,
+  'assemble': 3,
+  'ensemble': 3,
+  'preamble': 3,
+
+  # -ous words
+  'serious': 3,
+  'curious': 3,
+  'furious': 3,
+  'previous': 3,
+  'obvious': 3,
+  'various': 3,
+  'enormous': 3,
+  'dangerous': 3,
+  'mysterious': 4,
+  'continuous': 4,
+
+  # Compound words with mid-word silent-e (not hyphenated)
+  'something': 2,
+  'someone': 2,
+  'somewhere': 2,
+  'sometime': 2,
+  'sometimes': 2,
+  'somehow': 2,
+  'somewhat': 2,
+  'somebody': 3,
+  'someday': 2,
+  'someplace': 2,
+  'homesick': 2,
+  'homeless': 2,
+  'homework': 2,
+  'lonesome': 2,
+  'handsome': 2,
+  'wholesome': 2,
+  'awesome': 2,
+  'tiresome': 2,
+  'therefore': 2,
+  'furthermore': 3,
+  'elsewhere': 2,
+  'whatever': 3,
+  'whenever': 3,
+  'wherever': 3,
+  'whoever': 3,
+  'however': 3,
+  'moreover': 3,
+  'horseback': 2,
+  'horseshoe': 2,
+
+  # -efully/-elessly words (mid-word silent-e + suffix)
+  'carefully': 3,
+  'carelessly': 3,
+  'hopeful': 2,
+  'hopefully': 3,
+  'hopeless': 2,
+  'hopelessly': 3,
+  'peaceful': 2,
+  'peacefully': 3,
+  'graceful': 2,
+  'gracefully': 3,
+  'wasteful': 2,
+  'wastefully': 3,
+  'grateful': 2,
+  'gratefully': 3,
+  'hateful': 2,
+  'tasteful': 2,
+  'tastefully': 3,
+  'nameless': 2,
+  'homeless': 2,
+  'boneless': 2,
+  'faceless': 2,
+  'timeless': 2,
+  'wireless': 2,
+  'tireless': 2,
+  'tirelessly': 3,
+  'useless': 2,
+  'uselessly': 3,
+  'lonely': 2,
+  'lovely': 2,
+  'lately': 2,
+  'merely': 2,
+  'rarely': 2,
+  'purely': 2,
+  'surely': 2,
+  'entirely': 3,
+  'sincerely': 3,
+  'severely': 3,
+  'extremely': 3,
+  'completely': 3,
+  'immediately': 5,
+  'fortunately': 4,
+  'unfortunately': 5,
+  'separately': 4,
+  'desperately': 4,
+  'accurately': 4,
+  'deliberately': 5,
+
+  # Words where -ed is NOT a silent suffix
+  'hundred': 2,
+  'kindred': 2,
+  'hatred': 2,
+
+  # -vement/-ement words (mid-word silent-e)
+  'movement': 2,
+  'improvement': 3,
+  'achievement': 3,
+  'involvement': 3,
+  'excitement': 3,
+  'amazement': 3,
+  'arrangement': 3,
+  'engagement': 3,
+  'management': 3,
+  'replacement': 3,
+  'requirement': 3,
+  'retirement': 3,
+  'settlement': 3,
+  'statement': 2,
+  'pavement': 2,
+  'advertisement': 4,
+  'announcement': 3,
+  'enforcement': 3,
+  'encouragement': 4,
+
+  # -aying/-eying words (y between vowels breaks syllable)
+  'playing': 2,
+  'saying': 2,
+  'staying': 2,
+  'paying': 2,
+  'praying': 2,
+  'laying': 2,
+  'spraying': 2,
+  'swaying': 2,
+  'delaying': 3,
+  'displaying': 3,
+  'obeying': 3,
+  'surveying': 3,
+  'conveying': 3,
+  'portraying': 3,
+  'decaying': 3,
+  'relaying': 3,
+  'replaying': 3,
+
+  # Syllabic consonants (no standard vowel in one syllable)
+  'rhythm': 2,
+  'prism': 2,
+  'chasm': 2,
+  'spasm': 2,
+  'sarcasm': 3,
+
+  # -yle/-yre words (y is vowel before -le, silent-e should apply)
+  'style': 1,
+  'while': 1,
+  'smile': 1,
+  'file': 1,
+  'pile': 1,
+  'tile': 1,
+  'mile': 1,
+  'aisle': 1,
+  'isle': 1,
+
+  # Words where trailing -ue is pronounced (not silent)
+  'continue': 3,
+  'discontinue': 4,
+  'revenue': 3,
+  'avenue': 3,
+  'residue': 3,
+  'rescue': 2,
+  'barbecue': 3,
+  'virtue': 2,
+
+  # -ture words (2 syllables each, not 1)
+  'ature': 2,
+  'creature': 2,
+  'feature': 2,
+  'nature': 2,
+  'future': 2,
+  'picture': 2,
+  'capture': 2,
+  'mixture': 2,
+  'texture': 2,
+  'culture': 2,
+  'structure': 2,
+  'fracture': 2,
+  'lecture': 2,
+  'gesture': 2,
+  'moisture': 2,
+  'pasture': 2,
+  'posture': 2,
+  'sculpture': 2,
+  'venture': 2,
+  'vulture': 2,
+  'furniture': 3,
+  'adventure': 3,
+  'temperature': 4,
+  'literature': 4,
+  'architecture': 4,
+  'agriculture': 4,
+  'manufacture': 4,
+  'signature': 3,
+  'miniature': 4,
+  'caricature': 4,
+
+  # -tion/-sion words (algorithm usually handles these, but just in case)
+  'education': 4,
+  'information': 4,
+  'imagination': 5,
+  'communication': 5,
+  'determination': 5,
+
+  # Common contractions
+  "i'm": 1,
+  "i'll": 1,
+  "i'd": 1,
+  "i've": 1,
+  "he's": 1,
+  "she's": 1,
+  "it's": 1,
+  "we're": 1,
+  "we've": 1,
+  "we'll": 1,
+  "we'd": 1,
+  "you're": 1,
+  "you've": 1,
+  "you'll": 1,
+  "you'd": 1,
+  "they're": 1,
+  "they've": 1,
+  "they'll": 1,
+  "they'd": 1,
+  "that's": 1,
+  "what's": 1,
+  "who's": 1,
+  "here's": 1,
+  "there's": 1,
+  "where's": 1,
+  "let's": 1,
+  "how's": 1,
+  "isn't": 2,
+  "aren't": 2,
+  "wasn't": 2,
+  "weren't": 2,
+  "don't": 1,
+  "doesn't": 2,
+  "didn't": 2,
+  "won't": 1,
+  "wouldn't": 2,
+  "shouldn't": 2,
+  "couldn't": 2,
+  "can't": 1,
+  "hasn't": 2,
+  "haven't": 2,
+  "hadn't": 2,
+  "mustn't": 2,
+  "needn't": 2,
+}
+
+# ── Regex patterns ──────────────────────────────────────────────────────
+
+# Vowel group splitter: consecutive vowels (including y in vowel positions)
+_VOWEL_GROUP = re.compile(r'[aeiouy]+')
+
+# Patterns that ADD a syllable (undercounted by naive vowel-group counting)
+_ADD_SYLLABLE_PATTERNS = [
+    re.compile(r'(?<![ct])ia(?!n)'),  # "dia-" "via-" but not "-cial"/"-tial"/"-ian"
+    re.compile(r'iet'),               # "quiet", "diet"
+    re.compile(r'io(?!n)'),           # "bio-" "pio-" but not "-tion"/"-sion"
+    re.compile(r'ii'),                # "radii"
+    re.compile(r'iu'),                # "stadium", "calcium"
+    re.compile(r'[aeiou]ing$'),       # "seeing", "doing", "going" — vowel + -ing
+    re.compile(r'eo(?![u])'),         # "neon", "people" — but not "eous"
+    re.compile(r'ua(?![lg])'),        # "actual", "manual" — but not "guard"/"equal"
+    re.compile(r'ue[lt]'),            # "fuel", "cruel", "duet"
+]
+
+# Patterns that SUBTRACT a syllable (overcounted by naive vowel-group counting)
+_SUB_SYLLABLE_PATTERNS = [
+    re.compile(r'[aeiouy]ed$'),       # "played", "stayed" (vowel+ed = silent ed)
+    re.compile(r'ely$'),              # "lonely", "lovely"
+]
+
+_NON_WORD_CHARS = re.compile(r"[^a-z'-]")
+
+
+# ── Core algorithm ──────────────────────────────────────────────────────
+
+def count_syllables(word) -> int:
+    """
+    Count syllables in an English word.
+
+    Mirrors countSyllables() in js/syllable-counter.js: exception lookup,
+    vowel-group count, silent -e/-ed/-es adjustments, then the add/subtract
+    pattern passes. Hyphenated compounds are summed part by part.
+
+    Args:
+        word: A single English word (may contain apostrophes/hyphens)
+
+    Returns:
+        Estimated syllable count (minimum 1)
+    """
+    if not word or not isinstance(word, str):
+        return 1
+
+    w = _NON_WORD_CHARS.sub('', word.lower().strip())
+    if not w:
+        return 1
+
+    if '-' in w:
+        parts = [p for p in w.split('-') if p]
+        if len(parts) > 1:
+            return sum(count_syllables(p) for p in parts)
+
+    if w in EXCEPTIONS:
+        return EXCEPTIONS[w]
+
+    # Strip possessive 's (doesn't add a syllable for most words)
+    if w.endswith("'s"):
+        w = w[:-2]
+    elif w.endswith("'"):
+        w = w[:-1]
+
+    if len(w) <= 2:
+        return 1
+
+    count = len(_VOWEL_GROUP.findall(w)) or 1
+
+    # Silent-e: "make", "time"; vowel + le is silent ("while"), consonant + le is not ("apple")
+    if w.endswith('e') and len(w) > 3 and not w.endswith('ee') and not w.endswith('ye'):
+        if w.endswith('le'):
+            if w[-3] in 'aeiouy':
+                count -= 1
+        else:
+            count -= 1
+
+    # Silent -ed after anything but t/d: "walked" = 1, "wanted" = 2
+    if w.endswith('ed') and len(w) > 3 and w[-3] not in 'td':
+        if re.search(r'[^aeiouy]ed$', w):
+            count -= 1
+
+    # Silent -es unless after s/z/x/sh/ch: "makes" = 1, "boxes" = 2
+    if w.endswith('es') and len(w) > 3:
+        if not re.search(r'(?:ss|zz|sh|ch|[sxz])$', w[:-2]):
+            if re.search(r'[^aeiouy]es$', w):
+                count -= 1
+
+    for pattern in _ADD_SYLLABLE_PATTERNS:
+        count += len(pattern.findall(w))
+    for pattern in _SUB_SYLLABLE_PATTERNS:
+        count -= len(pattern.findall(w))
+
+    # "mc-" prefix adds a syllable: "McDonald" = 3
+    if w.startswith('mc'):
+        count += 1
+
+    return max(1, count)
+
+
+def count_syllables_in_text(text) -> int:
+    """Total syllable count of a whitespace-separated phrase."""
+    if not text or not isinstance(text, str):
+        return 0
+    return sum(count_syllables(w) for w in text.split())
@@ -0,0 +1,92 @@
+// Regenerate the alignment parity fixtures from js/alignment.js.
+//
+//   node services/reverb/tests/fixtures/alignment/generate.mjs
+//
+// Each case is run through alignWords() then consolidateSpilloverFragments()
+// (with isNearMiss from diagnostics.js, as app.js does) and written to
+// <name>.json as {referenceText, transcriptWords, alignment, spilloverLog}.
+// Transcripts are built from the reference with a seeded PRNG, so reruns
+// produce the same files.
+
+import { writeFileSync } from 'node:fs';
+import { dirname, join } from 'node:path';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+
+// backend-config.js (imported via nl-api.js) reads these at module load
+globalThis.localStorage = { getItem: () => null, setItem() {}, removeItem() {} };
+globalThis.location = { hostname: 'localhost' };
+
+const here = dirname(fileURLToPath(import.meta.url));
+const jsDir = join(here, '..', '..', '..', '..', '..', 'js');
+const { alignWords, consolidateSpilloverFragments } = await import(pathToFileURL(join(jsDir, 'alignment.js')));
+const { isNearMiss } = await import(pathToFileURL(join(jsDir, 'diagnostics.js')));
+
+const SENTENCES = [
+  'The old lighthouse keeper climbed the winding stairs every evening at dusk.',
+  'He carried a lantern, a notebook, and a thermos of hot cocoa.',
+  'From the top he could see twenty-five miles of rocky coastline.',
+  "Ships didn't need the light as much as they used to, but he still kept it burning.",
+  'In 1998 a storm knocked out the power for three whole days.',
+  'The keeper wound the clockwork by hand so the beam would keep turning.',
+  'Sailors later said they would have been lost without it.',
+  'Now students visit the tower on field trips each spring.',
+  'They count the steps, all 217 of them, on the way up.',
+  'At the top, the wind is so strong that hats fly off into the sea.',
+];
+
+function passage(words) {
+  const out = [];
+  for (let i = 0; out.join(' ').split(' ').length < words; i++) out.push(SENTENCES[i % SENTENCES.length]);
+  return out.join(' ');
+}
+
+function prng(seed) {
+  let s = seed >>> 0;
+  return () => {
+    s = (s + 0x6D2B79F5) >>> 0;
+    let t = s;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const SUBSTITUTES = ['the', 'a', 'light', 'house', 'stair', 'went', 'then', 'cool', 'ship', 'store'];
+
+/** Spoken words for `text`: substitutions, omissions, insertions, fillers, optional skipped span. */
+function transcript(text, seed, { errorRate = 0.08, skip = null } = {}) {
+  const rand = prng(seed);
+  const words = text.split(/\s+/);
+  const spoken = [];
+  words.forEach((word, i) => {
+    if (skip && i >= skip[0] && i < skip[1]) return;
+    const r = rand();
+    if (r < errorRate / 3) return;                                              // omission
+    if (r < (2 * errorRate) / 3) spoken.push(SUBSTITUTES[Math.floor(rand() * SUBSTITUTES.length)]);
+    else spoken.push(word);
+    if (r > 1 - errorRate / 3) spoken.push(rand() < 0.5 ? 'um' : SUBSTITUTES[Math.floor(rand() * SUBSTITUTES.length)]);
+  });
+  return spoken.map((word, i) => ({ word, startTime: `${(i * 0.4).toFixed(1)}s`, endTime: `${(i * 0.4 + 0.3).toFixed(1)}s` }));
+}
+
+const CASES = {
+  'short-clean': [SENTENCES[0], transcript(SENTENCES[0], 1, { errorRate: 0 })],
+  'short-errors': [SENTENCES.slice(2, 5).join(' '), transcript(SENTENCES.slice(2, 5).join(' '), 2, { errorRate: 0.3 })],
+  'short-compound': ['The keeper wound the clockwork by hand.',
+    ['the', 'keeper', 'wound', 'the', 'clock', 'work', 'by', 'hand'].map(word => ({ word }))],
+  'short-spillover': ['The old lighthouse keeper climbed the stairs with a magnificent lantern.',
+    ['the', 'old', 'lightho', 'use', 'climbed', 'the', 'stairs', 'with', 'a', 'magnif', 'icent']
+      .map(word => ({ word }))],
+  'medium-errors': [passage(150), transcript(passage(150), 3)],
+  'large-deletion': [passage(200), transcript(passage(200), 4, { skip: [60, 130] })],
+  'banded-errors': [passage(450), transcript(passage(450), 5)],
+  'banded-deletion': [passage(600), transcript(passage(600), 6, { skip: [250, 290] })],
+};
+
+for (const [name, [referenceText, transcriptWords]] of Object.entries(CASES)) {
+  const alignment = alignWords(referenceText, transcriptWords);
+  const spilloverLog = consolidateSpilloverFragments(alignment, isNearMiss);
+  writeFileSync(join(here, `${name}.json`),
+    JSON.stringify({ referenceText, transcriptWords, alignment, spilloverLog }) + '\n');
+  console.log(`${name}: ${alignment.length} entries, ${spilloverLog.length} spillover`);
+}
@@ -0,0 +1,41 @@
+"""
+Parity of alignment.py with js/alignment.js.
+
+Fixtures are alignWords() + consolidateSpilloverFragments() output recorded
+from the JS by fixtures/alignment/generate.mjs; rerun it after changing
+either implementation.
+"""
+
+import glob
+import json
+import os
+
+import pytest
+
+from alignment import FULL_DP_MAX_CELLS, align_words, consolidate_spillover_fragments
+from text_normalize import normalize_text
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "alignment")
+FIXTURES = sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.json")))
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: os.path.basename(p)[:-5])
+def test_matches_js(path):
+    case = _load(path)
+    alignment = align_words(case["referenceText"], case["transcriptWords"])
+    log = consolidate_spillover_fragments(alignment)
+    assert alignment == case["alignment"]
+    assert log == case["spilloverLog"]
+
+
+def test_fixtures_cover_banded_dp():
+    """The banded-* cases must actually be large enough to leave the full DP."""
+    for path in glob.glob(os.path.join(FIXTURE_DIR, "banded-*.json")):
+        case = _load(path)
+        cells = len(normalize_text(case["referenceText"])) * len(case["transcriptWords"])
+        assert cells > FULL_DP_MAX_CELLS, os.path.basename(path)
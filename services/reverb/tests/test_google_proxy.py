@@ -0,0 +1,63 @@
+import json
+import threading
+
+import pytest
+
+import google_proxy as gp
+
+
+@pytest.fixture
+def proxy(tmp_path, monkeypatch):
+    server = gp.stub_server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    for base_env, *_ in gp.SERVICES.values():
+        monkeypatch.setenv(base_env, base)
+    monkeypatch.setattr(gp._StubHandler, "calls", 0)
+    yield gp.GoogleProxy(gp.ResponseCache(str(tmp_path)))
+    server.shutdown()
+    server.server_close()
+
+
+def vision_body(content):
+    return {"requests": [{"image": {"content": content}, "features": [{"type": "DOCUMENT_TEXT_DETECTION"}]}]}
+
+
+def gemini_body(text):
+    return {"contents": [{"parts": [{"text": text}]}], "generationConfig": {"temperature": 0}}
+
+
+@pytest.mark.parametrize("service, method, body", [
+    ("nl", "analyzeSyntax", {"document": {"type": "PLAIN_TEXT", "content": "The cat sat."}}),
+    ("vision", "annotate", vision_body("aW1hZ2U=")),
+    ("gemini", "gemini-2.0-flash:generateContent", gemini_body("Transcribe this passage.")),
+])
+def test_second_call_is_served_from_cache(proxy, service, method, body):
+    first = proxy.forward(service, method, body, api_key="k")
+    second = proxy.forward(service, method, body, api_key="k")
+    assert (first[0], first[2]) == (200, "MISS")
+    assert second == (200, first[1], "HIT")
+    assert gp._StubHandler.calls == 1
+
+    fresh = gp.GoogleProxy(gp.ResponseCache(proxy.cache.root))
+    assert fresh.forward(service, method, body, api_key="k")[2] == "HIT"
+    assert gp._StubHandler.calls == 1
+
+
+@pytest.mark.parametrize("service, method, body", [
+    ("vision", "annotate", vision_body(gp.STUB_ERROR_IMAGE)),
+    ("gemini", "gemini-2.0-flash:generateContent", gemini_body(f"Transcribe {gp.STUB_BLOCK_TEXT}.")),
+])
+def test_error_payload_in_200_is_not_cached(proxy, service, method, body):
+    for _ in range(2):
+        status, payload, source = proxy.forward(service, method, body, api_key="k")
+        assert (status, source) == (200, "MISS")
+        assert not gp.cacheable_response(service, payload)
+    assert gp._StubHandler.calls == 2
+    assert proxy.cache.stats()["entries"] == 0
+
+
+def test_gemini_candidate_without_content_is_not_cacheable():
+    payload = json.dumps({"candidates": [{"finishReason": "SAFETY"}]}).encode()
+    assert not gp.cacheable_response("gemini", payload)
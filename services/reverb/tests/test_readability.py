@@ -0,0 +1,40 @@
+"""Batch readability scoring must not depend on what else is in the batch."""
+
+import pytest
+
+import readability
+
+PASSAGE = ("The old lighthouse keeper climbed the winding stairs every evening at dusk, carrying "
+           "a lantern, a notebook and a thermos of hot cocoa for the long and lonely night ahead.")
+OTHER = "Ships did not need the light as much as they used to, but he still kept it burning every night."
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    readability._cache.clear()
+    yield
+    readability._cache.clear()
+
+
+def _alone(text):
+    readability._cache.clear()
+    result = readability.analyze_readability(text)
+    readability._cache.clear()
+    return result
+
+
+@pytest.mark.parametrize("batch", [
+    [PASSAGE, "!!!", OTHER],   # empty passage in the middle
+    [OTHER, PASSAGE, "!!!"],   # and at the end
+    ["...", PASSAGE, "?!", OTHER, "!!!"],
+])
+def test_punctuation_only_passages_do_not_affect_neighbours(batch):
+    expected = {text: _alone(text) for text in (PASSAGE, OTHER)}
+    results = readability.analyze_readability_batch(batch)
+    for text, result in zip(batch, results):
+        if text in expected:
+            assert result == expected[text]
+        else:
+            assert result is None
+    # and the cached results are the correct ones too
+    assert readability.analyze_readability(PASSAGE) == expected[PASSAGE]
@@ -0,0 +1,135 @@
+"""
+Text normalization for server-side analysis.
+
+Python port of js/text-normalize.js. The browser and the service must agree
+token-for-token on how reference text and transcripts are split, so keep the
+rules here in lockstep with the JS module.
+"""
+
+import re
+
+DISFLUENCIES = frozenset(['um', 'uh', 'uh-huh', 'mm', 'hmm', 'er', 'ah'])
+
+# JS regex \w and \d are ASCII-only; re.ASCII keeps Python in agreement.
+_LINE_BREAK_HYPHEN = re.compile(r'-\s*\n\s*')
+_DASHES = re.compile('[—–]')
+_WHITESPACE = re.compile(r'\s+')
+_EDGE_PUNCT = re.compile(r"^[^\w'-]+|[^\w'-]+$", re.ASCII)
+_DIGIT_COMMA = re.compile(r'(\d),(?=\d)', re.ASCII)
+_DECIMAL = re.compile(r'^\d[\d.]*\d$', re.ASCII)
+_APOSTROPHES = re.compile("['‘’‛`]")
+_TRAILING_HYPHENS = re.compile(r'-+$')
+
+
+def split_hyphen_parts(stripped: str):
+    """
+    Core hyphen-split decision for a single stripped token.
+
+    Mirrors splitHyphenParts() in js/text-normalize.js:
+      - No hyphen -> None
+      - Single-letter first part (e-mail, x-ray) -> ("join", parts)
+      - Otherwise -> ("split", parts)
+    """
+    if '-' not in stripped:
+        return None
+    parts = [p for p in stripped.split('-') if p]
+    if len(parts) < 2:
+        return None
+    if len(parts[0]) == 1:
+        return ('join', parts)
+    return ('split', parts)
+
+
+def strip_edge_punct(word: str) -> str:
+    """Strip leading/trailing punctuation, keeping apostrophes and hyphens."""
+    return _EDGE_PUNCT.sub('', word)
+
+
+def normalize_text(text) -> list:
+    """
+    Normalize text into a list of lowercase words.
+
+    Mirrors normalizeText() in js/text-normalize.js: rejoins line-break
+    hyphens, treats em/en dashes as separators, strips edge punctuation,
+    digit-grouping commas, non-decimal periods and apostrophes, then applies
+    the shared hyphen split/join rule.
+
+    Args:
+        text: Raw passage or transcript text
+
+    Returns:
+        List of normalized word strings
+    """
+    if not text or not isinstance(text, str):
+        return []
+    text = _LINE_BREAK_HYPHEN.sub('', text)
+    text = _DASHES.sub(' ', text).lower()
+
+    tokens = []
+    for w in _WHITESPACE.split(text):
+        w = _EDGE_PUNCT.sub('', w)
+        w = _DIGIT_COMMA.sub(r'\1', w)
+        if not _DECIMAL.match(w):
+            w = w.replace('.', '')
+        w = _APOSTROPHES.sub('', w)
+        if w:
+            tokens.append(w)
+
+    # Merge trailing-hyphen tokens with the next token (OCR line breaks)
+    merged = []
+    i = 0
+    while i < len(tokens):
+        if tokens[i].endswith('-') and i + 1 < len(tokens):
+            merged.append(tokens[i][:-1] + tokens[i + 1])
+            i += 2
+        else:
+            merged.append(_TRAILING_HYPHENS.sub('', tokens[i]))
+            i += 1
+
+    result = []
+    for token in merged:
+        hp = split_hyphen_parts(token)
+        if hp is None:
+            result.append(token)
+        elif hp[0] == 'join':
+            result.append(''.join(hp[1]))
+        else:
+            result.extend(hp[1])
+    return result
+
+
+def split_reference_for_display(reference_text: str) -> list:
+    """
+    Split reference text into display tokens that stay index-aligned with
+    normalize_text(), keeping original punctuation on each token.
+
+    Mirrors splitReferenceForDisplay() in js/text-normalize.js: trailing-hyphen
+    merge keeps the second part's formatting, single-letter prefix joins stay
+    one token, and split hyphen compounds emit stripped inner parts followed
+    by the original token (so trailing punctuation survives on the last part).
+    """
+    raw_tokens = _WHITESPACE.split(_DASHES.sub(' ', reference_text.strip()))
+
+    merged = []
+    i = 0
+    while i < len(raw_tokens):
+        s = strip_edge_punct(raw_tokens[i])
+        if not s:
+            i += 1
+            continue
+        if s.endswith('-') and i + 1 < len(raw_tokens):
+            merged.append(raw_tokens[i + 1])
+            i += 2
+        else:
+            merged.append(raw_tokens[i])
+            i += 1
+
+    result = []
+    for token in merged:
+        hp = split_hyphen_parts(strip_edge_punct(token))
+        if hp is None or hp[0] == 'join':
+            result.append(token)
+        else:
+            result.extend(hp[1][:-1])
+            result.append(token)
+    return result
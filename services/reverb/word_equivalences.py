@@ -0,0 +1,327 @@
+"""
+Word equivalence rules for server-side analysis.
+
+Python port of js/word-equivalences.js. Maps written forms (as they appear
+in reference text) to acceptable spoken pronunciations. When a student says
+an equivalent form, it counts as correct — not a substitution.
+
+All entries are lowercase/normalized. Group order matters: if a word appears
+in several groups, the first group wins.
+"""
+
+EQUIVALENCE_GROUPS = [
+    # ── Titles & honorifics ──
+    ['vs', 'versus', 'verses'],
+    ['mr', 'mister'],
+    ['mrs', 'missus', 'misses'],
+    ['ms', 'miss', 'miz'],
+    ['dr', 'doctor'],
+    ['st', 'saint', 'street'],
+    ['jr', 'junior'],
+    ['sr', 'senior'],
+    ['gov', 'governor'],
+    ['pres', 'president'],
+    ['sen', 'senator'],
+    ['rep', 'representative'],
+    ['rev', 'reverend'],
+    ['prof', 'professor'],
+    ['gen', 'general'],
+    ['col', 'colonel'],
+    ['maj', 'major'],
+    ['capt', 'captain'],
+    ['sgt', 'sergeant'],
+    ['lt', 'lieutenant'],
+    ['cpl', 'corporal'],
+    ['pvt', 'private'],
+    ['cmdr', 'commander'],
+    ['adm', 'admiral'],
+
+    # ── Address & place ──
+    ['ave', 'avenue'],
+    ['blvd', 'boulevard'],
+    ['rd', 'road'],
+    ['ln', 'lane'],
+    ['ct', 'court'],
+    ['pl', 'place'],
+    ['hwy', 'highway'],
+    ['pkwy', 'parkway'],
+    ['apt', 'apartment'],
+    ['bldg', 'building'],
+
+    # ── Compass directions (multi-letter only; single letters too ambiguous) ──
+    ['ne', 'northeast'],
+    ['nw', 'northwest'],
+    ['se', 'southeast'],
+    ['sw', 'southwest'],
+
+    # ── Organizations & business ──
+    ['dept', 'department'],
+    ['govt', 'government'],
+    ['inc', 'incorporated'],
+    ['ltd', 'limited'],
+    ['co', 'company', 'county'],
+    ['corp', 'corporation'],
+    ['assn', 'assoc', 'association'],
+    ['natl', 'national'],
+    ['intl', 'international'],
+
+    # ── Common abbreviation expansions (after normalizeText strips periods) ──
+    ['etc', 'etcetera'],
+    ['mt', 'mount', 'mountain'],
+    ['ft', 'fort', 'foot', 'feet'],
+    ['vol', 'volume'],
+    ['fig', 'figure'],
+    ['approx', 'approximately'],
+    ['info', 'information'],
+    ['tv', 'television'],
+
+    # ── Measurement: metric ──
+    ['km', 'kilometer', 'kilometers', 'kilometre', 'kilometres'],
+    ['cm', 'centimeter', 'centimeters', 'centimetre', 'centimetres'],
+    ['mm', 'millimeter', 'millimeters', 'millimetre', 'millimetres'],
+    ['kg', 'kilogram', 'kilograms'],
+    ['mg', 'milligram', 'milligrams'],
+    ['ml', 'milliliter', 'milliliters', 'millilitre', 'millilitres'],
+
+    # ── Measurement: imperial / US customary ──
+    ['oz', 'ounce', 'ounces'],
+    ['lb', 'lbs', 'pound', 'pounds'],
+    ['yd', 'yard', 'yards'],
+    ['mi', 'mile', 'miles'],
+    ['gal', 'gallon', 'gallons'],
+    ['pt', 'pint', 'pints'],
+    ['qt', 'quart', 'quarts'],
+    ['tsp', 'teaspoon', 'teaspoons'],
+    ['tbsp', 'tablespoon', 'tablespoons'],
+
+    # ── Measurement: other ──
+    ['sq', 'square'],
+    ['cu', 'cubic'],
+    ['deg', 'degree', 'degrees'],
+
+    # ── Time units ──
+    # Note: 'hr'/'hours' handled in HOMOPHONE_GROUPS with 'our'/'hour'
+    ['min', 'minute', 'minutes'],
+    ['sec', 'seconds'],  # 'second' omitted — conflicts with ordinal ['2nd', 'second']
+    ['yr', 'year', 'years'],
+    ['mo', 'month', 'months'],
+    ['wk', 'week', 'weeks'],
+
+    # ── Days of the week (after normalizeText strips periods: "Mon." → "mon") ──
+    ['mon', 'monday'],
+    ['tue', 'tues', 'tuesday'],
+    ['wed', 'wednesday'],
+    ['thu', 'thur', 'thurs', 'thursday'],
+    ['fri', 'friday'],
+    ['sat', 'saturday'],
+    # Note: 'sun'/'sunday' handled in HOMOPHONE_GROUPS with 'sun'/'son'
+
+    # ── Months of the year (after period strip: "Jan." → "jan") ──
+    ['jan', 'january'],
+    ['feb', 'february'],
+    ['mar', 'march'],
+    ['apr', 'april'],
+    ['aug', 'august'],
+    ['sep', 'sept', 'september'],
+    ['oct', 'october'],
+    ['nov', 'november'],
+    ['dec', 'december'],
+
+    # ── Contractions ↔ expanded forms ──
+    # Keys are apostrophe-free to match normalizeText output ("don't" → "dont").
+    # Known collisions (were/we're, well/we'll) are acceptable: they sound
+    # different so ASR distinguishes them, and cross-validation catches errors.
+    ['cant', 'cannot', 'can not'],
+    ['wont', 'will not'],
+    ['dont', 'do not'],
+    ['doesnt', 'does not'],
+    ['didnt', 'did not'],
+    ['isnt', 'is not'],
+    ['arent', 'are not'],
+    ['wasnt', 'was not'],
+    ['werent', 'were not'],
+    ['hasnt', 'has not'],
+    ['havent', 'have not'],
+    ['hadnt', 'had not'],
+    ['wouldnt', 'would not'],
+    ['couldnt', 'could not'],
+    ['shouldnt', 'should not'],
+    ['im', 'i am'],
+    ['ill', 'i will'],
+    ['ive', 'i have'],
+    ['id', 'i would', 'i had'],
+    ['wed', 'we would', 'we had'],
+    ['were', 'we are'],
+    ['weve', 'we have'],
+    ['well', 'we will'],
+    # 'theyre' moved to HOMOPHONE_GROUPS (with 'they are') to avoid conflict
+    ['theyve', 'they have'],
+    ['theyll', 'they will'],
+    # 'youre' moved to HOMOPHONE_GROUPS (with 'you are') to avoid conflict
+    ['youve', 'you have'],
+    ['youll', 'you will'],
+    ['hes', 'he is', 'he has'],
+    ['shes', 'she is', 'she has'],
+    ['its', 'it is', 'it has'],
+    ['thats', 'that is', 'that has'],
+    ['theres', 'there is', 'there has'],
+    ['heres', 'here is', 'here has'],
+    ['whats', 'what is', 'what has'],
+    ['whos', 'who is', 'who has'],
+    ['lets', 'let us'],
+
+    # ── Numbers written as digits ↔ words ──
+    ['1', 'one'],
+    ['2', 'two'],
+    ['3', 'three'],
+    ['4', 'four'],
+    ['5', 'five'],
+    ['6', 'six'],
+    ['7', 'seven'],
+    ['8', 'eight'],
+    ['9', 'nine'],
+    ['10', 'ten'],
+    ['11', 'eleven'],
+    ['12', 'twelve'],
+    ['13', 'thirteen'],
+    ['14', 'fourteen'],
+    ['15', 'fifteen'],
+    ['16', 'sixteen'],
+    ['17', 'seventeen'],
+    ['18', 'eighteen'],
+    ['19', 'nineteen'],
+    ['20', 'twenty'],
+
+    # ── Symbols ──
+    ['&', 'and'],
+    ['%', 'percent'],
+
+    # ── Article / determiner variants ──
+    # "a" vs "an" is a phonetic alternation, not a reading error.
+    # Students naturally adjust based on the following sound.
+    ['a', 'an'],
+
+    # ── Common alternate forms ──
+    ['ok', 'okay'],
+    ['gonna', 'going to'],
+    ['wanna', 'want to'],
+    ['gotta', 'got to'],
+    ['kinda', 'kind of'],
+    ['sorta', 'sort of'],
+]
+
+# Common homophones — student saying "there" when text says "their" is
+# correct pronunciation.
+HOMOPHONE_GROUPS = [
+    ['their', 'there', 'theyre', 'they are'],
+    ['your', 'youre', 'you are'],
+    # "it's" → "its" after normalizeText; contraction group handles "its"↔"it is"
+    ['to', 'too', 'two'],
+    ['by', 'bye', 'buy'],
+    ['for', 'four', 'fore'],
+    ['no', 'know'],
+    ['new', 'knew', 'gnu'],
+    ['right', 'write', 'rite'],
+    ['see', 'sea'],
+    ['be', 'bee'],
+    ['hear', 'here'],
+    ['our', 'hour', 'hr', 'hours'],  # Extended: hr/hours abbreviation
+    ['ate', 'eight'],
+    ['one', 'won'],
+    ['sun', 'son', 'sunday'],  # Extended: Sun. abbreviation for Sunday
+    ['would', 'wood'],
+    ['which', 'witch'],
+    ['wear', 'where', 'ware'],
+    ['weather', 'whether'],
+    ['piece', 'peace'],
+    ['break', 'brake'],
+    ['wait', 'weight'],
+    ['great', 'grate'],
+    ['whole', 'hole'],
+    ['pair', 'pear', 'pare'],
+    ['meet', 'meat'],
+    ['read', 'red'],  # Past tense of read
+    ['led', 'lead'],  # Metal
+    ['bored', 'board'],
+    ['flower', 'flour'],
+    ['role', 'roll'],
+    ['through', 'threw'],
+    ['principal', 'principle'],
+    ['stationary', 'stationery'],
+    ['council', 'counsel'],
+]
+
+_TENS = ['twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety']
+_TENS_ORDINAL = ['twentieth', 'thirtieth', 'fortieth', 'fiftieth', 'sixtieth',
+                 'seventieth', 'eightieth', 'ninetieth']
+_ONES = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+_ONES_ORDINAL = ['first', 'second', 'third', 'fourth', 'fifth', 'sixth',
+                 'seventh', 'eighth', 'ninth']
+_ORDINALS_1_20 = ['first', 'second', 'third', 'fourth', 'fifth', 'sixth',
+                  'seventh', 'eighth', 'ninth', 'tenth', 'eleventh', 'twelfth',
+                  'thirteenth', 'fourteenth', 'fifteenth', 'sixteenth',
+                  'seventeenth', 'eighteenth', 'nineteenth', 'twentieth']
+
+
+def _ordinal_suffix(n: int) -> str:
+    if n % 100 in (11, 12, 13):
+        return 'th'
+    return {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+
+
+def _build_number_words() -> list:
+    """
+    Number words for 21-100 and ordinals 1st-100th.
+
+    Generated rather than spelled out, but produces exactly the NUMBER_WORDS
+    table in word-equivalences.js (same entries, same order). Joined forms
+    ("twentyone", "twentyfirst") match what compound merge rebuilds from
+    normalizeText splitting "twenty-one" into two tokens.
+    """
+    groups = []
+    for t, tens in enumerate(_TENS, start=2):
+        if t > 2:  # 20 is a single-word form covered by EQUIVALENCE_GROUPS
+            groups.append([str(t * 10), tens])
+        for o, ones in enumerate(_ONES, start=1):
+            groups.append([str(t * 10 + o), f'{tens}-{ones}', f'{tens}{ones}'])
+    groups.append(['100', 'hundred', 'one hundred'])
+    for n, word in enumerate(_ORDINALS_1_20, start=1):
+        groups.append([f'{n}{_ordinal_suffix(n)}', word])
+    for t, tens in enumerate(_TENS, start=2):
+        if t > 2:
+            groups.append([f'{t * 10}th', _TENS_ORDINAL[t - 2]])
+        for o, ones_ord in enumerate(_ONES_ORDINAL, start=1):
+            n = t * 10 + o
+            groups.append([f'{n}{_ordinal_suffix(n)}', f'{tens}{ones_ord}'])
+    groups.append(['100th', 'hundredth', 'one hundredth'])
+    return groups
+
+
+NUMBER_WORDS = _build_number_words()
+
+ALL_EQUIVALENCE_GROUPS = EQUIVALENCE_GROUPS + HOMOPHONE_GROUPS + NUMBER_WORDS
+
+# Every word in a group maps to the group's first entry (canonical).
+_word_to_canonical = {}
+for _group in ALL_EQUIVALENCE_GROUPS:
+    for _word in _group:
+        _word_to_canonical.setdefault(_word, _group[0])
+
+
+def get_canonical(word: str) -> str:
+    """
+    Return the canonical form of a word if an equivalence exists,
+    otherwise return the word unchanged.
+
+    Args:
+        word: Normalized (lowercase, punctuation-stripped) word
+    """
+    return _word_to_canonical.get(word) or word
+
+
+def get_all_equivalents(word: str) -> list:
+    """Get all equivalent forms for a word, including the word itself."""
+    for group in ALL_EQUIVALENCE_GROUPS:
+        if word in group:
+            return list(group)
+    return [word]
@@ -1,4 +1,4 @@
-const CACHE_NAME = 'orf-v73';
+const CACHE_NAME = 'orf-v74';
 
 const SHELL = [
   // --- HTML pages ---
@@ -23,7 +23,7 @@ const SHELL = [
   './icons/icon-512.png',
 
   // --- Data ---
-  './data/cmudict-phoneme-counts.json',
+  './data/lexicon.bin',
 
   // --- Core pipeline JS ---
   './js/app.js',
@@ -57,6 +57,7 @@ const SHELL = [
   './js/vad-gap-analyzer.js',
   './js/maze-generator.js',
   './js/phoneme-counter.js',
+  './js/lexicon-index.js',
 
   // --- API + support modules ---
   './js/number-words.js',